@@ -0,0 +1,68 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-benchmarks-common-2026-qxx"
+
+"""
+基准测试公共工具
+
+- bootstrap()：注册 mzapi 包层次（跳过 mzapi/__init__.py 中的服务商导入），
+  并将历史路径 mzapi.utlis 指向 mzapi/core，使各模块可直接 import
+- bench()：按固定迭代次数计时，返回每秒操作数
+- report()：打印对齐的结果行
+
+运行方式（在仓库根目录）::
+
+    python -m benchmarks.bench_tencent_tc3_sign
+"""
+
+import importlib
+import os
+import sys
+import time
+import types
+
+_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), os.pardir, "mzapi"))
+
+
+def bootstrap():
+    """注册 mzapi 包层次，返回 mzapi.core 包"""
+    if "mzapi" not in sys.modules:
+        pkg = types.ModuleType("mzapi")
+        pkg.__path__ = [_ROOT]
+        sys.modules["mzapi"] = pkg
+    core = importlib.import_module("mzapi.core")
+    if "mzapi.utlis" not in sys.modules:
+        utlis = types.ModuleType("mzapi.utlis")
+        utlis.__path__ = list(core.__path__)
+        sys.modules["mzapi.utlis"] = utlis
+    return core
+
+
+def bench(func, number, repeat=5):
+    """执行 func number 次，重复 repeat 轮，取最快一轮
+
+    :return: 每秒操作数
+    :rtype: float
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return number / best if best > 0 else float("inf")
+
+
+def report(name, ops_per_sec, unit="ops/s"):
+    """打印一行基准结果"""
+    print("%-40s %14.1f %s" % (name, ops_per_sec, unit))
@@ -0,0 +1,268 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-bench-aliyun-http2-2026-qxx"
+
+"""
+DaraCore HTTP/1.1 与 HTTP/2 传输对比基准
+
+在本机启动一个自签名证书的 TLS 服务，按 ALPN 协商结果以 HTTP/1.1 或 HTTP/2 应答，
+每个请求固定延迟。以 200 并发分别测量同步（线程池 + do_action）与异步
+（asyncio.gather + async_do_action）两种调用方式下：
+
+  - 服务端接受的 TCP 连接数
+  - 吞吐（requests/s）与 p50 / p99 延迟
+
+disableHttp2=True 使用 requests / aiohttp，disableHttp2=False 使用 httpx HTTP/2。
+需要安装 httpx[http2]。
+
+    python -m benchmarks.bench_aliyun_http2 [--concurrency 200] [--requests 2000] [--latency-ms 20]
+"""
+
+import argparse
+import asyncio
+import datetime
+import ipaddress
+import os
+import ssl
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import h2.config
+import h2.connection
+import h2.events
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from benchmarks._common import bootstrap, report
+
+bootstrap()
+
+from mzapi.core.aliyunauth.darabonba.core import DaraCore  # noqa: E402
+from mzapi.core.aliyunauth.darabonba.request import DaraRequest  # noqa: E402
+
+_BODY = b'{"RequestId":"bench","Data":{"Content":"hello"}}'
+
+
+def _write_self_signed(directory):
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (x509.CertificateBuilder()
+            .subject_name(name).issuer_name(name)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - datetime.timedelta(days=1))
+            .not_valid_after(now + datetime.timedelta(days=1))
+            .add_extension(x509.SubjectAlternativeName([
+                x509.DNSName("localhost"), x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), critical=False)
+            .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+            .sign(key, hashes.SHA256()))
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                  serialization.NoEncryption()))
+    return cert_path, key_path
+
+
+class _StubServer(object):
+    """在后台线程的事件循环中运行的 HTTP/1.1 + HTTP/2 桩服务"""
+
+    def __init__(self, cert_path, key_path, latency):
+        self.latency = latency
+        self.connections = 0
+        self._ssl = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        self._ssl.load_cert_chain(cert_path, key_path)
+        self._ssl.set_alpn_protocols(["h2", "http/1.1"])
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._server = None
+        self._writers = set()
+        self.port = None
+
+    def start(self):
+        self._thread.start()
+        self._ready.wait()
+        return self
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _shutdown(self):
+        self._server.close()
+        for writer in list(self._writers):
+            writer.transport.abort()
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle, "127.0.0.1", 0, ssl=self._ssl, backlog=1024))
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        self._writers.add(writer)
+        try:
+            if writer.get_extra_info("ssl_object").selected_alpn_protocol() == "h2":
+                await self._serve_h2(reader, writer)
+            else:
+                await self._serve_http1(reader, writer)
+        except (OSError, asyncio.IncompleteReadError, ssl.SSLError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _serve_http1(self, reader, writer):
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n")[1:]:
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"content-length":
+                    length = int(value)
+            if length:
+                await reader.readexactly(length)
+            await asyncio.sleep(self.latency)
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                         b"Content-Length: %d\r\n\r\n%s" % (len(_BODY), _BODY))
+            await writer.drain()
+
+    async def _serve_h2(self, reader, writer):
+        conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False, header_encoding=None))
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        pending = set()
+
+        async def respond(stream_id):
+            await asyncio.sleep(self.latency)
+            conn.send_headers(stream_id, [(":status", "200"), ("content-type", "application/json"),
+                                          ("content-length", str(len(_BODY)))])
+            conn.send_data(stream_id, _BODY, end_stream=True)
+            writer.write(conn.data_to_send())
+
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                break
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.DataReceived):
+                    conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, h2.events.StreamEnded):
+                    task = asyncio.ensure_future(respond(event.stream_id))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(conn.data_to_send())
+            await writer.drain()
+
+
+def _new_request(port):
+    request = DaraRequest()
+    request.protocol = "https"
+    request.port = port
+    request.method = "POST"
+    request.pathname = "/"
+    request.headers = {"host": "localhost", "content-type": "application/json"}
+    request.body = b"{}"
+    return request
+
+
+def _percentile(latencies, pct):
+    latencies = sorted(latencies)
+    return latencies[min(len(latencies) - 1, int(len(latencies) * pct / 100))]
+
+
+def _run_sync(port, runtime, concurrency, total):
+    def call(_):
+        start = time.perf_counter()
+        response = DaraCore.do_action(_new_request(port), runtime)
+        assert response.status_code == 200 and response.body == _BODY
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        start = time.perf_counter()
+        latencies = list(pool.map(call, range(total)))
+        elapsed = time.perf_counter() - start
+    return latencies, elapsed
+
+
+async def _run_async(port, runtime, concurrency, total):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call():
+        async with semaphore:
+            start = time.perf_counter()
+            response = await DaraCore.async_do_action(_new_request(port), runtime)
+            assert response.status_code == 200 and response.body == _BODY
+            return time.perf_counter() - start
+
+    try:
+        start = time.perf_counter()
+        latencies = await asyncio.gather(*(call() for _ in range(total)))
+        elapsed = time.perf_counter() - start
+    finally:
+        await DaraCore.close_async_sessions()
+    return latencies, elapsed
+
+
+def _report(label, server, connections_before, latencies, elapsed):
+    report("%s connections" % label, server.connections - connections_before, "")
+    report("%s throughput" % label, len(latencies) / elapsed, "requests/s")
+    report("%s p50" % label, _percentile(latencies, 50) * 1000, "ms")
+    report("%s p99" % label, _percentile(latencies, 99) * 1000, "ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert_path, key_path = _write_self_signed(directory)
+        server = _StubServer(cert_path, key_path, args.latency_ms / 1000).start()
+        try:
+            for disable_http2, label in ((True, "http/1.1"), (False, "http/2")):
+                runtime = {"ca": cert_path, "disableHttp2": disable_http2, "maxIdleConns": args.concurrency}
+
+                before = server.connections
+                latencies, elapsed = _run_sync(server.port, runtime, args.concurrency, args.requests)
+                _report("sync %s" % label, server, before, latencies, elapsed)
+
+                before = server.connections
+                latencies, elapsed = asyncio.run(
+                    _run_async(server.port, runtime, args.concurrency, args.requests))
+                _report("async %s" % label, server, before, latencies, elapsed)
+        finally:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
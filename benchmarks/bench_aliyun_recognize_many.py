@@ -0,0 +1,105 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-bench-aliyun-recognize-many-2026-qxx"
+
+"""
+RecognizeAllText.recognize_many 吞吐基准
+
+在本机启动一个模拟 OCR 服务（每个请求固定延迟），对比逐条 recognize()
+与不同并发度的 recognize_many() 的吞吐。输入为生成器，同时验证内存有界。
+
+    python -m benchmarks.bench_aliyun_recognize_many [--latency-ms 20] [--count 400]
+"""
+
+import argparse
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from benchmarks._common import bootstrap, report
+
+bootstrap()
+
+from mzapi.aliyun.ocr.recognize_all_text import RecognizeAllText  # noqa: E402
+
+_BODY = json.dumps({"RequestId": "bench", "Data": {"Content": "hello"}}).encode()
+
+
+def _start_stub(latency):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(_BODY)))
+            self.end_headers()
+            self.wfile.write(_BODY)
+
+        def log_message(self, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        request_queue_size = 1024
+
+    server = Server(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _images(count):
+    for i in range(count):
+        yield "https://example.com/page-%d.jpg" % i
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency-ms", type=float, default=20)
+    parser.add_argument("--count", type=int, default=400)
+    args = parser.parse_args()
+
+    server = _start_stub(args.latency_ms / 1000)
+    client = RecognizeAllText("ak", "sk", endpoint="127.0.0.1:%d" % server.server_address[1], protocol="HTTP")
+
+    sequential = max(args.count // 10, 1)
+    start = time.perf_counter()
+    for image in _images(sequential):
+        client.recognize(url=image)
+    report("recognize (sequential)", sequential / (time.perf_counter() - start), "req/s")
+
+    for concurrency in (4, 16, 64):
+        # 预热：建立该并发度对应连接池中的连接
+        for _ in client.recognize_many(_images(concurrency * 2), max_concurrency=concurrency):
+            pass
+        for ordered in (True, False):
+            start = time.perf_counter()
+            failed = sum(not item.ok for item in client.recognize_many(
+                _images(args.count), max_concurrency=concurrency, ordered=ordered))
+            elapsed = time.perf_counter() - start
+            name = "recognize_many c=%d %s" % (concurrency, "ordered" if ordered else "unordered")
+            report(name, args.count / elapsed, "req/s" + (" (%d failed)" % failed if failed else ""))
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-bench-aliyun-request-overhead-2026-qxx"
+
+"""
+RecognizeAllText 单次请求的客户端开销基准（不含网络）
+
+DaraCore.do_action 被替换为直接返回固定响应，测得的是参数构造、
+凭证获取、签名、请求体编码与响应解析的耗时。
+
+    python -m benchmarks.bench_aliyun_request_overhead
+"""
+
+from benchmarks._common import bench, bootstrap, report
+
+bootstrap()
+
+from mzapi.aliyun.ocr.recognize_all_text import RecognizeAllText  # noqa: E402
+from mzapi.core.aliyunauth import client as client_module  # noqa: E402
+from mzapi.core.aliyunauth.darabonba.response import DaraResponse  # noqa: E402
+
+_OPTIONS = dict(output_table=True, output_coordinate=True, type="Advanced", need_rotate=True)
+_URL = "https://example.com/scans/page-0001.jpg"
+
+
+def _fake_do_action(request, runtime_option=None):
+    response = DaraResponse()
+    response.status_code = 200
+    response.headers = {"content-type": "application/json"}
+    response.body = b'{"RequestId":"bench","Data":{"Content":"hello"}}'
+    return response
+
+
+def main():
+    client_module.DaraCore.do_action = staticmethod(_fake_do_action)
+    client = RecognizeAllText("test_ak", "test_sk")
+    template = client.prepare(**_OPTIONS)
+    image = b"\x89PNG" + b"\x00" * 4096
+
+    number = 5000
+    for name, func in (
+        ("recognize(url=...)", lambda: client.recognize(url=_URL, **_OPTIONS)),
+        ("prepare().recognize(url=...)", lambda: template.recognize(url=_URL)),
+        ("recognize_bytes(4 KiB)", lambda: client.recognize_bytes(image, **_OPTIONS)),
+        ("prepare().recognize_bytes(4 KiB)", lambda: template.recognize_bytes(image)),
+    ):
+        ops = bench(func, number)
+        report(name, 1e6 / ops, "us/req")
+
+
+if __name__ == "__main__":
+    main()
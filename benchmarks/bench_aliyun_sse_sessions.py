@@ -0,0 +1,156 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-bench-ali-sse-sessions-2026-qxx"
+
+"""
+DaraCore.async_do_sse_action 会话复用基准
+
+在本机启动一个自签名证书的 TLS SSE 服务，对比两种情况下的每秒调用数：
+
+  - cold：每次调用前清空会话与 SSLContext 缓存（等同于旧实现：每次解析 CA、
+    新建连接器并完成 TCP + TLS 握手）
+  - pooled：复用缓存的会话、连接器与 SSLContext
+
+    python -m benchmarks.bench_aliyun_sse_sessions [--calls 300]
+"""
+
+import argparse
+import asyncio
+import datetime
+import ipaddress
+import os
+import ssl
+import tempfile
+import time
+
+from aiohttp import web
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from benchmarks._common import bootstrap, report
+
+bootstrap()
+
+from mzapi.core.aliyunauth.darabonba.core import DaraCore  # noqa: E402
+from mzapi.core.aliyunauth.darabonba.request import DaraRequest  # noqa: E402
+from mzapi.core.ssl_context import clear_ssl_contexts  # noqa: E402
+
+_EVENTS = b"".join(b"id: %d\ndata: {\"n\": %d}\n\n" % (i, i) for i in range(5))
+
+
+def _write_self_signed(directory):
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (x509.CertificateBuilder()
+            .subject_name(name).issuer_name(name)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - datetime.timedelta(days=1))
+            .not_valid_after(now + datetime.timedelta(days=1))
+            .add_extension(x509.SubjectAlternativeName([
+                x509.DNSName("localhost"), x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), critical=False)
+            .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+            .sign(key, hashes.SHA256()))
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                  serialization.NoEncryption()))
+    return cert_path, key_path
+
+
+async def _start_server(cert_path, key_path):
+    async def handle(request):
+        await request.read()
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        response.content_length = len(_EVENTS)
+        await response.prepare(request)
+        await response.write(_EVENTS)
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_post("/sse", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    server_ctx = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    server_ctx.load_cert_chain(cert_path, key_path)
+    site = web.TCPSite(runner, "127.0.0.1", 0, ssl_context=server_ctx)
+    await site.start()
+    return runner, site._server.sockets[0].getsockname()[1]
+
+
+def _new_request(port):
+    request = DaraRequest()
+    request.protocol = "https"
+    request.port = port
+    request.method = "POST"
+    request.pathname = "/sse"
+    request.headers = {"host": "localhost", "content-type": "application/json"}
+    request.body = b"{}"
+    return request
+
+
+async def _call(port, runtime):
+    response = await DaraCore.async_do_sse_action(_new_request(port), runtime)
+    async for _ in response.body:
+        pass
+
+
+async def _run(port, runtime, calls, cold):
+    start = time.perf_counter()
+    for _ in range(calls):
+        if cold:
+            await DaraCore.close_async_sessions()
+            clear_ssl_contexts()
+        await _call(port, runtime)
+    return calls / (time.perf_counter() - start)
+
+
+async def _main(calls):
+    with tempfile.TemporaryDirectory() as directory:
+        cert_path, key_path = _write_self_signed(directory)
+        runner, port = await _start_server(cert_path, key_path)
+        runtime = {"ca": cert_path}
+        try:
+            await _run(port, runtime, 10, cold=False)  # 预热
+            cold = await _run(port, runtime, calls, cold=True)
+            await DaraCore.close_async_sessions()
+            before = DaraCore.async_session_stats()
+            pooled = await _run(port, runtime, calls, cold=False)
+            after = DaraCore.async_session_stats()
+        finally:
+            await DaraCore.close_async_sessions()
+            await runner.cleanup()
+
+    report("sse cold (new context + handshake)", cold, "calls/s")
+    report("sse pooled", pooled, "calls/s")
+    report("speedup", pooled / cold, "x")
+    report("pooled sessions created", after["sessions_created"] - before["sessions_created"], "")
+    report("pooled sessions reused", after["sessions_reused"] - before["sessions_reused"], "")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=300)
+    args = parser.parse_args()
+    asyncio.run(_main(args.calls))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-bench-hwc-sign-latency-2026-qxx"
+
+"""
+华为云同步请求签名延迟基准
+
+在 32 / 128 个并发调用线程下，对比两种签名路径的单次延迟：
+
+  - future：process_auth_request(...).result()，经 HttpClient 的 8 线程池中转
+  - inline：process_auth_request_sync(...)，在调用线程内直接签名
+
+    python -m benchmarks.bench_huaweicloud_sign_latency
+"""
+
+import logging
+import threading
+import time
+
+from benchmarks._common import bootstrap, report
+
+bootstrap()
+
+from mzapi.core.huaweicloudauth.auth.credentials import BasicCredentials  # noqa: E402
+from mzapi.core.huaweicloudauth.http.http_client import HttpClient  # noqa: E402
+from mzapi.core.huaweicloudauth.http.http_config import HttpConfig  # noqa: E402
+from mzapi.core.huaweicloudauth.sdk_request import SdkRequest  # noqa: E402
+
+_BODY = '{"data": {"url": "https://example.com/image.jpg"}}'
+
+
+def _new_request():
+    return SdkRequest(method="POST", schema="https", host="ocr.cn-north-4.myhuaweicloud.com",
+                      resource_path="/v2/0123456789abcdef/ocr/general-text", query_params=[],
+                      header_params={"Content-Type": "application/json"}, body=_BODY)
+
+
+def _percentile(samples, p):
+    return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+
+def _run(sign, threads, per_thread):
+    latencies = [[] for _ in range(threads)]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(out):
+        barrier.wait()
+        for _ in range(per_thread):
+            start = time.perf_counter()
+            sign(_new_request())
+            out.append(time.perf_counter() - start)
+
+    workers = [threading.Thread(target=worker, args=(latencies[i],)) for i in range(threads)]
+    for t in workers:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for t in workers:
+        t.join()
+    elapsed = time.perf_counter() - start
+    samples = sorted(x for out in latencies for x in out)
+    return samples, len(samples) / elapsed
+
+
+def main(total=20000):
+    credentials = BasicCredentials("AK0123456789EXAMPLE", "SK0123456789abcdefEXAMPLE", "0123456789abcdef")
+    http_client = HttpClient(HttpConfig.get_default_config(), None, None, logging.getLogger(__name__))
+    paths = (
+        ("future", lambda r: credentials.process_auth_request(r, http_client).result()),
+        ("inline", lambda r: credentials.process_auth_request_sync(r, http_client)),
+    )
+    try:
+        for threads in (32, 128):
+            for name, sign in paths:
+                _run(sign, threads, 20)  # 预热
+                samples, throughput = _run(sign, threads, max(1, total // threads))
+                label = "%s x%d" % (name, threads)
+                report(label + " p50", _percentile(samples, 0.50) * 1e6, "us")
+                report(label + " p99", _percentile(samples, 0.99) * 1e6, "us")
+                report(label + " throughput", throughput, "ops/s")
+    finally:
+        http_client.executor.shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-bench-sm3-2026-qxx"
+
+"""
+SM3 载荷哈希吞吐基准
+
+对 1 KB ~ 20 MB 的请求体分别测量 new_sm3_hash（默认后端）、纯 Python
+SM3Hash 与 SHA-256 的吞吐。纯 Python 路径较慢，默认只测到 1 MB。
+
+    python -m benchmarks.bench_sm3 [--pure-max-size 20971520]
+"""
+
+import argparse
+import hashlib
+import os
+import time
+
+from benchmarks._common import bootstrap, report
+
+bootstrap()
+
+from mzapi.core.sm3 import OPENSSL_SM3_AVAILABLE, SM3Hash, new_sm3_hash  # noqa: E402
+
+_SIZES = (1 << 10, 64 << 10, 1 << 20, 5 << 20, 20 << 20)
+
+
+def _throughput(func, data, min_time=0.5):
+    """返回 MB/s"""
+    rounds = 0
+    start = time.perf_counter()
+    while True:
+        func(data).digest()
+        rounds += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return rounds * len(data) / elapsed / (1 << 20)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pure-max-size", type=int, default=1 << 20,
+                        help="纯 Python 实现参与测试的最大报文长度（字节）")
+    args = parser.parse_args(argv)
+
+    print("OpenSSL sm3 available: %s" % OPENSSL_SM3_AVAILABLE)
+    for size in _SIZES:
+        data = os.urandom(size)
+        label = "%d KB" % (size >> 10)
+        report("sha256 %s" % label, _throughput(hashlib.sha256, data), "MB/s")
+        report("new_sm3_hash %s" % label, _throughput(new_sm3_hash, data), "MB/s")
+        if size <= args.pure_max_size:
+            report("SM3Hash (pure) %s" % label, _throughput(SM3Hash, data), "MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-bench-sse-decoder-2026-qxx"
+
+"""
+SSE 事件流解析吞吐基准
+
+构造 100k 个事件（每个含 id / event / data 三个字段），按不同分块大小输入，
+分别测量：
+
+- SSEDecoder（mzapi.core.sse.iter_sse）
+- 阿里云 Stream.read_as_sse（在 SSEDecoder 之上构造 Event）
+- 旧实现：str 缓冲区 + split('\\n', 1) + 逐行正则（仅作对照，保留在本文件中）
+
+    python -m benchmarks.bench_sse_decoder [--events 100000]
+"""
+
+import argparse
+import codecs
+import json
+import re
+import time
+
+from benchmarks._common import bootstrap, report
+
+bootstrap()
+
+from mzapi.core.sse import iter_sse  # noqa: E402
+from mzapi.core.aliyunauth.darabonba.utils.stream import Stream  # noqa: E402
+
+_CHUNK_SIZES = (8 << 10, 256 << 10)
+
+_line_pattern = re.compile('(?P<name>[^:]*):?( ?(?P<value>.*))?')
+
+
+def _payload(events):
+    parts = []
+    for i in range(events):
+        data = json.dumps({"index": i, "text": "识别结果 %d" % i, "finished": False}, ensure_ascii=False)
+        parts.append("id: %d\nevent: delta\ndata: %s\n\n" % (i, data))
+    return "".join(parts).encode("utf-8")
+
+
+def _chunks(payload, size):
+    return [payload[i:i + size] for i in range(0, len(payload), size)]
+
+
+def _legacy_parse(chunks):
+    """旧版 _parse_sse_stream 的解析循环（增量 UTF-8 解码，不含 1 MB 丢弃逻辑）"""
+    buffer = ""
+    current = {}
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        while "\n" in buffer:
+            line, buffer = buffer.split("\n", 1)
+            line = line.rstrip("\r")
+            if not line.strip():
+                if current.get("data") is not None:
+                    yield current
+                    current = {}
+                continue
+            if line.startswith(":"):
+                continue
+            match = _line_pattern.match(line)
+            name = match.group("name").strip()
+            value = match.group("value").strip()
+            if name == "data":
+                current["data"] = value if "data" not in current else current["data"] + "\n" + value
+            elif name in ("event", "id"):
+                current[name] = value
+
+
+class _Response(object):
+    """只提供 iter_content() 的 requests 响应替身"""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+
+    def iter_content(self, chunk_size=None):
+        return iter(self._chunks)
+
+
+def _events_per_sec(parse, chunks, expected):
+    start = time.perf_counter()
+    count = sum(1 for _ in parse(chunks))
+    elapsed = time.perf_counter() - start
+    if count != expected:
+        raise AssertionError("parsed %d events, expected %d" % (count, expected))
+    return count / elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=100000, help="事件数")
+    args = parser.parse_args(argv)
+
+    payload = _payload(args.events)
+    print("%d events, %.1f MB" % (args.events, len(payload) / (1 << 20)))
+    for size in _CHUNK_SIZES:
+        chunks = _chunks(payload, size)
+        label = "%d KB chunks" % (size >> 10)
+        report("SSEDecoder %s" % label, _events_per_sec(iter_sse, chunks, args.events), "events/s")
+        report("Stream.read_as_sse %s" % label,
+               _events_per_sec(lambda c: Stream.read_as_sse(_Response(c)), chunks, args.events), "events/s")
+        report("legacy str parser %s" % label, _events_per_sec(_legacy_parse, chunks, args.events), "events/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-bench-txc-multipart-2026-qxx"
+
+"""
+multipart 请求体构建基准
+
+对 10 MB 图片的上传流程（构建请求体 -> 计算 SHA-256 签名摘要 -> 逐块发送），
+对比 bytes 拼接与 MultipartEncoder 的耗时和 tracemalloc 峰值内存。
+
+    python -m benchmarks.bench_tencent_multipart
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import pathlib
+import time
+import tracemalloc
+
+from benchmarks._common import bootstrap, report
+
+bootstrap()
+
+from mzapi.core.tencentauth.http.multipart import MultipartEncoder  # noqa: E402
+
+_IMAGE_SIZE = 10 << 20
+
+
+def _concat_body(params, boundary, binparas):
+    """改造前的拼接实现"""
+    boundary = boundary.encode()
+    body = b''
+    for k, v in params.items():
+        kbytes = k.encode()
+        body += b'--%s\r\n' % boundary
+        body += b'Content-Disposition: form-data; name="%s"' % kbytes
+        if k in binparas:
+            body += b'; filename="%s"\r\n' % kbytes
+        else:
+            body += b"\r\n"
+            if isinstance(v, (list, dict)):
+                v = json.dumps(v)
+                body += b'Content-Type: application/json\r\n'
+        if isinstance(v, str):
+            v = v.encode()
+        body += b'\r\n%s\r\n' % v
+    if body != b'':
+        body += b'--%s--\r\n' % boundary
+    return body
+
+
+def _upload_concat(image):
+    body = _concat_body({"ImageName": "scan.png", "Image": image, "Config": {"a": 1}}, "b", ["Image"])
+    hashlib.sha256(body).hexdigest()
+    for i in range(0, len(body), 65536):
+        memoryview(body)[i:i + 65536]
+
+
+def _upload_encoder(image):
+    body = MultipartEncoder({"ImageName": "scan.png", "Image": image, "Config": {"a": 1}}, "b", ["Image"])
+    body.sha256_hexdigest()
+    for _ in body:
+        pass
+
+
+def _measure(name, func, image):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func(image)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    report("%s time" % name, elapsed * 1000, "ms")
+    report("%s peak" % name, peak / (1 << 20), "MB")
+
+
+def main():
+    image = os.urandom(_IMAGE_SIZE)
+    _measure("bytes concat", _upload_concat, image)
+    _measure("MultipartEncoder bytes", _upload_encoder, image)
+    with tempfile.TemporaryDirectory() as d:
+        path = pathlib.Path(d, "scan.png")
+        path.write_bytes(image)
+        del image
+        _measure("MultipartEncoder mmap path", _upload_encoder, path)
+        with open(path, "rb") as f:
+            _measure("MultipartEncoder file object", _upload_encoder, f)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-bench-txc-tc3-sign-2026-qxx"
+
+"""
+TC3-HMAC-SHA256 签名吞吐基准
+
+对比 Sign.sign_tc3 使用签名密钥缓存与每次重新推导两种路径。
+
+    python -m benchmarks.bench_tencent_tc3_sign
+"""
+
+import hashlib
+
+from benchmarks._common import bootstrap, bench, report
+
+bootstrap()
+
+from mzapi.core.tencentauth.sign import Sign  # noqa: E402
+
+_SECRET_KEY = "Gu5t9xGARNpq86cd98joQYCN3EXAMPLE"
+_DATE = "2026-05-06"
+_SERVICE = "ocr"
+_STRING_TO_SIGN = "TC3-HMAC-SHA256\n1778025600\n%s/%s/tc3_request\n%s" % (
+    _DATE, _SERVICE, hashlib.sha256(b"canonical-request").hexdigest())
+
+
+def main(number=200000):
+    uncached = bench(lambda: Sign.sign_tc3(_SECRET_KEY, _DATE, _SERVICE, _STRING_TO_SIGN,
+                                           use_cache=False), number)
+    cached = bench(lambda: Sign.sign_tc3(_SECRET_KEY, _DATE, _SERVICE, _STRING_TO_SIGN), number)
+    report("sign_tc3 uncached", uncached)
+    report("sign_tc3 cached", cached)
+    report("speedup", cached / uncached, "x")
+
+
+if __name__ == "__main__":
+    main()
@@ -35,9 +35,16 @@ API 文档参考：
     https://help.aliyun.com/zh/ocr/developer-reference/api-ocr-api-2021-07-07-recognizealltext
 """
 
-from .recognize_all_text import RecognizeAllText, RecognizeAllTextResponse
+from .recognize_all_text import (
+    RecognizeAllText,
+    RecognizeAllTextBatchItem,
+    RecognizeAllTextResponse,
+    RecognizeAllTextTemplate,
+)
 
 __all__ = [
     "RecognizeAllText",
+    "RecognizeAllTextBatchItem",
     "RecognizeAllTextResponse",
+    "RecognizeAllTextTemplate",
 ]
@@ -22,12 +22,18 @@ API 文档参考：
     https://help.aliyun.com/zh/ocr/developer-reference/api-ocr-api-2021-07-07-recognizealltext
 """
 
-from typing import Optional, Union
+import io
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from types import MappingProxyType
+from typing import Any, Iterable, Iterator, Mapping, Union
 
-from darabonba.runtime import RuntimeOptions
+from mzapi.core.aliyunauth.darabonba.runtime import RuntimeOptions
 
 from mzapi.core.aliyunauth import utils_models
 from mzapi.core.aliyunauth.client import Client as AliyunOpenApiClient
+from mzapi.core.aliyunauth.utils import Utils
 
 
 # OCR API 默认版本
@@ -36,6 +42,43 @@ _API_VERSION = "2021-07-07"
 # 默认端点
 _DEFAULT_ENDPOINT = "ocr-api.cn-hangzhou.aliyuncs.com"
 
+# recognize 关键字参数 -> API 业务参数名
+_BIZ_PARAM_NAMES = {
+    "url": "Url",
+    "body": "Body",
+    "output_char_info": "OutputCharInfo",
+    "output_table": "OutputTable",
+    "output_figure": "OutputFigure",
+    "output_formula": "OutputFormula",
+    "output_barcode": "OutputBarcode",
+    "output_qrcode": "OutputQrcode",
+    "output_seal": "OutputSeal",
+    "output_handwriting": "OutputHandwriting",
+    "output_stamp": "OutputStamp",
+    "output_kv_pair": "OutputKVPair",
+    "output_coordinate": "OutputCoordinate",
+    "type": "Type",
+    "min_size": "MinSize",
+    "max_side": "MaxSide",
+    "cut_type": "CutType",
+    "need_rotate": "NeedRotate",
+    "need_sort": "NeedSort",
+    "multi_language": "MultiLanguage",
+}
+
+# 二进制上传：图片作为 application/octet-stream 请求体，其余参数放在查询串中
+_STREAM_PARAMS = utils_models.Params(
+    action="RecognizeAllText",
+    version=_API_VERSION,
+    protocol="HTTPS",
+    pathname="/",
+    method="POST",
+    auth_type="AK",
+    style="V3",
+    req_body_type="binary",
+    body_type="json",
+)
+
 
 class RecognizeAllTextResponse:
     """RecognizeAllText 接口的响应封装。
@@ -57,6 +100,34 @@ class RecognizeAllTextResponse:
         self.body = body or {}
 
 
+class RecognizeAllTextBatchItem:
+    """recognize_many 的单条结果。
+
+    Attributes:
+        index: 图片在输入序列中的位置（从 0 开始）。
+        image: 输入的图片（URL、Base64 字符串或文件路径）。
+        response: 识别成功时的响应，失败时为 ``None``。
+        error: 识别失败时的异常，成功时为 ``None``。
+    """
+
+    def __init__(
+        self,
+        index: int,
+        image: Any,
+        response: RecognizeAllTextResponse = None,
+        error: BaseException = None,
+    ):
+        self.index = index
+        self.image = image
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """识别是否成功。"""
+        return self.error is None
+
+
 class RecognizeAllText:
     """阿里云 OCR - 识别全部文字（RecognizeAllText）。
 
@@ -179,70 +250,240 @@ class RecognizeAllText:
             ...     type="Advanced",
             ... )
         """
-        # 构造业务请求参数
+        request = self._build_request(
+            url=url, body=body, output_char_info=output_char_info, output_table=output_table,
+            output_figure=output_figure, output_formula=output_formula, output_barcode=output_barcode,
+            output_qrcode=output_qrcode, output_seal=output_seal, output_handwriting=output_handwriting,
+            output_stamp=output_stamp, output_kv_pair=output_kv_pair, output_coordinate=output_coordinate,
+            type=type, min_size=min_size, max_side=max_side, cut_type=cut_type, need_rotate=need_rotate,
+            need_sort=need_sort, multi_language=multi_language,
+        )
+
+        return self._call(request, RuntimeOptions())
+
+    def recognize_many(
+        self,
+        images: Iterable[Any],
+        max_concurrency: int = 8,
+        ordered: bool = True,
+        **options,
+    ) -> Iterator[RecognizeAllTextBatchItem]:
+        """并发识别多张图片，以生成器形式逐条返回结果。
+
+        每个输入可以是图片 URL（``http://`` / ``https://``）、本地文件路径
+        （``str`` 或 ``os.PathLike``）或 Base64 字符串；本地文件按 ``recognize_file``
+        以二进制流上传。单条失败不会中断整批，异常记录在对应结果的 ``error`` 中。
+
+        输入按需消费：任意时刻最多有 ``max_concurrency`` 个请求在途，
+        因此 ``images`` 可以是覆盖海量页面的生成器，内存占用保持有界。
+        请求共享 ``DaraCore`` 中按端点缓存的连接池，连接池大小与并发数一致。
+
+        Args:
+            images: 图片序列或生成器。
+            max_concurrency: 最大并发请求数，默认 8。
+            ordered: 为 ``True`` 时按输入顺序返回结果；为 ``False`` 时按完成顺序返回，
+                慢请求不会阻塞后续结果。
+            **options: 除 ``url`` / ``body`` 外的 ``recognize`` 关键字参数，作用于每张图片。
+
+        Yields:
+            RecognizeAllTextBatchItem: 单条识别结果。
+
+        Raises:
+            ValueError: ``max_concurrency`` 小于 1。
+            TypeError: ``options`` 中包含未知参数或 ``url`` / ``body``。
+
+        示例::
+
+            >>> for item in client.recognize_many(["a.jpg", "https://example.com/b.jpg"], max_concurrency=16):
+            ...     if item.ok:
+            ...         print(item.index, item.response.body["Data"]["Content"])
+            ...     else:
+            ...         print(item.index, item.error)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self._check_options("recognize_many", options)
+        return self._recognize_many(images, max_concurrency, ordered, options)
+
+    def _recognize_many(self, images, max_concurrency, ordered, options):
+        template = RecognizeAllTextTemplate(self, options, RuntimeOptions(max_idle_conns=max_concurrency))
+
+        def run(index, image):
+            try:
+                params = self._image_params(image)
+                if "file" in params:
+                    response = template.recognize_file(params["file"])
+                else:
+                    response = template.recognize(**params)
+                return RecognizeAllTextBatchItem(index, image, response=response)
+            except Exception as e:
+                return RecognizeAllTextBatchItem(index, image, error=e)
+
+        source = enumerate(images)
+        pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="recognize_many")
+        try:
+            if ordered:
+                pending = deque()
+                for index, image in source:
+                    pending.append(pool.submit(run, index, image))
+                    if len(pending) >= max_concurrency:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            else:
+                pending = set()
+                for index, image in source:
+                    pending.add(pool.submit(run, index, image))
+                    if len(pending) >= max_concurrency:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield future.result()
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+        finally:
+            # 调用方提前停止迭代时，丢弃尚未开始的请求
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _image_params(image) -> dict:
+        """将 recognize_many 的单个输入转换为 url / body / file 参数。"""
+        if isinstance(image, os.PathLike):
+            return {"file": os.fspath(image)}
+        if isinstance(image, str) and image.startswith(("http://", "https://")):
+            return {"url": image}
+        if isinstance(image, str) and os.path.isfile(image):
+            return {"file": image}
+        return {"body": image}
+
+    def recognize_file(self, file, **options) -> RecognizeAllTextResponse:
+        """以二进制流上传本地图片并识别。
+
+        图片作为 ``application/octet-stream`` 请求体原样发送，不做 Base64 编码和
+        表单编码；签名所需的请求体摘要按块增量计算，文件不会整体读入内存。
+
+        Args:
+            file: 图片文件路径（``str`` / ``os.PathLike``），或以二进制模式打开的文件对象。
+                文件对象可 seek 时按块发送，重试时从原位置重新读取；不可 seek 时先完整读取。
+            **options: 除 ``url`` / ``body`` 外的 ``recognize`` 关键字参数。
+
+        Returns:
+            RecognizeAllTextResponse: 包含 status_code、headers 和 body 的响应对象。
+
+        示例::
+
+            >>> result = client.recognize_file("scan.png", output_table=True)
+        """
+        self._check_options("recognize_file", options)
+        return RecognizeAllTextTemplate(self, options).recognize_file(file)
+
+    def recognize_bytes(self, data: Union[bytes, bytearray, memoryview], **options) -> RecognizeAllTextResponse:
+        """以二进制流上传内存中的图片数据并识别，参数同 ``recognize_file``。
+
+        示例::
+
+            >>> result = client.recognize_bytes(open("scan.png", "rb").read())
+        """
+        self._check_options("recognize_bytes", options)
+        return RecognizeAllTextTemplate(self, options).recognize_bytes(data)
+
+    def prepare(self, **options) -> "RecognizeAllTextTemplate":
+        """预编译一组固定的识别参数，返回可重复使用的请求模板。
+
+        批量识别同一类图片时，参数在模板中只校验、转换与编码一次，
+        之后每次调用只需提供图片。模板不可变，可在多个线程或协程间共享。
+
+        Args:
+            **options: 除 ``url`` / ``body`` 外的 ``recognize`` 关键字参数。
+
+        Returns:
+            RecognizeAllTextTemplate: 请求模板。
+
+        Raises:
+            TypeError: ``options`` 中包含未知参数或 ``url`` / ``body``。
+
+        示例::
+
+            >>> template = client.prepare(output_table=True, type="Advanced")
+            >>> for url in urls:
+            ...     result = template.recognize(url=url)
+        """
+        self._check_options("prepare", options)
+        return RecognizeAllTextTemplate(self, options)
+
+    async def recognize_async(
+        self,
+        url: str = None,
+        body: str = None,
+        output_char_info: bool = None,
+        output_table: bool = None,
+        output_figure: bool = None,
+        output_formula: bool = None,
+        output_barcode: bool = None,
+        output_qrcode: bool = None,
+        output_seal: bool = None,
+        output_handwriting: bool = None,
+        output_stamp: bool = None,
+        output_kv_pair: bool = None,
+        output_coordinate: bool = None,
+        type: str = None,
+        min_size: int = None,
+        max_side: int = None,
+        cut_type: int = None,
+        need_rotate: bool = None,
+        need_sort: bool = None,
+        multi_language: str = None,
+    ) -> RecognizeAllTextResponse:
+        """``recognize`` 的协程版本，参数与返回值相同。
+
+        凭证获取、重试退避与网络 I/O 均不阻塞事件循环；同一事件循环中的调用
+        共享按端点缓存的 aiohttp 会话，asyncio.run() 关闭事件循环前会自动关闭这些会话；
+        也可调用 ``DaraCore.close_async_sessions()`` 提前释放连接。
+
+        示例::
+
+            >>> result = await client.recognize_async(url="https://example.com/image.jpg")
+        """
+        request = self._build_request(
+            url=url, body=body, output_char_info=output_char_info, output_table=output_table,
+            output_figure=output_figure, output_formula=output_formula, output_barcode=output_barcode,
+            output_qrcode=output_qrcode, output_seal=output_seal, output_handwriting=output_handwriting,
+            output_stamp=output_stamp, output_kv_pair=output_kv_pair, output_coordinate=output_coordinate,
+            type=type, min_size=min_size, max_side=max_side, cut_type=cut_type, need_rotate=need_rotate,
+            need_sort=need_sort, multi_language=multi_language,
+        )
+
+        return await self._call_async(request, RuntimeOptions())
+
+    @staticmethod
+    def _build_request(**options) -> utils_models.OpenApiRequest:
+        """将 recognize 的关键字参数转换为 OpenApiRequest，值为 None 的参数不发送。"""
         biz_params = {}
-        if url is not None:
-            biz_params["Url"] = url
-        if body is not None:
-            biz_params["Body"] = body
-        if output_char_info is not None:
-            biz_params["OutputCharInfo"] = output_char_info
-        if output_table is not None:
-            biz_params["OutputTable"] = output_table
-        if output_figure is not None:
-            biz_params["OutputFigure"] = output_figure
-        if output_formula is not None:
-            biz_params["OutputFormula"] = output_formula
-        if output_barcode is not None:
-            biz_params["OutputBarcode"] = output_barcode
-        if output_qrcode is not None:
-            biz_params["OutputQrcode"] = output_qrcode
-        if output_seal is not None:
-            biz_params["OutputSeal"] = output_seal
-        if output_handwriting is not None:
-            biz_params["OutputHandwriting"] = output_handwriting
-        if output_stamp is not None:
-            biz_params["OutputStamp"] = output_stamp
-        if output_kv_pair is not None:
-            biz_params["OutputKVPair"] = output_kv_pair
-        if output_coordinate is not None:
-            biz_params["OutputCoordinate"] = output_coordinate
-        if type is not None:
-            biz_params["Type"] = type
-        if min_size is not None:
-            biz_params["MinSize"] = min_size
-        if max_side is not None:
-            biz_params["MaxSide"] = max_side
-        if cut_type is not None:
-            biz_params["CutType"] = cut_type
-        if need_rotate is not None:
-            biz_params["NeedRotate"] = need_rotate
-        if need_sort is not None:
-            biz_params["NeedSort"] = need_sort
-        if multi_language is not None:
-            biz_params["MultiLanguage"] = multi_language
-
-        # 构造 RPC 风格的请求参数
-        params = utils_models.Params(
+        for name, api_name in _BIZ_PARAM_NAMES.items():
+            value = options.get(name)
+            if value is not None:
+                biz_params[api_name] = value
+        return utils_models.OpenApiRequest(
+            body=biz_params,
+            query={},
+        )
+
+    def _call(self, request: utils_models.OpenApiRequest, runtime: RuntimeOptions) -> RecognizeAllTextResponse:
+        resp = self.client.do_rpcrequest(
             action="RecognizeAllText",
             version=_API_VERSION,
             protocol="HTTPS",
-            pathname="/",
             method="POST",
             auth_type="AK",
             body_type="json",
-            req_body_type="json",
-            style="RPC",
-        )
-
-        request = utils_models.OpenApiRequest(
-            body=biz_params,
-            query={},
+            request=request,
+            runtime=runtime,
         )
+        return self._to_response(resp)
 
-        runtime = RuntimeOptions()
-
-        resp = self.client.do_rpcrequest(
+    async def _call_async(self, request: utils_models.OpenApiRequest, runtime: RuntimeOptions) -> RecognizeAllTextResponse:
+        resp = await self.client.do_rpcrequest_async(
             action="RecognizeAllText",
             version=_API_VERSION,
             protocol="HTTPS",
@@ -252,7 +493,24 @@ class RecognizeAllText:
             request=request,
             runtime=runtime,
         )
+        return self._to_response(resp)
 
+    def _call_stream(self, stream, query: dict, runtime: RuntimeOptions) -> RecognizeAllTextResponse:
+        request = utils_models.OpenApiRequest(
+            query=query,
+            stream=stream,
+        )
+        resp = self.client.do_request(_STREAM_PARAMS, request, runtime)
+        return self._to_response(resp)
+
+    @staticmethod
+    def _check_options(method: str, options: dict):
+        for name in options:
+            if name not in _BIZ_PARAM_NAMES or name in ("url", "body"):
+                raise TypeError(f"{method}() got an unexpected keyword argument '{name}'")
+
+    @staticmethod
+    def _to_response(resp: dict) -> RecognizeAllTextResponse:
         return RecognizeAllTextResponse(
             status_code=resp.get("statusCode"),
             headers=resp.get("headers", {}),
@@ -260,7 +518,68 @@ class RecognizeAllText:
         )
 
 
+class RecognizeAllTextTemplate:
+    """RecognizeAllText 的预编译请求模板，由 ``RecognizeAllText.prepare()`` 创建。
+
+    创建时完成参数校验、API 参数名映射与取值字符串化，并固定一份 RuntimeOptions；
+    每次调用只需合入图片，时间戳、随机数与签名在发送时生成。
+    模板创建后不可修改，可在多个线程或协程间共享。
+
+    Attributes:
+        options: 创建模板时的识别参数（只读）。
+    """
+
+    __slots__ = ("_owner", "_options", "_params", "_runtime")
+
+    def __init__(self, owner: "RecognizeAllText", options: dict, runtime: RuntimeOptions = None):
+        api_params = RecognizeAllText._build_request(**options).body
+        object.__setattr__(self, "_owner", owner)
+        object.__setattr__(self, "_options", MappingProxyType(dict(options)))
+        # 与 do_rpcrequest 中 Utils.query 的结果一致：已展开并转换为字符串
+        object.__setattr__(self, "_params", Utils.query(api_params))
+        object.__setattr__(self, "_runtime", runtime or RuntimeOptions())
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @property
+    def options(self) -> Mapping[str, Any]:
+        return self._options
+
+    def _request(self, url: str, body: str) -> utils_models.OpenApiRequest:
+        params = dict(self._params)
+        if url is not None:
+            params["Url"] = url
+        if body is not None:
+            params["Body"] = body
+        return utils_models.OpenApiRequest(body=params, query={})
+
+    def recognize(self, url: str = None, body: str = None) -> RecognizeAllTextResponse:
+        """按模板参数识别一张图片（URL 或 Base64，二选一）。"""
+        return self._owner._call(self._request(url, body), self._runtime)
+
+    async def recognize_async(self, url: str = None, body: str = None) -> RecognizeAllTextResponse:
+        """``recognize`` 的协程版本。"""
+        return await self._owner._call_async(self._request(url, body), self._runtime)
+
+    def recognize_file(self, file) -> RecognizeAllTextResponse:
+        """按模板参数以二进制流上传本地图片，参见 ``RecognizeAllText.recognize_file``。"""
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "rb") as f:
+                return self._owner._call_stream(f, dict(self._params), self._runtime)
+        return self._owner._call_stream(file, dict(self._params), self._runtime)
+
+    def recognize_bytes(self, data: Union[bytes, bytearray, memoryview]) -> RecognizeAllTextResponse:
+        """按模板参数以二进制流上传内存中的图片数据。"""
+        return self._owner._call_stream(io.BytesIO(data), dict(self._params), self._runtime)
+
+
 __all__ = [
     "RecognizeAllText",
+    "RecognizeAllTextBatchItem",
     "RecognizeAllTextResponse",
+    "RecognizeAllTextTemplate",
 ]
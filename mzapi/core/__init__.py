@@ -22,4 +22,9 @@ _MZAPI_ORIGIN = "mzapi-utlis-init-2026-qxx"
   - huaweicloudauth：华为云 SDK 核心认证模块（来自 huaweicloud-sdk-python-v3）
   - tencentauth：腾讯云 API 完整认证工具集
   - aliyunauth：阿里云 OpenAPI SDK 核心模块（来自 alibabacloud_tea_openapi）
+  - sm3：SM3 国密哈希算法（阿里云与华为云签名共用）
+  - ssl_context：进程级 SSLContext 注册表（三家传输层共用）
+  - loop_resources：按事件循环缓存的异步连接资源（阿里云与华为云共用）
+  - sse：增量 SSE 解码器（阿里云与腾讯云共用）
+  - rate_limit：根据限流响应自适应调整的客户端限速器（三家客户端共用）
 """
@@ -24,16 +24,15 @@ from mzapi.utlis.aliyunauth import exceptions as main_exceptions
 from mzapi.utlis.aliyunauth import models as main_models
 from mzapi.utlis.aliyunauth import utils_models as open_api_util_models
 from mzapi.utlis.aliyunauth.utils import Utils
-from darabonba.core import DaraCore as DaraCore
-from darabonba.core import DaraCore
-from darabonba.exceptions import DaraException, UnretryableException
-from darabonba.policy.retry import RetryOptions, RetryPolicyContext
-from darabonba.request import DaraRequest
-from darabonba.runtime import RuntimeOptions
-from darabonba.utils.bytes import Bytes as DaraBytes
-from darabonba.utils.form import Form as DaraForm
-from darabonba.utils.stream import Stream as DaraStream
-from darabonba.utils.xml import XML as DaraXML
+from mzapi.core.aliyunauth.darabonba.core import DaraCore
+from mzapi.core.rate_limit import AdaptiveRateLimiter, get_rate_limiter
+from mzapi.core.aliyunauth.darabonba.exceptions import DaraException, UnretryableException
+from mzapi.core.aliyunauth.darabonba.policy.retry import RetryOptions, RetryPolicyContext
+from mzapi.core.aliyunauth.darabonba.request import DaraRequest
+from mzapi.core.aliyunauth.darabonba.runtime import RuntimeOptions
+from mzapi.core.aliyunauth.darabonba.utils.bytes import Bytes as DaraBytes
+from mzapi.core.aliyunauth.darabonba.utils.stream import Stream as DaraStream
+from mzapi.core.aliyunauth.darabonba.utils.xml import XML as DaraXML
 
 """
  * @remarks
@@ -73,6 +72,7 @@ class Client:
     _retry_options: RetryOptions = None
     _tls_min_version: str = None
     _attribute_map: spi_models.AttributeMap = None
+    _rate_limit_account: str = None
 
     def __init__(
         self,
@@ -133,6 +133,7 @@ class Client:
         self._disable_http_2 = config.disable_http_2
         self._retry_options = config.retry_options
         self._tls_min_version = config.tls_min_version
+        self._rate_limit_account = config.access_key_id or ''
 
     """
      * @remarks
@@ -174,6 +175,8 @@ class Client:
             'retryOptions': self._retry_options,
             'ignoreSSL': runtime.ignore_ssl,
             'tlsMinVersion': self._tls_min_version,
+            'disableHttp2': self._disable_http_2,
+            'stream': body_type == 'binary',
         }
         _last_request = None
         _last_response = None
@@ -235,7 +238,7 @@ class Client:
                 if not DaraCore.is_null(request.body):
                     m = request.body
                     tmp = Utils.query(m)
-                    _request.body = DaraForm.to_form_string(tmp)
+                    _request.body = Utils.to_form_string(tmp)
                     _request.headers["content-type"] = 'application/x-www-form-urlencoded'
                 if auth_type != 'Anonymous':
                     if DaraCore.is_null(self._credential):
@@ -265,19 +268,25 @@ class Client:
                         _request.query["AccessKeyId"] = access_key_id
                         t = None
                         if not DaraCore.is_null(request.body):
-                            t = request.body
-                        signed_param = DaraCore.merge({}, _request.query, Utils.query(t))
+                            # reuse the flattened form params built for the body above
+                            t = tmp
+                        signed_param = DaraCore.merge({}, _request.query, t)
                         _request.query["Signature"] = Utils.get_rpcsignature(signed_param, _request.method, access_key_secret)
 
                 _last_request = _request
+                _limiter = self._get_rate_limiter(action)
+                _limiter.acquire()
                 _response = DaraCore.do_action(_request, _runtime)
                 _last_response = _response
+                if _response.status_code < 400:
+                    _limiter.on_success()
                 if (_response.status_code >= 400) and (_response.status_code < 600):
                     _res = DaraStream.read_as_json(_response.body)
                     err = _res
                     request_id = err.get("RequestId") or err.get("requestId")
                     code = err.get("Code") or err.get("code")
                     if (f'{code}' == 'Throttling') or (f'{code}' == 'Throttling.User') or (f'{code}' == 'Throttling.Api'):
+                        _limiter.on_throttle(Utils.get_throttling_time_left(_response.headers) / 1000)
                         raise main_exceptions.ThrottlingException(
                             status_code = _response.status_code,
                             code = f'{code}',
@@ -385,6 +394,7 @@ class Client:
             'retryOptions': self._retry_options,
             'ignoreSSL': runtime.ignore_ssl,
             'tlsMinVersion': self._tls_min_version,
+            'disableHttp2': self._disable_http_2,
         }
         _last_request = None
         _last_response = None
@@ -396,7 +406,7 @@ class Client:
             if _retries_attempted > 0:
                 _backoff_time = DaraCore.get_backoff_time(_runtime.get('retryOptions'), _context)
                 if _backoff_time > 0:
-                    DaraCore.sleep(_backoff_time)
+                    await DaraCore.sleep_async(_backoff_time)
             _retries_attempted = _retries_attempted + 1
             try:
                 _request = DaraRequest()
@@ -446,7 +456,7 @@ class Client:
                 if not DaraCore.is_null(request.body):
                     m = request.body
                     tmp = Utils.query(m)
-                    _request.body = DaraForm.to_form_string(tmp)
+                    _request.body = Utils.to_form_string(tmp)
                     _request.headers["content-type"] = 'application/x-www-form-urlencoded'
                 if auth_type != 'Anonymous':
                     if DaraCore.is_null(self._credential):
@@ -476,19 +486,25 @@ class Client:
                         _request.query["AccessKeyId"] = access_key_id
                         t = None
                         if not DaraCore.is_null(request.body):
-                            t = request.body
-                        signed_param = DaraCore.merge({}, _request.query, Utils.query(t))
+                            # reuse the flattened form params built for the body above
+                            t = tmp
+                        signed_param = DaraCore.merge({}, _request.query, t)
                         _request.query["Signature"] = Utils.get_rpcsignature(signed_param, _request.method, access_key_secret)
 
                 _last_request = _request
+                _limiter = self._get_rate_limiter(action)
+                await _limiter.acquire_async()
                 _response = await DaraCore.async_do_action(_request, _runtime)
                 _last_response = _response
+                if _response.status_code < 400:
+                    _limiter.on_success()
                 if (_response.status_code >= 400) and (_response.status_code < 600):
                     _res = await DaraStream.read_as_json_async(_response.body)
                     err = _res
                     request_id = err.get("RequestId") or err.get("requestId")
                     code = err.get("Code") or err.get("code")
                     if (f'{code}' == 'Throttling') or (f'{code}' == 'Throttling.User') or (f'{code}' == 'Throttling.Api'):
+                        _limiter.on_throttle(Utils.get_throttling_time_left(_response.headers) / 1000)
                         raise main_exceptions.ThrottlingException(
                             status_code = _response.status_code,
                             code = f'{code}',
@@ -612,6 +628,8 @@ class Client:
             'retryOptions': self._retry_options,
             'ignoreSSL': runtime.ignore_ssl,
             'tlsMinVersion': self._tls_min_version,
+            'disableHttp2': self._disable_http_2,
+            'stream': body_type == 'binary',
         }
         _last_request = None
         _last_response = None
@@ -691,8 +709,12 @@ class Client:
                         _request.headers["authorization"] = f'acs {access_key_id}:{Utils.get_roasignature(string_to_sign, access_key_secret)}'
 
                 _last_request = _request
+                _limiter = self._get_rate_limiter(action)
+                _limiter.acquire()
                 _response = DaraCore.do_action(_request, _runtime)
                 _last_response = _response
+                if _response.status_code < 400:
+                    _limiter.on_success()
                 if _response.status_code == 204:
                     return {
                         'headers': _response.headers
@@ -704,6 +726,7 @@ class Client:
                     request_id = request_id or err.get("requestid")
                     code = err.get("Code") or err.get("code")
                     if (f'{code}' == 'Throttling') or (f'{code}' == 'Throttling.User') or (f'{code}' == 'Throttling.Api'):
+                        _limiter.on_throttle(Utils.get_throttling_time_left(_response.headers) / 1000)
                         raise main_exceptions.ThrottlingException(
                             status_code = _response.status_code,
                             code = f'{code}',
@@ -812,6 +835,7 @@ class Client:
             'retryOptions': self._retry_options,
             'ignoreSSL': runtime.ignore_ssl,
             'tlsMinVersion': self._tls_min_version,
+            'disableHttp2': self._disable_http_2,
         }
         _last_request = None
         _last_response = None
@@ -823,7 +847,7 @@ class Client:
             if _retries_attempted > 0:
                 _backoff_time = DaraCore.get_backoff_time(_runtime.get('retryOptions'), _context)
                 if _backoff_time > 0:
-                    DaraCore.sleep(_backoff_time)
+                    await DaraCore.sleep_async(_backoff_time)
             _retries_attempted = _retries_attempted + 1
             try:
                 _request = DaraRequest()
@@ -891,8 +915,12 @@ class Client:
                         _request.headers["authorization"] = f'acs {access_key_id}:{Utils.get_roasignature(string_to_sign, access_key_secret)}'
 
                 _last_request = _request
+                _limiter = self._get_rate_limiter(action)
+                await _limiter.acquire_async()
                 _response = await DaraCore.async_do_action(_request, _runtime)
                 _last_response = _response
+                if _response.status_code < 400:
+                    _limiter.on_success()
                 if _response.status_code == 204:
                     return {
                         'headers': _response.headers
@@ -904,6 +932,7 @@ class Client:
                     request_id = request_id or err.get("requestid")
                     code = err.get("Code") or err.get("code")
                     if (f'{code}' == 'Throttling') or (f'{code}' == 'Throttling.User') or (f'{code}' == 'Throttling.Api'):
+                        _limiter.on_throttle(Utils.get_throttling_time_left(_response.headers) / 1000)
                         raise main_exceptions.ThrottlingException(
                             status_code = _response.status_code,
                             code = f'{code}',
@@ -1027,6 +1056,8 @@ class Client:
             'retryOptions': self._retry_options,
             'ignoreSSL': runtime.ignore_ssl,
             'tlsMinVersion': self._tls_min_version,
+            'disableHttp2': self._disable_http_2,
+            'stream': body_type == 'binary',
         }
         _last_request = None
         _last_response = None
@@ -1107,8 +1138,12 @@ class Client:
                         _request.headers["authorization"] = f'acs {access_key_id}:{Utils.get_roasignature(string_to_sign, access_key_secret)}'
 
                 _last_request = _request
+                _limiter = self._get_rate_limiter(action)
+                _limiter.acquire()
                 _response = DaraCore.do_action(_request, _runtime)
                 _last_response = _response
+                if _response.status_code < 400:
+                    _limiter.on_success()
                 if _response.status_code == 204:
                     return {
                         'headers': _response.headers
@@ -1119,6 +1154,7 @@ class Client:
                     request_id = err.get("RequestId") or err.get("requestId")
                     code = err.get("Code") or err.get("code")
                     if (f'{code}' == 'Throttling') or (f'{code}' == 'Throttling.User') or (f'{code}' == 'Throttling.Api'):
+                        _limiter.on_throttle(Utils.get_throttling_time_left(_response.headers) / 1000)
                         raise main_exceptions.ThrottlingException(
                             status_code = _response.status_code,
                             code = f'{code}',
@@ -1227,6 +1263,7 @@ class Client:
             'retryOptions': self._retry_options,
             'ignoreSSL': runtime.ignore_ssl,
             'tlsMinVersion': self._tls_min_version,
+            'disableHttp2': self._disable_http_2,
         }
         _last_request = None
         _last_response = None
@@ -1238,7 +1275,7 @@ class Client:
             if _retries_attempted > 0:
                 _backoff_time = DaraCore.get_backoff_time(_runtime.get('retryOptions'), _context)
                 if _backoff_time > 0:
-                    DaraCore.sleep(_backoff_time)
+                    await DaraCore.sleep_async(_backoff_time)
             _retries_attempted = _retries_attempted + 1
             try:
                 _request = DaraRequest()
@@ -1307,8 +1344,12 @@ class Client:
                         _request.headers["authorization"] = f'acs {access_key_id}:{Utils.get_roasignature(string_to_sign, access_key_secret)}'
 
                 _last_request = _request
+                _limiter = self._get_rate_limiter(action)
+                await _limiter.acquire_async()
                 _response = await DaraCore.async_do_action(_request, _runtime)
                 _last_response = _response
+                if _response.status_code < 400:
+                    _limiter.on_success()
                 if _response.status_code == 204:
                     return {
                         'headers': _response.headers
@@ -1319,6 +1360,7 @@ class Client:
                     request_id = err.get("RequestId") or err.get("requestId")
                     code = err.get("Code") or err.get("code")
                     if (f'{code}' == 'Throttling') or (f'{code}' == 'Throttling.User') or (f'{code}' == 'Throttling.Api'):
+                        _limiter.on_throttle(Utils.get_throttling_time_left(_response.headers) / 1000)
                         raise main_exceptions.ThrottlingException(
                             status_code = _response.status_code,
                             code = f'{code}',
@@ -1435,6 +1477,8 @@ class Client:
             'retryOptions': self._retry_options,
             'ignoreSSL': runtime.ignore_ssl,
             'tlsMinVersion': self._tls_min_version,
+            'disableHttp2': self._disable_http_2,
+            'stream': params.body_type == 'binary',
         }
         _last_request = None
         _last_response = None
@@ -1442,6 +1486,7 @@ class Client:
         _context = RetryPolicyContext(
             retries_attempted= _retries_attempted
         )
+        _stream_offset = Utils.stream_offset(request.stream)
         while DaraCore.should_retry(_runtime.get('retryOptions'), _context):
             if _retries_attempted > 0:
                 _backoff_time = DaraCore.get_backoff_time(_runtime.get('retryOptions'), _context)
@@ -1486,7 +1531,12 @@ class Client:
                         _request.headers = DaraCore.merge({}, _request.headers, headers)
                 signature_algorithm = self._signature_algorithm or 'ACS3-HMAC-SHA256'
                 hashed_request_payload = Utils.hash(DaraBytes.from_('', 'utf-8'), signature_algorithm)
-                if not DaraCore.is_null(request.stream):
+                if not DaraCore.is_null(request.stream) and not DaraCore.is_null(_stream_offset):
+                    # seekable streams are hashed chunk by chunk and sent without buffering
+                    hashed_request_payload = Utils.hash_stream(request.stream, _stream_offset, signature_algorithm)
+                    _request.body = request.stream
+                    _request.headers["content-type"] = 'application/octet-stream'
+                elif not DaraCore.is_null(request.stream):
                     tmp = DaraStream.read_as_bytes(request.stream)
                     hashed_request_payload = Utils.hash(tmp, signature_algorithm)
                     _request.body = tmp
@@ -1542,8 +1592,12 @@ class Client:
                         _request.headers["Authorization"] = Utils.get_authorization(_request, signature_algorithm, hashed_request_payload.hex(), access_key_id, access_key_secret)
 
                 _last_request = _request
+                _limiter = self._get_rate_limiter(params.action)
+                _limiter.acquire()
                 _response = DaraCore.do_action(_request, _runtime)
                 _last_response = _response
+                if _response.status_code < 400:
+                    _limiter.on_success()
                 if (_response.status_code >= 400) and (_response.status_code < 600):
                     err = {}
                     if not DaraCore.is_null(_response.headers.get("content-type")) and _response.headers.get("content-type") == 'text/xml;charset=utf-8':
@@ -1557,6 +1611,7 @@ class Client:
                     request_id = err.get("RequestId") or err.get("requestId")
                     code = err.get("Code") or err.get("code")
                     if (f'{code}' == 'Throttling') or (f'{code}' == 'Throttling.User') or (f'{code}' == 'Throttling.Api'):
+                        _limiter.on_throttle(Utils.get_throttling_time_left(_response.headers) / 1000)
                         raise main_exceptions.ThrottlingException(
                             status_code = _response.status_code,
                             code = f'{code}',
@@ -1661,6 +1716,7 @@ class Client:
             'retryOptions': self._retry_options,
             'ignoreSSL': runtime.ignore_ssl,
             'tlsMinVersion': self._tls_min_version,
+            'disableHttp2': self._disable_http_2,
         }
         _last_request = None
         _last_response = None
@@ -1668,11 +1724,12 @@ class Client:
         _context = RetryPolicyContext(
             retries_attempted= _retries_attempted
         )
+        _stream_offset = Utils.stream_offset(request.stream)
         while DaraCore.should_retry(_runtime.get('retryOptions'), _context):
             if _retries_attempted > 0:
                 _backoff_time = DaraCore.get_backoff_time(_runtime.get('retryOptions'), _context)
                 if _backoff_time > 0:
-                    DaraCore.sleep(_backoff_time)
+                    await DaraCore.sleep_async(_backoff_time)
             _retries_attempted = _retries_attempted + 1
             try:
                 _request = DaraRequest()
@@ -1712,7 +1769,12 @@ class Client:
                         _request.headers = DaraCore.merge({}, _request.headers, headers)
                 signature_algorithm = self._signature_algorithm or 'ACS3-HMAC-SHA256'
                 hashed_request_payload = Utils.hash(DaraBytes.from_('', 'utf-8'), signature_algorithm)
-                if not DaraCore.is_null(request.stream):
+                if not DaraCore.is_null(request.stream) and not DaraCore.is_null(_stream_offset):
+                    # seekable streams are hashed chunk by chunk and sent without buffering
+                    hashed_request_payload = Utils.hash_stream(request.stream, _stream_offset, signature_algorithm)
+                    _request.body = request.stream
+                    _request.headers["content-type"] = 'application/octet-stream'
+                elif not DaraCore.is_null(request.stream):
                     tmp = await DaraStream.read_as_bytes_async(request.stream)
                     hashed_request_payload = Utils.hash(tmp, signature_algorithm)
                     _request.body = tmp
@@ -1768,8 +1830,12 @@ class Client:
                         _request.headers["Authorization"] = Utils.get_authorization(_request, signature_algorithm, hashed_request_payload.hex(), access_key_id, access_key_secret)
 
                 _last_request = _request
+                _limiter = self._get_rate_limiter(params.action)
+                await _limiter.acquire_async()
                 _response = await DaraCore.async_do_action(_request, _runtime)
                 _last_response = _response
+                if _response.status_code < 400:
+                    _limiter.on_success()
                 if (_response.status_code >= 400) and (_response.status_code < 600):
                     err = {}
                     if not DaraCore.is_null(_response.headers.get("content-type")) and _response.headers.get("content-type") == 'text/xml;charset=utf-8':
@@ -1783,6 +1849,7 @@ class Client:
                     request_id = err.get("RequestId") or err.get("requestId")
                     code = err.get("Code") or err.get("code")
                     if (f'{code}' == 'Throttling') or (f'{code}' == 'Throttling.User') or (f'{code}' == 'Throttling.Api'):
+                        _limiter.on_throttle(Utils.get_throttling_time_left(_response.headers) / 1000)
                         raise main_exceptions.ThrottlingException(
                             status_code = _response.status_code,
                             code = f'{code}',
@@ -1901,7 +1968,7 @@ class Client:
             'retryOptions': self._retry_options,
             'ignoreSSL': runtime.ignore_ssl,
             'tlsMinVersion': self._tls_min_version,
-            'disableHttp2': bool(self._disable_http_2 or False),
+            'disableHttp2': self._disable_http_2,
         }
         _last_request = None
         _last_response = None
@@ -1983,8 +2050,14 @@ class Client:
                 _request.body = interceptor_context.request.stream
                 _request.headers = interceptor_context.request.headers
                 _last_request = _request
+                _limiter = self._get_rate_limiter(params.action)
+                _limiter.acquire()
                 _response = DaraCore.do_action(_request, _runtime)
                 _last_response = _response
+                if _response.status_code == 429:
+                    _limiter.on_throttle(Utils.get_throttling_time_left(_response.headers) / 1000)
+                elif _response.status_code < 400:
+                    _limiter.on_success()
                 response_context = spi_models.InterceptorContextResponse(
                     status_code = _response.status_code,
                     headers = _response.headers,
@@ -2030,7 +2103,7 @@ class Client:
             'retryOptions': self._retry_options,
             'ignoreSSL': runtime.ignore_ssl,
             'tlsMinVersion': self._tls_min_version,
-            'disableHttp2': bool(self._disable_http_2 or False),
+            'disableHttp2': self._disable_http_2,
         }
         _last_request = None
         _last_response = None
@@ -2042,7 +2115,7 @@ class Client:
             if _retries_attempted > 0:
                 _backoff_time = DaraCore.get_backoff_time(_runtime.get('retryOptions'), _context)
                 if _backoff_time > 0:
-                    DaraCore.sleep(_backoff_time)
+                    await DaraCore.sleep_async(_backoff_time)
             _retries_attempted = _retries_attempted + 1
             try:
                 _request = DaraRequest()
@@ -2112,8 +2185,14 @@ class Client:
                 _request.body = interceptor_context.request.stream
                 _request.headers = interceptor_context.request.headers
                 _last_request = _request
+                _limiter = self._get_rate_limiter(params.action)
+                await _limiter.acquire_async()
                 _response = await DaraCore.async_do_action(_request, _runtime)
                 _last_response = _response
+                if _response.status_code == 429:
+                    _limiter.on_throttle(Utils.get_throttling_time_left(_response.headers) / 1000)
+                elif _response.status_code < 400:
+                    _limiter.on_success()
                 response_context = spi_models.InterceptorContextResponse(
                     status_code = _response.status_code,
                     headers = _response.headers,
@@ -2166,6 +2245,7 @@ class Client:
         _context = RetryPolicyContext(
             retries_attempted= _retries_attempted
         )
+        _stream_offset = Utils.stream_offset(request.stream)
         while DaraCore.should_retry(_runtime.get('retryOptions'), _context):
             if _retries_attempted > 0:
                 _backoff_time = DaraCore.get_backoff_time(_runtime.get('retryOptions'), _context)
@@ -2210,7 +2290,12 @@ class Client:
                         _request.headers = DaraCore.merge({}, _request.headers, headers)
                 signature_algorithm = self._signature_algorithm or 'ACS3-HMAC-SHA256'
                 hashed_request_payload = Utils.hash(DaraBytes.from_('', 'utf-8'), signature_algorithm)
-                if not DaraCore.is_null(request.stream):
+                if not DaraCore.is_null(request.stream) and not DaraCore.is_null(_stream_offset):
+                    # seekable streams are hashed chunk by chunk and sent without buffering
+                    hashed_request_payload = Utils.hash_stream(request.stream, _stream_offset, signature_algorithm)
+                    _request.body = request.stream
+                    _request.headers["content-type"] = 'application/octet-stream'
+                elif not DaraCore.is_null(request.stream):
                     tmp = DaraStream.read_as_bytes(request.stream)
                     hashed_request_payload = Utils.hash(tmp, signature_algorithm)
                     _request.body = tmp
@@ -2322,11 +2407,12 @@ class Client:
         _context = RetryPolicyContext(
             retries_attempted= _retries_attempted
         )
+        _stream_offset = Utils.stream_offset(request.stream)
         while DaraCore.should_retry(_runtime.get('retryOptions'), _context):
             if _retries_attempted > 0:
                 _backoff_time = DaraCore.get_backoff_time(_runtime.get('retryOptions'), _context)
                 if _backoff_time > 0:
-                    DaraCore.sleep(_backoff_time)
+                    await DaraCore.sleep_async(_backoff_time)
             _retries_attempted = _retries_attempted + 1
             try:
                 _request = DaraRequest()
@@ -2366,7 +2452,12 @@ class Client:
                         _request.headers = DaraCore.merge({}, _request.headers, headers)
                 signature_algorithm = self._signature_algorithm or 'ACS3-HMAC-SHA256'
                 hashed_request_payload = Utils.hash(DaraBytes.from_('', 'utf-8'), signature_algorithm)
-                if not DaraCore.is_null(request.stream):
+                if not DaraCore.is_null(request.stream) and not DaraCore.is_null(_stream_offset):
+                    # seekable streams are hashed chunk by chunk and sent without buffering
+                    hashed_request_payload = Utils.hash_stream(request.stream, _stream_offset, signature_algorithm)
+                    _request.body = request.stream
+                    _request.headers["content-type"] = 'application/octet-stream'
+                elif not DaraCore.is_null(request.stream):
                     tmp = await DaraStream.read_as_bytes_async(request.stream)
                     hashed_request_payload = Utils.hash(tmp, signature_algorithm)
                     _request.body = tmp
@@ -2587,6 +2678,17 @@ class Client:
         self._headers = None
         return headers
 
+    def _get_rate_limiter(self, action: str) -> AdaptiveRateLimiter:
+        """
+         * @remarks
+         * Get the adaptive rate limiter shared by requests of the same account and api.
+         * It starts pacing after the first throttling response and recovers gradually.
+         * 
+         * @param action - api name
+         * @returns the rate limiter
+        """
+        return get_rate_limiter('aliyun', self._rate_limit_account, action)
+
     def default_any(
         input_value: Any,
         default_value: Any,
@@ -34,12 +34,20 @@ _MZAPI_ORIGIN = "mzapi-aliyun-default-2026-qxx"
   - 支持凭证提供者链式调用
   - 支持重用上次成功的凭证提供者
   - 支持凭证自动刷新
+
+重用上次成功的提供者时（默认），首次成功后固定该提供者，凭证以内存快照提供：
+快照由 RefreshCachedSupplier 管理，过期前（带有效期的凭证提前 15 分钟，
+有效期未知的凭证在 SNAPSHOT_STALE_TIME 后）同步刷新，
+平时每隔 SNAPSHOT_PREFETCH_INTERVAL 秒通过 NonBlocking 在后台线程重新向提供者取值，
+请求路径上不再读取环境变量、配置文件或访问元数据服务。
 """
 
+import time
+
 from . import EnvironmentVariableCredentialsProvider, EcsRamRoleCredentialsProvider, \
     OIDCRoleArnCredentialsProvider, URLCredentialsProvider, CLIProfileCredentialsProvider, ProfileCredentialsProvider
 
-from .refreshable import Credentials
+from .refreshable import Credentials, RefreshResult, RefreshCachedSupplier, NonBlocking
 from .refreshable import ICredentialsProvider
 from ... import auth_util as au
 from ..exceptions import CredentialException
@@ -54,8 +62,16 @@ class DefaultCredentialsProvider(ICredentialsProvider):
     Attributes:
         _providers_chain: 凭证提供者链
         _last_used_provider: 上次成功使用的凭证提供者
+        _credentials_cache: 凭证快照，仅在重用上次成功的提供者时启用
+
+    Class Attributes:
+        SNAPSHOT_PREFETCH_INTERVAL: 后台重新取值的间隔（秒），默认 60 秒
+        SNAPSHOT_STALE_TIME: 有效期未知的凭证快照最长使用时间（秒），默认 5 分钟
     """
 
+    SNAPSHOT_PREFETCH_INTERVAL = 60  # seconds
+    SNAPSHOT_STALE_TIME = 5 * 60  # seconds
+
     def __init__(self, *,
                  reuse_last_provider_enabled: bool = True):
         """初始化默认凭证提供者
@@ -89,25 +105,51 @@ class DefaultCredentialsProvider(ICredentialsProvider):
         if au.environment_credentials_uri is not None and au.environment_credentials_uri != '':
             self.__providers_chain.append(URLCredentialsProvider())
 
+        self.__credentials_cache = None
+        if reuse_last_provider_enabled:
+            self.__credentials_cache = RefreshCachedSupplier(
+                refresh_callable=self._refresh_credentials,
+                refresh_callable_async=self._refresh_credentials_async,
+                prefetch_strategy=NonBlocking()
+            )
+
     def get_credentials(self) -> Credentials:
         """获取凭证同步方法
 
         按照提供者链顺序依次尝试获取凭证，直到成功。
+        重用上次成功的提供者时，返回内存中的凭证快照。
 
         Returns:
             Credentials: 凭证对象
 
+        Raises:
+            CredentialException: 当所有提供者都无法获取凭证时抛出
+        """
+        if self.__credentials_cache is not None:
+            return self.__credentials_cache._sync_call()
+        return self._wrap(self._resolve_credentials())
+
+    async def get_credentials_async(self) -> Credentials:
+        """获取凭证异步方法
+
+        Returns:
+            Credentials: 凭证对象
+        """
+        if self.__credentials_cache is not None:
+            return await self.__credentials_cache._async_call()
+        return self._wrap(await self._resolve_credentials_async())
+
+    def _resolve_credentials(self) -> Credentials:
+        """从固定的提供者或提供者链获取凭证
+
+        Returns:
+            Credentials: 提供者返回的凭证
+
         Raises:
             CredentialException: 当所有提供者都无法获取凭证时抛出
         """
         if self.__reuse_last_provider_enabled and self.__last_used_provider is not None:
-            credentials = self.__last_used_provider.get_credentials()
-            return Credentials(
-                access_key_id=credentials.get_access_key_id(),
-                access_key_secret=credentials.get_access_key_secret(),
-                security_token=credentials.get_security_token(),
-                provider_name=f'{self.get_provider_name()}/{credentials.get_provider_name()}'
-            )
+            return self.__last_used_provider.get_credentials()
 
         error_messages = []
         for provider in self.__providers_chain:
@@ -115,32 +157,21 @@ class DefaultCredentialsProvider(ICredentialsProvider):
                 credentials = provider.get_credentials()
                 if credentials is not None:
                     self.__last_used_provider = provider
-                    return Credentials(
-                        access_key_id=credentials.get_access_key_id(),
-                        access_key_secret=credentials.get_access_key_secret(),
-                        security_token=credentials.get_security_token(),
-                        provider_name=f'{self.get_provider_name()}/{credentials.get_provider_name()}'
-                    )
+                    return credentials
             except Exception as e:
                 error_messages.append(f'{type(provider).__name__}: {str(e)}')
 
         raise CredentialException(
             f'unable to load credentials from any of the providers in the chain: {error_messages}')
 
-    async def get_credentials_async(self) -> Credentials:
-        """获取凭证异步方法
+    async def _resolve_credentials_async(self) -> Credentials:
+        """从固定的提供者或提供者链获取凭证（异步版本）
 
         Returns:
-            Credentials: 凭证对象
+            Credentials: 提供者返回的凭证
         """
         if self.__reuse_last_provider_enabled and self.__last_used_provider is not None:
-            credentials = await self.__last_used_provider.get_credentials_async()
-            return Credentials(
-                access_key_id=credentials.get_access_key_id(),
-                access_key_secret=credentials.get_access_key_secret(),
-                security_token=credentials.get_security_token(),
-                provider_name=f'{self.get_provider_name()}/{credentials.get_provider_name()}'
-            )
+            return await self.__last_used_provider.get_credentials_async()
 
         error_messages = []
         for provider in self.__providers_chain:
@@ -148,18 +179,58 @@ class DefaultCredentialsProvider(ICredentialsProvider):
                 credentials = await provider.get_credentials_async()
                 if credentials is not None:
                     self.__last_used_provider = provider
-                    return Credentials(
-                        access_key_id=credentials.get_access_key_id(),
-                        access_key_secret=credentials.get_access_key_secret(),
-                        security_token=credentials.get_security_token(),
-                        provider_name=f'{self.get_provider_name()}/{credentials.get_provider_name()}'
-                    )
+                    return credentials
             except Exception as e:
                 error_messages.append(f'{type(provider).__name__}: {str(e)}')
 
         raise CredentialException(
             f'unable to load credentials from any of the providers in the chain: {error_messages}')
 
+    def _wrap(self, credentials: Credentials) -> Credentials:
+        """以 default/<提供者名称> 包装提供者返回的凭证
+
+        Args:
+            credentials: 提供者返回的凭证
+
+        Returns:
+            Credentials: 包装后的凭证
+        """
+        return Credentials(
+            access_key_id=credentials.get_access_key_id(),
+            access_key_secret=credentials.get_access_key_secret(),
+            security_token=credentials.get_security_token(),
+            expiration=credentials.get_expiration(),
+            provider_name=f'{self.get_provider_name()}/{credentials.get_provider_name()}'
+        )
+
+    def _to_refresh_result(self, credentials: Credentials) -> RefreshResult[Credentials]:
+        """计算快照的过期与预刷新时间
+
+        Args:
+            credentials: 提供者返回的凭证
+
+        Returns:
+            RefreshResult: 包含快照凭证和过期时间信息的结果对象
+        """
+        now = int(time.mktime(time.localtime()))
+        expiration = credentials.get_expiration()
+        if expiration:
+            stale_time = expiration - 15 * 60
+        else:
+            # 有效期未知（静态 AK，或 Profile 等包装后丢失了有效期），限制快照的最长使用时间
+            stale_time = now + DefaultCredentialsProvider.SNAPSHOT_STALE_TIME
+        return RefreshResult(value=self._wrap(credentials),
+                             stale_time=stale_time,
+                             prefetch_time=min(now + DefaultCredentialsProvider.SNAPSHOT_PREFETCH_INTERVAL, stale_time))
+
+    def _refresh_credentials(self) -> RefreshResult[Credentials]:
+        """刷新凭证快照（同步版本）"""
+        return self._to_refresh_result(self._resolve_credentials())
+
+    async def _refresh_credentials_async(self) -> RefreshResult[Credentials]:
+        """刷新凭证快照（异步版本）"""
+        return self._to_refresh_result(await self._resolve_credentials_async())
+
     def get_provider_name(self) -> str:
         """获取凭证提供者名称
 
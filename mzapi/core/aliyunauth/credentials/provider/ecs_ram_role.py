@@ -36,14 +36,13 @@ ECS RAM 角色凭证提供者模块
 import calendar
 import json
 import time
-import atexit
 import logging
+import weakref
 
 from .refreshable import Credentials, RefreshResult, StaleValueBehavior, \
-    RefreshCachedSupplier, NonBlocking
+    RefreshCachedSupplier, NonBlocking, SCHEDULER
 from ..http import HttpOptions
 from Tea.core import TeaCore
-from apscheduler.schedulers.background import BackgroundScheduler
 from .refreshable import ICredentialsProvider
 from ... import auth_util as au
 from ... import parameter_helper as ph
@@ -118,16 +117,19 @@ class EcsRamRoleCredentialsProvider(ICredentialsProvider):
                 prefetch_strategy=NonBlocking()
             )
 
-            scheduler = BackgroundScheduler()
+            # 周期检查挂在进程共享的刷新调度器上，只持有弱引用，提供者被回收后任务自动取消
+            provider_ref = weakref.ref(self)
 
             def refresh_task():
-                if self._should_refresh:
+                provider = provider_ref()
+                if provider is None:
+                    handle.cancel()
+                    return
+                if provider._should_refresh:
                     log.debug(f'Begin checking or refreshing credentials asynchronously')
-                    self.get_credentials()
+                    provider.get_credentials()
 
-            scheduler.add_job(refresh_task, 'interval', minutes=1)
-            scheduler.start()
-            atexit.register(scheduler.shutdown, wait=False)
+            handle = SCHEDULER.schedule(refresh_task, 60, interval=60)
 
         else:
             self._credentials_cache = RefreshCachedSupplier(
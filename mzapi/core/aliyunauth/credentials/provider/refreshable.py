@@ -25,6 +25,7 @@ _MZAPI_ORIGIN = "mzapi-aliyun-refreshable-2026-qxx"
   - RefreshResult：刷新结果封装类
   - PrefetchStrategy：预取策略基类
   - NonBlocking：非阻塞预取策略
+  - RefreshScheduler / ScheduledRefresh：共享的定时刷新调度器与任务句柄
   - OneCallerBlocks：阻塞调用者预取策略
   - RefreshCachedSupplier：带缓存的凭证刷新供应器
 
@@ -36,6 +37,8 @@ _MZAPI_ORIGIN = "mzapi-aliyun-refreshable-2026-qxx"
   - 自动处理凭证过期和刷新
 """
 
+import heapq
+import itertools
 import random
 import asyncio
 import threading
@@ -59,15 +62,121 @@ log.addHandler(ch)
 T = TypeVar('T')
 INT64_MAX = 2 ** 63 - 1
 MAX_CONCURRENT_REFRESHES = 100
+MAX_REFRESH_WORKERS = 4
 CONCURRENT_REFRESH_LEASES = Semaphore(MAX_CONCURRENT_REFRESHES)
-EXECUTOR = ThreadPoolExecutor(max_workers=INT64_MAX, thread_name_prefix='non-blocking-refresh')
+# 异步刷新等待其他线程持有的刷新锁时的轮询间隔（秒）
+REFRESH_LOCK_POLL_INTERVAL = 0.01
+EXECUTOR = ThreadPoolExecutor(max_workers=MAX_REFRESH_WORKERS, thread_name_prefix='non-blocking-refresh')
+
+
+class RefreshScheduler:
+    """共享的凭证刷新调度器
+
+    单个定时线程按到期时间（最小堆）触发任务，任务本身提交到有界线程池 EXECUTOR 执行，
+    因此无论进程内有多少凭证提供者，刷新相关线程数恒为 1 + MAX_REFRESH_WORKERS。
+    同一个周期任务上一次仍在执行时跳过本次触发。
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor):
+        """初始化调度器
+
+        Args:
+            executor: 执行任务的线程池
+        """
+        self._executor = executor
+        self._heap = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+    def schedule(self, action: Callable, delay: float, interval: float = None) -> 'ScheduledRefresh':
+        """在 delay 秒后执行 action；指定 interval 时此后每隔 interval 秒重复执行
+
+        Args:
+            action: 任务回调
+            delay: 首次执行前的延迟（秒）
+            interval: 重复间隔（秒），None 表示只执行一次
+
+        Returns:
+            ScheduledRefresh: 任务句柄，可调用 cancel() 取消
+        """
+        job = ScheduledRefresh(action, interval)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError('refresh scheduler has been shut down')
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._counter), job))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='credentials-refresh-timer', daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return job
+
+    def shutdown(self):
+        """停止定时线程并丢弃未执行的任务"""
+        with self._cond:
+            self._closed = True
+            self._heap.clear()
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and (not self._heap or self._heap[0][0] > time.monotonic()):
+                    self._cond.wait(self._heap[0][0] - time.monotonic() if self._heap else None)
+                if self._closed:
+                    return
+                _, _, job = heapq.heappop(self._heap)
+                if job.cancelled:
+                    continue
+                if job.interval is not None:
+                    heapq.heappush(self._heap, (time.monotonic() + job.interval, next(self._counter), job))
+            job.submit(self._executor)
+
+
+class ScheduledRefresh:
+    """RefreshScheduler 返回的任务句柄"""
+
+    def __init__(self, action: Callable, interval: float = None):
+        self.action = action
+        self.interval = interval
+        self.cancelled = False
+        self._running = False
+        self._lock = threading.Lock()
+
+    def cancel(self):
+        """取消任务，已开始的执行不受影响"""
+        self.cancelled = True
+
+    def submit(self, executor: ThreadPoolExecutor):
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+        try:
+            executor.submit(self._execute)
+        except RuntimeError:
+            # 进程退出时线程池已关闭
+            self._running = False
+
+    def _execute(self):
+        try:
+            self.action()
+        except Exception:
+            log.warning('Scheduled credentials refresh failed.', exc_info=True)
+        finally:
+            self._running = False
+
+
+SCHEDULER = RefreshScheduler(EXECUTOR)
 
 
 def _shutdown_handler():
     """线程池关闭处理器
 
-    在程序退出时优雅关闭线程池。
+    在程序退出时优雅关闭定时线程与线程池。
     """
+    SCHEDULER.shutdown()
     EXECUTOR.shutdown(wait=False)
 
 
@@ -276,42 +385,80 @@ class PrefetchStrategy:
 class NonBlocking(PrefetchStrategy):
     """非阻塞预取策略
 
-    使用后台线程池执行预取操作，不会阻塞当前线程。
-    如果后台任务过多，会跳过本次预取。
+    同步调用时在共享的有界线程池 EXECUTOR 中执行预取，不会阻塞当前线程；
+    异步调用时在调用方的事件循环上以 Task 执行预取。
+    同一个提供者的预取在完成前只会有一个，重复触发直接跳过；
+    排队中的预取超过 MAX_CONCURRENT_REFRESHES 时跳过本次预取。
     """
 
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight = set()
+        # 保留 Task 的强引用，避免执行中被回收
+        self._tasks = set()
+
+    def _begin(self, action: Callable) -> bool:
+        with self._lock:
+            if action in self._inflight:
+                return False
+            self._inflight.add(action)
+            return True
+
+    def _end(self, action: Callable):
+        with self._lock:
+            self._inflight.discard(action)
+
     def prefetch(self, action: Callable):
         """执行非阻塞预取
 
         Args:
             action: 预取操作回调
         """
+        if not self._begin(action):
+            return
         if not CONCURRENT_REFRESH_LEASES.acquire(False):
+            self._end(action)
             log.warning('Skipping a background refresh task because there are too many other tasks running.')
             return
 
+        def run():
+            try:
+                action()
+            finally:
+                CONCURRENT_REFRESH_LEASES.release()
+                self._end(action)
+
         try:
-            EXECUTOR.submit(action)
+            EXECUTOR.submit(run)
         except KeyboardInterrupt:
+            CONCURRENT_REFRESH_LEASES.release()
+            self._end(action)
             _shutdown_handler()
         except Exception as t:
-            log.warning(f'Exception occurred when submitting background task.', exc_info=True)
-        finally:
             CONCURRENT_REFRESH_LEASES.release()
+            self._end(action)
+            log.warning(f'Exception occurred when submitting background task.', exc_info=True)
 
     async def prefetch_async(self, action: Callable):
         """执行非阻塞异步预取
 
         Args:
-            action: 预取操作回调
+            action: 预取操作回调（协程函数）
         """
-        def run_asyncio_loop():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            loop.run_until_complete(action())
-            loop.close()
+        if not self._begin(action):
+            return
+
+        async def run():
+            try:
+                await action()
+            except Exception:
+                log.warning('Background credentials refresh failed.', exc_info=True)
+            finally:
+                self._end(action)
 
-        self.prefetch(run_asyncio_loop)
+        task = asyncio.get_running_loop().create_task(run())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
 
 class OneCallerBlocks(PrefetchStrategy):
@@ -373,6 +520,8 @@ class RefreshCachedSupplier(Generic[T]):
         self._consecutive_refresh_failures = 0
         self._cached_value = None
         self._refresh_lock = threading.Lock()
+        # 事件循环 -> 进行中的异步刷新 Task，刷新完成后移除
+        self._async_refreshes = {}
 
     def _sync_call(self) -> T:
         """同步获取凭证
@@ -444,8 +593,41 @@ class RefreshCachedSupplier(Generic[T]):
         await self._prefetch_strategy.prefetch_async(self._refresh_cache_async)
 
     async def _refresh_cache_async(self):
-        """刷新缓存（异步版本）"""
-        acquired = self._refresh_lock.acquire(timeout=RefreshCachedSupplier.REFRESH_BLOCKING_MAX_WAIT)
+        """刷新缓存（异步版本）
+
+        同一事件循环上并发的刷新（包括 NonBlocking 的预取 Task）合并为一个 Task，
+        其余调用方等待该 Task 完成，不会在事件循环上阻塞等待刷新锁。
+        """
+        loop = asyncio.get_running_loop()
+        task = self._async_refreshes.get(loop)
+        if task is None:
+            task = loop.create_task(self._do_refresh_cache_async())
+            self._async_refreshes[loop] = task
+            task.add_done_callback(lambda t: self._on_async_refresh_done(loop, t))
+        await asyncio.shield(task)
+
+    def _on_async_refresh_done(self, loop, task):
+        if self._async_refreshes.get(loop) is task:
+            del self._async_refreshes[loop]
+        if not task.cancelled():
+            # 等待方全部被取消时，避免 "exception was never retrieved" 警告
+            task.exception()
+
+    async def _acquire_refresh_lock_async(self) -> bool:
+        """以轮询方式获取刷新锁，等待期间让出事件循环
+
+        Returns:
+            bool: 是否在 REFRESH_BLOCKING_MAX_WAIT 内获取到锁
+        """
+        deadline = time.monotonic() + RefreshCachedSupplier.REFRESH_BLOCKING_MAX_WAIT
+        while not self._refresh_lock.acquire(blocking=False):
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(REFRESH_LOCK_POLL_INTERVAL)
+        return True
+
+    async def _do_refresh_cache_async(self):
+        acquired = await self._acquire_refresh_lock_async()
         try:
             if self._cache_is_stale() or self._should_initiate_cache_prefetch():
                 try:
@@ -19,34 +19,50 @@ darabonba 核心运行时模块
 提供 HTTP 请求的同步/异步执行、SSE 流式响应、TLS 适配、重试判断、
 退避计算、数据模型序列化等核心能力。
 
+运行时配置 disableHttp2 显式为 False 时，非流式请求改走 httpx 的 HTTP/2 传输，
+同一端点的并发请求在少量连接上多路复用（需要安装 httpx[http2]）；
+未设置或为 True 时仍使用 requests / aiohttp 的 HTTP/1.1 传输。
+
 包含的类：
   - DaraCore：核心运行时类，提供静态工具方法完成请求发送与数据处理。
   - TLSVersion：TLS 版本枚举。
   - _ModelEncoder：支持 DaraModel 与 bytes 的 JSON 编码器。
   - _TLSAdapter：自定义 TLS 版本的 requests HTTPAdapter。
+  - _AsyncSessionEntry：异步会话缓存项，记录最近使用时间与进行中的请求数。
 """
 
 import asyncio
 import aiohttp
+import atexit
 import logging
 import io
 import os
 import ssl
 import time
 import re
-import certifi
+import threading
 import json
 from requests import status_codes, adapters, PreparedRequest
+from requests.utils import super_len
 from typing import Any, Dict, Optional, Union
 from enum import Enum
 from urllib.parse import urlencode, urlparse
 from requests import status_codes, adapters, PreparedRequest, Session
+from requests.utils import should_bypass_proxies
 from mzapi.core.aliyunauth.darabonba.exceptions import RequiredArgumentException, RetryError
 from mzapi.core.aliyunauth.darabonba.model import DaraModel
 from mzapi.core.aliyunauth.darabonba.request import DaraRequest
 from mzapi.core.aliyunauth.darabonba.response import DaraResponse
-from mzapi.core.aliyunauth.darabonba.utils.stream import BaseStream, SSEResponseWrapper, SyncSSEResponseWrapper
+from mzapi.core.aliyunauth.darabonba.utils.stream import (
+    BaseStream, ResponseStream, SSEResponseWrapper, SyncSSEResponseWrapper, DEFAULT_CHUNK_SIZE)
 from mzapi.core.aliyunauth.darabonba.policy.retry import RetryOptions, RetryPolicyContext
+from mzapi.core.loop_resources import LoopResources
+from mzapi.core.ssl_context import SSLContextAdapter, get_ssl_context, ssl_context_stats
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
 
 DEFAULT_CONNECT_TIMEOUT = 5000
@@ -54,7 +70,12 @@ DEFAULT_READ_TIMEOUT = 10000
 DEFAULT_POOL_SIZE = 10
 DEFAULT_POOL_MAXSIZE = DEFAULT_POOL_SIZE * 4
 MAX_DELAY_TIME = 120 * 1000
+# 异步会话空闲超过该时长（秒）且无进行中的请求时被回收
+DEFAULT_ASYNC_SESSION_IDLE_TIMEOUT = 300
+# 空闲回收扫描的最小间隔（秒）
+ASYNC_SESSION_SWEEP_INTERVAL = 30
 MIN_DELAY_TIME = 100
+HTTP2_ALPN_PROTOCOLS = ('h2', 'http/1.1')
 
 logger = logging.getLogger('darabonba-core')
 logger.setLevel(logging.DEBUG)
@@ -79,23 +100,31 @@ class TLSVersion(Enum):
     TLSv1_2 = 'TLSv1.2'
     TLSv1_3 = 'TLSv1.3'    
 
-class _TLSAdapter(adapters.HTTPAdapter):
-    """使用指定 TLS 版本的 requests HTTPAdapter。"""
+class _TLSAdapter(SSLContextAdapter):
+    """使用指定 TLS 版本的 requests HTTPAdapter。
 
-    def __init__(self, ssl_context=None, **kwargs):
-        """初始化 TLS 适配器。
+    SSLContext 取自进程级注册表，相同 TLS 配置的会话共享同一个 SSLContext。
+    """
+
+
+class _AsyncSessionEntry:
+    """异步会话缓存项。"""
+
+    __slots__ = ('session', 'last_used', 'active')
+
+    def __init__(self, session: aiohttp.ClientSession):
+        self.session = session
+        self.last_used = time.monotonic()
+        self.active = 0
 
-        Args:
-            ssl_context: 用于连接的 SSL 上下文。
-            **kwargs: 传递给 HTTPAdapter 的其余参数。
-        """
-        self.ssl_context = ssl_context
-        super().__init__(**kwargs)
 
-    def init_poolmanager(self, *args, **kwargs):
-        """覆写 init_poolmanager 方法，将自定义 SSL 上下文注入连接池。"""
-        kwargs['ssl_context'] = self.ssl_context
-        super().init_poolmanager(*args, **kwargs)
+class _AsyncSessionPool(dict):
+    """单个事件循环上的会话缓存：{会话键: _AsyncSessionEntry}。"""
+
+    def __init__(self):
+        super().__init__()
+        # 上次空闲回收扫描时间
+        self.swept_at = time.monotonic()
 
 
 class DaraCore:
@@ -106,6 +135,22 @@ class DaraCore:
     """
 
     _sessions = {}
+    # 事件循环 -> {会话键: _AsyncSessionEntry}，事件循环关闭前关闭其上的会话
+    _async_sessions = LoopResources(lambda entry: entry.session.close(), factory=_AsyncSessionPool)
+    _async_sessions_lock = threading.Lock()
+    # 回收中的会话关闭任务，防止被垃圾回收
+    _async_closing = set()
+    async_session_idle_timeout = DEFAULT_ASYNC_SESSION_IDLE_TIMEOUT
+    _async_metrics = {
+        'sessions_created': 0,
+        'sessions_reused': 0,
+        'sessions_evicted': 0,
+    }
+    # HTTP/2 传输：客户端键 -> httpx.Client
+    _http2_clients = {}
+    _http2_clients_lock = threading.Lock()
+    # 事件循环 -> {客户端键: httpx.AsyncClient}
+    _async_http2_clients = LoopResources(lambda client: client.aclose())
     http_adapter = adapters.HTTPAdapter(pool_connections=DEFAULT_POOL_SIZE, pool_maxsize=DEFAULT_POOL_MAXSIZE)
     https_adapter = adapters.HTTPAdapter(pool_connections=DEFAULT_POOL_SIZE, pool_maxsize=DEFAULT_POOL_MAXSIZE)
 
@@ -176,7 +221,7 @@ class DaraCore:
     
     @staticmethod
     def get_adapter(prefix, tls_min_version: str = None, pool_size: int = None):
-        """根据协议前缀创建 HTTP/HTTPS 适配器，并加载 CA 证书。
+        """根据协议前缀创建 HTTP/HTTPS 适配器，SSLContext 取自进程级注册表。
 
         Args:
             prefix: 协议前缀（http / https）。
@@ -187,13 +232,8 @@ class DaraCore:
             配置好的 HTTPAdapter。
         """
         pool_maxsize = pool_size if pool_size is not None and pool_size > 0 else DEFAULT_POOL_MAXSIZE
-        ca_cert = certifi.where()
-        context = ssl.create_default_context()
-        if ca_cert and prefix.upper() == 'HTTPS':
-            context = DaraCore._set_tls_minimum_version(context, tls_min_version)
-            context.load_verify_locations(ca_cert)
         adapter = _TLSAdapter(
-            ssl_context=context,
+            tls_min_version=tls_min_version if prefix.upper() == 'HTTPS' else None,
             pool_connections=DEFAULT_POOL_SIZE,
             pool_maxsize=pool_maxsize,
         )
@@ -287,6 +327,7 @@ class DaraCore:
         """异步执行 HTTP 请求并返回响应。
 
         支持 TLS 校验、客户端证书、代理、连接池与超时等运行时配置。
+        同一事件循环内，相同端点与 TLS 配置的请求复用同一个 ClientSession 及其连接池。
 
         Args:
             request: DaraRequest 请求对象。
@@ -331,72 +372,236 @@ class DaraCore:
                 proxy = os.environ.get('HTTPS_PROXY') or os.environ.get('https_proxy')
 
         pool_maxsize = DaraCore._resolve_pool_maxsize(runtime_option)
-        connector = None
-        ca_cert = certifi.where()
-        ssl_context = None
-        if isinstance(verify, str) and request.protocol.upper() == 'HTTPS':
-            ssl_context = ssl.create_default_context()
-            ssl_context = DaraCore._set_tls_minimum_version(ssl_context, tls_min_version)
-            ssl_context.load_verify_locations(verify)
-            # Handle cert if provided
-            if cert is not None:
-                if isinstance(cert, (list, tuple)):
-                    ssl_context.load_cert_chain(certfile=cert[0], keyfile=cert[1] if len(cert) > 1 else None)
-                else:
-                    ssl_context.load_cert_chain(certfile=cert, keyfile=None)
-            connector = aiohttp.TCPConnector(
-                ssl=ssl_context, limit=pool_maxsize, limit_per_host=pool_maxsize
-            )
-        elif ca_cert and request.protocol.upper() == 'HTTPS' and verify:
-            ssl_context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-            ssl_context = DaraCore._set_tls_minimum_version(ssl_context, tls_min_version)
-            ssl_context.load_verify_locations(ca_cert)
-            # Handle cert if provided
-            if cert is not None:
-                if isinstance(cert, (list, tuple)):
-                    ssl_context.load_cert_chain(certfile=cert[0], keyfile=cert[1] if len(cert) > 1 else None)
-                else:
-                    ssl_context.load_cert_chain(certfile=cert, keyfile=None)
-            connector = aiohttp.TCPConnector(
-                ssl=ssl_context, limit=pool_maxsize, limit_per_host=pool_maxsize
-            )
+        host = request.headers.get('host').rstrip('/')
+        if isinstance(cert, list):
+            cert = tuple(cert)
+        body = b''
+        if isinstance(request.body, BaseStream):
+            for content in request.body:
+                body += content
+        elif isinstance(request.body, str):
+            body = request.body.encode('utf-8')
         else:
-            verify = False
-            connector = aiohttp.TCPConnector(limit=pool_maxsize, limit_per_host=pool_maxsize)
+            body = request.body or b''
+
+        if DaraCore._use_http2(runtime_option):
+            client_key = (f'{request.protocol.lower()}://{host}:{request.port}:pool={pool_maxsize}',
+                          verify, cert, tls_min_version, proxy)
+            client = DaraCore._get_async_http2_client(client_key, request.protocol, verify, cert,
+                                                      tls_min_version, proxy, pool_maxsize)
+            headers = request.headers
+            if hasattr(body, 'read'):
+                # httpx.AsyncClient 不接受同步文件对象，改为在线程中分块读取
+                headers, body = DaraCore._async_http2_file_content(body, headers)
+            try:
+                resp = await client.request(request.method, url, content=body, headers=headers,
+                                            timeout=httpx.Timeout(read_timeout, connect=connect_timeout))
+            except (IOError, httpx.TransportError) as e:
+                raise RetryError(str(e))
+            return DaraCore._to_http2_response(resp)
+
+        session_key = (f'{request.protocol.lower()}://{host}:{request.port}:pool={pool_maxsize}',
+                       verify, cert, tls_min_version)
+        entry = DaraCore._acquire_async_session(session_key, request.protocol, verify, cert,
+                                                tls_min_version, pool_maxsize)
 
         timeout = aiohttp.ClientTimeout(
             sock_read=read_timeout,
             sock_connect=connect_timeout
         )
-        async with aiohttp.ClientSession(
-                connector=connector
-        ) as s:
-            body = b''
-            if isinstance(request.body, BaseStream):
-                for content in request.body:
-                    body += content
-            elif isinstance(request.body, str):
-                body = request.body.encode('utf-8')
-            else:
-                body = request.body or b''
-            try:
-                ssl_param: Union[bool, ssl.SSLContext] = ssl_context if ssl_context is not None else bool(verify)
-                async with s.request(request.method, url,
-                                     data=body,
-                                     headers=request.headers,
-                                     ssl=ssl_param,
-                                     proxy=proxy,
-                                     timeout=timeout) as response:
-                    tea_resp: DaraResponse = DaraResponse()
-                    tea_resp.body = await response.read()
-                    tea_resp.headers = dict({k.lower(): v for k, v in response.headers.items()})
-                    tea_resp.status_code = response.status
-                    tea_resp.status_message = response.reason
-                    tea_resp.response = response
-            except IOError as e:
-                raise RetryError(str(e))
+        try:
+            async with entry.session.request(request.method, url,
+                                             data=body,
+                                             headers=request.headers,
+                                             proxy=proxy,
+                                             timeout=timeout) as response:
+                tea_resp: DaraResponse = DaraResponse()
+                tea_resp.body = await response.read()
+                tea_resp.headers = dict({k.lower(): v for k, v in response.headers.items()})
+                tea_resp.status_code = response.status
+                tea_resp.status_message = response.reason
+                tea_resp.response = response
+        except IOError as e:
+            raise RetryError(str(e))
+        finally:
+            DaraCore._release_async_session(entry)
         return tea_resp
 
+    @staticmethod
+    def _new_async_connector(protocol: str, verify: Union[bool, str], cert,
+                             tls_min_version: str, pool_maxsize: int) -> aiohttp.TCPConnector:
+        """按 TLS 配置创建 aiohttp 连接器。
+
+        Args:
+            protocol: 协议（http / https）。
+            verify: 是否校验证书，或自定义 CA 文件路径。
+            cert: 客户端证书路径，或 (certfile, keyfile)。
+            tls_min_version: 最低 TLS 版本。
+            pool_maxsize: 连接池大小。
+
+        Returns:
+            aiohttp.TCPConnector 连接器。
+        """
+        if protocol.upper() == 'HTTPS':
+            ssl_context = DaraCore._get_ssl_context(verify, cert, tls_min_version)
+            if ssl_context is not None:
+                return aiohttp.TCPConnector(ssl=ssl_context, limit=pool_maxsize, limit_per_host=pool_maxsize)
+        return aiohttp.TCPConnector(ssl=False, limit=pool_maxsize, limit_per_host=pool_maxsize)
+
+    @staticmethod
+    def _get_ssl_context(verify: Union[bool, str], cert, tls_min_version: str) -> Optional[ssl.SSLContext]:
+        """从进程级注册表获取 TLS 配置对应的 SSLContext。
+
+        Args:
+            verify: 是否校验证书，或自定义 CA 文件路径。
+            cert: 客户端证书路径，或 (certfile, keyfile)。
+            tls_min_version: 最低 TLS 版本。
+
+        Returns:
+            ssl.SSLContext；不校验证书时返回 None。
+        """
+        if not verify:
+            return None
+        return get_ssl_context(ca=verify if isinstance(verify, str) else None, cert=cert,
+                               tls_min_version=tls_min_version)
+
+    @staticmethod
+    def _get_async_session(session_key, protocol: str, verify: Union[bool, str], cert,
+                           tls_min_version: str, pool_maxsize: int) -> aiohttp.ClientSession:
+        """按会话键获取（或创建）当前事件循环上的 aiohttp.ClientSession。
+
+        ClientSession 只能在创建它的事件循环中使用，因此会话按事件循环分组缓存；
+        asyncio.run() 等关闭事件循环前（loop.shutdown_asyncgens()）关闭该循环上的会话并移除缓存。
+
+        Args:
+            session_key: 会话缓存键（端点、连接池大小与 TLS 配置）。
+            protocol: 协议（http / https）。
+            verify: 是否校验证书，或自定义 CA 文件路径。
+            cert: 客户端证书。
+            tls_min_version: 最低 TLS 版本。
+            pool_maxsize: 连接池大小。
+
+        Returns:
+            aiohttp.ClientSession 对象。
+        """
+        return DaraCore._async_session_entry(session_key, protocol, verify, cert,
+                                             tls_min_version, pool_maxsize).session
+
+    @staticmethod
+    def _acquire_async_session(session_key, protocol: str, verify: Union[bool, str], cert,
+                               tls_min_version: str, pool_maxsize: int) -> _AsyncSessionEntry:
+        """获取会话并登记一个进行中的请求，须与 _release_async_session 成对调用。
+
+        进行中的会话不会被空闲回收。参数同 _get_async_session。
+        """
+        entry = DaraCore._async_session_entry(session_key, protocol, verify, cert,
+                                              tls_min_version, pool_maxsize)
+        entry.active += 1
+        return entry
+
+    @staticmethod
+    def _release_async_session(entry: _AsyncSessionEntry):
+        """登记请求结束，并刷新会话的最近使用时间。"""
+        entry.active -= 1
+        entry.last_used = time.monotonic()
+
+    @staticmethod
+    def _async_session_entry(session_key, protocol: str, verify: Union[bool, str], cert,
+                             tls_min_version: str, pool_maxsize: int) -> _AsyncSessionEntry:
+        loop = asyncio.get_running_loop()
+        now = time.monotonic()
+        sessions = DaraCore._async_sessions.get()
+        if now - sessions.swept_at >= ASYNC_SESSION_SWEEP_INTERVAL:
+            sessions.swept_at = now
+            DaraCore._evict_idle_async_sessions(loop, sessions, now)
+
+        entry = sessions.get(session_key)
+        if entry is None or entry.session.closed:
+            connector = DaraCore._new_async_connector(protocol, verify, cert, tls_min_version, pool_maxsize)
+            entry = sessions[session_key] = _AsyncSessionEntry(aiohttp.ClientSession(connector=connector))
+            metric = 'sessions_created'
+        else:
+            entry.last_used = now
+            metric = 'sessions_reused'
+        with DaraCore._async_sessions_lock:
+            DaraCore._async_metrics[metric] += 1
+        return entry
+
+    @staticmethod
+    def _evict_idle_async_sessions(loop, sessions: dict, now: float):
+        """关闭空闲超时且没有进行中请求的会话。"""
+        idle_timeout = DaraCore.async_session_idle_timeout
+        expired = [key for key, entry in sessions.items()
+                   if entry.active <= 0 and now - entry.last_used >= idle_timeout]
+        for key in expired:
+            task = loop.create_task(sessions.pop(key).session.close())
+            DaraCore._async_closing.add(task)
+            task.add_done_callback(DaraCore._async_closing.discard)
+        if expired:
+            with DaraCore._async_sessions_lock:
+                DaraCore._async_metrics['sessions_evicted'] += len(expired)
+
+    @staticmethod
+    def async_session_stats() -> Dict[str, int]:
+        """返回异步会话与 SSLContext 缓存的复用统计，供监控导出。
+
+        Returns:
+            字典，包含：
+              - sessions：当前缓存的会话数（所有事件循环）
+              - active_requests：进行中的请求数
+              - sessions_created / sessions_reused / sessions_evicted：会话创建、复用、回收次数
+              - ssl_contexts：进程级注册表中的 SSLContext 数
+              - ssl_contexts_created / ssl_contexts_reused：SSLContext 创建、复用次数（所有服务商共用）
+        """
+        with DaraCore._async_sessions_lock:
+            stats = dict(DaraCore._async_metrics)
+        entries = [entry for _, sessions in DaraCore._async_sessions.items() for entry in list(sessions.values())]
+        ssl_stats = ssl_context_stats()
+        stats['ssl_contexts'] = ssl_stats['contexts']
+        stats['ssl_contexts_created'] = ssl_stats['created']
+        stats['ssl_contexts_reused'] = ssl_stats['reused']
+        stats['sessions'] = len(entries)
+        stats['active_requests'] = sum(entry.active for entry in entries)
+        return stats
+
+    @staticmethod
+    async def close_async_sessions():
+        """关闭当前事件循环上缓存的全部 aiohttp.ClientSession 与 HTTP/2 客户端。
+
+        由 asyncio.run() 运行的事件循环在关闭前会自动关闭这些会话；
+        事件循环继续运行但不再发起请求时，可调用本方法提前释放连接。
+        """
+        sessions = DaraCore._async_sessions.pop()
+        http2_clients = DaraCore._async_http2_clients.pop()
+        if sessions:
+            for entry in sessions.values():
+                await entry.session.close()
+        if http2_clients:
+            for client in http2_clients.values():
+                await client.aclose()
+
+    @staticmethod
+    def _close_async_sessions_at_exit():
+        """进程退出时的兜底清理：关闭仍可运行的事件循环上遗留的会话。"""
+        for loop, sessions in DaraCore._async_sessions.clear():
+            if loop.is_closed() or loop.is_running():
+                continue
+            for entry in sessions.values():
+                if not entry.session.closed:
+                    loop.run_until_complete(entry.session.close())
+        http2_leftovers = DaraCore._async_http2_clients.clear()
+        with DaraCore._http2_clients_lock:
+            sync_clients = list(DaraCore._http2_clients.values())
+            DaraCore._http2_clients.clear()
+        for loop, clients in http2_leftovers:
+            if loop.is_closed() or loop.is_running():
+                continue
+            for client in clients.values():
+                if not client.is_closed:
+                    loop.run_until_complete(client.aclose())
+        for client in sync_clients:
+            client.close()
+
     @staticmethod
     def do_action(
             request: DaraRequest,
@@ -405,6 +610,8 @@ class DaraCore:
         """同步执行 HTTP 请求并返回响应。
 
         使用 requests.Session 发送请求，支持代理、TLS、调试日志等配置。
+        runtime_option 中 stream 为真时不缓冲响应体，response.body 为
+        ResponseStream，按 streamChunkSize（默认 64KB）分块读取。
 
         Args:
             request: DaraRequest 请求对象。
@@ -468,6 +675,27 @@ class DaraCore:
 
         pool_maxsize = DaraCore._resolve_pool_maxsize(runtime_option)
         session_key = f'{request.protocol.lower()}://{host}:{request.port}:pool={pool_maxsize}'
+        stream = bool(runtime_option.get('stream'))
+        # 流式下载依赖 urllib3 的原始响应（ResponseStream），仍走 HTTP/1.1
+        if DaraCore._use_http2(runtime_option) and not stream:
+            proxy = proxies.get(request.protocol.lower())
+            if proxy and no_proxy and should_bypass_proxies(url, no_proxy):
+                proxy = None
+            if isinstance(cert, list):
+                cert = tuple(cert)
+            client = DaraCore._get_http2_client((session_key, verify, cert, tls_min_version, proxy),
+                                                request.protocol, verify, cert, tls_min_version,
+                                                proxy, pool_maxsize)
+            try:
+                resp = client.request(p.method, p.url, content=p.body, headers=p.headers,
+                                      timeout=httpx.Timeout(timeout[1], connect=timeout[0]))
+            except (IOError, httpx.TransportError) as e:
+                raise RetryError(str(e))
+            debug = runtime_option.get('debug') or os.getenv('DEBUG')
+            if debug and debug.lower() == 'sdk':
+                DaraCore._do_http_debug(p, resp)
+            return DaraCore._to_http2_response(resp)
+
         session = DaraCore._get_session(session_key=session_key, protocol=request.protocol,
                                        tls_min_version=tls_min_version, verify=verify,
                                        pool_size=pool_maxsize)
@@ -478,6 +706,7 @@ class DaraCore:
                 timeout=timeout,
                 verify=verify,
                 cert=cert,
+                stream=stream,
             )
         except IOError as e:
             raise RetryError(str(e))
@@ -490,7 +719,10 @@ class DaraCore:
         response.status_message = resp.reason
         response.status_code = resp.status_code
         response.headers = {k.lower(): v for k, v in resp.headers.items()}
-        response.body = resp.content
+        if stream:
+            response.body = ResponseStream(resp, runtime_option.get('streamChunkSize') or DEFAULT_CHUNK_SIZE)
+        else:
+            response.body = resp.content
         response.response = resp
         return response
 
@@ -547,46 +779,14 @@ class DaraCore:
                 proxy = os.environ.get('HTTPS_PROXY') or os.environ.get('https_proxy')
 
         pool_maxsize = DaraCore._resolve_pool_maxsize(runtime_option)
-        connector = None
-        ca_cert = certifi.where()
-        ssl_context = None
-        if isinstance(verify, str) and request.protocol.upper() == 'HTTPS':
-            ssl_context = ssl.create_default_context()
-            ssl_context = DaraCore._set_tls_minimum_version(ssl_context, tls_min_version)
-            ssl_context.load_verify_locations(verify)
-            # Handle cert if provided
-            if cert is not None:
-                if isinstance(cert, (list, tuple)):
-                    ssl_context.load_cert_chain(certfile=cert[0], keyfile=cert[1] if len(cert) > 1 else None)
-                else:
-                    ssl_context.load_cert_chain(certfile=cert, keyfile=None)
-            connector = aiohttp.TCPConnector(
-                ssl=ssl_context, limit=pool_maxsize, limit_per_host=pool_maxsize
-            )
-        elif ca_cert and request.protocol.upper() == 'HTTPS' and verify:
-            ssl_context = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-            ssl_context = DaraCore._set_tls_minimum_version(ssl_context, tls_min_version)
-            ssl_context.load_verify_locations(ca_cert)
-            # Handle cert if provided
-            if cert is not None:
-                if isinstance(cert, (list, tuple)):
-                    ssl_context.load_cert_chain(certfile=cert[0], keyfile=cert[1] if len(cert) > 1 else None)
-                else:
-                    ssl_context.load_cert_chain(certfile=cert, keyfile=None)
-            connector = aiohttp.TCPConnector(
-                ssl=ssl_context, limit=pool_maxsize, limit_per_host=pool_maxsize
-            )
-        else:
-            verify = False
-            connector = aiohttp.TCPConnector(limit=pool_maxsize, limit_per_host=pool_maxsize)
-
+        host = request.headers.get('host').rstrip('/')
+        if isinstance(cert, list):
+            cert = tuple(cert)
         timeout = aiohttp.ClientTimeout(
             sock_read=read_timeout,
             sock_connect=connect_timeout
         )
 
-        session = aiohttp.ClientSession(connector=connector)
-        
         body = b''
         if isinstance(request.body, BaseStream):
             for content in request.body:
@@ -596,15 +796,17 @@ class DaraCore:
         else:
             body = request.body or b''
 
+        session_key = (f'{request.protocol.lower()}://{host}:{request.port}:pool={pool_maxsize}',
+                       verify, cert, tls_min_version)
+        entry = DaraCore._acquire_async_session(session_key, request.protocol, verify, cert,
+                                                tls_min_version, pool_maxsize)
         try:
             headers = request.headers.copy()
-            ssl_param: Union[bool, ssl.SSLContext] = ssl_context if ssl_context is not None else bool(verify)
-            response = await session.request(
-                request.method, 
+            response = await entry.session.request(
+                request.method,
                 url,
                 data=body,
                 headers=headers,
-                ssl=ssl_param,
                 proxy=proxy,
                 timeout=timeout
             )
@@ -612,12 +814,16 @@ class DaraCore:
             tea_resp.status_code = response.status
             tea_resp.status_message = response.reason
             tea_resp.headers = dict({k.lower(): v for k, v in response.headers.items()})
-            tea_resp.body = SSEResponseWrapper(session, response)
+            # 会话由缓存持有，流结束时只归还连接
+            tea_resp.body = SSEResponseWrapper(entry.session, response,
+                                               on_close=lambda: DaraCore._release_async_session(entry))
             return tea_resp
-                        
-        except IOError as e:
-            await session.close()
-            raise RetryError(str(e))
+        except BaseException as e:
+            # 包装器未接管前的任何失败（含非 IOError 的 aiohttp 异常与取消）都要归还计数
+            DaraCore._release_async_session(entry)
+            if isinstance(e, IOError):
+                raise RetryError(str(e))
+            raise
 
     @staticmethod
     def do_sse_action(
@@ -948,6 +1154,114 @@ class DaraCore:
         else:
             return model
 
+    @staticmethod
+    def _use_http2(runtime_option) -> bool:
+        """运行时配置 disableHttp2 显式为 False 时使用 HTTP/2 传输。"""
+        return runtime_option.get('disableHttp2') is False
+
+    @staticmethod
+    def _http2_client_options(protocol: str, verify: Union[bool, str], cert, tls_min_version: str,
+                              proxy: Optional[str], pool_maxsize: int) -> Dict[str, Any]:
+        """生成 httpx 客户端的公共参数。
+
+        HTTPS 使用单独的 SSLContext（ALPN 为 h2、http/1.1），不与 requests / aiohttp 共用。
+        服务端不支持 HTTP/2 时经 ALPN 协商回落到 HTTP/1.1。
+
+        Args:
+            protocol: 协议（http / https）。
+            verify: 是否校验证书，或自定义 CA 文件路径。
+            cert: 客户端证书路径，或 (certfile, keyfile)。
+            tls_min_version: 最低 TLS 版本。
+            proxy: 代理地址。
+            pool_maxsize: 连接池大小。
+
+        Returns:
+            httpx.Client / httpx.AsyncClient 的构造参数。
+
+        Raises:
+            ImportError: 未安装 httpx 或 h2 时抛出。
+        """
+        if httpx is None:
+            raise ImportError("HTTP/2 transport requires httpx, run: pip install 'httpx[http2]'")
+        ssl_context = True
+        if protocol.upper() == 'HTTPS':
+            ssl_context = get_ssl_context(ca=verify if isinstance(verify, str) else None, cert=cert,
+                                          tls_min_version=tls_min_version, verify=verify is not False,
+                                          alpn_protocols=HTTP2_ALPN_PROTOCOLS)
+        return {
+            'http2': True,
+            'verify': ssl_context,
+            'proxy': proxy or None,
+            'trust_env': False,
+            'limits': httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize),
+        }
+
+    @staticmethod
+    def _get_http2_client(client_key, protocol: str, verify: Union[bool, str], cert, tls_min_version: str,
+                          proxy: Optional[str], pool_maxsize: int):
+        """按客户端键获取（或创建）同步 HTTP/2 客户端，进程内共享。
+
+        Returns:
+            httpx.Client 对象。
+        """
+        with DaraCore._http2_clients_lock:
+            client = DaraCore._http2_clients.get(client_key)
+            if client is None:
+                client = DaraCore._http2_clients[client_key] = httpx.Client(
+                    **DaraCore._http2_client_options(protocol, verify, cert, tls_min_version,
+                                                     proxy, pool_maxsize))
+            return client
+
+    @staticmethod
+    def _get_async_http2_client(client_key, protocol: str, verify: Union[bool, str], cert,
+                                tls_min_version: str, proxy: Optional[str], pool_maxsize: int):
+        """按客户端键获取（或创建）当前事件循环上的异步 HTTP/2 客户端。
+
+        Returns:
+            httpx.AsyncClient 对象。
+        """
+        clients = DaraCore._async_http2_clients.get()
+        client = clients.get(client_key)
+        if client is None or client.is_closed:
+            client = clients[client_key] = httpx.AsyncClient(
+                **DaraCore._http2_client_options(protocol, verify, cert, tls_min_version, proxy, pool_maxsize))
+        return client
+
+    @staticmethod
+    def _async_http2_file_content(fileobj, headers):
+        """把文件对象请求体转换为 httpx.AsyncClient 可接受的异步迭代器。
+
+        Args:
+            fileobj: 文件对象请求体。
+            headers: 请求头，不会被修改。
+
+        Returns:
+            (headers, content) 元组；长度可知时补充 content-length，避免退化为分块传输。
+        """
+        length = super_len(fileobj)
+        if length and not any(k.lower() == 'content-length' for k in headers):
+            headers = dict(headers, **{'content-length': str(length)})
+        return headers, DaraCore._aiter_file(fileobj)
+
+    @staticmethod
+    async def _aiter_file(fileobj):
+        while True:
+            chunk = await asyncio.to_thread(fileobj.read, DEFAULT_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+
+    @staticmethod
+    def _to_http2_response(resp) -> DaraResponse:
+        """把 httpx.Response 转换为 DaraResponse。"""
+        response = DaraResponse()
+        response.status_message = resp.reason_phrase
+        response.status_code = resp.status_code
+        response.headers = {k.lower(): v for k, v in resp.headers.items()}
+        response.body = resp.content
+        response.response = resp
+        return response
+
     @staticmethod
     def _get_session(session_key: str, protocol: str, tls_min_version: str = None,
                      verify: bool = True, pool_size: int = None):
@@ -979,4 +1293,7 @@ class DaraCore:
             else:
                 session.mount('http://', adapter)
             DaraCore._sessions[session_key] = session
-        return DaraCore._sessions[session_key]
\ No newline at end of file
+        return DaraCore._sessions[session_key]
+
+
+atexit.register(DaraCore._close_async_sessions_at_exit)
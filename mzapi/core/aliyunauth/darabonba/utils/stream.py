@@ -24,6 +24,7 @@ _MZAPI_ORIGIN = "mzapi-aliyun-utils-stream-2026-qxx"
   - _ReadableMc：可读性判断的元类
   - READABLE：可读流标记类，用于 isinstance 判断
   - SyncSSEResponseWrapper：同步 SSE 响应包装器
+  - ResponseStream：同步流式响应体，按需读取 requests 响应的 raw 流
   - SSEResponseWrapper：异步 SSE 响应包装器（基于 aiohttp）
   - _WriteableMc：可写性判断的元类
   - WRITABLE：可写流标记类，用于 isinstance 判断
@@ -31,16 +32,16 @@ _MZAPI_ORIGIN = "mzapi-aliyun-utils-stream-2026-qxx"
 """
 
 import json
-import re
 import aiohttp
-import codecs
 from mzapi.utlis.aliyunauth.darabonba.event import Event
+from mzapi.core.sse import aiter_sse, iter_sse
 
 from io import BytesIO, StringIO
 from typing import Any, BinaryIO, Generator, AsyncGenerator, Dict
 
-# define WRITEABLE
-sse_line_pattern = re.compile('(?P<name>[^:]*):?( ?(?P<value>.*))?')
+# ResponseStream 迭代读取时的默认分块大小
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
 
 class BaseStream:
     """流基类，定义可读流需要实现的抽象接口。"""
@@ -138,27 +139,131 @@ class SyncSSEResponseWrapper:
         finally:
             self.close()
 
+class ResponseStream:
+    """同步流式响应体，直接读取 requests 响应的 raw 流，不在内存中缓冲完整响应。
+
+    读到末尾后连接归还连接池；未读完即关闭时断开连接。
+    """
+
+    def __init__(self, response, chunk_size=DEFAULT_CHUNK_SIZE):
+        """初始化流式响应体。
+
+        Args:
+            response: 以 stream=True 发送得到的 requests 响应对象。
+            chunk_size: 迭代读取时的默认分块大小（字节）。
+        """
+        self.response = response
+        self.chunk_size = chunk_size
+        self._raw = response.raw
+        self._eof = False
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """是否已关闭。"""
+        return self._closed
+
+    def read(self, size=-1) -> bytes:
+        """读取至多 size 字节（已按 Content-Encoding 解码），size 为负或 None 时读取剩余全部内容。
+
+        Args:
+            size: 读取的字节数。
+
+        Returns:
+            读取到的字节数据，读完后返回空字节。
+        """
+        if self._closed:
+            return b''
+        if size is None or size < 0:
+            data = self._raw.read(decode_content=True)
+            self._eof = True
+            self.close()
+            return data
+        data = self._raw.read(size, decode_content=True)
+        if not data:
+            self._eof = True
+            self.close()
+        return data
+
+    def readinto(self, b) -> int:
+        """读取数据写入预分配的缓冲区 b，返回写入的字节数。"""
+        view = memoryview(b).cast('B')
+        data = self.read(len(view))
+        n = len(data)
+        view[:n] = data
+        return n
+
+    def __iter__(self):
+        """返回按 chunk_size 分块的迭代器。"""
+        return self.iter_chunks()
+
+    def iter_chunks(self, chunk_size=None):
+        """按指定大小分块读取响应内容，读完或中断时关闭。
+
+        Args:
+            chunk_size: 分块大小，默认使用构造时的 chunk_size。
+        """
+        chunk_size = chunk_size or self.chunk_size
+        try:
+            while True:
+                chunk = self.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+        finally:
+            self.close()
+
+    def close(self):
+        """关闭响应；已读完时仅释放连接供复用。"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._eof:
+            self._raw.release_conn()
+        else:
+            self.response.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 class SSEResponseWrapper:
     """异步 SSE 响应包装器，封装 aiohttp 会话与响应，支持异步分块迭代读取。"""
 
-    def __init__(self, session: aiohttp.ClientSession, response: aiohttp.ClientResponse):
+    def __init__(self, session: aiohttp.ClientSession, response: aiohttp.ClientResponse, on_close=None):
         """初始化异步响应包装器。
 
         Args:
             session: aiohttp 客户端会话对象。
             response: aiohttp 客户端响应对象。
+            on_close: 可选回调；提供时会话由调用方持有，关闭时只释放响应连接并调用该回调。
         """
         self.session = session
         self.response = response
+        self._on_close = on_close
         self._closed = False
         self._content_cache = None
 
     async def close(self):
         """异步关闭响应与会话，释放资源。"""
-        if not self._closed:
+        if self._closed:
+            return
+        self._closed = True
+        if self._on_close is None:
             self.response.close()
             await self.session.close()
-            self._closed = True
+            return
+        try:
+            if self.response.content.at_eof():
+                # 已读完，连接归还连接池复用
+                self.response.release()
+            else:
+                self.response.close()
+        finally:
+            self._on_close()
 
     def __aiter__(self):
         """返回异步分块迭代器，支持 async for 读取。"""
@@ -272,13 +377,10 @@ class Stream:
         @param stream: the readable stream
         @return: the bytes result
         """
-        if isinstance(stream, SyncSSEResponseWrapper):
+        if isinstance(stream, (SyncSSEResponseWrapper, ResponseStream)):
             return stream.read()
         elif isinstance(stream, READABLE):
-            b = b''
-            for part in Stream.__read_part(stream, 1024):
-                b += part
-            return b
+            return b''.join(Stream.__read_part(stream, DEFAULT_CHUNK_SIZE))
         elif isinstance(stream, bytes):
             return stream
         else:
@@ -479,81 +581,24 @@ class Stream:
             raise ValueError(f'The value is not a writeable')
         return value
     
+    @staticmethod
+    def _to_event_dict(event: Dict[str, Any]) -> Dict[str, Any]:
+        """将 SSEDecoder 产出的事件转换为 id / event / data / retry 字典，event 缺省为 message。"""
+        return {
+            'id': event.get('id'),
+            'event': event.get('event') or 'message',
+            'data': event.get('data'),
+            'retry': event.get('retry')
+        }
+
     @staticmethod
     async def _parse_sse_stream(wrapper: SSEResponseWrapper) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Analyze SSE stream data
         """
-        buffer = ""
-        current_event = Event()
-        
-        MAX_BUFFER_SIZE = 1024 * 1024  # 1MB
-        dec = codecs.getincrementaldecoder('utf-8')()
-        
-        async for chunk in wrapper:
-            try:
-                chunk_str = dec.decode(chunk)
-            except UnicodeDecodeError:
-                chunk_str = chunk.decode('utf-8', errors='replace')
-            
-            if len(buffer) + len(chunk_str) > MAX_BUFFER_SIZE:
-                import logging
-                logging.warning("SSE stream data too large, skipping chunk")
-                continue
-                
-            buffer += chunk_str
-
-            while '\n' in buffer:
-                line, buffer = buffer.split('\n', 1)
-                line = line.rstrip('\r')  # Remove \r
-                
-                if not line.strip():
-                    if current_event.data is not None:
-                        yield {
-                            'id': current_event.id,
-                            'event': current_event.event or 'message',
-                            'data': current_event.data,
-                            'retry': current_event.retry
-                        }
-                        current_event = Event()
-                    continue
-                
-                if line.startswith(':'):
-                    continue
-                
-                if ':' in line:
-                    match = sse_line_pattern.match(line)
-                    if match:
-                        name = match.group('name').strip()
-                        value = match.group('value').strip()
-                        
-                        if name == 'event':
-                            current_event.event = value
-                        elif name == 'id':
-                            current_event.id = value
-                        elif name == 'data':
-                            if current_event.data is None:
-                                current_event.data = value
-                            else:
-                                current_event.data += '\n' + value
-                        elif name == 'retry':
-                            try:
-                                current_event.retry = int(value)
-                            except ValueError:
-                                pass
-                else:
-                    if current_event.data is None:
-                        current_event.data = line
-                    else:
-                        current_event.data += '\n' + line
-
-        if buffer.strip() and current_event.data is not None:
-            yield {
-                'id': current_event.id,
-                'event': current_event.event or 'message',
-                'data': current_event.data,
-                'retry': current_event.retry
-            }
+        async for event in aiter_sse(wrapper):
+            if 'data' in event:
+                yield Stream._to_event_dict(event)
 
     @staticmethod
     async def _parse_sse_stream_from_response(response) -> AsyncGenerator[Dict[str, Any], None]:
@@ -565,205 +610,24 @@ class Stream:
         Yields:
             解析出的 SSE 事件字典（含 id、event、data、retry 字段）。
         """
-        buffer = ""
-        current_event = Event()
-
-        async for chunk in response.content.iter_chunked(8192):
-            try:
-                chunk_str = chunk.decode('utf-8')
-            except UnicodeDecodeError:
-                continue
-            
-            buffer += chunk_str
-            
-            while '\n' in buffer:
-                line, buffer = buffer.split('\n', 1)
-                line = line.rstrip('\r')
-                
-                if not line.strip():
-                    if current_event.data is not None:
-                        yield {
-                            'id': current_event.id,
-                            'event': current_event.event or 'message',
-                            'data': current_event.data,
-                            'retry': current_event.retry
-                        }
-                        current_event = Event()
-                    continue
-                
-                if line.startswith(':'):
-                    continue
-                
-                if ':' in line:
-                    match = sse_line_pattern.match(line)
-                    if match:
-                        name = match.group('name').strip()
-                        value = match.group('value').strip()
-                        
-                        if name == 'event':
-                            current_event.event = value
-                        elif name == 'id':
-                            current_event.id = value
-                        elif name == 'data':
-                            if current_event.data is None:
-                                current_event.data = value
-                            else:
-                                current_event.data += '\n' + value
-                        elif name == 'retry':
-                            try:
-                                current_event.retry = int(value)
-                            except ValueError:
-                                pass
-                else:
-                    if current_event.data is None:
-                        current_event.data = line
-                    else:
-                        current_event.data += '\n' + line
-
-        if buffer.strip() and current_event.data is not None:
-            yield {
-                'id': current_event.id,
-                'event': current_event.event or 'message',
-                'data': current_event.data,
-                'retry': current_event.retry
-            }
-    
+        async for event in aiter_sse(response.content.iter_chunked(8192)):
+            if 'data' in event:
+                yield Stream._to_event_dict(event)
+
     @staticmethod
     def _parse_sse_stream_sync(wrapper: SyncSSEResponseWrapper) -> Generator[Dict[str, Any], None, None]:
         """
         Analyze SSE stream data (synchronous version)
         """
-        buffer = ""
-        current_event = Event()
-
-        for chunk in wrapper:
-            # Decoding byte data into strings
-            try:
-                chunk_str = chunk.decode('utf-8')
-            except UnicodeDecodeError:
-                # If decoding fails, skip this chunk
-                continue
-            
-            buffer += chunk_str
-            
-            # Split processing by row
-            while '\n' in buffer:
-                line, buffer = buffer.split('\n', 1)
-                line = line.rstrip('\r')  # Remove \r
-                
-                if not line.strip():
-                    if current_event.data is not None:
-                        yield {
-                            'id': current_event.id,
-                            'event': current_event.event or 'message',
-                            'data': current_event.data,
-                            'retry': current_event.retry
-                        }
-                        current_event = Event()
-                    continue
-                
-                # Skip comment lines
-                if line.startswith(':'):
-                    continue
-                
-                if ':' in line:
-                    match = sse_line_pattern.match(line)
-                    if match:
-                        name = match.group('name').strip()
-                        value = match.group('value').strip()
-                        
-                        if name == 'event':
-                            current_event.event = value
-                        elif name == 'id':
-                            current_event.id = value
-                        elif name == 'data':
-                            if current_event.data is None:
-                                current_event.data = value
-                            else:
-                                current_event.data += '\n' + value
-                        elif name == 'retry':
-                            try:
-                                current_event.retry = int(value)
-                            except ValueError:
-                                pass
-                else:
-                    if current_event.data is None:
-                        current_event.data = line
-                    else:
-                        current_event.data += '\n' + line
-
-        if buffer.strip() and current_event.data is not None:
-            yield {
-                'id': current_event.id,
-                'event': current_event.event or 'message',
-                'data': current_event.data,
-                'retry': current_event.retry
-            }
+        for event in iter_sse(wrapper):
+            if 'data' in event:
+                yield Stream._to_event_dict(event)
 
     @staticmethod
     def _parse_sse_stream_from_response_sync(response) -> Generator[Dict[str, Any], None, None]:
         """
         Parse SSE stream from requests response object (synchronous version)
         """
-        buffer = ""
-        current_event = Event()
-
-        for chunk in response.iter_content(chunk_size=8192):
-            try:
-                chunk_str = chunk.decode('utf-8')
-            except UnicodeDecodeError:
-                continue
-            
-            buffer += chunk_str
-            
-            while '\n' in buffer:
-                line, buffer = buffer.split('\n', 1)
-                line = line.rstrip('\r')
-                
-                if not line.strip():
-                    if current_event.data is not None:
-                        yield {
-                            'id': current_event.id,
-                            'event': current_event.event or 'message',
-                            'data': current_event.data,
-                            'retry': current_event.retry
-                        }
-                        current_event = Event()
-                    continue
-                
-                if line.startswith(':'):
-                    continue
-                
-                if ':' in line:
-                    match = sse_line_pattern.match(line)
-                    if match:
-                        name = match.group('name').strip()
-                        value = match.group('value').strip()
-                        
-                        if name == 'event':
-                            current_event.event = value
-                        elif name == 'id':
-                            current_event.id = value
-                        elif name == 'data':
-                            if current_event.data is None:
-                                current_event.data = value
-                            else:
-                                current_event.data += '\n' + value
-                        elif name == 'retry':
-                            try:
-                                current_event.retry = int(value)
-                            except ValueError:
-                                pass
-                else:
-                    if current_event.data is None:
-                        current_event.data = line
-                    else:
-                        current_event.data += '\n' + line
-
-        if buffer.strip() and current_event.data is not None:
-            yield {
-                'id': current_event.id,
-                'event': current_event.event or 'message',
-                'data': current_event.data,
-                'retry': current_event.retry
-            }
\ No newline at end of file
+        for event in iter_sse(response.iter_content(chunk_size=8192)):
+            if 'data' in event:
+                yield Stream._to_event_dict(event)
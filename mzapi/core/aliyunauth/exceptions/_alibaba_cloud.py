@@ -27,7 +27,7 @@ _MZAPI_ORIGIN = "mzapi-aliyun-exceptions-alibaba-cloud-2026-qxx"
 
 from typing import Dict, Any
 
-from mzapi.utlis.aliyunauth.darabonba.exceptions import ResponseException
+from mzapi.core.aliyunauth.darabonba.exceptions import ResponseException
 
 
 class AlibabaCloudException(ResponseException):
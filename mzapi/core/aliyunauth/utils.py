@@ -11,7 +11,7 @@
 # -*- coding: utf-8 -*-
 # This file is auto-generated, don't edit it. Thanks.
 from __future__ import annotations
-from darabonba.model import DaraModel
+from mzapi.core.aliyunauth.darabonba.model import DaraModel
 from typing import Dict, Any, List
 import binascii
 import datetime
@@ -19,6 +19,7 @@ import hashlib
 import hmac
 import base64
 import copy
+import functools
 import platform
 import time
 import Tea
@@ -30,15 +31,43 @@ from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.primitives.serialization import load_pem_private_key
 from urllib.parse import quote_plus, quote
-from darabonba.utils.stream import STREAM_CLASS
-from darabonba.utils.form import Form
-from darabonba.core import DaraCore
+from mzapi.core.aliyunauth.darabonba.utils.stream import STREAM_CLASS
+from mzapi.core.aliyunauth.darabonba.utils.form import Form
+from mzapi.core.aliyunauth.darabonba.core import DaraCore
 from datetime import datetime
 from typing import Any, Dict, List
 from .sm3 import hash_sm3, Sm3
 
 _process_start_time = int(time.time() * 1000)
 _seqId = 0
+_STREAM_HASH_CHUNK_SIZE = 64 * 1024
+# RPC 签名中参数名与常见取值（Action、Version、AccessKeyId、业务选项等）反复出现，
+# 缓存其百分号编码结果；超长取值（如 Base64 图片）不进入缓存
+_PERCENT_ENCODE_CACHE_SIZE = 4096
+_PERCENT_ENCODE_CACHE_MAX_LEN = 256
+
+
+@functools.lru_cache(maxsize=_PERCENT_ENCODE_CACHE_SIZE)
+def _cached_percent_encode(value):
+    return quote(value, safe="~", encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=_PERCENT_ENCODE_CACHE_SIZE)
+def _cached_form_encode(value):
+    return quote_plus(value)
+
+
+def _percent_encode(value):
+    if len(value) > _PERCENT_ENCODE_CACHE_MAX_LEN:
+        return quote(value, safe="~", encoding="utf-8")
+    return _cached_percent_encode(value)
+
+
+def _form_encode(value):
+    if len(value) > _PERCENT_ENCODE_CACHE_MAX_LEN:
+        return quote_plus(value)
+    return _cached_form_encode(value)
+
 
 def to_str(val):
     if val is None:
@@ -263,6 +292,19 @@ class Utils(object):
             Utils._object_handler('', filter, result)
         return Form.to_form_string(result)
 
+    @staticmethod
+    def to_form_string(params):
+        """
+        Encode the flat params returned by query() into a form string,
+        same output as Form.to_form_string
+
+        @type params: dict
+        @param params: map[string]string
+
+        @return: the form string
+        """
+        return '&'.join(f'{_form_encode(k)}={_form_encode(v)}' for k, v in sorted(params.items()))
+
     @staticmethod
     def get_timestamp():
         """
@@ -303,18 +345,15 @@ class Utils(object):
 
         @return: the signature
         """
-        queries = signed_params.copy()
-        keys = list(queries.keys())
-        keys.sort()
-
-        canonicalized_query_string = ""
+        canonicalized_query_string = '&'.join(
+            f'{_percent_encode(k)}={_percent_encode(v)}'
+            for k, v in sorted(signed_params.items()) if v is not None
+        )
 
-        for k in keys:
-            if queries[k] is not None:
-                canonicalized_query_string += f'&{quote(k, safe="~", encoding="utf-8")}=' \
-                                              f'{quote(queries[k], safe="~", encoding="utf-8")}'
-
-        string_to_sign = f'{method}&%2F&{quote_plus(canonicalized_query_string[1:], safe="~", encoding="utf-8")}'
+        # the canonicalized string only holds unreserved characters, '%', '=' and '&',
+        # so percent-encoding it again reduces to escaping those three
+        encoded = canonicalized_query_string.replace('%', '%25').replace('=', '%3D').replace('&', '%26')
+        string_to_sign = f'{method}&%2F&{encoded}'
 
         digest_maker = hmac.new(bytes(secret + '&', encoding="utf-8"),
                                 bytes(string_to_sign, encoding="utf-8"),
@@ -428,6 +467,52 @@ class Utils(object):
         elif sign_type == 'ACS3-HMAC-SM3':
             return hash_sm3(raw)
 
+    @staticmethod
+    def stream_offset(stream):
+        """
+        Get the start offset of a seekable stream
+
+        @param stream: request stream
+
+        @return: current position, or None when the stream cannot seek
+        """
+        try:
+            if stream is not None and stream.seekable():
+                return stream.tell()
+        except (AttributeError, OSError, ValueError):
+            pass
+        return None
+
+    @staticmethod
+    def hash_stream(stream, offset, sign_type, chunk_size=_STREAM_HASH_CHUNK_SIZE):
+        """
+        Hash a seekable stream chunk by chunk from offset, then seek back to offset
+
+        @param stream: seekable request stream
+
+        @param offset: start offset from stream_offset()
+
+        @param sign_type: signature algorithm
+
+        @return: the digest bytes
+        """
+        if sign_type == 'ACS3-HMAC-SHA256' or sign_type == 'ACS3-RSA-SHA256':
+            h = hashlib.sha256()
+        elif sign_type == 'ACS3-HMAC-SM3':
+            h = Sm3()
+        else:
+            return None
+        stream.seek(offset)
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            h.update(chunk)
+        stream.seek(offset)
+        return h.digest()
+
     @staticmethod
     def hex_encode(raw):
         if raw:
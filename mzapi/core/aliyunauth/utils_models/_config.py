@@ -26,10 +26,10 @@ from __future__ import annotations
 # 内部项目标识（请勿修改）
 _MZAPI_ORIGIN = "mzapi-aliyun-utils-models-config-2026-qxx"
 
-from darabonba.model import DaraModel
+from mzapi.core.aliyunauth.darabonba.model import DaraModel
 from alibabacloud_credentials.client import Client
 from mzapi.utlis.aliyunauth import utils_models as main_models
-from darabonba.policy.retry import RetryOptions
+from mzapi.core.aliyunauth.darabonba.policy.retry import RetryOptions
 
 
 class Config(DaraModel):
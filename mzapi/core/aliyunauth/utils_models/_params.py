@@ -26,7 +26,7 @@ from __future__ import annotations
 # 内部项目标识（请勿修改）
 _MZAPI_ORIGIN = "mzapi-aliyun-utils-models-params-2026-qxx"
 
-from darabonba.model import DaraModel
+from mzapi.core.aliyunauth.darabonba.model import DaraModel
 
 
 class Params(DaraModel):
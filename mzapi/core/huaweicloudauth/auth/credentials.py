@@ -16,15 +16,22 @@ _MZAPI_ORIGIN = "mzapi-hwc-auth-credentials-2026-qxx"
 
 实现 Credentials、BasicCredentials、GlobalCredentials 等凭证类，
 支持 AK/SK 认证、STS 临时凭证、联邦认证等方式。
+
+STS 临时凭证按 single-flight 刷新：剩余有效期低于提前量时由一个后台线程刷新，
+其余请求继续使用仍然有效的旧凭证；临近过期时请求线程等待同一次刷新完成。
 """
 
+import asyncio
 import json
 import re
 import threading
+import time
 from abc import abstractmethod, ABC
+from collections import namedtuple
 from typing import Callable, Optional, Dict, Any
 
 from mzapi.utlis.huaweicloudauth.auth.internal import IamHelper, MetadataAccessor, StsHelper, StsAccessor, FederalAccessor
+from mzapi.utlis.huaweicloudauth.auth.project_cache import ProjectIdCache, DEFAULT_TTL_SECONDS
 from mzapi.utlis.huaweicloudauth.exceptions.exceptions import ApiValueError, ServiceResponseException, SdkException, \
     HostUnreachableException
 from mzapi.utlis.huaweicloudauth.http.http_client import HttpClient
@@ -34,6 +41,10 @@ from mzapi.utlis.huaweicloudauth.signer.signer import Signer, SM3Signer, Derivat
 from mzapi.utlis.huaweicloudauth.utils import string_utils, six_utils, time_utils
 
 
+# 一组同时生效的 AK/SK/安全令牌；STS 刷新整体替换，签名时只读取一次，避免拿到新旧混合的密钥
+_Secret = namedtuple("_Secret", ["ak", "sk", "security_token"])
+
+
 class DerivedCredentials(ABC):
     _DEFAULT_ENDPOINT_REG = "^[a-z][a-z0-9-]+(\\.[a-z]{2,}-[a-z]+-\\d{1,2})?\\.(my)?(huaweicloud|myhwclouds).(com|cn)"
 
@@ -58,6 +69,7 @@ class Credentials(DerivedCredentials):
     _X_SECURITY_TOKEN = "X-Security-Token"
     _AUTHORIZATION = "Authorization"
     _DEFAULT_EXPIRATION_THRESHOLD_SECONDS = 40 * 60  # 40min
+    _DEFAULT_BLOCKING_THRESHOLD_SECONDS = 5 * 60  # 5min
     _CACHE = {}
     _LOCK = threading.Lock()
     _SIGNER_CASE = {
@@ -69,38 +81,41 @@ class Credentials(DerivedCredentials):
 
     def __init__(self, ak: str = None, sk: str = None):
         super().__init__()
-        self._ak = ak
-        self._sk = sk
+        self._secret = _Secret(ak, sk, None)
         self._idp_id: Optional[str] = None
         self._id_token_file: Optional[str] = None
         self._iam_endpoint: Optional[str] = None
-        self._security_token: Optional[str] = None
         self._derived_auth_service_name: Optional[str] = None
         self._derived_predicate: Optional[Callable[[SdkRequest], bool]] = None
         self._region_id: Optional[str] = None
         self._sts_accessor: Optional[StsAccessor] = None
         self._expire_at: Optional[float] = 0
         self._once = six_utils.Once()
+        self._sts_refresh_lead_seconds = self._DEFAULT_EXPIRATION_THRESHOLD_SECONDS
+        # 同一时刻只允许一次 STS 刷新；后台刷新在调用线程获取锁，由刷新线程释放
+        self._sts_lock = threading.Lock()
+        self._sts_stats = {"refreshes": 0, "background_refreshes": 0, "failures": 0,
+                           "last_latency": 0.0, "max_latency": 0.0, "total_latency": 0.0}
 
     @property
     def ak(self):
-        return self._ak
+        return self._secret.ak
 
     @ak.setter
     def ak(self, value: str):
         if not value:
             raise ValueError("ak cannot be None or empty")
-        self._ak = value
+        self._secret = self._secret._replace(ak=value)
 
     @property
     def sk(self):
-        return self._sk
+        return self._secret.sk
 
     @sk.setter
     def sk(self, value: str):
         if not value:
             raise ValueError("sk cannot be None or empty")
-        self._sk = value
+        self._secret = self._secret._replace(sk=value)
 
     @property
     def idp_id(self):
@@ -128,11 +143,21 @@ class Credentials(DerivedCredentials):
 
     @property
     def security_token(self):
-        return self._security_token
+        return self._secret.security_token
 
     @security_token.setter
     def security_token(self, value: str):
-        self._security_token = value
+        self._secret = self._secret._replace(security_token=value)
+
+    @property
+    def sts_refresh_lead_seconds(self):
+        return self._sts_refresh_lead_seconds
+
+    @sts_refresh_lead_seconds.setter
+    def sts_refresh_lead_seconds(self, value: float):
+        if value is None or value < 0:
+            raise ValueError("sts_refresh_lead_seconds cannot be None or negative")
+        self._sts_refresh_lead_seconds = value
 
     @property
     def sts_accessor(self):
@@ -166,6 +191,15 @@ class Credentials(DerivedCredentials):
         self.security_token = token
         return self
 
+    def with_sts_refresh_lead(self, seconds: float):
+        """设置 STS 临时凭证提前后台刷新的时间（秒），默认 40 分钟"""
+        self.sts_refresh_lead_seconds = seconds
+        return self
+
+    def sts_refresh_stats(self) -> Dict[str, Any]:
+        """STS 刷新统计：成功/失败次数、后台刷新次数及刷新耗时（秒）"""
+        return dict(self._sts_stats)
+
     def get_update_path_params(self) -> Dict[str, Any]:
         pass
 
@@ -177,22 +211,96 @@ class Credentials(DerivedCredentials):
 
         return http_client.executor.submit(self.sign_request, request)
 
+    def process_auth_request_sync(self, request: SdkRequest, http_client: HttpClient) -> SdkRequest:
+        """在调用线程内直接签名，避免同步请求经线程池中转"""
+        self.process_sts(http_client)
+
+        return self.sign_request(request)
+
+    async def process_auth_request_async(self, request: SdkRequest, http_client: HttpClient) -> SdkRequest:
+        """process_auth_request_sync 的协程版本，需要等待 STS 刷新时不阻塞事件循环"""
+        await self.process_sts_async(http_client)
+
+        return self.sign_request(request)
+
     def process_sts(self, http_client: Optional[HttpClient]):
         self._once.do(self._process_accessor)
+        if not self.sts_accessor:
+            return
+
+        remaining = self._expire_at - time_utils.get_timestamp_utc()
+        if remaining < self._blocking_threshold():
+            self._refresh_sts_blocking(http_client)
+        elif remaining < self.sts_refresh_lead_seconds:
+            self._start_background_refresh(http_client)
+
+    async def process_sts_async(self, http_client: Optional[HttpClient]):
+        """process_sts 的协程版本，与同步调用共用同一把刷新锁"""
+        self._once.do(self._process_accessor)
+        if not self.sts_accessor:
+            return
+
+        remaining = self._expire_at - time_utils.get_timestamp_utc()
+        if remaining < self._blocking_threshold():
+            await asyncio.to_thread(self._refresh_sts_blocking, http_client)
+        elif remaining < self.sts_refresh_lead_seconds:
+            self._start_background_refresh(http_client)
+
+    def _blocking_threshold(self) -> float:
+        return min(self._DEFAULT_BLOCKING_THRESHOLD_SECONDS, self.sts_refresh_lead_seconds)
+
+    def _refresh_sts_blocking(self, http_client: Optional[HttpClient]):
+        with self._sts_lock:
+            # 等锁期间其他线程可能已经完成刷新
+            if self._expire_at - time_utils.get_timestamp_utc() < self._blocking_threshold():
+                self._refresh_sts(http_client)
 
-        if self._need_refresh_sts():
-            iam_endpoint = self.iam_endpoint or IamHelper.get_iam_endpoint()
+    def _start_background_refresh(self, http_client: Optional[HttpClient]):
+        if not self._sts_lock.acquire(blocking=False):
+            return
+        try:
+            threading.Thread(target=self._background_refresh, args=(http_client,),
+                             name="huaweicloud-sts-refresh", daemon=True).start()
+        except BaseException:
+            self._sts_lock.release()
+            raise
+
+    def _background_refresh(self, http_client: Optional[HttpClient]):
+        try:
+            if self._is_expired():
+                self._sts_stats["background_refreshes"] += 1
+                self._refresh_sts(http_client)
+        except Exception as e:
+            # 旧凭证仍然有效，下一次请求会再次触发刷新
+            if http_client is not None:
+                http_client.logger.warning("failed to refresh sts credential in background: %s", e)
+        finally:
+            self._sts_lock.release()
+
+    def _refresh_sts(self, http_client: Optional[HttpClient]):
+        iam_endpoint = self.iam_endpoint or IamHelper.get_iam_endpoint()
+        start = time.monotonic()
+        try:
             credential = self.sts_accessor.get_credential(
                 iam_endpoint=iam_endpoint,
                 http_client=http_client,
                 idp_id=self.idp_id,
                 id_token_file=self.id_token_file
             )
-
-            self.ak = credential.access
-            self.sk = credential.secret
-            self.security_token = credential.security_token
-            self._expire_at = credential.expire_at
+        except Exception:
+            self._sts_stats["failures"] += 1
+            raise
+        finally:
+            latency = time.monotonic() - start
+            self._sts_stats["last_latency"] = latency
+            self._sts_stats["total_latency"] += latency
+            self._sts_stats["max_latency"] = max(self._sts_stats["max_latency"], latency)
+
+        if not credential.access or not credential.secret:
+            raise ValueError("ak and sk cannot be None or empty")
+        self._secret = _Secret(credential.access, credential.secret, credential.security_token)
+        self._expire_at = credential.expire_at
+        self._sts_stats["refreshes"] += 1
 
     def _process_accessor(self):
         if self.sts_accessor:
@@ -207,23 +315,25 @@ class Credentials(DerivedCredentials):
         return self.sts_accessor and self._is_expired()
 
     def _is_expired(self) -> bool:
-        return self._expire_at - time_utils.get_timestamp_utc() < self._DEFAULT_EXPIRATION_THRESHOLD_SECONDS
+        return self._expire_at - time_utils.get_timestamp_utc() < self.sts_refresh_lead_seconds
 
     def sign_request(self, request: SdkRequest) -> SdkRequest:
-        if self.security_token is not None:
-            request.header_params["X-Security-Token"] = self.security_token
+        # 后台 STS 刷新可能随时替换凭证，整个签名过程使用同一份快照
+        secret = self._secret
+        if secret.security_token is not None:
+            request.header_params["X-Security-Token"] = secret.security_token
 
         if self._AUTHORIZATION in request.header_params:
             Signer.process_request_uri(request)
             return request
 
         if self._is_derived_auth(request):
-            return DerivationAKSKSigner(self).sign(request, self._derived_auth_service_name, self._region_id)
+            return DerivationAKSKSigner(secret).sign(request, self._derived_auth_service_name, self._region_id)
 
         signer_cls = self._SIGNER_CASE.get(request.signing_algorithm)
         if not signer_cls:
             raise SdkException("unsupported signing algorithm: " + str(request.signing_algorithm))
-        return signer_cls(self).sign(request)
+        return signer_cls(secret).sign(request)
 
     def _is_derived_auth(self, request: SdkRequest) -> bool:
         if not self._derived_predicate:
@@ -248,6 +358,7 @@ class Credentials(DerivedCredentials):
 
 class BasicCredentials(Credentials):
     _X_PROJECT_ID = "X-Project-Id"
+    _PROJECT_ID_LOCKS = {}
 
     def __init__(self, ak: str = None, sk: str = None, project_id: str = None):
         """区域级服务认证凭证
@@ -258,6 +369,7 @@ class BasicCredentials(Credentials):
         """
         super().__init__(ak, sk)
         self._project_id = project_id
+        self._project_id_cache: Optional[ProjectIdCache] = None
 
     @property
     def project_id(self) -> Optional[str]:
@@ -271,6 +383,23 @@ class BasicCredentials(Credentials):
         self.project_id = project_id
         return self
 
+    @property
+    def project_id_cache(self) -> Optional[ProjectIdCache]:
+        return self._project_id_cache
+
+    @project_id_cache.setter
+    def project_id_cache(self, value: Optional[ProjectIdCache]):
+        self._project_id_cache = value
+
+    def with_project_id_cache(self, path: str = None, ttl: float = DEFAULT_TTL_SECONDS):
+        """启用项目 ID 持久化缓存
+
+        :param path: 缓存文件路径，默认 ~/.huaweicloud/project_id_cache.json
+        :param ttl: 条目有效期（秒），默认 24 小时
+        """
+        self.project_id_cache = ProjectIdCache(path, ttl)
+        return self
+
     def get_update_path_params(self) -> Dict[str, Any]:
         path_params = {}
         if self.project_id:
@@ -301,6 +430,43 @@ class BasicCredentials(Credentials):
             self.project_id = project_id
             return self
 
+        if not cache_name:
+            self.project_id = self.__auto_get_project_id(http_client, region_id)
+            return self
+
+        # 同一 (ak/idp_id, 区域) 只由一个线程查询，其余线程等待后读取缓存
+        with self._LOCK:
+            lock = self._PROJECT_ID_LOCKS.setdefault(cache_name, threading.Lock())
+        with lock:
+            project_id = self._CACHE.get(cache_name)
+            if project_id:
+                self.project_id = project_id
+                return self
+
+            principal = self.ak or self.idp_id
+            persistent_cache = self.project_id_cache or ProjectIdCache.from_env()
+            if persistent_cache:
+                project_id = persistent_cache.get(principal, region_id)
+                if project_id:
+                    http_client.logger.info("project id of region '%s' loaded from %s: %s", region_id,
+                                            persistent_cache.path, string_utils.mask(project_id))
+
+            if not project_id:
+                project_id = self.__auto_get_project_id(http_client, region_id)
+                if persistent_cache:
+                    try:
+                        persistent_cache.put(principal, region_id, project_id)
+                    except OSError as e:
+                        http_client.logger.warning("failed to write project id cache %s: %s",
+                                                   persistent_cache.path, e)
+
+            self.project_id = project_id
+            with self._LOCK:
+                self._CACHE[cache_name] = project_id
+
+        return self
+
+    def __auto_get_project_id(self, http_client: HttpClient, region_id: str) -> str:
         derived_predicate = self._derived_predicate
         self._derived_predicate = None
 
@@ -311,7 +477,7 @@ class BasicCredentials(Credentials):
             http_client.logger.info("project id of region '%s' not found in BasicCredentials, "
                                     "trying to get project id from IAM service: %s",
                                     region_id, self.iam_endpoint)
-            response = http_client.do_request_sync(self.process_auth_request(req, http_client).result())
+            response = http_client.do_request_sync(self.process_auth_request_sync(req, http_client))
             trace_id = response.headers.get("X-IAM-Trace-Id")
             data = json.loads(response.content)
             projects = data.get("projects")
@@ -327,17 +493,14 @@ class BasicCredentials(Credentials):
                                    "Please select one when initializing the credentials: "
                                    "BasicCredentials(ak, sk, project_id)")
 
-            self.project_id = projects[0]["id"]
+            project_id = projects[0]["id"]
             http_client.logger.info("success to get project id of region '%s': %s",
-                                    region_id, string_utils.mask(self.project_id))
-            if cache_name:
-                with self._LOCK:
-                    self._CACHE[cache_name] = self.project_id
+                                    region_id, string_utils.mask(project_id))
         except ServiceResponseException as e:
             raise SdkException(f"Failed to get project id of region '{region_id}', {e}")
         self._derived_predicate = derived_predicate
 
-        return self
+        return project_id
 
     def sign_request(self, request: SdkRequest) -> SdkRequest:
         if self.project_id:
@@ -425,7 +588,7 @@ class GlobalCredentials(Credentials):
         http_client.logger.info('domain id not found in GlobalCredentials, '
                                 'trying to get domain id from %s', iam_endpoint)
         try:
-            response = http_client.do_request_sync(self.process_auth_request(req, http_client).result())
+            response = http_client.do_request_sync(self.process_auth_request_sync(req, http_client))
         except ServiceResponseException as e:
             raise SdkException(failed_msg_prefix + str(e))
         trace_id = response.headers.get("X-IAM-Trace-Id")
@@ -445,7 +608,7 @@ class GlobalCredentials(Credentials):
         req = StsHelper.get_caller_identity_request(http_client.config, sts_endpoint)
         http_client.logger.info("domains is empty, trying to get domain id from %s", sts_endpoint)
         try:
-            response = http_client.do_request_sync(self.process_auth_request(req, http_client).result())
+            response = http_client.do_request_sync(self.process_auth_request_sync(req, http_client))
         except HostUnreachableException as hostException:
             raise SdkException(failed_msg_prefix + str(hostException))
         except ServiceResponseException as se:
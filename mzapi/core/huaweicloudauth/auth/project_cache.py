@@ -0,0 +1,116 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-hwc-auth-project-cache-2026-qxx"
+
+"""华为云项目 ID 持久化缓存
+
+BasicCredentials 未指定 project_id 时需要调用 IAM KeystoneListProjects 查询，
+启用本缓存后查询结果写入本地 JSON 文件，后续进程启动时直接读取，省去一次 IAM 调用。
+
+- 键为 (ak 或 idp_id, 区域) 的 SHA-256 摘要，文件中不出现 AK
+- 条目带 TTL，过期后重新查询
+- 写入先落到同目录临时文件再 os.replace()，读者不会看到写了一半的文件；
+  多个进程同时写入时以最后一次为准，丢失的条目只会导致多一次 IAM 查询
+- 缓存文件权限 0600，所在目录权限 0700
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Optional
+
+PROJECT_ID_CACHE_ENV_NAME = "HUAWEICLOUD_SDK_PROJECT_ID_CACHE"
+DEFAULT_CACHE_PATH = os.path.join("~", ".huaweicloud", "project_id_cache.json")
+DEFAULT_TTL_SECONDS = 24 * 60 * 60  # 24h
+
+
+class ProjectIdCache:
+
+    def __init__(self, path: str = None, ttl: float = DEFAULT_TTL_SECONDS):
+        """项目 ID 文件缓存
+
+        :param path: 缓存文件路径，默认 ~/.huaweicloud/project_id_cache.json
+        :param ttl: 条目有效期（秒），默认 24 小时
+        """
+        if ttl is None or ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self._path = os.path.expanduser(path or DEFAULT_CACHE_PATH)
+        self._ttl = ttl
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @classmethod
+    def from_env(cls) -> Optional["ProjectIdCache"]:
+        """根据环境变量 HUAWEICLOUD_SDK_PROJECT_ID_CACHE 创建缓存
+
+        取值为 true / 1 时使用默认路径，其他非空值视为缓存文件路径，未设置时返回 None。
+        """
+        value = os.getenv(PROJECT_ID_CACHE_ENV_NAME)
+        if not value or value.lower() in ("0", "false"):
+            return None
+        if value.lower() in ("1", "true"):
+            return cls()
+        return cls(value)
+
+    @staticmethod
+    def _key(principal: str, region_id: str) -> str:
+        return hashlib.sha256(f"{principal}\n{region_id}".encode("utf-8")).hexdigest()
+
+    def get(self, principal: str, region_id: str) -> Optional[str]:
+        entry = self._read().get(self._key(principal, region_id))
+        if not isinstance(entry, dict) or entry.get("expires_at", 0) <= time.time():
+            return None
+        return entry.get("project_id")
+
+    def put(self, principal: str, region_id: str, project_id: str):
+        with self._lock:
+            now = time.time()
+            entries = {k: v for k, v in self._read().items()
+                       if isinstance(v, dict) and v.get("expires_at", 0) > now}
+            entries[self._key(principal, region_id)] = {"project_id": project_id, "expires_at": now + self._ttl}
+            self._write(entries)
+
+    def _read(self) -> dict:
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write(self, entries: dict):
+        directory = os.path.dirname(self._path) or "."
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".project_id_cache.", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self._path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
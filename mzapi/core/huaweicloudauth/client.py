@@ -18,15 +18,19 @@ _MZAPI_ORIGIN = "mzapi-hwc-client-2026-qxx"
 序列化、发送、反序列化等核心通信能力。
 """
 
+import asyncio
 import datetime
 import decimal
+import io
 import logging
 import os
 import re
 import sys
 import threading
+import time
 import warnings
 from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from logging.handlers import RotatingFileHandler
 from typing import Iterable, Union, List, TextIO, Optional
 from typing import Mapping
@@ -34,16 +38,20 @@ from typing import TypeVar, Generic
 from urllib.parse import quote, urlparse
 
 import bson
+import requests
 import simplejson as json
+from requests.structures import CaseInsensitiveDict
 from requests_toolbelt import MultipartEncoder
 
+from mzapi.core.rate_limit import get_rate_limiter
 from mzapi.utlis.huaweicloudauth.auth.credentials import BasicCredentials, DerivedCredentials, Credentials
 from mzapi.utlis.huaweicloudauth.auth.provider import CredentialProviderChain
 from mzapi.utlis.huaweicloudauth.exceptions.exception_handler import ExceptionHandler, DefaultExceptionHandler
 from mzapi.utlis.huaweicloudauth.exceptions.exceptions import HostUnreachableException, SslHandShakeException, \
-    ConnectionException
+    ConnectionException, ClientRequestException, ServerResponseException, RequestTimeoutException
 from mzapi.utlis.huaweicloudauth.http import progress
 from mzapi.utlis.huaweicloudauth.http.bson_types import BSON_TYPES_MAPPING
+from mzapi.utlis.huaweicloudauth.http.endpoint_selector import EndpointSelector
 from mzapi.utlis.huaweicloudauth.http.formdata import FormFile
 from mzapi.utlis.huaweicloudauth.http.http_client import HttpClient
 from mzapi.utlis.huaweicloudauth.http.http_config import HttpConfig
@@ -196,6 +204,8 @@ class Client:
     _AUTHORIZATION = "Authorization"
     _HEADERS = "headers"
     _LOG_FORMAT = '%(asctime)s %(thread)d %(name)s %(filename)s %(lineno)d %(levelname)s %(message)s'
+    _IDEMPOTENT_METHODS = ("GET", "HEAD")
+    _HEDGE_PERCENTILE = 95
 
     def __init__(self):
         self.preset_headers = {}
@@ -204,9 +214,11 @@ class Client:
 
         self._credentials = None
         self._config = None
-        self._endpoint_index = 0
         self._endpoints = []
+        self._endpoint_selector = None
         self._mutex = threading.Lock()
+        self._hedge_executor = None
+        self._hedge_stats = {"hedged": 0, "hedge_wins": 0}
 
         self._http_client = None
         self._http_handler = None
@@ -231,6 +243,7 @@ class Client:
 
     def with_endpoints(self, endpoints: List[str]):
         self._endpoints += endpoints
+        self._endpoint_selector = EndpointSelector(len(self._endpoints)) if self._endpoints else None
         return self
 
     def with_exception_handler(self, exception_handler: ExceptionHandler):
@@ -414,8 +427,10 @@ class Client:
 
         return None
 
-    def _url_parse(self, cname):
-        parse_result = urlparse(self._endpoints[self._endpoint_index])
+    def _url_parse(self, cname, endpoint=None):
+        if endpoint is None:
+            endpoint = self._endpoints[self._endpoint_selector.select()]
+        parse_result = urlparse(endpoint)
         if cname:
             endpoint = "%s://%s.%s" % (parse_result.scheme, cname, parse_result.netloc)
             parse_result = urlparse(endpoint)
@@ -425,40 +440,300 @@ class Client:
                         body=None, post_params=None, cname=None, response_type=None, response_headers=None,
                         collection_formats=None, request_type=None, async_request=False, progress_callback=None):
 
+        limiter = self._get_rate_limiter(method, resource_path)
         if async_request:
             future_request = self.build_future_request(method, resource_path, path_params, query_params, header_params,
                                                        body, post_params, cname, response_type, collection_formats,
                                                        progress_callback)
             future_response = self._http_client.executor.submit(self._do_http_request_async, future_request,
-                                                                response_type, response_headers, progress_callback)
+                                                                response_type, response_headers, progress_callback,
+                                                                limiter)
             return FutureSdkResponse(future_response, self._logger)
 
+        def build(endpoint):
+            return self.build_request(method, resource_path, path_params, query_params, header_params,
+                                      body, post_params, cname, response_type,
+                                      collection_formats, progress_callback, endpoint=endpoint)
+
+        hedge = self._should_hedge(method, resource_path, response_type, body)
+        try:
+            response = self._send_with_failover(build, limiter, hedge)
+        except ClientRequestException as e:
+            self._on_rate_limit_error(limiter, e)
+            raise
+
+        limiter.on_success()
+        return self.sync_response_handler(response, response_type, response_headers, progress_callback)
+
+    async def do_http_request_async(self, method, resource_path, path_params=None, query_params=None,
+                                    header_params=None, body=None, post_params=None, cname=None, response_type=None,
+                                    response_headers=None, collection_formats=None, request_type=None,
+                                    progress_callback=None):
+        """do_http_request 的协程版本，基于 asyncio 传输，不占用线程池
+
+        流式响应在返回前完整读取并转换为 requests.Response，下载进度回调不生效。
+        """
+        limiter = self._get_rate_limiter(method, resource_path)
+
+        async def build(endpoint):
+            return await self.build_request_async(method, resource_path, path_params, query_params,
+                                                  header_params, body, post_params, cname, response_type,
+                                                  collection_formats, progress_callback, endpoint=endpoint)
+
+        hedge = self._should_hedge(method, resource_path, response_type, body)
+        try:
+            response = await self._send_with_failover_async(build, limiter, hedge)
+        except ClientRequestException as e:
+            self._on_rate_limit_error(limiter, e)
+            raise
+
+        limiter.on_success()
+        if self._is_stream(response_type):
+            response = self._to_requests_response(response)
+        return self.sync_response_handler(response, response_type, response_headers, None)
+
+    @staticmethod
+    def _to_requests_response(response):
+        """把已读取完毕的 httpx.Response 转换为 requests.Response
+
+        consume_download_stream 的回调按同步路径的约定使用 raw / iter_content，
+        这里以内存中的响应体构造等价对象。
+        """
+        converted = requests.Response()
+        converted.status_code = response.status_code
+        converted.reason = response.reason_phrase
+        converted.url = str(response.url)
+        converted.headers = CaseInsensitiveDict(response.headers)
+        converted.encoding = response.encoding
+        converted._content = response.content
+        converted._content_consumed = True
+        converted.raw = io.BytesIO(response.content)
+        return converted
+
+    def _get_rate_limiter(self, method, resource_path):
+        """按 (AK, 请求方法 + 未展开的资源路径) 获取共享限速器"""
+        return get_rate_limiter("huaweicloud", getattr(self._credentials, "ak", None),
+                                "%s %s" % (method, resource_path))
+
+    @staticmethod
+    def _on_rate_limit_error(limiter, e):
+        # HttpClient 的 urllib3 重试用尽后同样以 429 的 ClientRequestException 抛出
+        if e.status_code == 429:
+            limiter.on_throttle()
+
+    def endpoint_stats(self):
+        """返回各终端节点的 EWMA 延迟、错误率、请求数与健康状态，以及对冲请求次数"""
+        stats = dict(self._hedge_stats)
+        stats["endpoints"] = dict(zip(self._endpoints, self._endpoint_selector.stats())) \
+            if self._endpoint_selector else {}
+        return stats
+
+    def _should_hedge(self, method, resource_path, response_type, body):
+        config = self._config
+        if not config.hedge_requests or len(self._endpoints) < 2 or self._is_stream(response_type):
+            return False
+        # 文件等只能读取一次的请求体无法重复发送
+        if hasattr(body, "read"):
+            return False
+        method = method.upper()
+        return method in self._IDEMPOTENT_METHODS or \
+            (method == "POST" and any(path in resource_path for path in config.hedge_paths))
+
+    def _hedge_delay(self):
+        latency = self._endpoint_selector.percentile(self._HEDGE_PERCENTILE)
+        if latency is None:
+            return None
+        return max(self._config.hedge_min_delay, latency)
+
+    def _hedge_target(self, primary):
+        """对冲请求的目标节点，样本不足或没有其他健康节点时返回 (None, None)"""
+        delay = self._hedge_delay()
+        if delay is None:
+            return None, None
+        secondary = self._endpoint_selector.select(exclude=(primary,), healthy_only=True)
+        if secondary is None:
+            return None, None
+        return secondary, delay
+
+    def _count_hedge(self, key):
+        with self._mutex:
+            self._hedge_stats[key] += 1
+
+    def _record_endpoint(self, index, start, error=None):
+        elapsed = time.monotonic() - start
+        if isinstance(error, ConnectionException):
+            self._endpoint_selector.record_failure(index)
+        elif error is None or isinstance(error, ClientRequestException):
+            # 4xx 说明节点本身工作正常
+            self._endpoint_selector.record(index, elapsed)
+        elif isinstance(error, (ServerResponseException, RequestTimeoutException)):
+            self._endpoint_selector.record(index, elapsed, ok=False)
+        elif isinstance(error, asyncio.CancelledError):
+            # 对冲落败被取消，已耗时是实际延迟的下界，仍计入以免慢节点一直被选为主节点
+            self._endpoint_selector.record(index, elapsed)
+
+    def _on_endpoint_failure(self, e, tried, exc_msgs):
+        exc_msgs.append(str(e))
+        if len(tried) < len(self._endpoints):
+            return
+        if len(exc_msgs) == 1:
+            raise e
+        raise ConnectionException("; ".join(exc_msgs))
+
+    def _send_with_failover(self, build, limiter, hedge):
+        tried = []
         exc_msgs = []
         while True:
+            index = self._endpoint_selector.select(exclude=tried)
             try:
-                request = self.build_future_request(method, resource_path, path_params, query_params, header_params,
-                                                    body, post_params, cname, response_type,
-                                                    collection_formats, progress_callback).result()
-                response = self._do_http_request_sync(request)
-                break
+                if hedge:
+                    return self._send_hedged(build, limiter, index)
+                return self._send_to_endpoint(build, limiter, index)
             except (HostUnreachableException, SslHandShakeException) as e:
-                with self._mutex:
-                    if self._endpoint_index < len(self._endpoints) - 1:
-                        self._endpoint_index += 1
-                        exc_msgs.append(str(e))
-                    else:
-                        self._endpoint_index = 0
-
-                        if not exc_msgs:
-                            raise e
-                        exc_msgs.append(str(e))
-                        raise ConnectionException("; ".join(exc_msgs))
+                tried.append(index)
+                self._on_endpoint_failure(e, tried, exc_msgs)
 
-        return self.sync_response_handler(response, response_type, response_headers, progress_callback)
+    def _send_to_endpoint(self, build, limiter, index):
+        request = build(self._endpoints[index])
+        limiter.acquire()
+        start = time.monotonic()
+        try:
+            response = self._do_http_request_sync(request)
+        except BaseException as e:
+            self._record_endpoint(index, start, e)
+            raise
+        self._record_endpoint(index, start)
+        return response
+
+    def _get_hedge_executor(self):
+        if self._hedge_executor is None:
+            with self._mutex:
+                if self._hedge_executor is None:
+                    self._hedge_executor = ThreadPoolExecutor(max_workers=max(4, 2 * self._config.pool_maxsize),
+                                                              thread_name_prefix="huaweicloud-hedge")
+        return self._hedge_executor
+
+    def _send_hedged(self, build, limiter, primary):
+        secondary, delay = self._hedge_target(primary)
+        if secondary is None:
+            return self._send_to_endpoint(build, limiter, primary)
+
+        executor = self._get_hedge_executor()
+        futures = [executor.submit(self._send_to_endpoint, build, limiter, primary)]
+        if not wait(futures, timeout=delay)[0]:
+            self._count_hedge("hedged")
+            futures.append(executor.submit(self._send_to_endpoint, build, limiter, secondary))
+
+        pending = set(futures)
+        errors = {}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in futures:
+                if future not in done:
+                    continue
+                error = future.exception()
+                # 4xx 同样是服务端的应答，直接返回
+                if error is None or isinstance(error, ClientRequestException):
+                    if future is not futures[0]:
+                        self._count_hedge("hedge_wins")
+                    for other in futures:
+                        if other is not future:
+                            other.add_done_callback(self._discard_hedged_response)
+                    return future.result()
+                errors[future] = error
+        raise errors[futures[0]]
+
+    @staticmethod
+    def _discard_hedged_response(future):
+        if not future.cancelled() and future.exception() is None:
+            future.result().close()
+
+    async def _send_with_failover_async(self, build, limiter, hedge):
+        tried = []
+        exc_msgs = []
+        while True:
+            index = self._endpoint_selector.select(exclude=tried)
+            try:
+                if hedge:
+                    return await self._send_hedged_async(build, limiter, index)
+                return await self._send_to_endpoint_async(build, limiter, index)
+            except (HostUnreachableException, SslHandShakeException) as e:
+                tried.append(index)
+                self._on_endpoint_failure(e, tried, exc_msgs)
+
+    async def _send_to_endpoint_async(self, build, limiter, index):
+        request = await build(self._endpoints[index])
+        await limiter.acquire_async()
+        start = time.monotonic()
+        try:
+            response = await self._http_client.async_do_request(request)
+        except BaseException as e:
+            self._record_endpoint(index, start, e)
+            raise
+        self._record_endpoint(index, start)
+        return response
+
+    async def _send_hedged_async(self, build, limiter, primary):
+        secondary, delay = self._hedge_target(primary)
+        if secondary is None:
+            return await self._send_to_endpoint_async(build, limiter, primary)
+
+        tasks = [asyncio.ensure_future(self._send_to_endpoint_async(build, limiter, primary))]
+        try:
+            if not (await asyncio.wait(tasks, timeout=delay))[0]:
+                self._count_hedge("hedged")
+                tasks.append(asyncio.ensure_future(self._send_to_endpoint_async(build, limiter, secondary)))
+
+            pending = set(tasks)
+            errors = {}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in tasks:
+                    if task not in done:
+                        continue
+                    error = task.exception()
+                    if error is None or isinstance(error, ClientRequestException):
+                        if task is not tasks[0]:
+                            self._count_hedge("hedge_wins")
+                        return task.result()
+                    errors[task] = error
+            raise errors[tasks[0]]
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # 标记异常已读取，避免事件循环报告 "exception was never retrieved"
+                    task.exception()
 
     def build_future_request(self, method, resource_path, path_params, query_params, header_params,
-                             request_body, post_params, cname, response_type, collection_formats, progress_callback):
-        url_parse_result = self._url_parse(cname)
+                             request_body, post_params, cname, response_type, collection_formats, progress_callback,
+                             endpoint=None):
+        sdk_request = self._build_sdk_request(method, resource_path, path_params, query_params, header_params,
+                                              request_body, post_params, cname, response_type, collection_formats,
+                                              progress_callback, endpoint)
+        return self._credentials.process_auth_request(sdk_request, self._http_client)
+
+    def build_request(self, method, resource_path, path_params, query_params, header_params,
+                      request_body, post_params, cname, response_type, collection_formats, progress_callback,
+                      endpoint=None):
+        sdk_request = self._build_sdk_request(method, resource_path, path_params, query_params, header_params,
+                                              request_body, post_params, cname, response_type, collection_formats,
+                                              progress_callback, endpoint)
+        return self._credentials.process_auth_request_sync(sdk_request, self._http_client)
+
+    async def build_request_async(self, method, resource_path, path_params, query_params, header_params,
+                                  request_body, post_params, cname, response_type, collection_formats,
+                                  progress_callback, endpoint=None):
+        sdk_request = self._build_sdk_request(method, resource_path, path_params, query_params, header_params,
+                                              request_body, post_params, cname, response_type, collection_formats,
+                                              progress_callback, endpoint)
+        return await self._credentials.process_auth_request_async(sdk_request, self._http_client)
+
+    def _build_sdk_request(self, method, resource_path, path_params, query_params, header_params,
+                           request_body, post_params, cname, response_type, collection_formats, progress_callback,
+                           endpoint=None):
+        url_parse_result = self._url_parse(cname, endpoint)
         schema = url_parse_result.scheme
         host = url_parse_result.netloc
 
@@ -492,20 +767,32 @@ class Client:
         sdk_request = SdkRequest(method=method, schema=schema, host=host, resource_path=resource_path,
                                  query_params=query_params, header_params=header_params, body=body, stream=stream,
                                  signing_algorithm=self._config.signing_algorithm)
-        return self._credentials.process_auth_request(sdk_request, self._http_client)
+        return sdk_request
 
     def _do_http_request_sync(self, request):
         response = self._http_client.do_request_sync(request)
         return response
 
-    def _do_http_request_async(self, future_request, response_type, response_headers, progress_callback):
+    def _do_http_request_async(self, future_request, response_type, response_headers, progress_callback,
+                               limiter=None):
         request = future_request.result()
-        future_response = self._http_client.do_request_async(
-            request=request,
-            hooks=[self.async_response_hook_factory(response_type, response_headers, progress_callback)]
-        )
+        hooks = [self.async_response_hook_factory(response_type, response_headers, progress_callback)]
+        if limiter is not None:
+            limiter.acquire()
+            hooks.insert(0, self._rate_limit_hook_factory(limiter))
+        future_response = self._http_client.do_request_async(request=request, hooks=hooks)
         return future_response
 
+    @staticmethod
+    def _rate_limit_hook_factory(limiter):
+        def response_hook(resp, *args, **kwargs):
+            if resp.status_code == 429:
+                limiter.on_throttle()
+            elif resp.status_code < 400:
+                limiter.on_success()
+
+        return response_hook
+
     def sync_response_handler(self, response, response_type, response_headers, progress_callback):
         concrete_response = self.deserialize(response, response_type, progress_callback)
         if isinstance(concrete_response, SdkResponse):
@@ -692,5 +979,13 @@ class Client:
         return kwargs
 
     def close(self):
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
         if self._http_client:
             self._http_client.close()
+
+    async def aclose(self):
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+        if self._http_client:
+            await self._http_client.aclose()
@@ -17,6 +17,8 @@ _MZAPI_ORIGIN = "mzapi-hwc-exception-handler-2026-qxx"
 实现 DefaultExceptionHandler，处理 HTTP 响应错误并转换为 SDK 异常。"""
 
 import json
+import socket
+import ssl
 from abc import abstractmethod, ABC
 
 from mzapi.utlis.huaweicloudauth.utils import six_utils as six
@@ -114,6 +116,23 @@ def process_connection_error(connection_error, logger):
     return exceptions.ConnectionException(str(connection_error))
 
 
+def process_async_connection_error(connection_error, logger):
+    """将 asyncio 传输层（httpx）的连接异常转换为 SDK 异常"""
+    reason_str = str(connection_error) or connection_error.__class__.__name__
+    cause = connection_error
+    while cause is not None:
+        if isinstance(cause, ssl.SSLError):
+            logger.error("SslHandShakeException occurred. %s", reason_str)
+            return exceptions.SslHandShakeException(reason_str)
+        if isinstance(cause, socket.gaierror):
+            logger.error("HostUnreachableException occurred. %s", reason_str)
+            return exceptions.HostUnreachableException(reason_str)
+        cause = cause.__cause__ or cause.__context__
+
+    logger.error("ConnectionException occurred. %s", reason_str)
+    return exceptions.ConnectionException(reason_str)
+
+
 def process_retry_error(retry_error, logger):
     err_msg = str(retry_error)
     logger.error("RetryError occurred. %s", err_msg)
@@ -0,0 +1,138 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-hwc-http-endpoint-selector-2026-qxx"
+
+"""华为云终端节点选择
+
+Client 配置了多个终端节点时，按各节点的延迟与错误率选择本次请求使用的节点：
+
+- 每个节点维护响应延迟与错误率的 EWMA，得分为 延迟 × (1 + ERROR_PENALTY × 错误率)，
+  选择得分最低的健康节点；尚无样本的节点得分为 0，会被优先探测一次
+- 连接失败（主机不可达、SSL 握手失败）的节点在冷却期内不参与选择，
+  连续失败时冷却期翻倍，最长为 MAX_COOLDOWN_FACTOR 倍；所有节点都在冷却期时选择最早恢复的节点
+- percentile() 返回最近请求延迟的分位数，用于计算对冲请求的等待时间
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Iterable, Optional
+
+DEFAULT_ALPHA = 0.2
+DEFAULT_FAILURE_COOLDOWN = 30.0
+MAX_COOLDOWN_FACTOR = 8
+ERROR_PENALTY = 4.0
+# 计算分位数所需的最少样本数，样本不足时不进行对冲
+MIN_PERCENTILE_SAMPLES = 20
+_SAMPLE_WINDOW = 256
+
+
+class EndpointSelector:
+
+    def __init__(self, size: int, alpha: float = DEFAULT_ALPHA,
+                 failure_cooldown: float = DEFAULT_FAILURE_COOLDOWN):
+        """按 EWMA 延迟与错误率选择终端节点
+
+        :param size: 终端节点数量，节点以 Client 中的下标表示
+        :param alpha: EWMA 平滑系数，越大越偏向最近的样本
+        :param failure_cooldown: 连接失败后节点的冷却时间（秒）
+        """
+        if size <= 0:
+            raise ValueError("size must be positive")
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self._size = size
+        self._alpha = alpha
+        self._failure_cooldown = failure_cooldown
+        self._lock = threading.Lock()
+        self._latency = [None] * size
+        self._error_rate = [0.0] * size
+        self._failures = [0] * size
+        self._down_until = [0.0] * size
+        self._requests = [0] * size
+        self._samples = deque(maxlen=_SAMPLE_WINDOW)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def select(self, exclude: Iterable[int] = (), healthy_only: bool = False) -> Optional[int]:
+        """返回当前最优的节点下标
+
+        :param exclude: 不参与选择的节点
+        :param healthy_only: 为 True 时不选择冷却期内的节点
+        :return: 节点下标，没有可选节点时返回 None
+        """
+        excluded = set(exclude)
+        candidates = [i for i in range(self._size) if i not in excluded]
+        if not candidates:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            healthy = [i for i in candidates if self._down_until[i] <= now]
+            if not healthy:
+                if healthy_only:
+                    return None
+                return min(candidates, key=lambda i: self._down_until[i])
+            return min(healthy, key=lambda i: (self._score(i), i))
+
+    def record(self, index: int, latency: float, ok: bool = True):
+        """记录一次收到响应（或超时）的请求
+
+        :param index: 节点下标
+        :param latency: 请求耗时（秒）
+        :param ok: 是否成功，服务端错误与超时为 False
+        """
+        with self._lock:
+            self._requests[index] += 1
+            previous = self._latency[index]
+            self._latency[index] = latency if previous is None else \
+                self._alpha * latency + (1 - self._alpha) * previous
+            self._error_rate[index] = (1 - self._alpha) * self._error_rate[index] + (0.0 if ok else self._alpha)
+            if ok:
+                self._failures[index] = 0
+            self._samples.append(latency)
+
+    def record_failure(self, index: int):
+        """记录一次连接失败，节点进入冷却期"""
+        with self._lock:
+            self._requests[index] += 1
+            self._failures[index] += 1
+            self._error_rate[index] = (1 - self._alpha) * self._error_rate[index] + self._alpha
+            factor = min(2 ** (self._failures[index] - 1), MAX_COOLDOWN_FACTOR)
+            self._down_until[index] = time.monotonic() + self._failure_cooldown * factor
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """最近请求延迟的分位数（秒），样本不足 MIN_PERCENTILE_SAMPLES 时返回 None"""
+        with self._lock:
+            if len(self._samples) < MIN_PERCENTILE_SAMPLES:
+                return None
+            samples = sorted(self._samples)
+        return samples[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+    def stats(self) -> list:
+        """返回每个节点的统计：EWMA 延迟、错误率、请求数与是否处于冷却期"""
+        now = time.monotonic()
+        with self._lock:
+            return [{
+                "latency": self._latency[i],
+                "error_rate": self._error_rate[i],
+                "requests": self._requests[i],
+                "healthy": self._down_until[i] <= now,
+            } for i in range(self._size)]
+
+    def _score(self, index):
+        latency = self._latency[index]
+        if latency is None:
+            return 0.0
+        return latency * (1 + ERROR_PENALTY * self._error_rate[index])
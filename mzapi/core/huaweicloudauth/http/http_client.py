@@ -14,25 +14,40 @@ _MZAPI_ORIGIN = "mzapi-hwc-http-client-2026-qxx"
 
 """华为云 HTTP 客户端
 
-实现 HttpClient 类，负责同步/异步 HTTP 请求的发送和响应处理。"""
+实现 HttpClient 类，负责同步/异步 HTTP 请求的发送和响应处理：
+  - do_request_sync：阻塞发送（requests）
+  - do_request_async：提交到线程池，返回 Future（requests）
+  - async_do_request：asyncio 协程发送（httpx.AsyncClient），按事件循环复用连接池"""
 
+import asyncio
 from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
 
 import requests
 from mzapi.utlis.huaweicloudauth.sdk_request import SdkRequest
 from requests import HTTPError, Timeout, TooManyRedirects
-from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, RetryError
+from requests.utils import super_len
 
 try:
     from requests.packages.urllib3.util import Retry
 except ImportError:
     from urllib3.util import Retry
 
+from mzapi.core.loop_resources import LoopResources
+from mzapi.core.ssl_context import SSLContextAdapter, get_ssl_context
 from mzapi.utlis.huaweicloudauth.exceptions import exceptions
-from mzapi.utlis.huaweicloudauth.exceptions.exception_handler import process_connection_error, process_retry_error
+from mzapi.utlis.huaweicloudauth.exceptions.exception_handler import process_connection_error, process_retry_error, \
+    process_async_connection_error
 from mzapi.utlis.huaweicloudauth.http.future_session import FutureSession
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+_ASYNC_READ_CHUNK_SIZE = 64 * 1024
+
 
 class HttpClient:
     def __init__(self, config, http_handler, exception_handler, logger):
@@ -55,13 +70,22 @@ class HttpClient:
         self._session = self._init_session()
         self._closed = False
 
-        self._executor = ThreadPoolExecutor(max_workers=8)
+        if config.executor is not None:
+            self._executor = config.executor
+            self._owns_executor = False
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=config.executor_max_workers)
+            self._owns_executor = True
+
+        # 每个事件循环一个 httpx.AsyncClient，asyncio.run() 关闭循环前关闭连接池并移除缓存
+        self._async_clients = LoopResources(lambda client: client.aclose())
 
     def _init_session(self):
         sdk_session = requests.Session()
         retry = Retry(total=self._config.retry_times, status_forcelist=self._retry_status_list)
-        sdk_adapter = HTTPAdapter(pool_connections=self._config.pool_connections,
-                                  pool_maxsize=self._config.pool_maxsize, max_retries=retry)
+        # SSLContext 取自进程级注册表，多个客户端共享同一份已解析的 CA
+        sdk_adapter = SSLContextAdapter(pool_connections=self._config.pool_connections,
+                                        pool_maxsize=self._config.pool_maxsize, max_retries=retry)
         sdk_session.mount('https://', sdk_adapter)
         sdk_session.mount('http://', sdk_adapter)
         return sdk_session
@@ -121,6 +145,100 @@ class HttpClient:
         )
         return future
 
+    async def async_do_request(self, request: SdkRequest):
+        """在当前事件循环上发送请求，不占用线程池
+
+        响应体在返回前已完整读取，流式响应同样如此。
+
+        :rtype: httpx.Response
+        """
+        client = self._get_async_client()
+        headers = dict(request.header_params or {})
+        try:
+            if self._http_handler is not None:
+                self._http_handler.process_request(request=request, logger=self._logger)
+            response = await client.request(
+                request.method,
+                request.url,
+                headers=headers,
+                content=self._async_content(request.body, headers),
+            )
+        except httpx.TimeoutException as timeout:
+            raise exceptions.CallTimeoutException(str(timeout))
+        except httpx.TooManyRedirects as too_many_redirects:
+            raise exceptions.RetryOutageException(str(too_many_redirects))
+        except httpx.TransportError as conn_err:
+            raise process_async_connection_error(conn_err, self._logger)
+
+        if self._http_handler is not None:
+            self._http_handler.process_response(response=response, logger=self._logger)
+        if response.status_code >= 400:
+            self._exception_handler.handle_exception(response.request, response)
+        return response
+
+    def _get_async_client(self):
+        clients = self._async_clients.get()
+        client = clients.get("client")
+        if client is None or client.is_closed:
+            client = clients["client"] = self._new_async_client()
+        return client
+
+    def _new_async_client(self):
+        if httpx is None:
+            raise exceptions.SdkException("httpx is required for async_do_request, run: pip install httpx")
+
+        config = self._config
+        ssl_context = self._ssl_context()
+        limits = httpx.Limits(max_connections=config.async_pool_maxsize,
+                              max_keepalive_connections=config.async_pool_maxsize)
+        transport = httpx.AsyncHTTPTransport(verify=ssl_context, limits=limits, retries=config.retry_times)
+        mounts = None
+        https_proxy = self._proxy.get("https") if self._proxy else None
+        if https_proxy:
+            # 与 requests 一致，代理只作用于 https
+            mounts = {"https://": httpx.AsyncHTTPTransport(proxy=https_proxy, verify=ssl_context, limits=limits,
+                                                          retries=config.retry_times)}
+
+        timeout = config.timeout
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+        return httpx.AsyncClient(transport=transport, mounts=mounts, timeout=timeout,
+                                 follow_redirects=config.allow_redirects)
+
+    def _ssl_context(self):
+        verify = self._verify
+        return get_ssl_context(ca=verify if isinstance(verify, str) else None, cert=self._cert,
+                               verify=verify is not False)
+
+    @staticmethod
+    def _async_content(body, headers):
+        """把 requests 风格的请求体转换为 httpx 可接受的 content"""
+        if body is None or isinstance(body, (bytes, str)):
+            return body
+        if isinstance(body, (dict, list)):
+            return urlencode(body, doseq=True)
+        if hasattr(body, "read"):
+            length = super_len(body)
+            if not length:
+                return body.read()
+            if not any(k.lower() == "content-length" for k in headers):
+                headers["Content-Length"] = str(length)
+            return HttpClient._aiter_file(body)
+        return HttpClient._aiter_chunks(body)
+
+    @staticmethod
+    async def _aiter_file(fileobj):
+        while True:
+            chunk = await asyncio.to_thread(fileobj.read, _ASYNC_READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk.encode() if isinstance(chunk, str) else chunk
+
+    @staticmethod
+    async def _aiter_chunks(iterable):
+        for chunk in iterable:
+            yield chunk.encode() if isinstance(chunk, str) else chunk
+
     def response_error_hook_factory(self):
         def response_hook(resp, *args, **kwargs):
             if self._http_handler is not None:
@@ -141,6 +259,14 @@ class HttpClient:
         try:
             if not self._closed:
                 self._session.close()
+                if self._owns_executor:
+                    self._executor.shutdown(wait=False)
                 self._closed = True
         except Exception as e:
             self._logger.warning("Close session failed, %s", e)
+
+    async def aclose(self):
+        """关闭当前事件循环上的 asyncio 连接池"""
+        clients = self._async_clients.pop()
+        if clients:
+            await clients["client"].aclose()
@@ -16,6 +16,7 @@ _MZAPI_ORIGIN = "mzapi-hwc-http-config-2026-qxx"
 
 提供 HttpConfig 类，管理代理、SSL、超时、重试等 HTTP 配置参数。"""
 
+from concurrent.futures import Executor
 from typing import Union
 
 from urllib.parse import quote_plus
@@ -41,7 +42,13 @@ class HttpConfig:
                  allow_redirects: bool = False,
                  ignore_content_type_for_get_request: bool = False,
                  signing_algorithm: SigningAlgorithm = SigningAlgorithm.get_default(),
-                 user_agent: str = None):
+                 user_agent: str = None,
+                 executor: Executor = None,
+                 executor_max_workers: int = 8,
+                 async_pool_maxsize: int = 256,
+                 hedge_requests: bool = False,
+                 hedge_min_delay: float = 0.05,
+                 hedge_paths: tuple = ("/ocr/",)):
         """
         :param proxy_protocol(可选) : 代理协议，http 或 https
         :type proxy_protocol: str
@@ -93,6 +100,27 @@ class HttpConfig:
 
         :param user_agent(可选): 可选的自定义值，将附加到 User-Agent 请求头
         :type user_agent: str
+
+        :param executor(可选): 异步请求（async_request=True）使用的线程池，多个客户端传入同一实例即可共享；
+            由调用方负责关闭。未设置时每个客户端按 executor_max_workers 创建自己的线程池
+        :type executor: concurrent.futures.Executor
+
+        :param executor_max_workers: 未注入 executor 时自建线程池的大小，默认值为 8
+        :type executor_max_workers: int
+
+        :param async_pool_maxsize: do_http_request_async 使用的 asyncio 连接池最大连接数，默认值为 256
+        :type async_pool_maxsize: int
+
+        :param hedge_requests: 配置了多个终端节点时，幂等请求在超过近期 p95 延迟仍未返回时向另一个节点
+            再发一次，取先返回的结果，默认值为 False
+        :type hedge_requests: bool
+
+        :param hedge_min_delay: 发出对冲请求前的最短等待时间（秒），默认值为 0.05
+        :type hedge_min_delay: float
+
+        :param hedge_paths: 视为幂等的 POST 请求资源路径片段，GET / HEAD 请求总是幂等，
+            默认值为 ("/ocr/",)（OCR 识别接口）
+        :type hedge_paths: tuple
         """
         self._proxy_protocol = proxy_protocol
         self._proxy_host = proxy_host
@@ -116,6 +144,14 @@ class HttpConfig:
 
         self._user_agent = user_agent
 
+        self._executor = executor
+        self._executor_max_workers = executor_max_workers
+        self._async_pool_maxsize = async_pool_maxsize
+
+        self._hedge_requests = hedge_requests
+        self._hedge_min_delay = hedge_min_delay
+        self._hedge_paths = tuple(hedge_paths or ())
+
     @property
     def proxy_protocol(self):
         return self._proxy_protocol
@@ -252,6 +288,54 @@ class HttpConfig:
     def user_agent(self, value: str):
         self._user_agent = value
 
+    @property
+    def executor(self):
+        return self._executor
+
+    @executor.setter
+    def executor(self, value: Executor):
+        self._executor = value
+
+    @property
+    def executor_max_workers(self):
+        return self._executor_max_workers
+
+    @executor_max_workers.setter
+    def executor_max_workers(self, value: int):
+        self._executor_max_workers = value
+
+    @property
+    def async_pool_maxsize(self):
+        return self._async_pool_maxsize
+
+    @async_pool_maxsize.setter
+    def async_pool_maxsize(self, value: int):
+        self._async_pool_maxsize = value
+
+    @property
+    def hedge_requests(self):
+        return self._hedge_requests
+
+    @hedge_requests.setter
+    def hedge_requests(self, value: bool):
+        self._hedge_requests = value
+
+    @property
+    def hedge_min_delay(self):
+        return self._hedge_min_delay
+
+    @hedge_min_delay.setter
+    def hedge_min_delay(self, value: float):
+        self._hedge_min_delay = value
+
+    @property
+    def hedge_paths(self):
+        return self._hedge_paths
+
+    @hedge_paths.setter
+    def hedge_paths(self, value: tuple):
+        self._hedge_paths = tuple(value or ())
+
     @property
     def proxy(self):
         return self.get_proxy()
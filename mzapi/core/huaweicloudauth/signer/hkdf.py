@@ -14,15 +14,17 @@ _MZAPI_ORIGIN = "mzapi-hwc-signer-hkdf-2026-qxx"
 
 """华为云 HKDF 密钥派生
 
-实现 HMAC-based Key Derivation Function，用于派生认证密钥。"""
-
-from __future__ import absolute_import
+实现 HMAC-based Key Derivation Function，用于派生认证密钥。
+派生结果经进程级 DerivedKeyCache 缓存，见 get_cached_der_key_sha256。"""
 
 import hashlib
 import math
 import hmac
 import copy
 import binascii
+import threading
+import time
+from collections import OrderedDict
 
 from mzapi.utlis.huaweicloudauth.exceptions.exceptions import SdkException
 
@@ -107,3 +109,78 @@ def hmac_sha256(key_byte, message, hmac_algorithm):
         return hmac.new(key_byte, message, digestmod=hmac_algorithm).digest()
 
     raise SdkException(f"not expecting type ({type(key_byte)}, {type(message)})")
+
+
+_SECONDS_PER_DAY = 86400
+
+
+class DerivedKeyCache:
+    """V11-HMAC-SHA256 派生密钥缓存
+
+    派生密钥只取决于 (ak, sk, info)，其中 info 形如 "日期/区域/服务"，
+    每个条目在写入当日的 UTC 零点过期。按 LRU 淘汰，线程安全，
+    进程内所有 HttpClient 共用同一实例。
+    """
+
+    DEFAULT_MAX_SIZE = 256
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self):
+        return self._hits
+
+    @property
+    def misses(self):
+        return self._misses
+
+    def get(self, access_key, secret_key, info):
+        cache_key = (access_key, secret_key, info)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and now < entry[0]:
+                self._entries.move_to_end(cache_key)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+
+        der_key = get_der_key_sha256(access_key, secret_key, info)
+        if der_key is None:
+            return None
+
+        expires_at = (int(now) // _SECONDS_PER_DAY + 1) * _SECONDS_PER_DAY
+        with self._lock:
+            self._entries[cache_key] = (expires_at, der_key)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return der_key
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self._hits, "misses": self._misses, "size": len(self._entries)}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_DERIVED_KEY_CACHE = DerivedKeyCache()
+
+
+def get_derived_key_cache():
+    return _DERIVED_KEY_CACHE
+
+
+def get_cached_der_key_sha256(access_key, secret_key, info):
+    return _DERIVED_KEY_CACHE.get(access_key, secret_key, info)
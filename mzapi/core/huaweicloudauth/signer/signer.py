@@ -20,13 +20,16 @@ _MZAPI_ORIGIN = "mzapi-hwc-signer-2026-qxx"
 
 import hashlib
 import hmac
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from typing import Optional, List
 
 from mzapi.utlis.huaweicloudauth.exceptions.exceptions import SdkException
 from mzapi.utlis.huaweicloudauth.sdk_request import SdkRequest
 from mzapi.utlis.huaweicloudauth.signer import hkdf
-from mzapi.utlis.huaweicloudauth.signer.utils import new_sm3_hash, SM2SigningKey, P256SigningKey
+from mzapi.utlis.huaweicloudauth.signer.utils import new_sm3_hash, SM2SigningKey, P256SigningKey, \
+    new_p256_signing_key
 from mzapi.utlis.huaweicloudauth.utils import six_utils as six
 
 from urllib.parse import quote, unquote
@@ -288,7 +291,7 @@ class DerivationAKSKSigner(Signer):
         date_str = datetime.strftime(t, self.BasicISODateFormat)
         info_str = "%s/%s/%s" % (date_str, region_id, derived_auth_service_name)
         string_to_sign = self._process_string_to_sign(canonical_request, t, info_str)
-        derivation_key = hkdf.get_der_key_sha256(access_key=self._ak, secret_key=self._sk, info=info_str)
+        derivation_key = hkdf.get_cached_der_key_sha256(access_key=self._ak, secret_key=self._sk, info=info_str)
         signature = self._sign_string_to_sign(string_to_sign, derivation_key)
         auth_value = self._process_auth_header_value(signature, self._ak, signed_headers, info_str)
         request.header_params[self._HEADER_AUTHORIZATION] = auth_value
@@ -302,6 +305,11 @@ class P256SHA256Signer(Signer):
     _ALGORITHM = "SDK-ECDSA-P256-SHA256"
     _N_MINUS_TWO = P256SigningKey.N_MINUS_TWO
 
+    # 派生私钥只取决于 (ak, sk, algorithm)，进程内缓存签名密钥
+    _SIGNING_KEY_CACHE_SIZE = 64
+    _signing_key_cache = OrderedDict()
+    _signing_key_lock = threading.Lock()
+
     def _verify_required(self):
         super()._verify_required()
 
@@ -333,8 +341,24 @@ class P256SHA256Signer(Signer):
         raise SdkException("derive candidate failed, counter out of range")
 
     def get_signing_key(self):
-        private_key = self._derive_key()
-        return P256SigningKey(private_key)
+        cache_key = (self._ak, self._sk, self._ALGORITHM)
+        cache = P256SHA256Signer._signing_key_cache
+        with P256SHA256Signer._signing_key_lock:
+            signing_key = cache.get(cache_key)
+            if signing_key is not None:
+                cache.move_to_end(cache_key)
+                return signing_key
+
+        signing_key = self._new_signing_key(self._derive_key())
+        with P256SHA256Signer._signing_key_lock:
+            cache[cache_key] = signing_key
+            while len(cache) > self._SIGNING_KEY_CACHE_SIZE:
+                cache.popitem(last=False)
+        return signing_key
+
+    @classmethod
+    def _new_signing_key(cls, private_key: int):
+        return new_p256_signing_key(private_key)
 
 
 class SM2SM3Signer(P256SHA256Signer):
@@ -347,6 +371,6 @@ class SM2SM3Signer(P256SHA256Signer):
         super().__init__(credentials)
         self._hash_func = new_sm3_hash
 
-    def get_signing_key(self):
-        private_key = self._derive_key()
+    @classmethod
+    def _new_signing_key(cls, private_key: int):
         return SM2SigningKey(private_key)
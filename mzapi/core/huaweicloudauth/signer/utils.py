@@ -14,148 +14,33 @@ _MZAPI_ORIGIN = "mzapi-hwc-signer-utils-2026-qxx"
 
 """华为云签名工具
 
-提供 SM3 哈希、SM2/P256 签名密钥等签名相关的工具函数。"""
+提供 SM2/P256 签名密钥等签名相关的工具函数，SM3 哈希见 mzapi.core.sm3。"""
 
 import hashlib
 import secrets
-from sys import version_info
+import threading
 from abc import abstractmethod, ABC
-from typing import List, Tuple, Optional
+from typing import Tuple, Optional, List
 
 from pyasn1.codec.der import encoder, decoder
 from pyasn1.type import univ
 
-from mzapi.utlis.huaweicloudauth.exceptions.exceptions import SdkException
-
-Point = Tuple[int, int]
-
-if version_info.major == 3:
-    if version_info.minor < 7:
-        _IV = [0x7380166f, 0x4914b2b9, 0x172442d7, 0xda8a0600, 0xa96f30bc, 0x163138aa, 0xe38dee4d, 0xb0fb0e4e]
-        _T_J = [0x79cc4519 if j < 16 else 0x7a879d8a for j in range(64)]
-        _0X8F = 0xffffffff
-
-        _OUT_OF_RANGE_ERROR = ValueError("j out of range [0, 64)")
-
-
-        def _left_rotate(n: int, k: int) -> int:
-            """
-            将 n 的二进制表示左移 k 位，
-            然后将最高位的 k 位移到最低位，形成新的 32 位无符号整数。
-            """
-            return ((n << k) & _0X8F) | ((n >> (32 - k)) & _0X8F)
-
-
-        def _ff_j(x: int, y: int, z: int, j: int) -> int:
-            """布尔函数，根据 j 的取值采用不同表达式。基于 GB/T 32905-2016。"""
-            if 0 <= j < 16:
-                return x ^ y ^ z
-            elif 16 <= j < 64:
-                return (x & y) | (x & z) | (y & z)
-            else:
-                raise _OUT_OF_RANGE_ERROR
-
-
-        def _gg_j(x: int, y: int, z: int, j: int) -> int:
-            """布尔函数，根据 j 的取值采用不同表达式。基于 GB/T 32905-2016。"""
-            if 0 <= j < 16:
-                return x ^ y ^ z
-            elif 16 <= j < 64:
-                return (x & y) ^ (~x & z)
-            else:
-                raise _OUT_OF_RANGE_ERROR
-
-
-        def _p_0(x: int) -> int:
-            """压缩函数中的置换函数，基于 GB/T 32905-2016。"""
-            return x ^ _left_rotate(x, 9) ^ _left_rotate(x, 17)
-
-
-        def _p_1(x: int) -> int:
-            """压缩函数中的置换函数，基于 GB/T 32905-2016。"""
-            return x ^ _left_rotate(x, 15) ^ _left_rotate(x, 23)
-
-
-        def _cf(v_i: List[int], b_i: List[int]) -> List[int]:
-            """压缩函数，基于 GB/T 32905-2016。"""
-            w = [0] * 68
-            for i in range(16):
-                data = b_i[i * 4: (i + 1) * 4]
-                w[i] = int.from_bytes(data, byteorder='big')
-
-            for i in range(16, 68):
-                w[i] = _p_1(w[i - 16] ^ w[i - 9] ^ (_left_rotate(w[i - 3], 15))) ^ (_left_rotate(w[i - 13], 7)) ^ w[
-                    i - 6]
-
-            w_1 = [w[i] ^ w[i + 4] for i in range(64)]
-
-            a, b, c, d, e, f, g, h = v_i
+try:
+    from cryptography.exceptions import InvalidSignature
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import ec
 
-            for i in range(64):
-                ss_1 = _left_rotate((_left_rotate(a, 12) + e + _left_rotate(_T_J[i], i % 32)) & _0X8F, 7)
-                ss_2 = ss_1 ^ _left_rotate(a, 12)
-                tt_1 = (_ff_j(a, b, c, i) + d + ss_2 + w_1[i]) & _0X8F
-                tt_2 = (_gg_j(e, f, g, i) + h + ss_1 + w[i]) & _0X8F
-                d, c, b, a, h, g, f, e = c, _left_rotate(b, 9), a, tt_1, g, _left_rotate(f, 19), e, _p_0(tt_2)
-                a, b, c, d, e, f, g, h = map(lambda x: x & _0X8F, (a, b, c, d, e, f, g, h))
+    HAS_CRYPTOGRAPHY_EC = True
+except ImportError:
+    HAS_CRYPTOGRAPHY_EC = False
 
-            v_j = (a, b, c, d, e, f, g, h)
-            return [v_j[i] ^ v_i[i] for i in range(8)]
-
-
-        def _hash(data: bytes) -> bytes:
-            """哈希函数，基于 GB/T 32905-2016。"""
-            data_list = [i for i in data]
-            length = len(data_list)
-            bit_length = length * 8
-            k = (56 - length - 1) % 64
-            data_list.append(0x80)
-            data_list.extend([0x00] * k)
-            data_list.extend([i for i in bit_length.to_bytes(8, 'big')])
-
-            iter_count = int(len(data_list) / 64)
-            b = [data_list[i * 64:(i + 1) * 64] for i in range(iter_count)]
-
-            v = [_IV]
-
-            i = 0
-            for i in range(iter_count):
-                v.append(_cf(v[i], b[i]))
-
-            return b''.join(map(lambda n: n.to_bytes(4, 'big'), v[i + 1]))
-
-
-        class _SM3Hash:
-            name = 'sm3'
-            digest_size = 32
-            block_size = 64
-
-            def __init__(self, data=b''):
-                self._bytearray = bytearray(data)
-
-            def update(self, data: bytes):
-                self._bytearray.extend(data)
-
-            def digest(self) -> bytes:
-                return _hash(bytes(self._bytearray))
-
-            def hexdigest(self) -> str:
-                return self.digest().hex()
-
-            def copy(self) -> '_SM3Hash':
-                """返回当前实例的副本
-
-                返回:
-                    _SM3Hash: 当前实例的副本
-                """
-                return self.__class__(bytes(self._bytearray))
+from mzapi.utlis.huaweicloudauth.exceptions.exceptions import SdkException
+from ...sm3 import new_sm3_hash
 
+Point = Tuple[int, int]
+JacobianPoint = Tuple[int, int, int]
 
-        new_sm3_hash = lambda data=b'': _SM3Hash(data)
-    else:
-        new_sm3_hash = lambda data=b'': hashlib.new('sm3', data)
-else:
-    new_sm3_hash = None
+_BASE_TABLE_LOCK = threading.Lock()
 
 
 def _secure_randint(a: int, b: int) -> int:
@@ -203,6 +88,9 @@ class P256SigningKey(SigningKey):
     N_MINUS_TWO = PARAM_n - 2
     OID = "1.2.840.10045.3.1.7"
 
+    # 基点预计算表的窗口宽度（比特）
+    BASE_TABLE_WINDOW = 4
+
     def __init__(self, private_key: int):
         super().__init__()
         self._private_key = private_key
@@ -214,30 +102,166 @@ class P256SigningKey(SigningKey):
             return p2
         if p2 is None:
             return p1
-        x1, y1 = p1
-        x2, y2 = p2
-        if x1 == x2 and y1 != y2:
-            return None
-        if x1 == x2:
-            m = (3 * x1 * x1 + cls.PARAM_a) * pow(2 * y1, cls.PARAM_p - 2, cls.PARAM_p)
-        else:
-            m = (y1 - y2) * pow(x1 - x2, cls.PARAM_p - 2, cls.PARAM_p)
-        x3 = (m * m - x1 - x2) % cls.PARAM_p
-        y3 = (m * (x1 - x3) - y1) % cls.PARAM_p
-        p = (x3, y3)
-        return p
+        return cls._from_jacobian(cls._jacobian_add_affine((p1[0], p1[1], 1), p2))
 
     @classmethod
     def _point_multiply(cls, k: int, p: Point) -> Point:
+        if p == cls.PARAM_G:
+            return cls._base_multiply(k)
+
+        result = None
+        for bit in bin(k)[2:]:
+            result = cls._jacobian_double(result)
+            if bit == "1":
+                result = cls._jacobian_add_affine(result, p)
+        return cls._from_jacobian(result)
+
+    @classmethod
+    def _base_multiply(cls, k: int) -> Point:
+        """基于预计算表计算 [k]G
+
+        表中第 i 行存放 j * 2^(w*i) * G（j = 1..2^w-1，仿射坐标），
+        因此只需按 w 位一组取 k 的各个窗口做混合加法，无需倍点运算。
+        """
+        table = cls._get_base_table()
+        window = cls.BASE_TABLE_WINDOW
+        mask = (1 << window) - 1
         result = None
-        addend = p
-        while k:
-            if k & 1:
-                result = cls._point_add(result, addend)
-            addend = cls._point_add(addend, addend)
-            k >>= 1
+        for row in table:
+            digit = k & mask
+            if digit:
+                result = cls._jacobian_add_affine(result, row[digit])
+            k >>= window
+            if not k:
+                break
+        return cls._from_jacobian(result)
+
+    @classmethod
+    def _get_base_table(cls) -> List[List[Optional[Point]]]:
+        # 每个曲线类独立持有一份表，首次使用时构建
+        table = cls.__dict__.get("_base_table")
+        if table is None:
+            with _BASE_TABLE_LOCK:
+                table = cls.__dict__.get("_base_table")
+                if table is None:
+                    table = cls._build_base_table()
+                    cls._base_table = table
+        return table
+
+    @classmethod
+    def _build_base_table(cls) -> List[List[Optional[Point]]]:
+        window = cls.BASE_TABLE_WINDOW
+        width = (1 << window) - 1
+        rows = (cls.PARAM_n.bit_length() + window - 1) // window
+        base = (cls.PARAM_G[0], cls.PARAM_G[1], 1)
+        points = []
+        for _ in range(rows):
+            acc = None
+            for _ in range(width):
+                acc = cls._jacobian_add(acc, base)
+                points.append(acc)
+            base = cls._jacobian_add(acc, base)
+
+        affine = cls._batch_from_jacobian(points)
+        return [[None] + affine[i * width:(i + 1) * width] for i in range(rows)]
+
+    @classmethod
+    def _batch_from_jacobian(cls, points: List[JacobianPoint]) -> List[Point]:
+        """批量转换为仿射坐标，用一次模逆完成全部 Z 坐标求逆"""
+        prime = cls.PARAM_p
+        prefix = []
+        acc = 1
+        for _, _, z in points:
+            acc = acc * z % prime
+            prefix.append(acc)
+
+        inv = pow(acc, prime - 2, prime)
+        result = [None] * len(points)
+        for i in range(len(points) - 1, -1, -1):
+            x, y, z = points[i]
+            z_inv = inv * prefix[i - 1] % prime if i else inv
+            inv = inv * z % prime
+            z_inv2 = z_inv * z_inv % prime
+            result[i] = (x * z_inv2 % prime, y * z_inv2 * z_inv % prime)
         return result
 
+    @classmethod
+    def _from_jacobian(cls, p: Optional[JacobianPoint]) -> Optional[Point]:
+        if p is None:
+            return None
+        x, y, z = p
+        prime = cls.PARAM_p
+        z_inv = pow(z, prime - 2, prime)
+        z_inv2 = z_inv * z_inv % prime
+        return x * z_inv2 % prime, y * z_inv2 * z_inv % prime
+
+    @classmethod
+    def _jacobian_double(cls, p: Optional[JacobianPoint]) -> Optional[JacobianPoint]:
+        if p is None:
+            return None
+        x, y, z = p
+        if y == 0:
+            return None
+        prime = cls.PARAM_p
+        yy = y * y % prime
+        s = 4 * x * yy % prime
+        zz = z * z % prime
+        m = (3 * x * x + cls.PARAM_a * zz * zz) % prime
+        x3 = (m * m - 2 * s) % prime
+        y3 = (m * (s - x3) - 8 * yy * yy) % prime
+        z3 = 2 * y * z % prime
+        return x3, y3, z3
+
+    @classmethod
+    def _jacobian_add(cls, p: Optional[JacobianPoint], q: Optional[JacobianPoint]) -> Optional[JacobianPoint]:
+        if p is None:
+            return q
+        if q is None:
+            return p
+        x1, y1, z1 = p
+        x2, y2, z2 = q
+        prime = cls.PARAM_p
+        z1z1 = z1 * z1 % prime
+        z2z2 = z2 * z2 % prime
+        u1 = x1 * z2z2 % prime
+        s1 = y1 * z2 * z2z2 % prime
+        h = (x2 * z1z1 - u1) % prime
+        r = (y2 * z1 * z1z1 - s1) % prime
+        if h == 0:
+            if r == 0:
+                return cls._jacobian_double(p)
+            return None
+        hh = h * h % prime
+        hhh = h * hh % prime
+        v = u1 * hh % prime
+        x3 = (r * r - hhh - 2 * v) % prime
+        y3 = (r * (v - x3) - s1 * hhh) % prime
+        z3 = h * z1 * z2 % prime
+        return x3, y3, z3
+
+    @classmethod
+    def _jacobian_add_affine(cls, p: Optional[JacobianPoint], q: Point) -> Optional[JacobianPoint]:
+        """Jacobian 点与仿射点的混合加法"""
+        if p is None:
+            return q[0], q[1], 1
+        x1, y1, z1 = p
+        x2, y2 = q
+        prime = cls.PARAM_p
+        z1z1 = z1 * z1 % prime
+        h = (x2 * z1z1 - x1) % prime
+        r = (y2 * z1 * z1z1 - y1) % prime
+        if h == 0:
+            if r == 0:
+                return cls._jacobian_double(p)
+            return None
+        hh = h * h % prime
+        hhh = h * hh % prime
+        v = x1 * hh % prime
+        x3 = (r * r - hhh - 2 * v) % prime
+        y3 = (r * (v - x3) - y1 * hhh) % prime
+        z3 = h * z1 % prime
+        return x3, y3, z3
+
     def sign(self, data):
         while 1:
             while 1:
@@ -293,6 +317,35 @@ class P256SigningKey(SigningKey):
         return x == r
 
 
+class CryptographyP256SigningKey(SigningKey):
+    """由 cryptography（OpenSSL）实现的 ECDSA P-256 签名密钥
+
+    与 P256SigningKey 输出相同的 ASN.1-DER (r, s) 签名。
+    """
+
+    def __init__(self, private_key: int):
+        super().__init__()
+        self._key = ec.derive_private_key(private_key, ec.SECP256R1())
+        self._verifying_key = self._key.public_key()
+
+    def sign(self, data):
+        return self._key.sign(data, ec.ECDSA(hashes.SHA256()))
+
+    def verify(self, signature, data):
+        try:
+            self._verifying_key.verify(signature, data, ec.ECDSA(hashes.SHA256()))
+        except InvalidSignature:
+            return False
+        return True
+
+
+def new_p256_signing_key(private_key: int) -> SigningKey:
+    """创建 P-256 签名密钥，cryptography 可用时优先使用"""
+    if HAS_CRYPTOGRAPHY_EC:
+        return CryptographyP256SigningKey(private_key)
+    return P256SigningKey(private_key)
+
+
 class SM2SigningKey(P256SigningKey):
     PARAM_p = 0xfffffffeffffffffffffffffffffffffffffffff00000000ffffffffffffffff
     PARAM_a = 0xfffffffeffffffffffffffffffffffffffffffff00000000fffffffffffffffc
@@ -0,0 +1,131 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-core-loop-resources-2026-qxx"
+
+"""
+按事件循环缓存的异步连接资源
+
+aiohttp.ClientSession 与 httpx.AsyncClient 只能在创建它们的事件循环中使用，并且持有该循环的强引用，
+以事件循环为键的 WeakKeyDictionary 中的项因此永远不会被回收。阿里云与华为云的异步传输改用
+LoopResources 缓存，以 id(loop) 为键，并在事件循环关闭前释放：
+
+- 首次在某个事件循环上取用资源时，登记一个挂起的异步生成器；asyncio.run() 等在关闭循环前调用
+  loop.shutdown_asyncgens()，生成器收尾时关闭该循环上的全部资源并移除缓存项
+- 没有经过 shutdown_asyncgens() 就关闭的循环，在下次访问注册表时丢弃其缓存项（资源无法再关闭，只释放引用）
+- pop() 供显式关闭（close_async_sessions() / aclose()）使用
+
+包含的内容：
+  - LoopResources：按事件循环分组的资源注册表
+"""
+
+import asyncio
+import logging
+import threading
+
+__all__ = ["LoopResources"]
+
+logger = logging.getLogger(__name__)
+
+
+class _LoopEntry(object):
+    __slots__ = ("loop", "resources", "hook")
+
+    def __init__(self, loop, resources):
+        self.loop = loop
+        self.resources = resources
+        self.hook = None
+
+
+class LoopResources(object):
+    """按事件循环分组的资源注册表，线程安全
+
+    :param close: 关闭单个资源的协程函数，如 ``lambda client: client.aclose()``
+    :param factory: 每个事件循环的资源容器类型，默认 dict
+    """
+
+    def __init__(self, close, factory=dict):
+        self._close = close
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    def get(self):
+        """返回当前事件循环的资源容器（必要时创建），须在事件循环中调用"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._prune_closed()
+            entry = self._entries.get(id(loop))
+            if entry is not None and entry.loop is loop:
+                return entry.resources
+            entry = self._entries[id(loop)] = _LoopEntry(loop, self._factory())
+        entry.hook = self._shutdown_hook(entry)
+        # 推进到第一个 yield：生成器由此登记到当前事件循环，循环关闭前会对它调用 aclose()
+        try:
+            entry.hook.asend(None).send(None)
+        except StopIteration:
+            pass
+        return entry.resources
+
+    def pop(self, loop=None):
+        """移除事件循环的资源容器并返回，由调用方负责关闭其中的资源
+
+        :param loop: 事件循环，默认当前运行的循环
+        :return: 资源容器，没有缓存时返回 None
+        """
+        loop = loop or asyncio.get_running_loop()
+        with self._lock:
+            entry = self._entries.get(id(loop))
+            if entry is None or entry.loop is not loop:
+                return None
+            del self._entries[id(loop)]
+            resources, entry.resources = entry.resources, self._factory()
+        return resources
+
+    def items(self):
+        """返回 [(事件循环, 资源容器)] 快照"""
+        with self._lock:
+            return [(entry.loop, entry.resources) for entry in self._entries.values()]
+
+    def clear(self):
+        """清空注册表并返回 [(事件循环, 资源容器)]，由调用方负责关闭其中的资源"""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            taken = []
+            for entry in entries:
+                taken.append((entry.loop, entry.resources))
+                entry.resources = self._factory()
+        return taken
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def _prune_closed(self):
+        closed = [key for key, entry in self._entries.items() if entry.loop.is_closed()]
+        for key in closed:
+            del self._entries[key]
+
+    async def _shutdown_hook(self, entry):
+        try:
+            yield
+        finally:
+            with self._lock:
+                if self._entries.get(id(entry.loop)) is entry:
+                    del self._entries[id(entry.loop)]
+                resources, entry.resources = entry.resources, self._factory()
+            for resource in list(resources.values()):
+                try:
+                    await self._close(resource)
+                except Exception:
+                    logger.debug("close %r failed", resource, exc_info=True)
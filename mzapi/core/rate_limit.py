@@ -0,0 +1,247 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-core-rate-limit-2026-qxx"
+
+"""
+自适应客户端限速器
+
+阿里云、腾讯云与华为云客户端共用。每个 (服务商, 账号, 接口) 对应一个限速器，
+发送请求前调用 acquire()，收到响应后调用 on_success() 或 on_throttle()。
+
+- 未收到过限流响应时不限速，acquire() 只统计发送速率
+- 收到限流响应时按乘性减小速率（AIMD）：新速率 = min(当前速率, 实测发送速率) × decrease_factor，
+  并启用令牌桶；服务端给出剩余限流时间时，在这段时间内不发放令牌。
+  同一个冷却期内的多个限流响应（同一批并发请求）只减速一次
+- 之后每成功一次按距上次减速的时间线性恢复：速率 = 减速后速率 + increase_rate × 经过秒数
+- 令牌以预约方式发放：并发调用方各自排到后续时间点，不会在令牌恢复的瞬间同时放行
+
+包含的内容：
+  - AdaptiveRateLimiter：令牌桶 + AIMD 限速器
+  - get_rate_limiter()：按 (服务商, 账号, 接口) 获取共享的限速器
+  - rate_limiter_stats()：所有限速器的统计
+  - clear_rate_limiters()：清空注册表
+"""
+
+import asyncio
+import threading
+import time
+
+__all__ = [
+    "AdaptiveRateLimiter",
+    "get_rate_limiter",
+    "rate_limiter_stats",
+    "clear_rate_limiters",
+]
+
+DEFAULT_MIN_RATE = 0.5
+DEFAULT_DECREASE_FACTOR = 0.5
+DEFAULT_INCREASE_RATE = 0.5
+# 同一冷却期（秒）内的多个限流响应只减速一次
+DEFAULT_DECREASE_COOLDOWN = 1.0
+# 单次等待的上限（秒），避免异常的 retry-after 让调用方无限期挂起
+MAX_WAIT = 60.0
+# 发送速率的测量窗口（秒）
+_MEASURE_WINDOW = 0.5
+_MEASURE_SMOOTHING = 0.3
+
+
+class AdaptiveRateLimiter(object):
+    """令牌桶 + AIMD 限速器，线程安全，同步与异步调用方可共用同一实例
+
+    :param min_rate: 最低速率（请求/秒）
+    :param max_rate: 最高速率（请求/秒），None 表示不设上限
+    :param decrease_factor: 收到限流响应时的速率乘数
+    :param increase_rate: 每秒恢复的速率（请求/秒）
+    :param decrease_cooldown: 两次减速之间的最短间隔（秒）
+    """
+
+    def __init__(self, min_rate=DEFAULT_MIN_RATE, max_rate=None, decrease_factor=DEFAULT_DECREASE_FACTOR,
+                 increase_rate=DEFAULT_INCREASE_RATE, decrease_cooldown=DEFAULT_DECREASE_COOLDOWN):
+        if min_rate <= 0:
+            raise ValueError("min_rate must be positive")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be in (0, 1)")
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self._decrease_factor = decrease_factor
+        self._increase_rate = increase_rate
+        self._decrease_cooldown = decrease_cooldown
+        self._lock = threading.Lock()
+        self._enabled = False
+        self._rate = None
+        self._base_rate = None
+        self._tokens = 0.0
+        self._refilled_at = 0.0
+        self._decreased_at = None
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._measured_rate = 0.0
+        self._stats = {"acquired": 0, "delayed": 0, "wait_time": 0.0, "throttles": 0, "decreases": 0}
+
+    @property
+    def enabled(self):
+        """是否已因限流响应开始限速"""
+        return self._enabled
+
+    @property
+    def rate(self):
+        """当前速率（请求/秒），未限速时为 None"""
+        return self._rate if self._enabled else None
+
+    def acquire(self):
+        """阻塞直到可以发送请求
+
+        :return: 等待的秒数
+        :rtype: float
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self):
+        """acquire() 的协程版本
+
+        :return: 等待的秒数
+        :rtype: float
+        """
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def on_success(self):
+        """记录一次未被限流的响应，逐步恢复速率"""
+        if not self._enabled:
+            return
+        with self._lock:
+            if not self._enabled:
+                return
+            now = time.monotonic()
+            self._refill(now)
+            rate = self._base_rate + self._increase_rate * (now - self._decreased_at)
+            if self._max_rate is not None:
+                rate = min(rate, self._max_rate)
+            self._rate = max(self._rate, rate)
+
+    def on_throttle(self, retry_after=None):
+        """记录一次限流响应，乘性减小速率
+
+        :param retry_after: 服务端给出的剩余限流时间（秒），在此期间不发放令牌
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._stats["throttles"] += 1
+            if self._enabled:
+                self._refill(now)
+            if self._decreased_at is None or now - self._decreased_at >= self._decrease_cooldown:
+                measured = self._current_send_rate(now)
+                current = min(self._rate, measured) if self._enabled and measured else (self._rate or measured)
+                rate = max(self._min_rate, (current or self._min_rate) * self._decrease_factor)
+                if self._max_rate is not None:
+                    rate = min(rate, self._max_rate)
+                self._rate = self._base_rate = rate
+                self._decreased_at = now
+                self._stats["decreases"] += 1
+                if not self._enabled:
+                    self._enabled = True
+                    self._refilled_at = now
+                    self._tokens = 0.0
+            if retry_after:
+                self._tokens = min(self._tokens, -min(retry_after, MAX_WAIT) * self._rate)
+
+    def stats(self):
+        """返回统计：当前速率、实测发送速率、放行 / 等待次数、累计等待时间与限流次数
+
+        :rtype: dict
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["enabled"] = self._enabled
+            stats["rate"] = self._rate if self._enabled else None
+            stats["measured_rate"] = self._measured_rate
+        return stats
+
+    def _reserve(self):
+        with self._lock:
+            now = time.monotonic()
+            self._measure(now)
+            self._stats["acquired"] += 1
+            if not self._enabled:
+                return 0.0
+            self._refill(now)
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            wait = min(-self._tokens / self._rate, MAX_WAIT)
+            self._stats["delayed"] += 1
+            self._stats["wait_time"] += wait
+            return wait
+
+    def _refill(self, now):
+        # 桶容量为 1：空闲期间最多积攒一个令牌，恢复后不会突发
+        self._tokens = min(1.0, self._tokens + (now - self._refilled_at) * self._rate)
+        self._refilled_at = now
+
+    def _measure(self, now):
+        elapsed = now - self._window_start
+        if elapsed >= _MEASURE_WINDOW:
+            sample = self._window_count / elapsed
+            if self._measured_rate:
+                sample = _MEASURE_SMOOTHING * sample + (1 - _MEASURE_SMOOTHING) * self._measured_rate
+            self._measured_rate = sample
+            self._window_start = now
+            self._window_count = 0
+        self._window_count += 1
+
+    def _current_send_rate(self, now):
+        elapsed = now - self._window_start
+        if elapsed >= _MEASURE_WINDOW / 2:
+            return max(self._measured_rate, self._window_count / elapsed)
+        return self._measured_rate or (self._window_count / _MEASURE_WINDOW)
+
+
+_lock = threading.Lock()
+_limiters = {}
+
+
+def get_rate_limiter(vendor, account, action):
+    """获取（必要时创建）(服务商, 账号, 接口) 对应的共享限速器
+
+    :param vendor: 服务商，如 "aliyun"、"tencent"、"huaweicloud"
+    :param account: 账号标识（通常为 AccessKey ID），未知时传空字符串
+    :param action: 接口名
+    :rtype: AdaptiveRateLimiter
+    """
+    key = (vendor, account or "", action or "")
+    limiter = _limiters.get(key)
+    if limiter is None:
+        with _lock:
+            limiter = _limiters.setdefault(key, AdaptiveRateLimiter())
+    return limiter
+
+
+def rate_limiter_stats():
+    """返回所有限速器的统计，键为 (服务商, 账号, 接口)
+
+    :rtype: dict
+    """
+    with _lock:
+        limiters = list(_limiters.items())
+    return {key: limiter.stats() for key, limiter in limiters}
+
+
+def clear_rate_limiters():
+    """清空注册表，已取得限速器的调用方不受影响"""
+    with _lock:
+        _limiters.clear()
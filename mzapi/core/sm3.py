@@ -0,0 +1,223 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-core-sm3-2026-qxx"
+
+"""
+SM3 国密哈希算法（GB/T 32905-2016）
+
+阿里云 ACS3-HMAC-SM3 与华为云 SDK-HMAC-SM3 / SDK-SM2-SM3 共用的 SM3 实现。
+
+- OpenSSL 提供 sm3 时（hashlib.new('sm3') 可用），直接使用 hashlib
+- 否则回退到纯 Python 实现 SM3Hash：按 64 字节分组增量压缩，
+  常量预先完成循环移位，仅缓存不足一个分组的尾部数据
+
+对外接口与 hashlib 对象一致：update() / digest() / hexdigest() / copy()。
+"""
+
+import hashlib
+import struct
+
+__all__ = [
+    "SM3Hash",
+    "new_sm3_hash",
+    "sm3_digest",
+    "OPENSSL_SM3_AVAILABLE",
+]
+
+_MASK = 0xFFFFFFFF
+
+_IV = (0x7380166F, 0x4914B2B9, 0x172442D7, 0xDA8A0600,
+       0xA96F30BC, 0x163138AA, 0xE38DEE4D, 0xB0FB0E4E)
+
+
+def _rotl(x, k):
+    k %= 32
+    return ((x << k) | (x >> (32 - k))) & _MASK
+
+
+# T_j <<< (j mod 32)，预先计算
+_T_ROT = tuple(_rotl(0x79CC4519 if j < 16 else 0x7A879D8A, j) for j in range(64))
+
+_BLOCK = struct.Struct(">16I")
+_DIGEST = struct.Struct(">8I")
+
+
+def _compress(state, data, end):
+    """压缩 data[0:end] 中的全部 64 字节分组
+
+    :param state: 当前链接变量 (A, B, C, D, E, F, G, H)
+    :param data: bytes / bytearray / memoryview
+    :param end: 待处理长度，必须为 64 的整数倍
+    :return: 新的链接变量
+    """
+    mask = _MASK
+    t_rot = _T_ROT
+    unpack_from = _BLOCK.unpack_from
+    v0, v1, v2, v3, v4, v5, v6, v7 = state
+
+    for offset in range(0, end, 64):
+        # 消息扩展
+        w = list(unpack_from(data, offset))
+        for j in range(16, 68):
+            x = w[j - 3]
+            x = w[j - 16] ^ w[j - 9] ^ (((x << 15) | (x >> 17)) & mask)
+            x ^= (((x << 15) | (x >> 17)) ^ ((x << 23) | (x >> 9))) & mask
+            y = w[j - 13]
+            w.append(x ^ (((y << 7) | (y >> 25)) & mask) ^ w[j - 6])
+
+        a, b, c, d, e, f, g, h = v0, v1, v2, v3, v4, v5, v6, v7
+
+        for j in range(16):
+            a12 = ((a << 12) | (a >> 20)) & mask
+            ss1 = (a12 + e + t_rot[j]) & mask
+            ss1 = ((ss1 << 7) | (ss1 >> 25)) & mask
+            tt1 = ((a ^ b ^ c) + d + (ss1 ^ a12) + (w[j] ^ w[j + 4])) & mask
+            tt2 = ((e ^ f ^ g) + h + ss1 + w[j]) & mask
+            d = c
+            c = ((b << 9) | (b >> 23)) & mask
+            b = a
+            a = tt1
+            h = g
+            g = ((f << 19) | (f >> 13)) & mask
+            f = e
+            e = tt2 ^ ((((tt2 << 9) | (tt2 >> 23)) ^ ((tt2 << 17) | (tt2 >> 15))) & mask)
+
+        for j in range(16, 64):
+            a12 = ((a << 12) | (a >> 20)) & mask
+            ss1 = (a12 + e + t_rot[j]) & mask
+            ss1 = ((ss1 << 7) | (ss1 >> 25)) & mask
+            tt1 = (((a & b) | (a & c) | (b & c)) + d + (ss1 ^ a12) + (w[j] ^ w[j + 4])) & mask
+            tt2 = (((e & f) | (~e & g)) + h + ss1 + w[j]) & mask
+            d = c
+            c = ((b << 9) | (b >> 23)) & mask
+            b = a
+            a = tt1
+            h = g
+            g = ((f << 19) | (f >> 13)) & mask
+            f = e
+            e = tt2 ^ ((((tt2 << 9) | (tt2 >> 23)) ^ ((tt2 << 17) | (tt2 >> 15))) & mask)
+
+        v0 ^= a
+        v1 ^= b
+        v2 ^= c
+        v3 ^= d
+        v4 ^= e
+        v5 ^= f
+        v6 ^= g
+        v7 ^= h
+
+    return v0, v1, v2, v3, v4, v5, v6, v7
+
+
+class SM3Hash(object):
+    """纯 Python 增量 SM3 哈希
+
+    update() 只压缩完整分组，内部仅保留不足 64 字节的尾部，
+    因此对大报文分块调用 update() 时内存占用恒定。
+    """
+
+    name = "sm3"
+    digest_size = 32
+    block_size = 64
+
+    __slots__ = ("_state", "_buffer", "_length")
+
+    def __init__(self, data=b""):
+        self._state = _IV
+        self._buffer = bytearray()
+        self._length = 0
+        if data:
+            self.update(data)
+
+    def update(self, data):
+        """追加数据
+
+        :param data: bytes-like 对象
+        """
+        view = memoryview(data)
+        if view.itemsize != 1 or view.ndim != 1:
+            view = view.cast("B")
+        self._length += len(view)
+
+        buf = self._buffer
+        if buf:
+            need = 64 - len(buf)
+            buf += view[:need]
+            if len(buf) < 64:
+                return
+            self._state = _compress(self._state, buf, 64)
+            del buf[:]
+            view = view[need:]
+
+        end = len(view) & ~63
+        if end:
+            self._state = _compress(self._state, view, end)
+        buf += view[end:]
+
+    def digest(self):
+        """返回 32 字节摘要，不影响后续 update()
+
+        :rtype: bytes
+        """
+        length = self._length
+        tail = bytes(self._buffer) + b"\x80" + b"\x00" * ((55 - length) % 64) \
+            + (length * 8).to_bytes(8, "big")
+        return _DIGEST.pack(*_compress(self._state, tail, len(tail)))
+
+    def hexdigest(self):
+        """返回十六进制摘要
+
+        :rtype: str
+        """
+        return self.digest().hex()
+
+    def copy(self):
+        """返回当前实例的副本
+
+        :rtype: SM3Hash
+        """
+        other = SM3Hash()
+        other._state = self._state
+        other._buffer = bytearray(self._buffer)
+        other._length = self._length
+        return other
+
+
+def _openssl_sm3_available():
+    try:
+        hashlib.new("sm3")
+    except ValueError:
+        return False
+    return True
+
+
+OPENSSL_SM3_AVAILABLE = _openssl_sm3_available()
+
+if OPENSSL_SM3_AVAILABLE:
+    def new_sm3_hash(data=b""):
+        """创建 SM3 哈希对象（OpenSSL 实现）"""
+        return hashlib.new("sm3", data)
+else:
+    def new_sm3_hash(data=b""):
+        """创建 SM3 哈希对象（纯 Python 实现）"""
+        return SM3Hash(data)
+
+
+def sm3_digest(data):
+    """计算 data 的 SM3 摘要
+
+    :param data: bytes-like 对象
+    :return: 32 字节摘要
+    :rtype: bytes
+    """
+    return new_sm3_hash(data).digest()
@@ -0,0 +1,174 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-core-sse-2026-qxx"
+
+"""
+增量 SSE（Server-Sent Events）解码器
+
+阿里云 darabonba Stream 与腾讯云 AbstractClient 共用的事件流解析实现。
+
+- 在 bytearray 上从上次扫描位置查找最后一个行结束符（LF / CRLF / CR），
+  完整的行一次性切出并用 bytes.split() 分行，剩余的不完整行留在缓冲区，
+  每个字节只扫描常数次
+- 按字节比较字段名，不使用正则；data 字段在事件结束时才合并并按 UTF-8 解码，
+  多字节字符跨分块不会被截断
+- 不限制缓冲区大小，也不丢弃分块
+
+事件以 dict 表示，只包含出现过的字段：data / event / id / retry。
+没有任何字段的空事件（连续空行）不会产生。
+
+包含的内容：
+  - SSEDecoder：增量解码器，feed() 输入字节分块，返回解析出的事件
+  - iter_sse()：从同步字节分块迭代器解析事件
+  - aiter_sse()：从异步字节分块迭代器解析事件
+"""
+
+__all__ = [
+    "SSEDecoder",
+    "iter_sse",
+    "aiter_sse",
+]
+
+_CR = 0x0D
+_COLON = 0x3A
+
+
+class SSEDecoder(object):
+    """增量 SSE 解码器
+
+    同一个实例只用于一条事件流；流结束时调用 flush() 取出未以空行结束的最后一个事件。
+    """
+
+    __slots__ = ("_buffer", "_scan", "_data", "_fields")
+
+    def __init__(self):
+        self._buffer = bytearray()
+        # 缓冲区中已确认不含行结束符的前缀长度，下次从这里继续查找
+        self._scan = 0
+        self._data = None
+        self._fields = {}
+
+    def feed(self, chunk):
+        """输入一个字节分块
+
+        :param chunk: bytes-like 对象
+        :return: 本分块内完成的事件
+        :rtype: list
+        """
+        self._buffer += chunk
+        return self._drain(False)
+
+    def flush(self):
+        """结束事件流，处理最后一行并返回未以空行结束的事件
+
+        :rtype: list
+        """
+        events = self._drain(True)
+        if self._buffer:
+            self._feed_lines([bytes(self._buffer)], events)
+            del self._buffer[:]
+        self._scan = 0
+        self._dispatch(events)
+        return events
+
+    def _drain(self, final):
+        buf = self._buffer
+        size = len(buf)
+        scan = self._scan
+        # 最后一个完整行的结束位置；末尾的 CR 需要等下一个字节才能判断是否为 CRLF
+        cut = buf.rfind(b"\n", scan) + 1
+        cr = buf.rfind(b"\r", max(cut, scan), size if final else size - 1)
+        if cr >= 0:
+            cut = cr + 1
+        events = []
+        if not cut:
+            self._scan = size - 1 if size and buf[-1] == _CR and not final else size
+            return events
+
+        segment = bytes(buf[:cut])
+        del buf[:cut]
+        self._scan = len(buf) - 1 if buf and buf[-1] == _CR and not final else len(buf)
+        if b"\r" in segment:
+            segment = segment.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        lines = segment.split(b"\n")
+        # segment 以行结束符结尾，最后一项恒为空
+        lines.pop()
+        self._feed_lines(lines, events)
+        return events
+
+    def _feed_lines(self, lines, events):
+        data = self._data
+        fields = self._fields
+        for line in lines:
+            if not line:
+                if data is not None:
+                    fields["data"] = b"\n".join(data).decode("utf-8", "replace")
+                    data = None
+                if fields:
+                    events.append(fields)
+                    fields = {}
+                continue
+            if line[0] == _COLON:
+                continue
+            colon = line.find(b":")
+            if colon < 0:
+                name, value = line, b""
+            else:
+                name = line[:colon]
+                value = line[colon + 2:] if line[colon + 1:colon + 2] == b" " else line[colon + 1:]
+            if name == b"data":
+                if data is None:
+                    data = [value]
+                else:
+                    data.append(value)
+            elif name == b"event":
+                fields["event"] = value.decode("utf-8", "replace")
+            elif name == b"id":
+                if b"\0" not in value:
+                    fields["id"] = value.decode("utf-8", "replace")
+            elif name == b"retry":
+                if value.isdigit():
+                    fields["retry"] = int(value)
+        self._data = data
+        self._fields = fields
+
+    def _dispatch(self, events):
+        self._feed_lines((b"",), events)
+
+
+def iter_sse(chunks):
+    """从字节分块迭代器中逐个解析事件
+
+    :param chunks: 产出 bytes 的可迭代对象
+    """
+    decoder = SSEDecoder()
+    for chunk in chunks:
+        if chunk:
+            for event in decoder.feed(chunk):
+                yield event
+    for event in decoder.flush():
+        yield event
+
+
+async def aiter_sse(chunks):
+    """从字节分块异步迭代器中逐个解析事件
+
+    :param chunks: 产出 bytes 的异步可迭代对象
+    """
+    decoder = SSEDecoder()
+    async for chunk in chunks:
+        if chunk:
+            for event in decoder.feed(chunk):
+                yield event
+    for event in decoder.flush():
+        yield event
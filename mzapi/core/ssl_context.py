@@ -0,0 +1,184 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-core-ssl-context-2026-qxx"
+
+"""
+进程级 SSLContext 注册表
+
+阿里云、腾讯云与华为云的传输层共用的 SSLContext 缓存。
+
+创建 SSLContext 需要从磁盘解析 CA 证书包（certifi 约 200 KB），
+耗时数毫秒并占用数 MB 内存。按 (CA 路径, 客户端证书, 最低 TLS 版本, 是否校验)
+缓存后，同一进程内任意多个客户端共享同一个 SSLContext。
+
+缓存的 SSLContext 视为只读：调用方不得再修改其校验模式或加载证书。
+requests 会在每个连接上按 verify / cert 参数改写 urllib3 的 SSLContext，
+因此 requests 会话应挂载 SSLContextAdapter，由它把参数换算为注册表中的 SSLContext。
+
+包含的内容：
+  - get_ssl_context()：获取（必要时创建）SSLContext
+  - ssl_context_stats()：缓存统计
+  - clear_ssl_contexts()：清空缓存（证书文件更新后调用）
+  - SSLContextAdapter：使用注册表 SSLContext 的 requests HTTPAdapter
+"""
+
+import os
+import ssl
+import threading
+from enum import Enum
+
+import certifi
+from requests.adapters import HTTPAdapter
+
+__all__ = [
+    "get_ssl_context",
+    "ssl_context_stats",
+    "clear_ssl_contexts",
+    "SSLContextAdapter",
+]
+
+_TLS_VERSIONS = {
+    "TLSv1": ssl.TLSVersion.TLSv1,
+    "TLSv1.1": ssl.TLSVersion.TLSv1_1,
+    "TLSv1.2": ssl.TLSVersion.TLSv1_2,
+    "TLSv1.3": ssl.TLSVersion.TLSv1_3,
+}
+
+_lock = threading.Lock()
+_contexts = {}
+_stats = {"created": 0, "reused": 0}
+
+
+def _normalize_tls_version(tls_min_version):
+    if isinstance(tls_min_version, Enum) and not isinstance(tls_min_version, ssl.TLSVersion):
+        tls_min_version = tls_min_version.value
+    if isinstance(tls_min_version, str):
+        return _TLS_VERSIONS.get(tls_min_version)
+    return tls_min_version
+
+
+def _normalize_cert(cert):
+    if isinstance(cert, (list, tuple)):
+        cert = tuple(cert)
+        if len(cert) == 1 or (len(cert) == 2 and not cert[1]):
+            return cert[0]
+    return cert or None
+
+
+def _new_context(ca, cert, tls_min_version, verify, alpn_protocols):
+    if not verify:
+        context = ssl.create_default_context()
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    elif os.path.isdir(ca):
+        context = ssl.create_default_context(capath=ca)
+    else:
+        context = ssl.create_default_context(cafile=ca)
+    if tls_min_version is not None:
+        context.minimum_version = tls_min_version
+    if cert is not None:
+        if isinstance(cert, tuple):
+            context.load_cert_chain(certfile=cert[0], keyfile=cert[1])
+        else:
+            context.load_cert_chain(certfile=cert)
+    if alpn_protocols:
+        context.set_alpn_protocols(list(alpn_protocols))
+    return context
+
+
+def get_ssl_context(ca=None, cert=None, tls_min_version=None, verify=True, alpn_protocols=None):
+    """获取（必要时创建）共享的 SSLContext
+
+    :param ca: CA 证书包文件或目录路径，默认使用 certifi
+    :type ca: str
+    :param cert: 客户端证书路径，或 (certfile, keyfile)
+    :type cert: str or tuple
+    :param tls_min_version: 最低 TLS 版本，如 "TLSv1.2" 或 ssl.TLSVersion
+    :param verify: 是否校验服务端证书；为 False 时忽略 ca
+    :type verify: bool
+    :param alpn_protocols: ALPN 协议列表，如 ("h2", "http/1.1")；不同的列表使用不同的 SSLContext，
+        避免 HTTP/1.1 传输与 HTTP/2 传输互相改写同一个 SSLContext 的 ALPN 设置
+    :type alpn_protocols: tuple
+    :rtype: ssl.SSLContext
+    """
+    verify = bool(verify)
+    ca = (ca or certifi.where()) if verify else None
+    cert = _normalize_cert(cert)
+    tls_min_version = _normalize_tls_version(tls_min_version)
+    alpn_protocols = tuple(alpn_protocols) if alpn_protocols else None
+    key = (ca, cert, tls_min_version, verify, alpn_protocols)
+
+    with _lock:
+        context = _contexts.get(key)
+        if context is not None:
+            _stats["reused"] += 1
+            return context
+
+    # 在锁外解析证书，并发创建时以先写入者为准
+    context = _new_context(ca, cert, tls_min_version, verify, alpn_protocols)
+    with _lock:
+        _stats["created"] += 1
+        return _contexts.setdefault(key, context)
+
+
+def ssl_context_stats():
+    """返回缓存统计：contexts（缓存数）、created（创建次数）、reused（复用次数）
+
+    :rtype: dict
+    """
+    with _lock:
+        stats = dict(_stats)
+        stats["contexts"] = len(_contexts)
+    return stats
+
+
+def clear_ssl_contexts():
+    """清空缓存，已建立的连接不受影响"""
+    with _lock:
+        _contexts.clear()
+
+
+class SSLContextAdapter(HTTPAdapter):
+    """使用注册表 SSLContext 的 requests HTTPAdapter
+
+    requests 把 verify / cert 作为 ca_certs、cert_file 等参数交给 urllib3，
+    urllib3 会在每个新连接上重新加载 CA 与客户端证书。本适配器改为按相同参数
+    从注册表取 SSLContext 传入连接池，连接建立时不再解析证书。
+
+    :param tls_min_version: 最低 TLS 版本
+    """
+
+    def __init__(self, tls_min_version=None, **kwargs):
+        self.tls_min_version = tls_min_version
+        super(SSLContextAdapter, self).__init__(**kwargs)
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        host_params, pool_kwargs = super(SSLContextAdapter, self).build_connection_pool_key_attributes(
+            request, verify, cert)
+        if host_params["scheme"] == "https":
+            for name in ("ca_certs", "ca_cert_dir", "cert_file", "key_file"):
+                pool_kwargs.pop(name, None)
+            pool_kwargs["ssl_context"] = get_ssl_context(
+                ca=verify if isinstance(verify, str) else None,
+                cert=cert,
+                tls_min_version=self.tls_min_version,
+                verify=verify is not False,
+            )
+        return host_params, pool_kwargs
+
+    def cert_verify(self, conn, url, verify, cert):
+        # 证书已包含在 SSLContext 中，只同步校验模式，避免 urllib3 逐连接加载证书
+        if url.lower().startswith("https"):
+            conn.cert_reqs = "CERT_REQUIRED" if verify is not False else "CERT_NONE"
+            return
+        super(SSLContextAdapter, self).cert_verify(conn, url, verify, cert)
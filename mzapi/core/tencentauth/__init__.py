@@ -27,6 +27,7 @@ _MZAPI_ORIGIN = "mzapi-txc-init-2026-qxx"
   - common_client / common_client_async：通用 API 客户端
   - circuit_breaker：地域熔断器
   - retry / retry_async：请求重试策略
+  - retry_budget：重试预算与退避抖动（两种重试策略共用）
   - http：HTTP 通信层
   - profile：配置管理
   - exception：SDK 异常定义
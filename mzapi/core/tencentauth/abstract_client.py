@@ -33,10 +33,13 @@ except ImportError:
     from urlparse import urlparse
 
 MZAPI_VERSION = "0.0.1"
+from mzapi.core.rate_limit import get_rate_limiter
+from mzapi.core.sse import iter_sse
 from mzapi.utlis.tencentauth.exception.tencent_cloud_sdk_exception import TencentCloudSDKException
 from mzapi.utlis.tencentauth.exception import TencentCloudSDKException as SDKError
 from mzapi.utlis.tencentauth.http.request import ApiRequest, ResponsePrettyFormatter
 from mzapi.utlis.tencentauth.http.request import RequestInternal
+from mzapi.utlis.tencentauth.http.multipart import MultipartEncoder
 from mzapi.utlis.tencentauth.profile.client_profile import ClientProfile, RegionBreakerProfile
 from mzapi.utlis.tencentauth.sign import Sign
 from mzapi.utlis.tencentauth.circuit_breaker import CircuitBreaker
@@ -48,6 +51,8 @@ _json_content = 'application/json'
 _multipart_content = 'multipart/form-data'
 _form_urlencoded_content = 'application/x-www-form-urlencoded'
 _octet_stream = "application/octet-stream"
+# RequestLimitExceeded 及其子错误码（UinLimitExceeded 等）表示触发了接口限频
+_throttling_code_prefix = "RequestLimitExceeded"
 
 
 class EmptyHandler(logging.Handler):
@@ -80,7 +85,9 @@ class AbstractClient(object):
                                   proxy=self.profile.httpProfile.proxy,
                                   is_http=is_http,
                                   certification=self.profile.httpProfile.certification,
-                                  pre_conn_pool_size=self.profile.httpProfile.pre_conn_pool_size)
+                                  pre_conn_pool_size=self.profile.httpProfile.pre_conn_pool_size,
+                                  pre_conn_min_idle=self.profile.httpProfile.pre_conn_min_idle,
+                                  pre_conn_idle_ttl=self.profile.httpProfile.pre_conn_idle_ttl)
         if self.profile.httpProfile.keepAlive:
             self.request.set_keep_alive()
         self.circuit_breaker = None
@@ -93,6 +100,29 @@ class AbstractClient(object):
         else:
             self.request_client = self._sdkVersion
 
+    def warmup(self, n=None):
+        """在流量到来之前于后台预先建立到服务域名的连接
+
+        需要设置 HttpProfile.pre_conn_pool_size > 0；配置了代理时不预建连接。
+
+        :param n: 预建的空闲连接数，默认为 pre_conn_min_idle，不超过 pre_conn_pool_size
+        :type n: int
+        :return: Future，结果为本次新建的连接数
+        :rtype: concurrent.futures.Future
+        """
+        return self.request.warmup(self._get_endpoint(), n)
+
+    def pre_conn_stats(self):
+        """返回预连接池统计，用于评估 pre_conn_pool_size 是否合适
+
+        键为 scheme://host:port，值包含 hits / misses（取连接时是否命中空闲连接）、
+        expired / dropped（因空闲超时或被对端关闭而淘汰的连接数）、opened / failed（后台预建成功与失败次数）
+        以及当前的 idle / min_idle / max_idle。
+
+        :rtype: dict
+        """
+        return self.request.pre_conn_stats(self._get_endpoint())
+
     def _fix_params(self, params):
         if not isinstance(params, (dict,)):
             return params
@@ -239,7 +269,10 @@ class AbstractClient(object):
         if sys.version_info[0] == 3 and isinstance(payload, type("")):
             payload = payload.encode("utf8")
 
-        payload_hash = hashlib.sha256(payload).hexdigest()
+        if isinstance(payload, MultipartEncoder):
+            payload_hash = payload.sha256_hexdigest()
+        else:
+            payload_hash = hashlib.sha256(payload).hexdigest()
 
         canonical_headers = 'content-type:%s\nhost:%s\n' % (
             req.header["Content-Type"], req.header["Host"])
@@ -305,31 +338,13 @@ class AbstractClient(object):
 
         req.header["Authorization"] = "SKIP"
 
-    # it must return bytes instead of string
+    # it must return bytes or a MultipartEncoder instead of string
     def _get_multipart_body(self, params, boundary, options=None):
         if options is None:
             options = {}
-        # boundary and params key will never contain unicode characters
-        boundary = boundary.encode()
-        binparas = options.get("BinaryParams", [])
-        body = b''
-        for k, v in params.items():
-            kbytes = k.encode()
-            body += b'--%s\r\n' % boundary
-            body += b'Content-Disposition: form-data; name="%s"' % kbytes
-            if k in binparas:
-                body += b'; filename="%s"\r\n' % kbytes
-            else:
-                body += b"\r\n"
-                if isinstance(v, list) or isinstance(v, dict):
-                    v = json.dumps(v)
-                    body += b'Content-Type: application/json\r\n'
-            if sys.version_info[0] == 3 and isinstance(v, type("")):
-                v = v.encode()
-            body += b'\r\n%s\r\n' % v
-        if body != b'':
-            body += b'--%s--\r\n' % boundary
-        return body
+        if not params:
+            return b''
+        return MultipartEncoder(params, boundary, options.get("BinaryParams", []))
 
     def _check_status(self, resp_inter):
         if resp_inter.status_code != 200:
@@ -375,40 +390,28 @@ class AbstractClient(object):
             warnings.warn("This action is deprecated, detail: %s" % data["Response"]["DeprecatedWarning"],
                           DeprecationWarning)
 
+    def _get_rate_limiter(self, action):
+        return get_rate_limiter("tencent", getattr(self.credential, "secret_id", None), action)
+
+    def _check_response(self, action, resp):
+        """检查响应并把是否被限频反馈给 action 对应的限速器"""
+        self._check_status(resp)
+        limiter = self._get_rate_limiter(action)
+        try:
+            self._check_error(resp)
+        except TencentCloudSDKException as e:
+            if (e.code or "").startswith(_throttling_code_prefix):
+                limiter.on_throttle()
+            raise
+        limiter.on_success()
+
     @staticmethod
     def _process_response_sse(resp):
         logger.debug("GetResponse: %s", ResponsePrettyFormatter(resp, format_body=False))
-        e = {}
-
-        for line in resp.iter_lines():
-            if not line:
-                yield e
-                e = {}
-                continue
-
-            logger.debug("GetResponse: %s", line)
-            line = line.decode('utf-8')
-
-            # comment
-            if line[0] == ':':
-                continue
-
-            colon_idx = line.find(':')
-            key = line[:colon_idx]
-            val = line[colon_idx + 1:]
-            # If value starts with a U+0020 SPACE character, remove it from value.
-            if val and val[0] == " ":
-                val = val[1:]
-            if key == 'data':
-                # The spec allows for multiple data fields per event, concatenated them with "\n".
-                if 'data' not in e:
-                    e['data'] = val
-                else:
-                    e['data'] += '\n' + val
-            elif key in ('event', 'id'):
-                e[key] = val
-            elif key == 'retry':
-                e[key] = int(val)
+        # 与 iter_lines() 默认的读取粒度一致
+        for e in iter_sse(resp.iter_content(chunk_size=512)):
+            logger.debug("GetResponse.Event: %s", e)
+            yield e
 
     @staticmethod
     def _process_response_json(resp, resp_type):
@@ -424,6 +427,7 @@ class AbstractClient(object):
             raise TencentCloudSDKException("ClientError", "headers must be a dict.")
         if "x-tc-traceid" not in {k.lower() for k in headers.keys()}:
             headers["X-TC-TraceId"] = str(uuid.uuid4())
+        self._get_rate_limiter(action).acquire()
         if not self.profile.disable_region_breaker:
             return self._call_with_region_breaker(action, params, options, headers)
         req = RequestInternal(self._get_endpoint(options=options),
@@ -441,8 +445,7 @@ class AbstractClient(object):
 
         def _call_once():
             resp = self._call(action, params, options, headers)
-            self._check_status(resp)
-            self._check_error(resp)
+            self._check_response(action, resp)
             logger.debug("GetResponse: %s", ResponsePrettyFormatter(resp))
             return resp
 
@@ -451,7 +454,7 @@ class AbstractClient(object):
 
     def _call_with_region_breaker(self, action, params, options=None, headers=None):
         endpoint = self._get_endpoint(options=options)
-        generation, need_break = self.circuit_breaker.before_requests()
+        generation, need_break = self.circuit_breaker.before_requests(endpoint)
         if need_break:
             endpoint = self._service + "." + self.profile.region_breaker_profile.backup_endpoint
         req = RequestInternal(endpoint,
@@ -462,18 +465,18 @@ class AbstractClient(object):
         resp = None
         try:
             resp = self.request.send_request(req)
-            self.circuit_breaker.after_requests(generation, True)
+            self.circuit_breaker.after_requests(generation, True, endpoint)
             return resp
         except TencentCloudSDKException as e:
             if resp and "RequestId" in resp.content and e.code != "InternalError":
-                self.circuit_breaker.after_requests(generation, True)
+                self.circuit_breaker.after_requests(generation, True, endpoint)
             else:
-                self.circuit_breaker.after_requests(generation, False)
+                self.circuit_breaker.after_requests(generation, False, endpoint)
 
     def call_with_region_breaker(self, action, params, options=None, headers=None):
+        self._get_rate_limiter(action).acquire()
         resp = self._call_with_region_breaker(action, params, options, headers)
-        self._check_status(resp)
-        self._check_error(resp)
+        self._check_response(action, resp)
         return resp.content
 
     def call_octet_stream(self, action, headers, body, options=None):
@@ -506,9 +509,9 @@ class AbstractClient(object):
         options["IsOctetStream"] = True
         self._build_req_inter(action, None, req, options)
 
+        self._get_rate_limiter(action).acquire()
         resp = self.request.send_request(req)
-        self._check_status(resp)
-        self._check_error(resp)
+        self._check_response(action, resp)
         return json.loads(resp.content)
 
     def call_json(self, action, params, headers=None, options=None):
@@ -526,8 +529,7 @@ class AbstractClient(object):
 
         def _call_once():
             resp = self._call(action, params, options, headers)
-            self._check_status(resp)
-            self._check_error(resp)
+            self._check_response(action, resp)
             logger.debug("GetResponse: %s", ResponsePrettyFormatter(resp))
             return resp
 
@@ -549,8 +551,7 @@ class AbstractClient(object):
 
         def _call_once():
             resp = self._call(action, params, options, headers)
-            self._check_status(resp)
-            self._check_error(resp)
+            self._check_response(action, resp)
             return resp
 
         retryer = self.profile.retryer or NoopRetryer()
@@ -559,8 +560,7 @@ class AbstractClient(object):
     def _call_and_deserialize(self, action, params, resp_type, headers=None, options=None):
         def _call_once():
             resp = self._call(action, params, options, headers)
-            self._check_status(resp)
-            self._check_error(resp)
+            self._check_response(action, resp)
             return resp
 
         retryer = self.profile.retryer or NoopRetryer()
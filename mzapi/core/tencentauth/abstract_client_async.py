@@ -29,13 +29,17 @@ from typing import Dict, Type, Union, List, Callable, Awaitable, Optional
 import httpx
 
 MZAPI_VERSION = "0.0.1"
-from mzapi.utlis.tencentauth.abstract_client import logger, urlparse, urlencode
+from mzapi.core.rate_limit import get_rate_limiter
+from mzapi.core.ssl_context import get_ssl_context
+from mzapi.core.sse import aiter_sse
+from mzapi.utlis.tencentauth.abstract_client import logger, urlparse, urlencode, _throttling_code_prefix
 from mzapi.utlis.tencentauth.abstract_model import AbstractModel
 from mzapi.utlis.tencentauth.circuit_breaker import CircuitBreaker
 from mzapi.utlis.tencentauth.credential import Credential
 from mzapi.utlis.tencentauth.exception import TencentCloudSDKException
 from mzapi.utlis.tencentauth.http.request_async import ApiRequest, ApiResponse, ResponsePrettyFormatter, \
     RequestPrettyFormatter
+from mzapi.utlis.tencentauth.http.multipart import MultipartEncoder
 from mzapi.utlis.tencentauth.profile.client_profile import ClientProfile, RegionBreakerProfile
 from mzapi.utlis.tencentauth.retry_async import NoopRetryer
 from mzapi.utlis.tencentauth.sign import Sign
@@ -102,10 +106,13 @@ class AbstractClient(object):
         if self.profile.httpProfile.proxy:
             kwargs["proxies"] = self.profile.httpProfile.proxy
 
+        # SSLContext 取自进程级注册表，避免每个 AsyncClient 重新解析 CA
         if self.profile.httpProfile.certification is False:
-            kwargs["verify"] = False
+            kwargs["verify"] = get_ssl_context(verify=False)
         elif isinstance(self.profile.httpProfile.certification, str) and self.profile.httpProfile.certification != "":
-            kwargs["cert"] = self.profile.httpProfile.certification
+            kwargs["verify"] = get_ssl_context(cert=self.profile.httpProfile.certification)
+        else:
+            kwargs["verify"] = get_ssl_context()
 
         self.http_client = httpx.AsyncClient(**kwargs)
 
@@ -150,6 +157,7 @@ class AbstractClient(object):
     ):
         chain = RequestChain()
         chain.add_interceptor(self._inter_retry)
+        chain.add_interceptor(self._inter_rate_limit(action))
         chain.add_interceptor(self._inter_deserialize_resp(resp_cls))
         if self.circuit_breaker:
             chain.add_interceptor(self._inter_breaker(opts))
@@ -161,6 +169,22 @@ class AbstractClient(object):
         retryer = self.profile.retryer or NoopRetryer()
         return await retryer.send_request(chain.proceed)
 
+    def _inter_rate_limit(self, action: str):
+        async def inter(chain: RequestChain):
+            # 每次重试都重新取令牌，限频错误码在反序列化拦截器中已转换为异常
+            limiter = get_rate_limiter("tencent", getattr(self.credential, "secret_id", None), action)
+            await limiter.acquire_async()
+            try:
+                resp = await chain.proceed()
+            except TencentCloudSDKException as e:
+                if (e.code or "").startswith(_throttling_code_prefix):
+                    limiter.on_throttle()
+                raise
+            limiter.on_success()
+            return resp
+
+        return inter
+
     def _inter_build_request(
             self,
             action: str,
@@ -198,9 +222,8 @@ class AbstractClient(object):
 
     def _inter_breaker(self, opts: Dict):
         async def inter(chain: RequestChain):
-            generation, need_break = self.circuit_breaker.before_requests()
-
             endpoint = self._get_endpoint(opts=opts)
+            generation, need_break = self.circuit_breaker.before_requests(endpoint)
             if need_break:
                 endpoint = self._service + "." + self.profile.region_breaker_profile.backup_endpoint
 
@@ -210,14 +233,14 @@ class AbstractClient(object):
             resp = None
             try:
                 resp = await chain.proceed()
-                self.circuit_breaker.after_requests(generation, True)
+                self.circuit_breaker.after_requests(generation, True, endpoint)
                 return resp
             except httpx.TransportError:
-                self.circuit_breaker.after_requests(generation, False)
+                self.circuit_breaker.after_requests(generation, False, endpoint)
                 raise
             except TencentCloudSDKException as e:
                 success = resp and "RequestId" in (await resp.aread()) and e.code != "InternalError"
-                self.circuit_breaker.after_requests(generation, success)
+                self.circuit_breaker.after_requests(generation, success, endpoint)
                 raise
 
         return inter
@@ -280,38 +303,11 @@ class AbstractClient(object):
 
         async def deserialize_sse(resp: ApiResponse):
             logger.debug("GetResponse:\n%s", ResponsePrettyFormatter(resp, format_body=False))
-            e = {}
 
             try:
-                async for line in resp.aiter_lines():
-                    line = line.strip()
-                    if not line:
-                        yield e
-                        e = {}
-                        continue
-
-                    logger.debug("GetResponse.Readline: %s", line)
-
-                    # comment
-                    if line[0] == ':':
-                        continue
-
-                    colon_idx = line.find(':')
-                    key = line[:colon_idx]
-                    val = line[colon_idx + 1:]
-                    # If value starts with a U+0020 SPACE character, remove it from value.
-                    if val and val[0] == " ":
-                        val = val[1:]
-                    if key == 'data':
-                        # The spec allows for multiple data fields per event, concatenated them with "\n".
-                        if 'data' not in e:
-                            e['data'] = val
-                        else:
-                            e['data'] += '\n' + val
-                    elif key in ('event', 'id'):
-                        e[key] = val
-                    elif key == 'retry':
-                        e[key] = int(val)
+                async for e in aiter_sse(resp.aiter_bytes()):
+                    logger.debug("GetResponse.Event: %s", e)
+                    yield e
             finally:
                 await resp.aclose()
 
@@ -389,7 +385,7 @@ class AbstractClient(object):
             body = self._get_multipart_body(params, boundary, opts)
 
         headers["Authorization"] = "SKIP"
-        return ApiRequest(method, url, params=query, content=body, headers=headers)
+        return ApiRequest(method, url, params=query, content=self._request_content(body, headers), headers=headers)
 
     def _build_req_with_tc3_signature(
             self, action: str, params: ParamsType, headers: Dict[str, str], opts: Dict) -> ApiRequest:
@@ -457,7 +453,7 @@ class AbstractClient(object):
         # httpx 0.22.0 版本会过滤掉空 value 的 params 如 "a=&b=2"
         # 不能使用 params 参数, 需要用 url 绕过, 后续版本已经修复, 但是 py36 最高只能安装 0.22.0
         url += "?" + query
-        return ApiRequest(method, url, content=body, headers=headers)
+        return ApiRequest(method, url, content=self._request_content(body, headers), headers=headers)
 
     def _build_req_with_old_signature(
             self, action: str, params: ParamsType, headers: Dict[str, str], opts: Dict) -> ApiRequest:
@@ -553,26 +549,16 @@ class AbstractClient(object):
     def _get_multipart_body(self, params, boundary, options=None):
         if options is None:
             options = {}
-        # boundary and params key will never contain unicode characters
-        boundary = boundary.encode()
-        binparas = options.get("BinaryParams", [])
-        body = b''
-        for k, v in params.items():
-            kbytes = k.encode()
-            body += b'--%s\r\n' % boundary
-            body += b'Content-Disposition: form-data; name="%s"' % kbytes
-            if k in binparas:
-                body += b'; filename="%s"\r\n' % kbytes
-            else:
-                body += b"\r\n"
-                if isinstance(v, list) or isinstance(v, dict):
-                    v = json.dumps(v)
-                    body += b'Content-Type: application/json\r\n'
-            if sys.version_info[0] == 3 and isinstance(v, type("")):
-                v = v.encode()
-            body += b'\r\n%s\r\n' % v
-        if body != b'':
-            body += b'--%s--\r\n' % boundary
+        if not params:
+            return b''
+        return MultipartEncoder(params, boundary, options.get("BinaryParams", []))
+
+    @staticmethod
+    def _request_content(body, headers):
+        # httpx.AsyncClient 只接受异步迭代的流式请求体, Content-Length 由编码器预先算出
+        if isinstance(body, MultipartEncoder):
+            headers["Content-Length"] = str(len(body))
+            return body.aiter()
         return body
 
     @staticmethod
@@ -585,7 +571,10 @@ class AbstractClient(object):
         if headers.get("X-TC-Content-SHA256") == "UNSIGNED-PAYLOAD":
             payload = b"UNSIGNED-PAYLOAD"
 
-        payload_hash = hashlib.sha256(payload).hexdigest()
+        if isinstance(payload, MultipartEncoder):
+            payload_hash = payload.sha256_hexdigest()
+        else:
+            payload_hash = hashlib.sha256(payload).hexdigest()
 
         canonical_headers = 'content-type:%s\nhost:%s\n' % (
             headers["Content-Type"], headers["Host"])
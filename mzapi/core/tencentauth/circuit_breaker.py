@@ -13,16 +13,18 @@
 _MZAPI_ORIGIN = "mzapi-txc-circuit-breaker-2026-qxx"
 
 
-
 """
 地域熔断器模块
 
 实现腾讯云 API 调用的地域熔断保护机制，
 当某个地域的 API 连续失败时，自动切换到备用地域，提高服务可用性。
 
+熔断状态按 endpoint 分片：主地域与备用地域各有独立的熔断器，
+互不争用同一把锁，备用地域的请求结果也不会污染主地域的统计。
+
 状态机（遵循标准熔断器模式）：
   - CLOSED（关闭）：正常状态，请求正常发送
-    - 失败次数 >= max_fail_num 且失败比例 >= max_fail_percent 时 -> OPEN
+    - 滑动窗口内失败次数 >= max_fail_num 且失败比例 >= max_fail_percent 时 -> OPEN
     - 连续失败 >= 5 次时 -> OPEN
   - OPEN（打开）：熔断状态，请求发送到备用地域
     - 超时后 -> HALF_OPEN
@@ -30,19 +32,37 @@ _MZAPI_ORIGIN = "mzapi-txc-circuit-breaker-2026-qxx"
     - 成功请求数 >= max_requests -> CLOSED
     - 收到失败响应 -> OPEN
 
+滑动窗口：window_interval 被划分为 window_buckets 个时间桶组成的环形缓冲区，
+记录结果时只更新当前桶，过期桶在复用时清零，不再整体按代重置。
+
+并发：状态以不可变快照 (state, generation, expiry) 发布，
+before_requests 在 CLOSED / 未到期的 OPEN 状态下只读取快照、不加锁；
+记录结果与状态转换在所属 endpoint 的锁内完成，临界区为常数时间。
+
 包含的类：
-  - Counter：计数器，跟踪成功/失败次数
-  - CircuitBreaker：熔断器主类，管理状态转换和请求路由
+  - Counter：计数器，跟踪成功/失败次数（保留以兼容旧代码）
+  - SlidingWindow：时间分桶的滑动窗口计数器
+  - EndpointBreaker：单个 endpoint 的熔断器
+  - CircuitBreaker：按 endpoint 分片的熔断器，管理状态转换、请求路由与指标导出
 """
 
-import time
 import threading
+import time
 
 
 STATE_CLOSED = 0
 STATE_HALF_OPEN = 1
 STATE_OPEN = 2
 
+STATE_NAMES = {
+    STATE_CLOSED: "closed",
+    STATE_HALF_OPEN: "half_open",
+    STATE_OPEN: "open",
+}
+
+# 连续失败达到该次数时直接熔断
+CONSECUTIVE_FAILURES_TO_OPEN = 5
+
 
 class Counter(object):
 
@@ -75,82 +95,228 @@ class Counter(object):
         return float(self.failures) / self.total
 
 
-class CircuitBreaker(object):
+class SlidingWindow(object):
+    """时间分桶的滑动窗口计数器（非线程安全，由调用方加锁）
+
+    :param interval: 窗口长度（秒）
+    :param buckets: 桶数量
+    """
+
+    __slots__ = ("width", "size", "_ids", "_successes", "_failures")
+
+    def __init__(self, interval, buckets=10):
+        self.size = max(1, int(buckets))
+        self.width = max(float(interval), 1e-3) / self.size
+        self._ids = [-1] * self.size
+        self._successes = [0] * self.size
+        self._failures = [0] * self.size
+
+    def _slot(self, now):
+        bucket_id = int(now // self.width)
+        slot = bucket_id % self.size
+        if self._ids[slot] != bucket_id:
+            self._ids[slot] = bucket_id
+            self._successes[slot] = 0
+            self._failures[slot] = 0
+        return slot
+
+    def add(self, success, now):
+        slot = self._slot(now)
+        if success:
+            self._successes[slot] += 1
+        else:
+            self._failures[slot] += 1
+
+    def totals(self, now):
+        """返回窗口内的 (失败数, 总数)"""
+        oldest = int(now // self.width) - self.size
+        failures = total = 0
+        for i, bucket_id in enumerate(self._ids):
+            if bucket_id > oldest:
+                failures += self._failures[i]
+                total += self._failures[i] + self._successes[i]
+        return failures, total
+
+    def clear(self):
+        for i in range(self.size):
+            self._ids[i] = -1
+            self._successes[i] = 0
+            self._failures[i] = 0
+
+
+class EndpointBreaker(object):
+    """单个 endpoint 的熔断器
+
+    :param breaker_setting: 熔断配置
+    :type breaker_setting: RegionBreakerProfile
+    """
 
     def __init__(self, breaker_setting):
         self.breaker_setting = breaker_setting
         self.lock = threading.Lock()
-        self.counter = Counter()
-        self.state = STATE_CLOSED
-        self.expiry = time.time() + breaker_setting.window_interval
-        self.generation = 0
+        self.window = SlidingWindow(breaker_setting.window_interval,
+                                    getattr(breaker_setting, "window_buckets", 10))
+        self.consecutive_failures = 0
+        self.half_open_successes = 0
+        self.opened_count = 0
+        # (state, generation, expiry)，整体替换以便无锁读取
+        self._snapshot = (STATE_CLOSED, 0, 0.0)
+
+    @property
+    def state(self):
+        return self._snapshot[0]
 
-    def ready_to_open(self):
-        return (self.counter.failures >= self.breaker_setting.max_fail_num and
-                self.counter.get_failure_rate() >= self.breaker_setting.max_fail_percent) or \
-               self.counter.consecutive_failures >= 5
+    @property
+    def generation(self):
+        return self._snapshot[1]
 
     def current_state(self, now):
-        if self.state == STATE_CLOSED:
-            if self.expiry <= now:
-                self.to_new_generation(now)
-        elif self.state == STATE_OPEN:
-            if self.expiry <= now:
-                self.switch_state(STATE_HALF_OPEN, now)
-        return self.state, self.generation
-
-    def switch_state(self, new_state, now):
-        if self.state == new_state:
+        """返回 (state, generation)，OPEN 超时后转入 HALF_OPEN"""
+        state, generation, expiry = self._snapshot
+        if state == STATE_OPEN and expiry <= now:
+            with self.lock:
+                state, generation, expiry = self._snapshot
+                if state == STATE_OPEN and expiry <= now:
+                    self._switch_state(STATE_HALF_OPEN, now)
+                    state, generation, expiry = self._snapshot
+        return state, generation
+
+    def _ready_to_open(self, now):
+        failures, total = self.window.totals(now)
+        setting = self.breaker_setting
+        if failures >= setting.max_fail_num and total and \
+                float(failures) / total >= setting.max_fail_percent:
+            return True
+        return self.consecutive_failures >= CONSECUTIVE_FAILURES_TO_OPEN
+
+    def _switch_state(self, new_state, now):
+        # 调用方须持有 self.lock
+        state, generation, _ = self._snapshot
+        if state == new_state:
             return
-        self.state = new_state
-        self.to_new_generation(now)
-
-    def to_new_generation(self, now):
-        self.generation = (self.generation + 1) % 10
-        self.counter.clear()
-        if self.state == STATE_CLOSED:
-            self.expiry = now + self.breaker_setting.window_interval
-        elif self.state == STATE_OPEN:
-            self.expiry = now + self.breaker_setting.timeout
-        else:  # STATE_HALF_OPEN
-            self.expiry = time.time()
+        self.window.clear()
+        self.consecutive_failures = 0
+        self.half_open_successes = 0
+        if new_state == STATE_OPEN:
+            self.opened_count += 1
+            expiry = now + self.breaker_setting.timeout
+        else:
+            expiry = 0.0
+        self._snapshot = (new_state, generation + 1, expiry)
 
-    # whether to use the backup region
-    def before_requests(self):
-        self.lock.acquire()
-        now = time.time()
-        state, generation = self.current_state(now)
-        self.lock.release()
-        if state == STATE_OPEN:
-            return generation, True
-        return generation, False
+    def record(self, before, success, now):
+        """记录一次请求结果
 
-    def after_requests(self, before, success):
-        self.lock.acquire()
-        now = time.time()
+        :param before: 发起请求时的 generation；状态已切换时结果作废
+        :param success: 请求是否成功
+        """
         state, generation = self.current_state(now)
-        self.lock.release()
-        # the breaker has entered the next generation, the current results abandon.
-        if generation != before:
+        if generation != before or state == STATE_OPEN:
             return
-        if success:
-            self.on_success(state, now)
+        with self.lock:
+            state, generation, _ = self._snapshot
+            # 加锁前状态可能已被其他线程切换
+            if generation != before:
+                return
+            if success:
+                self.consecutive_failures = 0
+                self.window.add(True, now)
+                if state == STATE_HALF_OPEN:
+                    self.half_open_successes += 1
+                    if self.half_open_successes >= self.breaker_setting.max_requests:
+                        self._switch_state(STATE_CLOSED, now)
+            else:
+                self.consecutive_failures += 1
+                self.window.add(False, now)
+                if state == STATE_HALF_OPEN or self._ready_to_open(now):
+                    self._switch_state(STATE_OPEN, now)
+
+    def metrics(self, now=None):
+        """导出当前状态与窗口统计
+
+        :rtype: dict
+        """
+        if now is None:
+            now = time.time()
+        state, generation = self.current_state(now)
+        with self.lock:
+            failures, total = self.window.totals(now)
+            consecutive_failures = self.consecutive_failures
+            opened_count = self.opened_count
+        return {
+            "state": STATE_NAMES[state],
+            "generation": generation,
+            "failures": failures,
+            "total": total,
+            "failure_rate": float(failures) / total if total else 0.0,
+            "consecutive_failures": consecutive_failures,
+            "opened_count": opened_count,
+        }
+
+
+class CircuitBreaker(object):
+    """按 endpoint 分片的地域熔断器
+
+    before_requests 返回的票据记录了 endpoint 与 generation，
+    after_requests 据此把结果记到发起请求时的 endpoint 上。
+
+    :param breaker_setting: 熔断配置
+    :type breaker_setting: RegionBreakerProfile
+    """
+
+    def __init__(self, breaker_setting):
+        self.breaker_setting = breaker_setting
+        self._breakers = {}
+
+    def get(self, endpoint=None):
+        """获取（必要时创建）endpoint 对应的熔断器
+
+        :rtype: EndpointBreaker
+        """
+        breaker = self._breakers.get(endpoint)
+        if breaker is None:
+            breaker = self._breakers.setdefault(endpoint, EndpointBreaker(self.breaker_setting))
+        return breaker
+
+    # whether to use the backup region
+    def before_requests(self, endpoint=None):
+        """请求前检查熔断状态
+
+        :param endpoint: 主地域域名
+        :return: (票据, 是否切换到备用地域)
+        """
+        state, generation = self.get(endpoint).current_state(time.time())
+        return (endpoint, generation), state == STATE_OPEN
+
+    def after_requests(self, before, success, endpoint=None):
+        """请求后记录结果
+
+        :param before: before_requests 返回的票据
+        :param success: 请求是否成功
+        :param endpoint: 实际请求的 endpoint；切换到备用地域时传入，
+            结果记到备用地域的熔断器上
+        """
+        origin, generation = before
+        now = time.time()
+        if endpoint is not None and endpoint != origin:
+            breaker = self.get(endpoint)
+            generation = breaker.current_state(now)[1]
         else:
-            self.on_failure(state, now)
-
-    def on_success(self, state, now):
-        if state == STATE_CLOSED:
-            self.counter.on_success()
-        elif state == STATE_HALF_OPEN:
-            self.counter.on_success()
-            if self.counter.total - self.counter.failures >= self.breaker_setting.max_requests:
-                self.switch_state(STATE_CLOSED, now)
-
-    def on_failure(self, state, now):
-        if state == STATE_CLOSED:
-            self.counter.on_failure()
-            if self.ready_to_open():
-                self.switch_state(STATE_OPEN, now)
-        elif state == STATE_HALF_OPEN:
-            self.counter.on_failure()
-            self.switch_state(STATE_OPEN, now)
+            breaker = self.get(origin)
+        breaker.record(generation, success, now)
+
+    def state(self, endpoint=None):
+        """返回 endpoint 当前状态名：closed / half_open / open
+
+        :rtype: str
+        """
+        return STATE_NAMES[self.get(endpoint).current_state(time.time())[0]]
+
+    def metrics(self):
+        """导出所有 endpoint 的状态与失败率，供监控采集
+
+        :return: {endpoint: 指标字典}
+        :rtype: dict
+        """
+        now = time.time()
+        return {endpoint: breaker.metrics(now) for endpoint, breaker in list(self._breakers.items())}
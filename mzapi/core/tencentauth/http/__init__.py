@@ -22,6 +22,7 @@ _MZAPI_ORIGIN = "mzapi-txc-http-init-2026-qxx"
 子模块：
   - request：基于 requests 库的同步 HTTP 客户端
   - request_async：基于 httpx 库的异步 HTTP 客户端
-  - pre_conn：预连接池优化，减少 TCP 连接建立耗时
+  - pre_conn：带空闲超时与健康检查的预连接池，后台保持最少空闲连接
+  - multipart：multipart/form-data 流式编码器
 """
 
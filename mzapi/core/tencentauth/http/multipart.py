@@ -0,0 +1,165 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-txc-http-multipart-2026-qxx"
+
+
+
+"""
+腾讯云 multipart/form-data 流式编码器
+
+MultipartEncoder 将请求参数编码为一组分片，逐块输出 memoryview，
+不拼接整个请求体：
+
+  - bytes / bytearray / memoryview 参数直接以 memoryview 引用，不复制
+  - BinaryParams 中的文件对象按块读取（需可 seek，以便签名后重新读取）
+  - BinaryParams 中的路径（os.PathLike）以只读 mmap 映射
+  - Content-Length 在构造时即可确定
+
+同步客户端把编码器直接交给 requests（按 __len__ 设置 Content-Length），
+异步客户端通过 aiter() 交给 httpx。
+"""
+
+import hashlib
+import io
+import json
+import mmap
+import os
+
+from ..exception.tencent_cloud_sdk_exception import TencentCloudSDKException
+
+__all__ = ["MultipartEncoder"]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class _FileSegment(object):
+    """文件对象分片，记录起始偏移，每次迭代前回到起点"""
+
+    def __init__(self, fileobj):
+        try:
+            self._start = fileobj.tell()
+            end = fileobj.seek(0, io.SEEK_END)
+            fileobj.seek(self._start)
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            raise TencentCloudSDKException("ClientParamsError",
+                                           "multipart file objects must be seekable")
+        self._fileobj = fileobj
+        self.length = end - self._start
+
+    def iter_chunks(self, chunk_size):
+        self._fileobj.seek(self._start)
+        remaining = self.length
+        while remaining > 0:
+            chunk = self._fileobj.read(min(chunk_size, remaining))
+            if not chunk:
+                raise TencentCloudSDKException("ClientParamsError",
+                                               "multipart file object truncated while reading")
+            remaining -= len(chunk)
+            yield memoryview(chunk)
+
+
+def _map_file(path):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(b"")
+        # mmap 持有独立的文件描述符，关闭 f 不影响映射
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+class MultipartEncoder(object):
+    """multipart/form-data 流式编码器
+
+    :param params: 请求参数
+    :type params: dict
+    :param boundary: 分隔符
+    :type boundary: str
+    :param binary_params: 以文件形式上传的参数名
+    :type binary_params: list
+    :param chunk_size: 读取文件对象时的块大小
+    :type chunk_size: int
+    """
+
+    def __init__(self, params, boundary, binary_params=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.boundary = boundary
+        self.chunk_size = chunk_size
+        self._segments = []
+        binary_params = binary_params or []
+
+        # boundary and params key will never contain unicode characters
+        bbytes = boundary.encode()
+        for k, v in params.items():
+            kbytes = k.encode()
+            head = b'--%s\r\nContent-Disposition: form-data; name="%s"' % (bbytes, kbytes)
+            if k in binary_params:
+                head += b'; filename="%s"\r\n' % kbytes
+            else:
+                head += b"\r\n"
+                if isinstance(v, (list, dict)):
+                    v = json.dumps(v)
+                    head += b"Content-Type: application/json\r\n"
+            self._segments.append(memoryview(head + b"\r\n"))
+            self._segments.append(self._value_segment(v, k in binary_params))
+            self._segments.append(memoryview(b"\r\n"))
+        if self._segments:
+            self._segments.append(memoryview(b"--%s--\r\n" % bbytes))
+
+        self.content_length = sum(
+            s.length if isinstance(s, _FileSegment) else s.nbytes for s in self._segments)
+
+    @staticmethod
+    def _value_segment(v, is_binary):
+        if isinstance(v, (bytes, bytearray, memoryview, mmap.mmap)):
+            return memoryview(v).cast("B")
+        if isinstance(v, str):
+            return memoryview(v.encode())
+        if is_binary and isinstance(v, os.PathLike):
+            return _map_file(v)
+        if is_binary and hasattr(v, "read"):
+            return _FileSegment(v)
+        return memoryview(str(v).encode())
+
+    def __len__(self):
+        return self.content_length
+
+    def __iter__(self):
+        for segment in self._segments:
+            if isinstance(segment, _FileSegment):
+                for chunk in segment.iter_chunks(self.chunk_size):
+                    yield chunk
+            elif segment.nbytes:
+                yield segment
+
+    async def aiter(self):
+        """异步迭代分片，供 httpx.AsyncClient 使用"""
+        for chunk in self:
+            yield chunk
+
+    def sha256_hexdigest(self):
+        """逐块计算请求体 SHA-256，用于 TC3 签名
+
+        :rtype: str
+        """
+        h = hashlib.sha256()
+        for chunk in self:
+            h.update(chunk)
+        return h.hexdigest()
+
+    def to_bytes(self):
+        """拼接为完整请求体（仅用于调试或不支持流式的场景）
+
+        :rtype: bytes
+        """
+        return b"".join(self)
+
+    def __str__(self):
+        return "<multipart/form-data; boundary=%s; %d bytes>" % (self.boundary, self.content_length)
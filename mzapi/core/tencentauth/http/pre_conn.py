@@ -25,79 +25,365 @@ HTTP 预连接池优化模块
   - HTTPPreConnPool：HTTP 预连接池
   - PreConnPoolManager：预连接池管理器
   - PreConnAdapter：预连接适配器
+  - ConnWarmer：所有预连接池共用的后台预热线程
 
 工作原理：
-  1. 创建连接池时，清空默认连接
-  2. 启动后台守护线程，持续创建新连接并放入池中
-  3. 请求时直接从池中获取已建立的连接
+  1. 创建连接池时清空 urllib3 预置的占位项，池中只保存已建立的空闲连接，最多 maxsize 个
+  2. 连接池把补足请求交给共用的 ConnWarmer 线程，后台把空闲连接补足到 min_idle；
+     ConnWarmer 每隔 SWEEP_INTERVAL 秒淘汰空闲超过 idle_ttl 或已被对端关闭的连接并重新补足
+  3. 取连接时跳过过期或已断开的空闲连接，池中没有可用连接时直接新建，并记录命中 / 未命中次数
+  4. 关闭连接池时从 ConnWarmer 注销；进程退出时停止 ConnWarmer
 """
 
+import atexit
+import functools
 import logging
+import queue
 import threading
+import time
+import weakref
+from concurrent.futures import Future
 
+import requests
 from requests.adapters import HTTPAdapter
 from urllib3 import HTTPSConnectionPool, PoolManager, HTTPConnectionPool
+from urllib3._collections import RecentlyUsedContainer
+from urllib3.exceptions import ClosedPoolError
+from urllib3.util.connection import is_connection_dropped
 
 logger = logging.getLogger("tencentcloud_sdk_common")
 
+# 空闲连接的最长保留时间（秒），低于常见服务端 60 秒的 keep-alive 超时
+DEFAULT_IDLE_TTL = 50.0
+# ConnWarmer 定期巡检的间隔（秒）
+SWEEP_INTERVAL = 5.0
+# 后台预建连接的连接超时（秒）；ConnWarmer 线程为全部连接池共用，不能无限等待不可达的主机
+DEFAULT_CONNECT_TIMEOUT = 10.0
 
-class HTTPSPreConnPool(HTTPSConnectionPool):
-    _close_signal = {}
 
-    def __init__(self, *args, **kwargs):
-        super(HTTPSPreConnPool, self).__init__(*args, **kwargs)
-        # clear the pool
-        for _ in range(self.pool.maxsize):
-            self.pool.get()
-        self._conn_producer = threading.Thread(target=self._conn_producer_loop)
-        self._conn_producer.setDaemon(True)
-        self._conn_producer.start()
-
-    def _conn_producer_loop(self):
+class ConnWarmer(object):
+    """所有预连接池共用的后台线程
+
+    线程在第一次有补足请求时启动；stop() 之后不再接受新的请求。
+    """
+
+    def __init__(self, sweep_interval=SWEEP_INTERVAL):
+        self._sweep_interval = sweep_interval
+        self._cond = threading.Condition()
+        self._pools = weakref.WeakSet()
+        # 连接池 -> [目标空闲数, 等待结果的 Future 列表]
+        self._pending = {}
+        self._thread = None
+        self._stopped = False
+
+    def register(self, pool):
+        with self._cond:
+            self._pools.add(pool)
+
+    def unregister(self, pool):
+        with self._cond:
+            self._pools.discard(pool)
+            self._pending.pop(pool, None)
+
+    def request(self, pool, target=None):
+        """请求把 pool 的空闲连接补足到 target（默认为 min_idle）
+
+        同一个连接池的多个请求合并为一次，取最大的 target。
+
+        :return: Future，结果为新建的连接数
+        """
+        future = Future()
+        if not self._enqueue(pool, target, future):
+            future.set_result(0)
+        return future
+
+    def refill(self, pool):
+        """请求把 pool 的空闲连接补足到 min_idle，不等待结果"""
+        self._enqueue(pool, None, None)
+
+    def _enqueue(self, pool, target, future):
+        with self._cond:
+            if self._stopped:
+                return False
+            self._pools.add(pool)
+            entry = self._pending.get(pool)
+            if entry is None:
+                entry = self._pending[pool] = [target, []]
+            elif target is not None:
+                entry[0] = target if entry[0] is None else max(entry[0], target)
+            if future is not None:
+                entry[1].append(future)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="tencentcloud-conn-warmer", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return True
+
+    def stop(self, timeout=None):
+        """停止后台线程，未完成的请求以 0 结束"""
+        with self._cond:
+            self._stopped = True
+            thread = self._thread
+            self._cond.notify()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _run(self):
         while True:
-            conn = super(HTTPSPreConnPool, self)._new_conn()
-            conn.connect()
-            logger.debug("HTTPSPreConnPool: created a new conn")
-            self.pool.put(conn)
+            with self._cond:
+                if not self._pending and not self._stopped:
+                    self._cond.wait(self._sweep_interval)
+                pending, self._pending = self._pending, {}
+                stopped = self._stopped
+                pools = [] if pending or stopped else list(self._pools)
+            if stopped:
+                for _, futures in pending.values():
+                    for future in futures:
+                        future.set_result(0)
+                return
+            for pool, (target, futures) in pending.items():
+                self._maintain(pool, target, futures)
+            for pool in pools:
+                self._maintain(pool, None, ())
+
+    @staticmethod
+    def _maintain(pool, target, futures):
+        try:
+            opened = pool._maintain(target)
+        except Exception as e:
+            logger.debug("ConnWarmer: failed to maintain %s: %s", pool, e)
+            for future in futures:
+                future.set_exception(e)
+        else:
+            for future in futures:
+                future.set_result(opened)
+
+
+WARMER = ConnWarmer()
 
 
-class HTTPPreConnPool(HTTPConnectionPool):
-    _close_signal = {}
+@atexit.register
+def _shutdown_warmer():
+    WARMER.stop(timeout=1)
+
+
+class _PreConnPoolMixin(object):
 
     def __init__(self, *args, **kwargs):
-        super(HTTPPreConnPool, self).__init__(*args, **kwargs)
-        # clear the pool
-        for _ in range(self.pool.maxsize):
-            self.pool.get()
-        self._conn_producer = threading.Thread(target=self._conn_producer_loop)
-        self._conn_producer.setDaemon(True)
-        self._conn_producer.start()
-
-    def _conn_producer_loop(self):
+        min_idle = kwargs.pop("min_idle", None)
+        self._idle_ttl = kwargs.pop("idle_ttl", DEFAULT_IDLE_TTL)
+        self._connect_timeout = kwargs.pop("connect_timeout", DEFAULT_CONNECT_TIMEOUT)
+        self._warmer = kwargs.pop("warmer", None) or WARMER
+        super(_PreConnPoolMixin, self).__init__(*args, **kwargs)
+        # urllib3 预先放入 maxsize 个 None 占位，清空后队列中只有已建立的连接
+        while True:
+            try:
+                self.pool.get_nowait()
+            except queue.Empty:
+                break
+        self._max_idle = self.pool.maxsize
+        self._min_idle = self._max_idle if min_idle is None else max(0, min(min_idle, self._max_idle))
+        self._stats_lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "dropped": 0, "opened": 0, "failed": 0}
+        self._warmer.register(self)
+        if self._min_idle:
+            self._warmer.refill(self)
+
+    def _count(self, key, n=1):
+        with self._stats_lock:
+            self._stats[key] += n
+
+    def _is_stale(self, conn, now):
+        idle_since = getattr(conn, "_mzapi_idle_since", None)
+        if idle_since is not None and now - idle_since > self._idle_ttl:
+            self._count("expired")
+            return True
+        if is_connection_dropped(conn):
+            self._count("dropped")
+            return True
+        return False
+
+    def _get_conn(self, timeout=None):
+        pool = self.pool
+        if pool is None:
+            raise ClosedPoolError(self, "Pool is closed.")
+        conn = None
+        now = time.monotonic()
         while True:
-            conn = super(HTTPPreConnPool, self)._new_conn()
-            conn.connect()
-            logger.debug("HTTPSPreConnPool: created a new conn")
-            self.pool.put(conn)
+            try:
+                conn = pool.get_nowait()
+            except queue.Empty:
+                conn = None
+                break
+            if not self._is_stale(conn, now):
+                break
+            conn.close()
+        if conn is not None:
+            self._count("hits")
+        else:
+            self._count("misses")
+            conn = self._new_conn()
+        if pool.qsize() < self._min_idle:
+            self._warmer.refill(self)
+        return conn
+
+    def _put_conn(self, conn):
+        pool = self.pool
+        if conn is None:
+            return
+        if pool is not None:
+            conn._mzapi_idle_since = time.monotonic()
+            try:
+                pool.put(conn, block=False)
+                return
+            except queue.Full:
+                # 并发的未命中请求各自新建了连接，归还时超出 maxsize 的部分直接关闭
+                pass
+        conn.close()
+
+    def _evict_stale(self):
+        pool = self.pool
+        if pool is None:
+            return
+        now = time.monotonic()
+        with pool.mutex:
+            stale = [conn for conn in pool.queue if self._is_stale(conn, now)]
+            for conn in stale:
+                pool.queue.remove(conn)
+            if stale:
+                pool.not_full.notify(len(stale))
+        for conn in stale:
+            conn.close()
+
+    def _maintain(self, target=None):
+        """淘汰过期连接并把空闲连接补足到 target，由 ConnWarmer 线程调用
+
+        :return: 新建的连接数
+        """
+        self._evict_stale()
+        target = self._min_idle if target is None else min(target, self._max_idle)
+        opened = 0
+        while self.pool is not None and self.pool.qsize() < target:
+            conn = self._new_conn()
+            # 连接池自身的 timeout 默认不限时，实际请求时会按请求的超时重新设置
+            conn.timeout = self._connect_timeout
+            try:
+                conn.connect()
+            except Exception as e:
+                self._count("failed")
+                conn.close()
+                logger.debug("%s: failed to pre-open a conn to %s: %s", type(self).__name__, self.host, e)
+                break
+            self._put_conn(conn)
+            opened += 1
+        if opened:
+            self._count("opened", opened)
+            logger.debug("%s: pre-opened %d conn(s) to %s", type(self).__name__, opened, self.host)
+        return opened
+
+    def warmup(self, n=None):
+        """在后台把空闲连接补足到 n 个（默认 min_idle，不超过 maxsize）
+
+        :return: Future，结果为新建的连接数
+        """
+        return self._warmer.request(self, n)
+
+    def stats(self):
+        """返回统计：命中 / 未命中、淘汰、预建与失败次数，以及当前空闲连接数
+
+        :rtype: dict
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        pool = self.pool
+        stats["idle"] = pool.qsize() if pool is not None else 0
+        stats["min_idle"] = self._min_idle
+        stats["max_idle"] = self._max_idle
+        return stats
+
+    def close(self):
+        self._warmer.unregister(self)
+        super(_PreConnPoolMixin, self).close()
+
+
+class HTTPSPreConnPool(_PreConnPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class HTTPPreConnPool(_PreConnPoolMixin, HTTPConnectionPool):
+    pass
 
 
 class PreConnPoolManager(PoolManager):
-    def __init__(self, pool_size, *args, **kwargs):
+    def __init__(self, pool_size, num_pools=10, headers=None, min_idle=None, idle_ttl=DEFAULT_IDLE_TTL,
+                 connect_timeout=DEFAULT_CONNECT_TIMEOUT, **connection_pool_kw):
         self._pool_size = pool_size
-        super(PreConnPoolManager, self).__init__(*args, **kwargs)
+        super(PreConnPoolManager, self).__init__(num_pools, headers, **connection_pool_kw)
+        # urllib3 2.x 淘汰或清空连接池时不再关闭它们，这里恢复关闭，使连接池及时从 ConnWarmer 注销
+        self.pools = RecentlyUsedContainer(num_pools, dispose_func=lambda pool: pool.close())
+        # min_idle / idle_ttl / connect_timeout 不是 urllib3 连接池键的字段，绑定到连接池类上传入
+        pre_conn_kw = {"min_idle": min_idle, "idle_ttl": idle_ttl, "connect_timeout": connect_timeout}
+        self.pool_classes_by_scheme = {
+            "http": functools.partial(HTTPPreConnPool, **pre_conn_kw),
+            "https": functools.partial(HTTPSPreConnPool, **pre_conn_kw),
+        }
+        self.connection_pool_kw["maxsize"] = pool_size
+
+    def stats(self):
+        """返回每个主机的连接池统计，键为 scheme://host:port
 
-    def _new_pool(self, scheme, host, port, request_context):
-        if scheme == 'https':
-            return HTTPSPreConnPool(host, port, maxsize=self._pool_size - 1)
-        if scheme == 'http':
-            return HTTPPreConnPool(host, port, maxsize=self._pool_size - 1)
-        return super(PreConnPoolManager, self)._new_pool(scheme, host, port, request_context)
+        :rtype: dict
+        """
+        stats = {}
+        for key in self.pools.keys():
+            pool = self.pools.get(key)
+            if pool is None:
+                continue
+            name = "%s://%s:%s" % (key.key_scheme, key.key_host, key.key_port)
+            pool_stats = pool.stats()
+            # 同一主机按不同 TLS 参数可能对应多个连接池，计数合并
+            if name in stats:
+                for k, v in pool_stats.items():
+                    stats[name][k] = max(stats[name][k], v) if k in ("min_idle", "max_idle") else stats[name][k] + v
+            else:
+                stats[name] = pool_stats
+        return stats
 
 
 class PreConnAdapter(HTTPAdapter):
     def __init__(self, conn_pool_size, *args, **kwargs):
         self._conn_pool_size = conn_pool_size
+        self._min_idle = kwargs.pop("min_idle", None)
+        self._idle_ttl = kwargs.pop("idle_ttl", DEFAULT_IDLE_TTL)
+        self._connect_timeout = kwargs.pop("connect_timeout", DEFAULT_CONNECT_TIMEOUT)
         super(PreConnAdapter, self).__init__(*args, **kwargs)
 
-    def init_poolmanager(self, *args, **kwargs):
-        self.poolmanager = PreConnPoolManager(self._conn_pool_size, *args, **kwargs)
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = PreConnPoolManager(self._conn_pool_size, num_pools=connections, block=block,
+                                              min_idle=self._min_idle, idle_ttl=self._idle_ttl,
+                                              connect_timeout=self._connect_timeout, **pool_kwargs)
+
+    def warmup(self, url, n=None, verify=True, cert=None):
+        """在后台预先建立到 url 所在主机的连接
+
+        按与实际请求相同的 TLS 参数取连接池，预建的连接会被后续请求复用。
+
+        :return: Future，结果为新建的连接数
+        """
+        request = requests.Request("GET", url).prepare()
+        if hasattr(self, "get_connection_with_tls_context"):
+            pool = self.get_connection_with_tls_context(request, verify, cert=cert)
+        else:
+            pool = self.get_connection(url)
+            self.cert_verify(pool, url, verify, cert)
+        return pool.warmup(n)
+
+    def stats(self):
+        """返回每个主机的连接池统计，键为 scheme://host:port
+
+        :rtype: dict
+        """
+        return self.poolmanager.stats()
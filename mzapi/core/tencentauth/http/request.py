@@ -35,11 +35,13 @@ _MZAPI_ORIGIN = "mzapi-txc-http-request-2026-qxx"
 
 import os
 import logging
+from concurrent.futures import Future
 
 import requests
 import certifi
 
-from mzapi.utlis.tencentauth.http.pre_conn import PreConnAdapter
+from mzapi.core.ssl_context import SSLContextAdapter
+from mzapi.utlis.tencentauth.http.pre_conn import PreConnAdapter, DEFAULT_IDLE_TTL
 
 try:
     from urllib.parse import urlparse
@@ -59,7 +61,8 @@ def _get_proxy_from_env(host, varname="HTTPS_PROXY"):
 
 
 class ProxyConnection(object):
-    def __init__(self, host, timeout=60, proxy=None, certification=None, is_http=False, pre_conn_pool_size=0):
+    def __init__(self, host, timeout=60, proxy=None, certification=None, is_http=False, pre_conn_pool_size=0,
+                 pre_conn_min_idle=None, pre_conn_idle_ttl=DEFAULT_IDLE_TTL):
         self.request_host = host
         self.certification = certification
         if certification is None:
@@ -75,9 +78,14 @@ class ProxyConnection(object):
         self.request_length = 0
         self._session = requests.Session()
         if pre_conn_pool_size > 0:
-            adapter = PreConnAdapter(conn_pool_size=pre_conn_pool_size)
-            self._session.mount("https://", adapter)
-            self._session.mount("http://", adapter)
+            # 预建连接使用请求超时作为连接超时
+            adapter = PreConnAdapter(conn_pool_size=pre_conn_pool_size, min_idle=pre_conn_min_idle,
+                                     idle_ttl=pre_conn_idle_ttl, connect_timeout=timeout)
+        else:
+            # SSLContext 取自进程级注册表，多个客户端共享同一份已解析的 CA
+            adapter = SSLContextAdapter()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     def request(self, method, url, body=None, headers=None):
         headers.setdefault("Host", self.request_host)
@@ -90,12 +98,36 @@ class ProxyConnection(object):
                                      timeout=self.timeout,
                                      stream=True)
 
+    def _pre_conn_adapter(self, url):
+        adapter = self._session.get_adapter(url)
+        return adapter if isinstance(adapter, PreConnAdapter) else None
+
+    def warmup(self, url, n=None):
+        """在后台预先建立到 url 所在主机的连接
+
+        :return: Future，结果为新建的连接数
+        """
+        adapter = self._pre_conn_adapter(url)
+        if adapter is None:
+            raise TencentCloudSDKException("ClientError", "warmup requires HttpProfile.pre_conn_pool_size > 0")
+        if self.proxy:
+            # 经代理的请求不使用预连接池
+            future = Future()
+            future.set_result(0)
+            return future
+        return adapter.warmup(url, n, verify=self.certification)
+
+    def pre_conn_stats(self, url):
+        adapter = self._pre_conn_adapter(url)
+        return adapter.stats() if adapter is not None else {}
+
 
 class ApiRequest(object):
     def __init__(self, host, req_timeout=60, debug=False, proxy=None, is_http=False, certification=None,
-                 pre_conn_pool_size=0):
+                 pre_conn_pool_size=0, pre_conn_min_idle=None, pre_conn_idle_ttl=DEFAULT_IDLE_TTL):
         self.conn = ProxyConnection(host, timeout=req_timeout, proxy=proxy, certification=certification,
-                                    is_http=is_http, pre_conn_pool_size=pre_conn_pool_size)
+                                    is_http=is_http, pre_conn_pool_size=pre_conn_pool_size,
+                                    pre_conn_min_idle=pre_conn_min_idle, pre_conn_idle_ttl=pre_conn_idle_ttl)
         self.is_http = is_http
         self.host = host
         self.req_timeout = req_timeout
@@ -141,6 +173,17 @@ class ApiRequest(object):
             raise TencentCloudSDKException(
                 "ClientParamsError", 'Method only support (GET, POST)')
 
+    def warmup(self, host, n=None):
+        """在后台预先建立到 host 的连接，需要启用预连接池
+
+        :return: Future，结果为新建的连接数
+        """
+        return self.conn.warmup(self._handle_host(host), n)
+
+    def pre_conn_stats(self, host):
+        """返回预连接池统计，未启用预连接池时为空 dict"""
+        return self.conn.pre_conn_stats(self._handle_host(host))
+
     def send_request(self, req_inter):
         try:
             http_resp = self._request(req_inter)
@@ -48,6 +48,9 @@ class RequestPrettyFormatter(object):
         if self._format_body:
             try:
                 lines.append(self._req.content.decode("utf-8"))
+            except httpx.RequestNotRead:
+                # streaming body, e.g. multipart upload
+                lines.append("<streaming body>")
             except UnicodeDecodeError:
                 # binary body
                 import base64
@@ -22,6 +22,7 @@ import re
 import warnings
 
 from ..exception.tencent_cloud_sdk_exception import TencentCloudSDKException
+from ..retry_budget import RetryBudget
 from .http_profile import HttpProfile
 
 
@@ -38,6 +39,10 @@ class ClientProfile(object):
     :type disable_region_breaker: bool
     :param request_client: 自定义请求客户端标识
     :type request_client: str
+    :param retryer: 重试策略，如 :class:`StandardRetryer`，默认不重试
+    :param retry_budget: 重试预算，使用同一 ClientProfile 的客户端（包括不同线程与事件循环中的）共享，
+        未指定 budget 的 StandardRetryer 使用它；默认新建一个 :class:`RetryBudget`
+    :type retry_budget: :class:`RetryBudget`
     """
 
     unsignedPayload = False
@@ -51,6 +56,7 @@ class ClientProfile(object):
         region_breaker_profile=None,
         request_client=None,
         retryer=None,
+        retry_budget=None,
     ):
         self.httpProfile = HttpProfile() if httpProfile is None else httpProfile
         self.signMethod = "TC3-HMAC-SHA256" if signMethod is None else signMethod
@@ -81,6 +87,9 @@ class ClientProfile(object):
                 "^[0-9a-zA-Z-_,;.]+$, ignored"
             )
         self.retryer = retryer
+        self.retry_budget = RetryBudget() if retry_budget is None else retry_budget
+        if getattr(retryer, "budget", False) is None:
+            retryer.budget = self.retry_budget
 
 
 class RegionBreakerProfile(object):
@@ -98,6 +107,8 @@ class RegionBreakerProfile(object):
     :type timeout: int
     :param max_requests: 半开状态下最大请求数，默认 5
     :type max_requests: int
+    :param window_buckets: 滑动窗口划分的时间桶数量，默认 10
+    :type window_buckets: int
     """
 
     def __init__(
@@ -108,6 +119,7 @@ class RegionBreakerProfile(object):
         window_interval=60 * 5,
         timeout=60,
         max_requests=5,
+        window_buckets=10,
     ):
         self.backup_endpoint = backup_endpoint
         if not self.check_endpoint():
@@ -126,6 +138,12 @@ class RegionBreakerProfile(object):
         self.window_interval = window_interval
         self.timeout = timeout
         self.max_requests = max_requests
+        if window_buckets < 1:
+            raise TencentCloudSDKException(
+                "ClientError",
+                "window buckets must be a positive integer",
+            )
+        self.window_buckets = window_buckets
 
     def check_endpoint(self):
         """校验 backup_endpoint 格式"""
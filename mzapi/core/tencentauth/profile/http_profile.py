@@ -65,4 +65,9 @@ class HttpProfile(object):
         self.rootDomain = "tencentcloudapi.com" if rootDomain is None else rootDomain
         self.certification = certification
         self.apigw_endpoint = None
-        self.pre_conn_pool_size = 0
\ No newline at end of file
+        # 大于 0 时启用预连接池：每个主机最多保留的空闲连接数
+        self.pre_conn_pool_size = 0
+        # 后台保持的最少空闲连接数，None 表示等于 pre_conn_pool_size
+        self.pre_conn_min_idle = None
+        # 空闲连接的最长保留时间（秒）
+        self.pre_conn_idle_ttl = 50
@@ -15,10 +15,16 @@ _MZAPI_ORIGIN = "mzapi-txc-retry-async-2026-qxx"
 
 import asyncio
 import logging
+import threading
+import time
 
 import httpx
 
 from mzapi.utlis.tencentauth.exception import TencentCloudSDKException
+from mzapi.utlis.tencentauth.retry_budget import (
+    DEFAULT_BASE_DELAY, DEFAULT_MAX_DELAY, JITTER_DECORRELATED, JITTER_FULL,
+    decorrelated_jitter, full_jitter,
+)
 
 
 class NoopRetryer(object):
@@ -39,22 +45,52 @@ class StandardRetryer(object):
     :param max_attempts: Maximum number of attempts.
     :type max_attempts: int
     :param backoff_fn: A function that takes the number of attempts and returns the number of seconds to sleep before the next retry.
-       Default sleep time is 2^n seconds, n is the number of attempts.
+       If not provided, the sleep time is chosen by ``jitter``.
     :type backoff_fn: function
     :param logger: A logger to log retry attempts. If not provided, no logging will be performed.
     :type logger: logging.Logger
+    :param jitter: "full" (default) sleeps a random time in [0, min(max_delay, base_delay * 2^n)],
+       "decorrelated" sleeps a random time in [base_delay, previous sleep * 3] capped at max_delay,
+       None sleeps min(max_delay, 2^n) seconds.
+    :type jitter: str
+    :param base_delay: Base sleep time in seconds used by jitter.
+    :type base_delay: float
+    :param max_delay: Maximum sleep time in seconds between two attempts.
+    :type max_delay: float
+    :param deadline: Maximum time in seconds a single call may spend including retries.
+       A retry whose sleep would cross the deadline is not made.
+    :type deadline: float
+    :param budget: A :class:`RetryBudget` limiting the retry ratio. If not provided,
+       ClientProfile binds its ``retry_budget`` to this retryer.
+    :type budget: RetryBudget
     """
 
-    def __init__(self, max_attempts=3, backoff_fn=None, logger=None):
+    def __init__(self, max_attempts=3, backoff_fn=None, logger=None, jitter=JITTER_FULL,
+                 base_delay=DEFAULT_BASE_DELAY, max_delay=DEFAULT_MAX_DELAY, deadline=None, budget=None):
+        if jitter not in (JITTER_FULL, JITTER_DECORRELATED, None):
+            raise ValueError("jitter must be 'full', 'decorrelated' or None")
+        if backoff_fn is None and type(self).backoff is not StandardRetryer.backoff:
+            # 子类覆盖了 backoff 时沿用其退避时间
+            backoff_fn = self.backoff
         self._max_attempts = max_attempts
-        self._backoff_fn = backoff_fn or self.backoff
+        self._backoff_fn = backoff_fn
         self._logger = logger
+        self._jitter = jitter
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._deadline = deadline
+        self.budget = budget
+        self._lock = threading.Lock()
+        self._stats = {"retries": 0, "budget_denied": 0, "deadline_exceeded": 0}
 
     async def send_request(self, fn):
-        resp = None
+        start = time.monotonic()
+        previous = self._base_delay
         err = None
 
         for n in range(self._max_attempts):
+            resp = None
+            err = None
             try:
                 resp = await fn()
             except TencentCloudSDKException as e:
@@ -65,14 +101,44 @@ class StandardRetryer(object):
             if not await self.should_retry(resp, err):
                 if err:
                     raise err
+                if self.budget is not None:
+                    self.budget.on_success()
                 return resp
 
-            sleep = await self._backoff_fn(n)
+            if n + 1 >= self._max_attempts:
+                break
+            sleep = await self._next_sleep(n, previous)
+            previous = sleep
+            if self._deadline is not None and time.monotonic() - start + sleep >= self._deadline:
+                self._count("deadline_exceeded")
+                break
+            if self.budget is not None and not self.budget.acquire():
+                self._count("budget_denied")
+                break
+            self._count("retries")
             await self.on_retry(n, sleep, resp, err)
             await asyncio.sleep(sleep)
 
         raise err
 
+    def stats(self):
+        """Return counters: retries made, retries denied by the budget and by the deadline."""
+        with self._lock:
+            return dict(self._stats)
+
+    async def _next_sleep(self, n, previous):
+        if self._backoff_fn is not None:
+            return await self._backoff_fn(n)
+        if self._jitter == JITTER_FULL:
+            return full_jitter(n, self._base_delay, self._max_delay)
+        if self._jitter == JITTER_DECORRELATED:
+            return decorrelated_jitter(previous, self._base_delay, self._max_delay)
+        return min(self._max_delay, await self.backoff(n))
+
+    def _count(self, key):
+        with self._lock:
+            self._stats[key] += 1
+
     @staticmethod
     async def should_retry(resp, err):
         if not err:
@@ -0,0 +1,126 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION - DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-txc-retry-budget-2026-qxx"
+
+"""
+重试预算与退避抖动
+
+retry.StandardRetryer 与 retry_async.StandardRetryer 共用：
+
+- RetryBudget：令牌桶形式的重试预算。每次重试消耗 retry_cost 个令牌，
+  每次成功的调用归还 success_credit 个令牌；令牌不足时不再重试，
+  避免故障期间所有调用方一起重试、成倍放大请求量。
+  只在锁内做计数，不阻塞，可在多个线程与事件循环之间共享（通常经由 ClientProfile 共享）
+- full_jitter() / decorrelated_jitter()：带上限的随机退避时间，使各调用方的重试时间错开
+"""
+
+import random
+import threading
+
+__all__ = [
+    "RetryBudget",
+    "full_jitter",
+    "decorrelated_jitter",
+    "JITTER_FULL",
+    "JITTER_DECORRELATED",
+]
+
+DEFAULT_CAPACITY = 500
+DEFAULT_RETRY_COST = 5
+DEFAULT_SUCCESS_CREDIT = 1
+
+JITTER_FULL = "full"
+JITTER_DECORRELATED = "decorrelated"
+
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 20.0
+
+
+class RetryBudget(object):
+    """重试预算，线程安全
+
+    :param capacity: 令牌桶容量，初始为满
+    :type capacity: int
+    :param retry_cost: 每次重试消耗的令牌数
+    :type retry_cost: int
+    :param success_credit: 每次成功调用归还的令牌数
+    :type success_credit: int
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, retry_cost=DEFAULT_RETRY_COST,
+                 success_credit=DEFAULT_SUCCESS_CREDIT):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if retry_cost <= 0:
+            raise ValueError("retry_cost must be positive")
+        if success_credit < 0:
+            raise ValueError("success_credit must not be negative")
+        self._capacity = capacity
+        self._retry_cost = retry_cost
+        self._success_credit = success_credit
+        self._tokens = capacity
+        self._lock = threading.Lock()
+        self._stats = {"granted": 0, "denied": 0, "successes": 0}
+
+    @property
+    def tokens(self):
+        """当前剩余令牌数"""
+        return self._tokens
+
+    def acquire(self):
+        """申请一次重试
+
+        :return: 令牌充足时扣除 retry_cost 并返回 True，否则返回 False
+        :rtype: bool
+        """
+        with self._lock:
+            if self._tokens < self._retry_cost:
+                self._stats["denied"] += 1
+                return False
+            self._tokens -= self._retry_cost
+            self._stats["granted"] += 1
+            return True
+
+    def on_success(self):
+        """记录一次成功的调用，归还 success_credit 个令牌"""
+        with self._lock:
+            self._stats["successes"] += 1
+            self._tokens = min(self._capacity, self._tokens + self._success_credit)
+
+    def stats(self):
+        """返回统计：批准 / 拒绝的重试次数、成功调用次数与剩余令牌数
+
+        :rtype: dict
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["tokens"] = self._tokens
+            stats["capacity"] = self._capacity
+        return stats
+
+
+def full_jitter(n, base=DEFAULT_BASE_DELAY, cap=DEFAULT_MAX_DELAY):
+    """第 n 次重试（从 0 开始）的退避时间，在 [0, min(cap, base × 2^n)] 内均匀分布
+
+    :rtype: float
+    """
+    return random.uniform(0, min(cap, base * 2 ** n))
+
+
+def decorrelated_jitter(previous, base=DEFAULT_BASE_DELAY, cap=DEFAULT_MAX_DELAY):
+    """去相关抖动：在 [base, previous × 3] 内均匀分布，不超过 cap
+
+    :param previous: 上一次的退避时间，首次重试传 base
+    :rtype: float
+    """
+    return min(cap, random.uniform(base, max(base, previous) * 3))
@@ -29,6 +29,8 @@ import binascii
 import hashlib
 import hmac
 import sys
+import threading
+from collections import OrderedDict
 
 from .exception.tencent_cloud_sdk_exception import TencentCloudSDKException
 
@@ -90,7 +92,7 @@ class Sign(object):
         return base64
 
     @staticmethod
-    def sign_tc3(secret_key, date, service, str2sign):
+    def sign_tc3(secret_key, date, service, str2sign, use_cache=True):
         """TC3-HMAC-SHA256 签名方法（推荐）
 
         适用于腾讯云 v3 版本 API 签名。
@@ -98,6 +100,8 @@ class Sign(object):
         签名密钥推导流程：
           secret_key -> ('TC3' + secret_key) + date -> service -> 'tc3_request'
 
+        推导结果按 (secret_key, service) 缓存至 UTC 日期变化，见 TC3SigningKeyCache。
+
         :param secret_key: 密钥（SecretKey）
         :type secret_key: str
         :param date: 日期字符串，格式 YYYY-MM-DD
@@ -106,19 +110,109 @@ class Sign(object):
         :type service: str
         :param str2sign: 待签名字符串
         :type str2sign: str
+        :param use_cache: 是否使用签名密钥缓存，默认 True
+        :type use_cache: bool
         :return: 十六进制签名字符串
         :rtype: str
         """
+        if use_cache:
+            signing_key = _tc3_key_cache.get(secret_key, date, service)
+        else:
+            signing_key = Sign.derive_tc3_signing_key(secret_key, date, service)
+        signature = hmac.new(signing_key, str2sign.encode("utf-8"), hashlib.sha256).hexdigest()
+        return signature
+
+    @staticmethod
+    def derive_tc3_signing_key(secret_key, date, service):
+        """推导 TC3-HMAC-SHA256 签名密钥（不使用缓存）
+
+        :param secret_key: 密钥（SecretKey）
+        :type secret_key: str
+        :param date: 日期字符串，格式 YYYY-MM-DD
+        :type date: str
+        :param service: 服务名称
+        :type service: str
+        :return: 签名密钥
+        :rtype: bytes
+        """
 
         def _hmac_sha256(key, msg):
             return hmac.new(key, msg.encode("utf-8"), hashlib.sha256)
 
-        def _get_signature_key(key, date, service):
-            k_date = _hmac_sha256(("TC3" + key).encode("utf-8"), date)
-            k_service = _hmac_sha256(k_date.digest(), service)
-            k_signing = _hmac_sha256(k_service.digest(), "tc3_request")
-            return k_signing.digest()
+        k_date = _hmac_sha256(("TC3" + secret_key).encode("utf-8"), date)
+        k_service = _hmac_sha256(k_date.digest(), service)
+        k_signing = _hmac_sha256(k_service.digest(), "tc3_request")
+        return k_signing.digest()
+
+
+class TC3SigningKeyCache(object):
+    """TC3-HMAC-SHA256 签名密钥缓存
+
+    签名密钥只取决于 (secret_key, date, service)，同一 UTC 日内对同一服务
+    的请求可以复用，省去每次请求的三轮 HMAC 推导。
+
+    - 以 (secret_key, service) 为键，记录密钥所属日期，日期变化即重新推导
+    - 按 LRU 淘汰，条目数不超过 max_size
+    - 线程安全，同步与异步客户端共用同一进程级实例
+    """
+
+    DEFAULT_MAX_SIZE = 256
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """
+        :param max_size: 最大缓存条目数
+        :type max_size: int
+        """
+        if max_size <= 0:
+            raise TencentCloudSDKException("ClientParamsError", "max_size must be positive")
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, secret_key, date, service):
+        """获取签名密钥，未命中或已跨日时重新推导并写入缓存
+
+        :param secret_key: 密钥（SecretKey）
+        :type secret_key: str
+        :param date: 日期字符串，格式 YYYY-MM-DD
+        :type date: str
+        :param service: 服务名称
+        :type service: str
+        :return: 签名密钥
+        :rtype: bytes
+        """
+        cache_key = (secret_key, service)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[0] == date:
+                self._entries.move_to_end(cache_key)
+                return entry[1]
+
+        # 推导在锁外进行，避免阻塞其他线程
+        signing_key = Sign.derive_tc3_signing_key(secret_key, date, service)
+        with self._lock:
+            self._entries[cache_key] = (date, signing_key)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return signing_key
+
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
 
-        signing_key = _get_signature_key(secret_key, date, service)
-        signature = _hmac_sha256(signing_key, str2sign).hexdigest()
-        return signature
\ No newline at end of file
+_tc3_key_cache = TC3SigningKeyCache()
+
+
+def get_tc3_signing_key_cache():
+    """获取进程级 TC3 签名密钥缓存
+
+    :rtype: TC3SigningKeyCache
+    """
+    return _tc3_key_cache
@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 # 阿里云 OpenAPI SDK 单元测试
 
+import json
 import sys
+import threading
+import time
 import types
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 # 确保 mzapi 包可以被导入（修复 mzapi/__init__.py 语法问题）
 if 'mzapi' not in sys.modules:
@@ -30,6 +34,9 @@ from mzapi.utlis.aliyunauth.exceptions import (
 from mzapi.utlis.aliyunauth.utils import Utils
 from mzapi.utlis.aliyunauth.sm3 import Sm3, hash_sm3
 from mzapi.utlis.aliyunauth.models import SSEResponse
+from mzapi.utlis.aliyunauth.client import Client as OpenApiClient
+
+RuntimeOptions = sys.modules[OpenApiClient.__module__].RuntimeOptions
 
 
 class TestConfig(unittest.TestCase):
@@ -267,6 +274,26 @@ class TestUtils(unittest.TestCase):
         self.assertIsInstance(sig, str)
         self.assertTrue(len(sig) > 0)
 
+    def test_get_rpcsignature_known_value(self):
+        sig = Utils.get_rpcsignature(
+            {
+                "Action": "RecognizeAllText",
+                "Url": "https://example.com/a b.jpg?x=1&y=中",
+                "SignatureNonce": "abc~",
+                "Empty": "",
+                "Skipped": None,
+            },
+            "POST",
+            "test_secret_key",
+        )
+        self.assertEqual(sig, "P1rEMODAljbvdtmCIV9Kia+Z9oY=")
+
+    def test_to_form_string_matches_form(self):
+        from darabonba.utils.form import Form
+        params = {"b": "x y", "a": "中文&=+/~", "c": "", "long": "v" * 1000}
+        self.assertEqual(Utils.to_form_string(params), Form.to_form_string(params))
+        self.assertEqual(Utils.to_form_string({}), "")
+
     def test_get_string_to_sign(self):
         class FakeRequest:
             method = "GET"
@@ -313,6 +340,24 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(result["k"], "123")
         self.assertEqual(result["b"], "hello")
 
+    def test_stream_offset(self):
+        import io
+        stream = io.BytesIO(b"0123456789")
+        stream.seek(3)
+        self.assertEqual(Utils.stream_offset(stream), 3)
+        self.assertIsNone(Utils.stream_offset(None))
+        self.assertIsNone(Utils.stream_offset(iter([b"a"])))
+
+    def test_hash_stream_matches_hash(self):
+        import io
+        data = bytes(range(256)) * 700
+        stream = io.BytesIO(b"skip" + data)
+        for sign_type in ("ACS3-HMAC-SHA256", "ACS3-HMAC-SM3"):
+            digest = Utils.hash_stream(stream, 4, sign_type, chunk_size=1000)
+            self.assertEqual(digest, Utils.hash(data, sign_type))
+            # 摘要计算后回到起始位置，便于发送与重试
+            self.assertEqual(stream.tell(), 4)
+
 
 class TestSm3(unittest.TestCase):
     """SM3 国密哈希算法测试"""
@@ -412,6 +457,102 @@ class TestSSEResponse(unittest.TestCase):
         self.assertEqual(resp.status_code, 200)
 
 
+class _ApiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status, body, content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.server.requests.append((self.path, dict(self.headers), body))
+        if self.path.startswith("/?"):
+            # RPC 风格请求返回错误响应
+            error = {"Code": "InvalidImage", "Message": "bad image", "RequestId": "rid"}
+            self._send(400, json.dumps(error).encode("utf-8"))
+            return
+        self._send(200, json.dumps({"RequestId": "rid"}).encode("utf-8"))
+
+    def do_GET(self):
+        # 分块发送 SSE，使一个 UTF-8 字符跨两个块
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        data = "data: 你好\n\n".encode("utf-8")
+        for part in (data[:7], data[7:]):
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(part), part))
+            self.wfile.flush()
+            time.sleep(0.05)
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, *args):
+        pass
+
+
+class TestClientTransport(unittest.TestCase):
+    """Client 经 DaraCore 发送请求的端到端测试"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _ApiHandler)
+        cls.server.daemon_threads = True
+        cls.server.requests = []
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests.clear()
+        self.client = OpenApiClient(Config(endpoint="127.0.0.1:%d" % self.server.server_address[1],
+                                           protocol="HTTP"))
+
+    def test_roa_model_body(self):
+        params = Params(action="RunTask", version="2024-01-01", protocol="HTTP", pathname="/v1/tasks",
+                        method="POST", auth_type="Anonymous", body_type="json", req_body_type="json",
+                        style="ROA")
+        request = OpenApiRequest(body={"Name": "任务", "Params": params})
+        resp = self.client.do_roarequest("RunTask", "2024-01-01", "HTTP", "POST", "Anonymous", "/v1/tasks",
+                                         "json", request, RuntimeOptions())
+        self.assertEqual(resp["statusCode"], 200)
+        self.assertEqual(resp["body"], {"RequestId": "rid"})
+        path, headers, body = self.server.requests[0]
+        self.assertEqual(path, "/v1/tasks")
+        self.assertEqual(headers["content-type"], "application/json; charset=utf-8")
+        self.assertEqual(json.loads(body), {"Name": "任务", "Params": params.to_map()})
+
+    def test_sse_utf8_split_across_chunks(self):
+        params = Params(action="Chat", version="2024-01-01", protocol="HTTP", pathname="/v1/chat",
+                        method="GET", auth_type="Anonymous", body_type="json", req_body_type="json",
+                        style="ROA")
+        events = list(self.client.call_sseapi(params, OpenApiRequest(), RuntimeOptions()))
+        self.assertEqual([resp.event.data for resp in events], ["你好"])
+        self.assertEqual(events[0].status_code, 200)
+
+    def test_rpc_binary_error_read_from_response_stream(self):
+        from unittest import mock
+        response_stream = sys.modules["mzapi.core.aliyunauth.darabonba.utils.stream"].ResponseStream
+        read = response_stream.read
+        request = OpenApiRequest(body={"Url": "https://example.com/a.jpg"})
+        with mock.patch.object(response_stream, "read", autospec=True, side_effect=read) as patched:
+            with self.assertRaises(ClientException) as ctx:
+                self.client.do_rpcrequest("RecognizeAllText", "2021-07-07", "HTTP", "POST", "Anonymous",
+                                          "binary", request, RuntimeOptions())
+        # 错误响应体经流式 ResponseStream 一次性读取
+        patched.assert_called_once()
+        self.assertEqual(ctx.exception.status_code, 400)
+        self.assertEqual(ctx.exception.code, "InvalidImage")
+        self.assertEqual(ctx.exception.request_id, "rid")
+
+
 class TestModuleInit(unittest.TestCase):
     """模块初始化测试"""
 
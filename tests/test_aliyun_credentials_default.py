@@ -0,0 +1,289 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-test-aliyun-default-provider-2026-qxx"
+
+"""
+aliyunauth.credentials.provider.default 模块单元测试
+
+覆盖场景：
+- 重用上次成功的提供者时，重复获取凭证只调用一次提供者
+- 超过 SNAPSHOT_PREFETCH_INTERVAL 后在后台重新取值，当次仍返回快照
+- 快照过期后同步刷新
+- 关闭 reuse_last_provider_enabled 时每次都遍历提供者链
+- 同步与异步两条路径
+"""
+
+import asyncio
+import importlib.util
+import os
+import sys
+import threading
+import time
+import types
+import unittest
+from unittest import mock
+
+_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), os.pardir, "mzapi", "core", "aliyunauth"))
+_PKG = "_mzapi_test_default_provider"
+
+
+def _make_pkg(name, path):
+    """在 sys.modules 中注册一个包模块"""
+    m = types.ModuleType(name)
+    m.__path__ = [path]
+    m.__package__ = name
+    sys.modules[name] = m
+    return m
+
+
+def _load(name, filepath, pkg_name):
+    """加载单个 .py 文件为模块，设置 __package__ 以支持相对导入"""
+    spec = importlib.util.spec_from_file_location(name, filepath)
+    mod = importlib.util.module_from_spec(spec)
+    mod.__package__ = pkg_name
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class _StubProvider(object):
+    """代替链上真实提供者的占位类，测试中会整体替换提供者链"""
+
+    def get_credentials(self):
+        raise RuntimeError("stub provider")
+
+    async def get_credentials_async(self):
+        raise RuntimeError("stub provider")
+
+
+if "alibabacloud_credentials_api" not in sys.modules:
+    try:
+        import alibabacloud_credentials_api  # noqa: F401
+    except ImportError:
+        _api = types.ModuleType("alibabacloud_credentials_api")
+        _api.ICredentials = type("ICredentials", (object,), {})
+        _api.ICredentialsProvider = type("ICredentialsProvider", (object,), {})
+        sys.modules["alibabacloud_credentials_api"] = _api
+
+# provider 包的 __init__ 会导入全部提供者及其第三方依赖，这里注册空包，链上的提供者以占位类代替
+_root_pkg = _make_pkg(_PKG, _ROOT)
+_make_pkg(_PKG + ".credentials", os.path.join(_ROOT, "credentials"))
+_provider_pkg = _make_pkg(_PKG + ".credentials.provider", os.path.join(_ROOT, "credentials", "provider"))
+for _name in ("EnvironmentVariableCredentialsProvider", "EcsRamRoleCredentialsProvider",
+              "OIDCRoleArnCredentialsProvider", "URLCredentialsProvider", "CLIProfileCredentialsProvider",
+              "ProfileCredentialsProvider"):
+    setattr(_provider_pkg, _name, type(_name, (_StubProvider,), {}))
+
+_auth_util = types.ModuleType(_PKG + ".auth_util")
+_auth_util.enable_oidc_credential = False
+_auth_util.environment_ecs_metadata_disabled = "true"
+_auth_util.environment_credentials_uri = None
+sys.modules[_PKG + ".auth_util"] = _auth_util
+_root_pkg.auth_util = _auth_util
+
+_load(_PKG + ".credentials.exceptions", os.path.join(_ROOT, "credentials", "exceptions.py"), _PKG + ".credentials")
+_refreshable = _load(_PKG + ".credentials.provider.refreshable",
+                     os.path.join(_ROOT, "credentials", "provider", "refreshable.py"), _PKG + ".credentials.provider")
+_refreshable.ICredentialsProvider = sys.modules["alibabacloud_credentials_api"].ICredentialsProvider
+_default = _load(_PKG + ".credentials.provider.default",
+                 os.path.join(_ROOT, "credentials", "provider", "default.py"), _PKG + ".credentials.provider")
+
+Credentials = _refreshable.Credentials
+DefaultCredentialsProvider = _default.DefaultCredentialsProvider
+CredentialException = sys.modules[_PKG + ".credentials.exceptions"].CredentialException
+
+
+class _Clock(object):
+    """代替 time 模块：localtime()/mktime() 返回可控的秒数，其余使用真实时间"""
+
+    def __init__(self):
+        self.now = 1000000
+
+    def localtime(self):
+        return self.now
+
+    def mktime(self, t):
+        return t
+
+    monotonic = staticmethod(time.monotonic)
+    sleep = staticmethod(time.sleep)
+
+
+class _CountingProvider(object):
+
+    def __init__(self, expiration=None):
+        self.calls = 0
+        self.expiration = expiration
+        # 设置后提供者在返回前等待该事件，用于观察后台取值
+        self.gate = None
+
+    def _next(self):
+        self.calls += 1
+        if self.gate is not None:
+            self.gate.wait(2)
+        return Credentials(access_key_id="ak%d" % self.calls, access_key_secret="sk",
+                           expiration=self.expiration, provider_name="counting")
+
+    def get_credentials(self):
+        return self._next()
+
+    async def get_credentials_async(self):
+        return self._next()
+
+
+class _FailingProvider(_CountingProvider):
+
+    def _next(self):
+        self.calls += 1
+        raise CredentialException("not configured")
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class _Base(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = _Clock()
+        for mod in (_default, _refreshable):
+            patcher = mock.patch.object(mod, "time", self.clock)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _provider(self, *chain, reuse=True):
+        provider = DefaultCredentialsProvider(reuse_last_provider_enabled=reuse)
+        provider._DefaultCredentialsProvider__providers_chain = list(chain)
+        return provider
+
+
+class TestDefaultCredentialsProviderSync(_Base):
+
+    def test_repeated_calls_hit_provider_once(self):
+        counting = _CountingProvider()
+        provider = self._provider(_FailingProvider(), counting)
+        for _ in range(10):
+            credentials = provider.get_credentials()
+        self.assertEqual(counting.calls, 1)
+        self.assertEqual(credentials.get_access_key_id(), "ak1")
+        self.assertEqual(credentials.get_provider_name(), "default/counting")
+
+    def test_prefetch_after_interval(self):
+        counting = _CountingProvider()
+        provider = self._provider(counting)
+        provider.get_credentials()
+        self.clock.now += DefaultCredentialsProvider.SNAPSHOT_PREFETCH_INTERVAL
+        counting.gate = threading.Event()
+        # 后台重新取值，当次返回的仍是快照
+        self.assertEqual(provider.get_credentials().get_access_key_id(), "ak1")
+        self.assertTrue(_wait_until(lambda: counting.calls == 2))
+        counting.gate.set()
+        self.assertTrue(_wait_until(lambda: provider.get_credentials().get_access_key_id() == "ak2"))
+
+    def test_stale_snapshot_refreshed_synchronously(self):
+        counting = _CountingProvider()
+        provider = self._provider(counting)
+        provider.get_credentials()
+        self.clock.now += DefaultCredentialsProvider.SNAPSHOT_STALE_TIME
+        self.assertEqual(provider.get_credentials().get_access_key_id(), "ak2")
+        self.assertEqual(counting.calls, 2)
+
+    def test_expiration_bounds_snapshot(self):
+        counting = _CountingProvider(expiration=1000000 + 20 * 60)
+        provider = self._provider(counting)
+        provider.get_credentials()
+        # 距离过期 15 分钟时同步刷新
+        self.clock.now += 5 * 60
+        provider.get_credentials()
+        self.assertEqual(counting.calls, 2)
+
+    def test_without_reuse_walks_chain(self):
+        failing = _FailingProvider()
+        counting = _CountingProvider()
+        provider = self._provider(failing, counting, reuse=False)
+        for _ in range(3):
+            provider.get_credentials()
+        self.assertEqual((failing.calls, counting.calls), (3, 3))
+
+    def test_all_providers_fail(self):
+        provider = self._provider(_FailingProvider(), reuse=False)
+        with self.assertRaises(CredentialException):
+            provider.get_credentials()
+
+
+class TestDefaultCredentialsProviderAsync(_Base):
+
+    def test_repeated_calls_hit_provider_once(self):
+        counting = _CountingProvider()
+        provider = self._provider(_FailingProvider(), counting)
+
+        async def main():
+            for _ in range(10):
+                credentials = await provider.get_credentials_async()
+            return credentials
+
+        self.assertEqual(asyncio.run(main()).get_access_key_id(), "ak1")
+        self.assertEqual(counting.calls, 1)
+
+    def test_prefetch_after_interval(self):
+        counting = _CountingProvider()
+        provider = self._provider(counting)
+
+        async def main():
+            await provider.get_credentials_async()
+            self.clock.now += DefaultCredentialsProvider.SNAPSHOT_PREFETCH_INTERVAL
+            first = await provider.get_credentials_async()
+            # 等待后台预取完成后再取值
+            deadline = time.monotonic() + 2
+            while counting.calls < 2 and time.monotonic() < deadline:
+                await asyncio.sleep(0.001)
+            await asyncio.sleep(0.01)
+            return first, await provider.get_credentials_async()
+
+        first, second = asyncio.run(main())
+        self.assertEqual(first.get_access_key_id(), "ak1")
+        self.assertEqual(second.get_access_key_id(), "ak2")
+        self.assertEqual(counting.calls, 2)
+
+    def test_stale_snapshot_refreshed_synchronously(self):
+        counting = _CountingProvider()
+        provider = self._provider(counting)
+
+        async def main():
+            await provider.get_credentials_async()
+            self.clock.now += DefaultCredentialsProvider.SNAPSHOT_STALE_TIME
+            return await provider.get_credentials_async()
+
+        self.assertEqual(asyncio.run(main()).get_access_key_id(), "ak2")
+        self.assertEqual(counting.calls, 2)
+
+    def test_without_reuse_walks_chain(self):
+        failing = _FailingProvider()
+        counting = _CountingProvider()
+        provider = self._provider(failing, counting, reuse=False)
+
+        async def main():
+            for _ in range(3):
+                await provider.get_credentials_async()
+
+        asyncio.run(main())
+        self.assertEqual((failing.calls, counting.calls), (3, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
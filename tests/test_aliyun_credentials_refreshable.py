@@ -0,0 +1,287 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-test-aliyun-refreshable-2026-qxx"
+
+"""
+aliyunauth.credentials.provider.refreshable 模块单元测试
+
+覆盖场景：
+- RefreshScheduler 延迟执行、周期执行、取消、上一次仍在执行时跳过、关闭后不再执行
+- NonBlocking 同一提供者的同步 / 异步预取在完成前只执行一次
+- 异步预取进行中缓存过期时，调用方等待同一次刷新，不阻塞事件循环
+- 其他线程持有刷新锁时，异步刷新不阻塞事件循环
+"""
+
+import asyncio
+import importlib.util
+import os
+import sys
+import threading
+import time
+import types
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), os.pardir, "mzapi", "core", "aliyunauth"))
+_PKG = "_mzapi_test_refreshable"
+
+
+def _make_pkg(name, path):
+    """在 sys.modules 中注册一个包模块"""
+    m = types.ModuleType(name)
+    m.__path__ = [path]
+    m.__package__ = name
+    sys.modules[name] = m
+    return m
+
+
+def _load(name, filepath, pkg_name):
+    """加载单个 .py 文件为模块，设置 __package__ 以支持相对导入"""
+    spec = importlib.util.spec_from_file_location(name, filepath)
+    mod = importlib.util.module_from_spec(spec)
+    mod.__package__ = pkg_name
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+# provider 包的 __init__ 会导入全部提供者及其第三方依赖，这里只注册空包并单独加载所需文件
+if "alibabacloud_credentials_api" not in sys.modules:
+    try:
+        import alibabacloud_credentials_api  # noqa: F401
+    except ImportError:
+        _api = types.ModuleType("alibabacloud_credentials_api")
+        _api.ICredentials = type("ICredentials", (object,), {})
+        _api.ICredentialsProvider = type("ICredentialsProvider", (object,), {})
+        sys.modules["alibabacloud_credentials_api"] = _api
+
+_make_pkg(_PKG, _ROOT)
+_make_pkg(_PKG + ".credentials", os.path.join(_ROOT, "credentials"))
+_make_pkg(_PKG + ".credentials.provider", os.path.join(_ROOT, "credentials", "provider"))
+_load(_PKG + ".credentials.exceptions", os.path.join(_ROOT, "credentials", "exceptions.py"), _PKG + ".credentials")
+_mod = _load(_PKG + ".credentials.provider.refreshable",
+             os.path.join(_ROOT, "credentials", "provider", "refreshable.py"), _PKG + ".credentials.provider")
+
+RefreshScheduler = _mod.RefreshScheduler
+NonBlocking = _mod.NonBlocking
+RefreshCachedSupplier = _mod.RefreshCachedSupplier
+RefreshResult = _mod.RefreshResult
+
+
+def _now():
+    return int(time.mktime(time.localtime()))
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class TestRefreshScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.scheduler = RefreshScheduler(self.executor)
+        self.addCleanup(self.executor.shutdown, wait=True)
+        self.addCleanup(self.scheduler.shutdown)
+
+    def test_delayed_run(self):
+        done = threading.Event()
+        self.scheduler.schedule(done.set, delay=0.02)
+        self.assertTrue(done.wait(2))
+
+    def test_interval_repeats_until_cancelled(self):
+        calls = []
+        job = self.scheduler.schedule(lambda: calls.append(1), delay=0, interval=0.01)
+        self.assertTrue(_wait_until(lambda: len(calls) >= 3))
+        job.cancel()
+        time.sleep(0.05)
+        count = len(calls)
+        time.sleep(0.1)
+        self.assertEqual(len(calls), count)
+
+    def test_cancel_before_run(self):
+        calls = []
+        job = self.scheduler.schedule(lambda: calls.append(1), delay=0.05)
+        job.cancel()
+        time.sleep(0.15)
+        self.assertEqual(calls, [])
+
+    def test_skip_while_running(self):
+        release = threading.Event()
+        calls = []
+
+        def action():
+            calls.append(1)
+            release.wait(2)
+
+        job = self.scheduler.schedule(action, delay=0, interval=0.01)
+        self.assertTrue(_wait_until(lambda: calls))
+        # 执行期间经过多个周期，不会并发执行
+        time.sleep(0.1)
+        self.assertEqual(len(calls), 1)
+        release.set()
+        self.assertTrue(_wait_until(lambda: len(calls) >= 2))
+        job.cancel()
+
+    def test_shutdown(self):
+        calls = []
+        self.scheduler.schedule(lambda: calls.append(1), delay=0.05)
+        self.scheduler.shutdown()
+        time.sleep(0.15)
+        self.assertEqual(calls, [])
+        with self.assertRaises(RuntimeError):
+            self.scheduler.schedule(lambda: None, delay=0)
+
+    def test_failed_action_keeps_schedule(self):
+        calls = []
+
+        def action():
+            calls.append(1)
+            raise ValueError("boom")
+
+        with self.assertLogs("credentials", level="WARNING"):
+            job = self.scheduler.schedule(action, delay=0, interval=0.01)
+            self.assertTrue(_wait_until(lambda: len(calls) >= 2))
+        job.cancel()
+
+
+class TestNonBlocking(unittest.TestCase):
+
+    def test_sync_prefetch_coalesced(self):
+        strategy = NonBlocking()
+        release = threading.Event()
+        calls = []
+
+        def action():
+            calls.append(1)
+            release.wait(2)
+
+        for _ in range(5):
+            strategy.prefetch(action)
+        self.assertTrue(_wait_until(lambda: calls))
+        release.set()
+        self.assertTrue(_wait_until(lambda: not strategy._inflight))
+        self.assertEqual(len(calls), 1)
+
+        strategy.prefetch(action)
+        self.assertTrue(_wait_until(lambda: len(calls) == 2))
+
+    def test_async_prefetch_coalesced(self):
+        strategy = NonBlocking()
+        calls = []
+
+        async def action():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+
+        async def main():
+            for _ in range(5):
+                await strategy.prefetch_async(action)
+            await asyncio.gather(*strategy._tasks)
+            await strategy.prefetch_async(action)
+            await asyncio.gather(*strategy._tasks)
+
+        asyncio.run(main())
+        self.assertEqual(len(calls), 2)
+
+
+class TestRefreshCachedSupplierAsync(unittest.TestCase):
+
+    def _supplier(self, delay):
+        calls = []
+
+        def refresh():
+            calls.append("sync")
+            return RefreshResult(value="new", stale_time=_now() + 3600, prefetch_time=_now() + 3600)
+
+        async def refresh_async():
+            calls.append("async")
+            await asyncio.sleep(delay)
+            return RefreshResult(value="new", stale_time=_now() + 3600, prefetch_time=_now() + 3600)
+
+        supplier = RefreshCachedSupplier(refresh_callable=refresh, refresh_callable_async=refresh_async,
+                                         prefetch_strategy=NonBlocking())
+        return supplier, calls
+
+    def test_stale_during_prefetch_waits_for_same_refresh(self):
+        supplier, calls = self._supplier(delay=0.2)
+        supplier._cached_value = RefreshResult(value="old", stale_time=_now() + 3600, prefetch_time=_now() - 1)
+
+        async def main():
+            self.assertEqual(await supplier._async_call(), "old")
+            # 让预取 Task 开始执行并持有刷新锁
+            await asyncio.sleep(0.01)
+            supplier._cached_value = RefreshResult(value="old", stale_time=_now() - 1, prefetch_time=_now() - 1)
+            start = time.monotonic()
+            value = await supplier._async_call()
+            return value, time.monotonic() - start
+
+        value, elapsed = asyncio.run(main())
+        self.assertEqual(value, "new")
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(calls, ["async"])
+
+    def test_concurrent_stale_calls_refresh_once(self):
+        supplier, calls = self._supplier(delay=0.05)
+
+        async def main():
+            return await asyncio.gather(*[supplier._async_call() for _ in range(5)])
+
+        self.assertEqual(asyncio.run(main()), ["new"] * 5)
+        self.assertEqual(calls, ["async"])
+
+    def test_lock_held_by_thread_does_not_block_loop(self):
+        supplier, calls = self._supplier(delay=0)
+        supplier._refresh_lock.acquire()
+        ticks = []
+        ticks_while_locked = []
+
+        def release():
+            ticks_while_locked.append(len(ticks))
+            supplier._refresh_lock.release()
+
+        timer = threading.Timer(0.2, release)
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+        async def ticker():
+            while len(ticks) < 30:
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+
+        async def main():
+            return (await asyncio.gather(supplier._async_call(), ticker()))[0]
+
+        self.assertEqual(asyncio.run(main()), "new")
+        # 持有锁的 0.2 秒内事件循环仍在运行
+        self.assertGreaterEqual(ticks_while_locked[0], 5)
+        self.assertEqual(calls, ["async"])
+
+    def test_refresh_failure_propagates(self):
+        async def refresh_async():
+            raise ValueError("boom")
+
+        supplier = RefreshCachedSupplier(refresh_callable=None, refresh_callable_async=refresh_async)
+        with self.assertLogs("credentials", level="WARNING"):
+            with self.assertRaises(ValueError):
+                asyncio.run(supplier._async_call())
+        self.assertEqual(supplier._async_refreshes, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -32,6 +32,7 @@ from mzapi.utlis.aliyunauth.utils_models import (
     Params,
 )
 from mzapi.utlis.aliyunauth.client import Client as AliyunOpenApiClient
+from mzapi.utlis.aliyunauth.darabonba.core import DaraCore
 from mzapi.aliyun.ocr import RecognizeAllText, RecognizeAllTextResponse
 
 
@@ -158,6 +159,645 @@ class TestRecognizeAllTextParams(unittest.TestCase):
             self.assertIn(param, sig.parameters, f"Missing parameter: {param}")
 
 
+    def test_build_request_skips_none(self):
+        """None 参数不发送，其余映射为 API 参数名"""
+        request = RecognizeAllText._build_request(
+            url="https://example.com/img.jpg", output_table=True, need_sort=False, type=None,
+        )
+        self.assertEqual(request.body, {
+            "Url": "https://example.com/img.jpg",
+            "OutputTable": True,
+            "NeedSort": False,
+        })
+        self.assertEqual(request.query, {})
+
+    def test_recognize_async_signature(self):
+        """recognize_async 为协程且参数与 recognize 一致"""
+        import inspect
+        client = RecognizeAllText(
+            access_key_id="test_ak",
+            access_key_secret="test_sk",
+        )
+        self.assertTrue(inspect.iscoroutinefunction(client.recognize_async))
+        self.assertEqual(list(inspect.signature(client.recognize_async).parameters),
+                         list(inspect.signature(client.recognize).parameters))
+
+
+# =========================================================================
+#  批量识别测试
+# =========================================================================
+class TestRecognizeMany(unittest.TestCase):
+    """测试 recognize_many 的并发、顺序、错误隔离与背压"""
+
+    def _client(self, call):
+        client = RecognizeAllText(
+            access_key_id="test_ak",
+            access_key_secret="test_sk",
+        )
+        client._call = call
+        return client
+
+    def test_ordered_results_and_per_item_errors(self):
+        import random
+        import time
+
+        def call(request, runtime):
+            time.sleep(random.random() * 0.005)
+            if request.body["Url"].endswith("/3"):
+                raise RuntimeError("boom")
+            return RecognizeAllTextResponse(status_code=200, body=dict(request.body))
+
+        client = self._client(call)
+        images = ["https://example.com/%d" % i for i in range(20)]
+        items = list(client.recognize_many(images, max_concurrency=4, output_table=True))
+        self.assertEqual([item.index for item in items], list(range(20)))
+        self.assertFalse(items[3].ok)
+        self.assertIsInstance(items[3].error, RuntimeError)
+        self.assertIsNone(items[3].response)
+        self.assertTrue(items[4].ok)
+        # 模板中的参数已按 Utils.query 转换为字符串
+        self.assertEqual(items[4].response.body, {"Url": images[4], "OutputTable": "True"})
+
+    def test_unordered_returns_every_item(self):
+        client = self._client(lambda request, runtime: RecognizeAllTextResponse(body=dict(request.body)))
+        images = ["https://example.com/%d" % i for i in range(50)]
+        items = list(client.recognize_many(images, max_concurrency=8, ordered=False))
+        self.assertEqual(sorted(item.index for item in items), list(range(50)))
+
+    def test_input_consumed_lazily(self):
+        import threading
+        consumed = []
+        lock = threading.Lock()
+
+        def images():
+            for i in range(1000):
+                with lock:
+                    consumed.append(i)
+                yield "https://example.com/%d" % i
+
+        client = self._client(lambda request, runtime: RecognizeAllTextResponse())
+        results = client.recognize_many(images(), max_concurrency=4)
+        for _ in range(10):
+            next(results)
+        results.close()
+        # 在途请求数不超过 max_concurrency
+        self.assertLessEqual(len(consumed), 10 + 4)
+
+    def test_image_params(self):
+        import os
+        import pathlib
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as d:
+            path = pathlib.Path(d, "scan.png")
+            path.write_bytes(b"\x89PNG-data")
+            self.assertEqual(RecognizeAllText._image_params(path), {"file": os.fspath(path)})
+            self.assertEqual(RecognizeAllText._image_params(os.fspath(path)), {"file": os.fspath(path)})
+        self.assertEqual(RecognizeAllText._image_params("aGVsbG8="), {"body": "aGVsbG8="})
+        self.assertEqual(RecognizeAllText._image_params("https://example.com/a.jpg"),
+                         {"url": "https://example.com/a.jpg"})
+
+    def test_invalid_arguments(self):
+        client = self._client(lambda request, runtime: None)
+        with self.assertRaises(ValueError):
+            client.recognize_many([], max_concurrency=0)
+        with self.assertRaises(TypeError):
+            client.recognize_many([], url="https://example.com/a.jpg")
+        with self.assertRaises(TypeError):
+            client.recognize_many([], output_everything=True)
+
+
+# =========================================================================
+#  请求模板测试
+# =========================================================================
+class TestRecognizeAllTextTemplate(unittest.TestCase):
+    """测试 prepare() 返回的不可变请求模板"""
+
+    def setUp(self):
+        self.client = RecognizeAllText(
+            access_key_id="test_ak",
+            access_key_secret="test_sk",
+        )
+        self.requests = []
+
+        def call(request, runtime):
+            self.requests.append((request, runtime))
+            return RecognizeAllTextResponse(status_code=200)
+
+        self.client._call = call
+
+    def test_template_merges_image(self):
+        template = self.client.prepare(output_table=True, type="Advanced", min_size=16)
+        template.recognize(url="https://example.com/1.jpg")
+        template.recognize(body="aGVsbG8=")
+        (first, runtime1), (second, runtime2) = self.requests
+        self.assertEqual(first.body, {
+            "OutputTable": "True", "Type": "Advanced", "MinSize": "16",
+            "Url": "https://example.com/1.jpg",
+        })
+        self.assertEqual(second.body["Body"], "aGVsbG8=")
+        self.assertNotIn("Url", second.body)
+        # 运行时配置在模板内复用
+        self.assertIs(runtime1, runtime2)
+
+    def test_template_is_immutable(self):
+        template = self.client.prepare(output_table=True)
+        self.assertEqual(dict(template.options), {"output_table": True})
+        with self.assertRaises(AttributeError):
+            template._params = {}
+        with self.assertRaises(AttributeError):
+            del template._runtime
+        with self.assertRaises(TypeError):
+            template.options["type"] = "Simple"
+
+    def test_prepare_rejects_unknown_options(self):
+        with self.assertRaises(TypeError):
+            self.client.prepare(url="https://example.com/a.jpg")
+        with self.assertRaises(TypeError):
+            self.client.prepare(outputtable=True)
+
+
+# =========================================================================
+#  二进制上传测试
+# =========================================================================
+class TestRecognizeBinaryUpload(unittest.TestCase):
+    """测试 recognize_file / recognize_bytes 以 octet-stream 方式上传"""
+
+    def setUp(self):
+        self.client = RecognizeAllText(
+            access_key_id="test_ak",
+            access_key_secret="test_sk",
+        )
+        self.calls = []
+
+        def do_request(params, request, runtime):
+            self.calls.append((params, request.query, request.stream.read()))
+            return {"statusCode": 200, "headers": {}, "body": {"Data": {"Content": "ok"}}}
+
+        self.client.client.do_request = do_request
+
+    def test_recognize_bytes(self):
+        resp = self.client.recognize_bytes(b"\x89PNG-data", output_table=True, type="Advanced")
+        self.assertEqual(resp.body["Data"]["Content"], "ok")
+        params, query, payload = self.calls[0]
+        self.assertEqual(payload, b"\x89PNG-data")
+        self.assertEqual(query, {"OutputTable": "True", "Type": "Advanced"})
+        self.assertEqual(params.action, "RecognizeAllText")
+        self.assertEqual(params.req_body_type, "binary")
+
+    def test_recognize_file_path_and_fileobj(self):
+        import io
+        import pathlib
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as d:
+            path = pathlib.Path(d, "scan.png")
+            path.write_bytes(b"\x89PNG-file")
+            self.client.recognize_file(path)
+            self.client.recognize_file(str(path))
+        self.client.recognize_file(io.BytesIO(b"\x89PNG-obj"))
+        self.assertEqual([c[2] for c in self.calls], [b"\x89PNG-file", b"\x89PNG-file", b"\x89PNG-obj"])
+
+    def test_rejects_url_and_body(self):
+        with self.assertRaises(TypeError):
+            self.client.recognize_bytes(b"x", body="aGVsbG8=")
+        with self.assertRaises(TypeError):
+            self.client.recognize_file("scan.png", url="https://example.com/a.jpg")
+
+
+# =========================================================================
+#  异步会话池测试
+# =========================================================================
+class TestAsyncSessionPool(unittest.TestCase):
+    """测试 DaraCore 按端点复用 aiohttp.ClientSession"""
+
+    def _get(self, key, protocol="HTTP"):
+        return DaraCore._get_async_session(key, protocol, True, None, None, 8)
+
+    def test_session_reused_per_key(self):
+        import asyncio
+
+        async def run():
+            a = self._get(("http://a:80", True, None, None))
+            b = self._get(("http://a:80", True, None, None))
+            c = self._get(("http://b:80", True, None, None))
+            self.assertIs(a, b)
+            self.assertIsNot(a, c)
+            await DaraCore.close_async_sessions()
+            self.assertTrue(a.closed)
+            self.assertTrue(c.closed)
+            # 关闭后重新创建
+            d = self._get(("http://a:80", True, None, None))
+            self.assertIsNot(a, d)
+            await DaraCore.close_async_sessions()
+
+        asyncio.run(run())
+
+    def test_sessions_scoped_to_event_loop(self):
+        import asyncio
+
+        async def run():
+            session = self._get(("http://a:80", True, None, None))
+            await DaraCore.close_async_sessions()
+            return session
+
+        first = asyncio.run(run())
+        second = asyncio.run(run())
+        self.assertIsNot(first, second)
+
+    def test_event_loops_not_retained(self):
+        import asyncio
+        import gc
+        import weakref
+
+        loops = weakref.WeakSet()
+
+        async def run():
+            loops.add(asyncio.get_running_loop())
+            return self._get(("http://a:80", True, None, None))
+
+        # 不调用 close_async_sessions()，事件循环关闭前由 shutdown_asyncgens 关闭会话
+        for _ in range(5):
+            asyncio.run(run())
+        gc.collect()
+        self.assertEqual(len(loops), 0)
+        self.assertEqual(len(DaraCore._async_sessions), 0)
+
+        session = asyncio.run(run())
+        self.assertTrue(session.closed)
+
+    def test_manually_closed_loop_dropped(self):
+        import asyncio
+        import gc
+        import warnings
+        import weakref
+
+        async def run():
+            self._get(("http://a:80", True, None, None))
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(run())
+        loop.close()
+        ref = weakref.ref(loop)
+        del loop
+
+        async def other():
+            self._get(("http://b:80", True, None, None))
+            await DaraCore.close_async_sessions()
+
+        asyncio.run(other())
+        with warnings.catch_warnings():
+            # 已关闭的循环上的会话无法再关闭，只释放引用
+            warnings.simplefilter("ignore", ResourceWarning)
+            gc.collect()
+        self.assertIsNone(ref())
+
+    def test_https_connector_uses_ssl_context(self):
+        import asyncio
+        import ssl
+
+        async def run():
+            session = DaraCore._get_async_session(("https://a:443", True, None, "TLSv1.2"),
+                                                  "HTTPS", True, None, "TLSv1.2", 8)
+            ssl_context = session.connector._ssl
+            await DaraCore.close_async_sessions()
+            return ssl_context
+
+        ssl_context = asyncio.run(run())
+        self.assertIsInstance(ssl_context, ssl.SSLContext)
+        self.assertEqual(ssl_context.minimum_version, ssl.TLSVersion.TLSv1_2)
+
+    def test_ssl_context_shared_across_sessions(self):
+        first = DaraCore._get_ssl_context(True, None, "TLSv1.2")
+        self.assertIs(DaraCore._get_ssl_context(True, None, "TLSv1.2"), first)
+        self.assertIsNot(DaraCore._get_ssl_context(True, None, "TLSv1.3"), first)
+        self.assertIsNone(DaraCore._get_ssl_context(False, None, None))
+
+    def test_idle_sessions_evicted(self):
+        import asyncio
+        from unittest import mock
+
+        async def run():
+            core = sys.modules[DaraCore.__module__]
+            idle = DaraCore._acquire_async_session(("http://idle:80", True, None, None), "HTTP", True, None, None, 8)
+            busy = DaraCore._acquire_async_session(("http://busy:80", True, None, None), "HTTP", True, None, None, 8)
+            DaraCore._release_async_session(idle)
+            idle.last_used -= DaraCore.async_session_idle_timeout + 1
+            busy.last_used -= DaraCore.async_session_idle_timeout + 1
+            evicted = DaraCore.async_session_stats()["sessions_evicted"]
+            with mock.patch.object(core, "ASYNC_SESSION_SWEEP_INTERVAL", 0):
+                self._get(("http://other:80", True, None, None))
+            await asyncio.sleep(0)
+            self.assertTrue(idle.session.closed)
+            self.assertFalse(busy.session.closed)
+            self.assertEqual(DaraCore.async_session_stats()["sessions_evicted"], evicted + 1)
+            DaraCore._release_async_session(busy)
+            await DaraCore.close_async_sessions()
+
+        asyncio.run(run())
+
+    def test_sse_reuses_session(self):
+        import asyncio
+        from aiohttp import web
+        from mzapi.utlis.aliyunauth.darabonba.request import DaraRequest
+
+        async def handle(request):
+            return web.Response(body=b"data: {}\n\n", content_type="text/event-stream")
+
+        async def call(port):
+            request = DaraRequest()
+            request.protocol = "http"
+            request.port = port
+            request.method = "POST"
+            request.pathname = "/sse"
+            request.headers = {"host": "127.0.0.1"}
+            response = await DaraCore.async_do_sse_action(request, {})
+            chunks = [chunk async for chunk in response.body]
+            return response.body, chunks
+
+        async def run():
+            app = web.Application()
+            app.router.add_post("/sse", handle)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            try:
+                before = DaraCore.async_session_stats()
+                first, chunks = await call(port)
+                second, _ = await call(port)
+                after = DaraCore.async_session_stats()
+                self.assertEqual(b"".join(chunks), b"data: {}\n\n")
+                self.assertIs(first.session, second.session)
+                self.assertFalse(first.session.closed)
+                self.assertEqual(after["sessions_created"] - before["sessions_created"], 1)
+                self.assertEqual(after["sessions_reused"] - before["sessions_reused"], 1)
+                self.assertEqual(after["active_requests"], 0)
+            finally:
+                await DaraCore.close_async_sessions()
+                await runner.cleanup()
+
+        asyncio.run(run())
+
+    def test_sse_failure_releases_session(self):
+        import asyncio
+        import aiohttp
+        from unittest import mock
+        from mzapi.utlis.aliyunauth.darabonba.request import DaraRequest
+
+        request = DaraRequest()
+        request.protocol = "http"
+        request.port = 80
+        request.method = "POST"
+        request.pathname = "/sse"
+        request.headers = {"host": "sse.example.com"}
+
+        async def run():
+            # 非 IOError 的 aiohttp 异常与任务取消都不能让进行中计数泄漏
+            for error in (aiohttp.ServerDisconnectedError(), asyncio.CancelledError()):
+                with mock.patch.object(aiohttp.ClientSession, "request", side_effect=error):
+                    with self.assertRaises(type(error)):
+                        await DaraCore.async_do_sse_action(request, {})
+                self.assertEqual(DaraCore.async_session_stats()["active_requests"], 0)
+            await DaraCore.close_async_sessions()
+
+        asyncio.run(run())
+
+
+class TestStreamingResponse(unittest.TestCase):
+    """测试 DaraCore.do_action 的流式响应体"""
+
+    PAYLOAD = bytes(range(256)) * 4096
+
+    @classmethod
+    def setUpClass(cls):
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        payload = cls.PAYLOAD
+        peers = cls.peers = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                peers.append(self.client_address)
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        cls.server.daemon_threads = True
+        # 未读完即关闭的响应会让服务端写入失败，忽略该错误
+        cls.server.handle_error = lambda request, client_address: None
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def _call(self, runtime):
+        from mzapi.utlis.aliyunauth.darabonba.request import DaraRequest
+
+        request = DaraRequest()
+        request.protocol = "http"
+        request.port = self.server.server_address[1]
+        request.method = "GET"
+        request.pathname = "/download"
+        request.headers = {"host": "127.0.0.1"}
+        return DaraCore.do_action(request, runtime)
+
+    def test_buffered_by_default(self):
+        response = self._call({})
+        self.assertEqual(response.body, self.PAYLOAD)
+
+    def test_stream_chunks(self):
+        core = sys.modules[DaraCore.__module__]
+
+        response = self._call({"stream": True, "streamChunkSize": 100000})
+        self.assertIsInstance(response.body, core.ResponseStream)
+        chunks = list(response.body)
+        self.assertEqual(b"".join(chunks), self.PAYLOAD)
+        self.assertEqual(max(len(c) for c in chunks), 100000)
+        self.assertTrue(response.body.closed)
+
+    def test_stream_read_as_bytes_and_reuse(self):
+        from mzapi.utlis.aliyunauth.darabonba.utils.stream import Stream
+
+        first = self._call({"stream": True})
+        self.assertEqual(Stream.read_as_bytes(first.body), self.PAYLOAD)
+        second = self._call({"stream": True})
+        buf = bytearray(1024)
+        self.assertEqual(second.body.readinto(buf), 1024)
+        self.assertEqual(bytes(buf), self.PAYLOAD[:1024])
+        second.body.close()
+        # 第一个响应读完后连接归还连接池，第二个请求复用该连接
+        self.assertEqual(self.peers[-1], self.peers[-2])
+
+    def test_read_as_bytes_readable(self):
+        import io
+        from mzapi.utlis.aliyunauth.darabonba.utils.stream import Stream
+
+        self.assertEqual(Stream.read_as_bytes(io.BytesIO(self.PAYLOAD)), self.PAYLOAD)
+
+
+class TestHttp2Transport(unittest.TestCase):
+    """测试 disableHttp2 选择 requests / aiohttp 或 httpx HTTP/2 传输"""
+
+    @classmethod
+    def setUpClass(cls):
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("X-Echo", "1")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        cls.server.daemon_threads = True
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def _request(self):
+        from mzapi.utlis.aliyunauth.darabonba.request import DaraRequest
+
+        request = DaraRequest()
+        request.protocol = "http"
+        request.port = self.server.server_address[1]
+        request.method = "POST"
+        request.pathname = "/"
+        request.headers = {"host": "127.0.0.1", "content-type": "application/json"}
+        request.body = '{"a": 1}'
+        return request
+
+    def test_http1_unless_explicitly_enabled(self):
+        import requests
+
+        for runtime in ({}, {"disableHttp2": None}, {"disableHttp2": True}):
+            response = DaraCore.do_action(self._request(), runtime)
+            self.assertIsInstance(response.response, requests.Response)
+            self.assertEqual(response.body, b'{"a": 1}')
+
+    def test_sync_http2_transport(self):
+        import httpx
+
+        response = DaraCore.do_action(self._request(), {"disableHttp2": False})
+        self.assertIsInstance(response.response, httpx.Response)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["x-echo"], "1")
+        self.assertEqual(response.body, b'{"a": 1}')
+        # 同一端点复用同一个 httpx.Client
+        clients = len(DaraCore._http2_clients)
+        DaraCore.do_action(self._request(), {"disableHttp2": False})
+        self.assertEqual(len(DaraCore._http2_clients), clients)
+
+    def test_stream_stays_on_http1(self):
+        core = sys.modules[DaraCore.__module__]
+
+        response = DaraCore.do_action(self._request(), {"disableHttp2": False, "stream": True})
+        self.assertIsInstance(response.body, core.ResponseStream)
+        self.assertEqual(response.body.read(), b'{"a": 1}')
+
+    def test_async_http2_transport(self):
+        import asyncio
+        import httpx
+
+        async def run():
+            first = await DaraCore.async_do_action(self._request(), {"disableHttp2": False})
+            second = await DaraCore.async_do_action(self._request(), {"disableHttp2": False})
+            clients = list(DaraCore._async_http2_clients.get().values())
+            await DaraCore.close_async_sessions()
+            return first, second, clients
+
+        first, second, clients = asyncio.run(run())
+        self.assertIsInstance(first.response, httpx.Response)
+        self.assertEqual(second.body, b'{"a": 1}')
+        self.assertEqual(len(clients), 1)
+        self.assertTrue(clients[0].is_closed)
+
+    def test_async_file_body(self):
+        import asyncio
+        import io
+        import os
+
+        payload = os.urandom(200 * 1024)
+
+        async def run(runtime):
+            request = self._request()
+            request.body = io.BytesIO(payload)
+            request.headers["content-type"] = "application/octet-stream"
+            response = await DaraCore.async_do_action(request, runtime)
+            self.assertNotIn("content-length", request.headers)
+            return response
+
+        # 上传接口把文件对象直接作为请求体，HTTP/2 与 aiohttp 两条路径都应发送完整内容
+        for runtime in ({"disableHttp2": False}, {}):
+            response = asyncio.run(run(runtime))
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.body, payload)
+
+    def test_async_http2_loops_not_retained(self):
+        import asyncio
+        import gc
+        import weakref
+
+        loops = weakref.WeakSet()
+        clients = []
+
+        async def run():
+            loops.add(asyncio.get_running_loop())
+            await DaraCore.async_do_action(self._request(), {"disableHttp2": False})
+            clients.extend(DaraCore._async_http2_clients.get().values())
+
+        # 不调用 close_async_sessions()，由 asyncio.run() 关闭客户端
+        for _ in range(5):
+            asyncio.run(run())
+        gc.collect()
+        self.assertEqual(len(loops), 0)
+        self.assertEqual(len(DaraCore._async_http2_clients), 0)
+        self.assertEqual(len(clients), 5)
+        self.assertTrue(all(client.is_closed for client in clients))
+
+    def test_connection_error_is_retryable(self):
+        RetryError = sys.modules[DaraCore.__module__].RetryError
+
+        request = self._request()
+        request.port = 1
+        with self.assertRaises(RetryError):
+            DaraCore.do_action(request, {"disableHttp2": False, "connectTimeout": 1000})
+
+    def test_https_uses_dedicated_alpn_context(self):
+        import ssl
+
+        core = sys.modules[DaraCore.__module__]
+        options = DaraCore._http2_client_options("HTTPS", True, None, "TLSv1.2", None, 8)
+        self.assertIsInstance(options["verify"], ssl.SSLContext)
+        self.assertIsNot(options["verify"], core.get_ssl_context(tls_min_version="TLSv1.2"))
+        self.assertIs(options["verify"], DaraCore._http2_client_options("HTTPS", True, None, "TLSv1.2", None, 8)["verify"])
+
+
 # =========================================================================
 #  RPC 参数模型测试
 # =========================================================================
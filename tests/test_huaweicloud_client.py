@@ -0,0 +1,375 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-test-hwc-client-2026-qxx"
+
+"""
+huaweicloudauth.client 多终端节点故障转移与对冲请求单元测试
+
+覆盖场景：
+- 连接失败时切换到下一个节点；只配置一个节点时原样抛出，全部失败时抛出 ConnectionException
+- 对冲请求先返回的一方胜出，落败的响应被关闭 / 协程被取消
+- 4xx 同样视为节点的应答，直接返回给调用方
+- 不在 hedge_paths 中的 POST 与文件请求体不发送对冲请求
+- 同步与异步两条路径
+- 异步路径的流式响应可按 requests 的方式（raw / iter_content）消费
+"""
+
+import asyncio
+import importlib.util
+import io
+import os
+import sys
+import threading
+import time
+import types
+import unittest
+
+_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), os.pardir, "mzapi"))
+_HW_ROOT = os.path.join(_ROOT, "utlis", "huaweicloudauth")
+
+
+def _make_pkg(name, path):
+    if name in sys.modules:
+        return sys.modules[name]
+    m = types.ModuleType(name)
+    m.__path__ = [path]
+    m.__package__ = name
+    m.__loader__ = None
+    sys.modules[name] = m
+    return m
+
+
+def _load(name, filepath, pkg_name=None):
+    spec = importlib.util.spec_from_file_location(name, filepath)
+    mod = importlib.util.module_from_spec(spec)
+    if pkg_name:
+        mod.__package__ = pkg_name
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+# client 在模块级导入 bson 与 requests_toolbelt，测试只用到故障转移与对冲逻辑，缺失时注册占位模块
+try:
+    import bson  # noqa: F401
+except ImportError:
+    _bson = types.ModuleType("bson")
+    for _name in ("MinKey", "MaxKey", "Regex", "Code", "ObjectId", "Timestamp", "Decimal128"):
+        setattr(_bson, _name, type(_name, (object,), {}))
+    sys.modules["bson"] = _bson
+try:
+    import requests_toolbelt  # noqa: F401
+except ImportError:
+    _toolbelt = types.ModuleType("requests_toolbelt")
+    _toolbelt.MultipartEncoder = type("MultipartEncoder", (object,), {})
+    sys.modules["requests_toolbelt"] = _toolbelt
+
+_HW_PKG = "mzapi.utlis.huaweicloudauth"
+
+
+def _hw_modules():
+    return [name for name in sys.modules if name == _HW_PKG or name.startswith(_HW_PKG + ".")]
+
+
+# 其他测试会在 sys.modules 中注册替身模块；client 使用真实依赖加载，加载完成后恢复原状，互不影响
+_saved_modules = {name: sys.modules.pop(name) for name in _hw_modules()}
+try:
+    _make_pkg("mzapi", _ROOT)
+    _make_pkg("mzapi.utlis", os.path.join(_ROOT, "utlis"))
+    # 各子包的 __init__ 会导入全部服务模块，这里只注册空包
+    _make_pkg(_HW_PKG, _HW_ROOT)
+    for _sub in ("auth", "exceptions", "http", "region", "signer", "utils", "warning"):
+        _make_pkg(_HW_PKG + "." + _sub, os.path.join(_HW_ROOT, _sub))
+    _client_mod = _load(_HW_PKG + ".client", os.path.join(_HW_ROOT, "client.py"), pkg_name=_HW_PKG)
+    SdkError = sys.modules[_HW_PKG + ".exceptions.exceptions"].SdkError
+finally:
+    for _name in _hw_modules():
+        del sys.modules[_name]
+    sys.modules.update(_saved_modules)
+
+Client = _client_mod.Client
+HttpConfig = _client_mod.HttpConfig
+ConnectionException = _client_mod.ConnectionException
+HostUnreachableException = _client_mod.HostUnreachableException
+ClientRequestException = _client_mod.ClientRequestException
+
+_PRIMARY = "a.example.com"
+_SECONDARY = "b.example.com"
+
+
+class _Credentials(object):
+    """不签名的凭证替身"""
+
+    ak = "test-client-ak"
+
+    def get_update_path_params(self):
+        return {}
+
+    def process_auth_request_sync(self, request, http_client):
+        return request
+
+    async def process_auth_request_async(self, request, http_client):
+        return request
+
+
+class _Response(object):
+
+    def __init__(self, host):
+        self.host = host
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class _Transport(object):
+    """按主机决定行为的传输层替身：behaviors[host] = (延迟秒数, 异常或 None)"""
+
+    def __init__(self, behaviors):
+        self.behaviors = behaviors
+        self.calls = []
+        self.responses = []
+        self.cancelled = []
+        self._lock = threading.Lock()
+
+    def _respond(self, host):
+        error = self.behaviors[host][1]
+        if error is not None:
+            raise error
+        response = _Response(host)
+        with self._lock:
+            self.responses.append(response)
+        return response
+
+    def send(self, request):
+        with self._lock:
+            self.calls.append(request.host)
+        time.sleep(self.behaviors[request.host][0])
+        return self._respond(request.host)
+
+    async def async_do_request(self, request):
+        self.calls.append(request.host)
+        try:
+            await asyncio.sleep(self.behaviors[request.host][0])
+        except asyncio.CancelledError:
+            self.cancelled.append(request.host)
+            raise
+        return self._respond(request.host)
+
+    def close(self):
+        pass
+
+
+def _client_error():
+    return ClientRequestException(400, SdkError(request_id="rid", error_code="OCR.0001", error_msg="bad image"))
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class _Base(unittest.TestCase):
+
+    def _client(self, behaviors, hedge=False, hosts=(_PRIMARY, _SECONDARY)):
+        config = HttpConfig(hedge_requests=hedge, hedge_min_delay=0.05)
+        client = Client().with_config(config).with_credentials(_Credentials()) \
+            .with_endpoints(["https://" + host for host in hosts])
+        transport = _Transport(behaviors)
+        client._http_client = transport
+        client._do_http_request_sync = transport.send
+        client.sync_response_handler = lambda response, *args: response
+        # 让第一个节点成为主节点，并积累足够的延迟样本以启用对冲
+        for _ in range(25):
+            client._endpoint_selector.record(0, 0.01)
+        for index in range(1, len(hosts)):
+            client._endpoint_selector.record(index, 0.02)
+        self.addCleanup(client.close)
+        return client, transport
+
+
+class TestFailover(_Base):
+
+    def test_switches_to_next_endpoint(self):
+        client, transport = self._client({_PRIMARY: (0, HostUnreachableException("a down")),
+                                          _SECONDARY: (0, None)})
+        self.assertEqual(client.do_http_request("GET", "/v1/x").host, _SECONDARY)
+        self.assertEqual(transport.calls, [_PRIMARY, _SECONDARY])
+        # 连接失败的节点进入冷却期，下一次直接选择健康节点
+        client.do_http_request("GET", "/v1/x")
+        self.assertEqual(transport.calls[-1], _SECONDARY)
+
+    def test_lone_failure_reraised(self):
+        error = HostUnreachableException("a down")
+        client, _ = self._client({_PRIMARY: (0, error)}, hosts=(_PRIMARY,))
+        with self.assertRaises(HostUnreachableException) as ctx:
+            client.do_http_request("GET", "/v1/x")
+        self.assertIs(ctx.exception, error)
+
+    def test_all_endpoints_fail(self):
+        client, transport = self._client({_PRIMARY: (0, HostUnreachableException("a down")),
+                                          _SECONDARY: (0, HostUnreachableException("b down"))})
+        with self.assertRaises(ConnectionException) as ctx:
+            client.do_http_request("GET", "/v1/x")
+        self.assertNotIsInstance(ctx.exception, HostUnreachableException)
+        self.assertIn("a down", str(ctx.exception))
+        self.assertIn("b down", str(ctx.exception))
+        self.assertEqual(sorted(transport.calls), [_PRIMARY, _SECONDARY])
+
+    def test_client_error_not_failed_over(self):
+        client, transport = self._client({_PRIMARY: (0, _client_error()), _SECONDARY: (0, None)})
+        with self.assertRaises(ClientRequestException):
+            client.do_http_request("GET", "/v1/x")
+        self.assertEqual(transport.calls, [_PRIMARY])
+
+    def test_async_switches_to_next_endpoint(self):
+        client, transport = self._client({_PRIMARY: (0, HostUnreachableException("a down")),
+                                          _SECONDARY: (0, None)})
+        response = asyncio.run(client.do_http_request_async("GET", "/v1/x"))
+        self.assertEqual(response.host, _SECONDARY)
+        self.assertEqual(transport.calls, [_PRIMARY, _SECONDARY])
+
+    def test_async_all_endpoints_fail(self):
+        client, _ = self._client({_PRIMARY: (0, HostUnreachableException("a down")),
+                                  _SECONDARY: (0, HostUnreachableException("b down"))})
+        with self.assertRaises(ConnectionException) as ctx:
+            asyncio.run(client.do_http_request_async("GET", "/v1/x"))
+        self.assertNotIsInstance(ctx.exception, HostUnreachableException)
+
+
+class TestHedging(_Base):
+
+    def test_hedge_wins_and_loser_closed(self):
+        client, transport = self._client({_PRIMARY: (0.3, None), _SECONDARY: (0, None)}, hedge=True)
+        start = time.monotonic()
+        response = client.do_http_request("GET", "/v1/x")
+        self.assertLess(time.monotonic() - start, 0.25)
+        self.assertEqual(response.host, _SECONDARY)
+        self.assertFalse(response.closed)
+        stats = client.endpoint_stats()
+        self.assertEqual((stats["hedged"], stats["hedge_wins"]), (1, 1))
+        # 主节点的响应随后到达并被关闭
+        self.assertTrue(_wait_until(lambda: len(transport.responses) == 2))
+        loser = next(r for r in transport.responses if r.host == _PRIMARY)
+        self.assertTrue(_wait_until(lambda: loser.closed))
+
+    def test_fast_primary_not_hedged(self):
+        client, transport = self._client({_PRIMARY: (0, None), _SECONDARY: (0, None)}, hedge=True)
+        self.assertEqual(client.do_http_request("GET", "/v1/x").host, _PRIMARY)
+        self.assertEqual(transport.calls, [_PRIMARY])
+        self.assertEqual(client.endpoint_stats()["hedged"], 0)
+
+    def test_client_error_is_an_answer(self):
+        client, _ = self._client({_PRIMARY: (0.3, None), _SECONDARY: (0, _client_error())}, hedge=True)
+        start = time.monotonic()
+        with self.assertRaises(ClientRequestException):
+            client.do_http_request("GET", "/v1/x")
+        self.assertLess(time.monotonic() - start, 0.25)
+        self.assertEqual(client.endpoint_stats()["hedge_wins"], 1)
+
+    def test_post_outside_hedge_paths_not_hedged(self):
+        client, transport = self._client({_PRIMARY: (0.2, None), _SECONDARY: (0, None)}, hedge=True)
+        self.assertEqual(client.do_http_request("POST", "/v1/orders", body={}).host, _PRIMARY)
+        self.assertEqual(transport.calls, [_PRIMARY])
+        self.assertEqual(client.endpoint_stats()["hedged"], 0)
+
+    def test_post_on_hedge_path_hedged(self):
+        client, _ = self._client({_PRIMARY: (0.3, None), _SECONDARY: (0, None)}, hedge=True)
+        response = client.do_http_request("POST", "/v2/{project_id}/ocr/general-text", body={})
+        self.assertEqual(response.host, _SECONDARY)
+
+    def test_file_body_not_hedged(self):
+        client, _ = self._client({}, hedge=True)
+        path = "/v2/{project_id}/ocr/general-text"
+        self.assertTrue(client._should_hedge("POST", path, None, {}))
+        self.assertFalse(client._should_hedge("POST", path, None, io.BytesIO(b"image")))
+        self.assertFalse(client._should_hedge("PUT", path, None, {}))
+
+    def test_async_hedge_wins_and_loser_cancelled(self):
+        client, transport = self._client({_PRIMARY: (0.3, None), _SECONDARY: (0, None)}, hedge=True)
+
+        async def run():
+            start = time.monotonic()
+            response = await client.do_http_request_async("GET", "/v1/x")
+            elapsed = time.monotonic() - start
+            # 让被取消的协程执行完清理
+            await asyncio.sleep(0)
+            return response, elapsed
+
+        response, elapsed = asyncio.run(run())
+        self.assertLess(elapsed, 0.25)
+        self.assertEqual(response.host, _SECONDARY)
+        self.assertEqual(transport.cancelled, [_PRIMARY])
+        stats = client.endpoint_stats()
+        self.assertEqual((stats["hedged"], stats["hedge_wins"]), (1, 1))
+
+    def test_async_client_error_is_an_answer(self):
+        client, transport = self._client({_PRIMARY: (0.3, None), _SECONDARY: (0, _client_error())}, hedge=True)
+
+        async def run():
+            try:
+                await client.do_http_request_async("GET", "/v1/x")
+            finally:
+                await asyncio.sleep(0)
+
+        with self.assertRaises(ClientRequestException):
+            asyncio.run(run())
+        self.assertEqual(transport.cancelled, [_PRIMARY])
+        self.assertEqual(client.endpoint_stats()["hedge_wins"], 1)
+
+    def test_async_post_outside_hedge_paths_not_hedged(self):
+        client, transport = self._client({_PRIMARY: (0.2, None), _SECONDARY: (0, None)}, hedge=True)
+        response = asyncio.run(client.do_http_request_async("POST", "/v1/orders", body={}))
+        self.assertEqual(response.host, _PRIMARY)
+        self.assertEqual(transport.calls, [_PRIMARY])
+
+
+class TestAsyncStreamResponse(unittest.TestCase):
+
+    def test_download_stream_is_requests_compatible(self):
+        import httpx
+
+        class DownloadResponse(_client_mod.SdkStreamResponse):
+            pass
+
+        body = b"\x89PNG" + bytes(range(256)) * 64
+
+        class Transport(_Transport):
+            async def async_do_request(self, request):
+                return httpx.Response(200, headers={"Content-Type": "application/octet-stream"}, content=body,
+                                      request=httpx.Request("GET", "https://%s/v1/file" % request.host))
+
+        client = Client().with_config(HttpConfig()).with_credentials(_Credentials()) \
+            .with_endpoints(["https://" + _PRIMARY])
+        client._http_client = Transport({})
+        client.model_package = types.SimpleNamespace(DownloadResponse=DownloadResponse)
+        self.addCleanup(client.close)
+
+        response = asyncio.run(client.do_http_request_async("GET", "/v1/file", response_type="DownloadResponse"))
+        self.assertIsInstance(response, DownloadResponse)
+        self.assertEqual(response.status_code, 200)
+        chunks = []
+        response.consume_download_stream(lambda stream: chunks.extend(stream.iter_content(1024)))
+        self.assertEqual(b"".join(chunks), body)
+        self.assertGreater(len(chunks), 1)
+        raw = []
+        response.consume_download_stream(lambda stream: raw.append(stream.raw.read()))
+        self.assertEqual(raw, [body])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,10 +21,19 @@ huaweicloudauth.auth.credentials 模块单元测试
 - with_* 链式调用
 - get_update_path_params
 - sign_request 流程（mock signer 依赖）
+- process_auth_request 同步内联签名 / 线程池签名
 - ak/setter 校验
+- process_auth_params 项目 ID 查询：并发只查询一次、持久化缓存命中与写入
+- STS 刷新 single-flight：临近过期时并发请求只刷新一次、提前量内后台刷新、异步刷新与统计
+- STS 刷新整体替换 AK/SK/安全令牌，签名使用同一份快照
 """
 
+import asyncio
 import importlib.util
+import json
+import tempfile
+import threading
+import time
 import os
 import sys
 import types
@@ -323,6 +332,27 @@ class TestCredentialsBase(unittest.TestCase):
         result = cred.sign_request(req)
         self.assertEqual(result.header_params["X-Security-Token"], "token123")
 
+    def test_process_auth_request_sync_signs_inline(self):
+        cred = Credentials(ak="ak", sk="sk")
+        cred.security_token = "token123"
+        http_client = MagicMock()
+        req = SdkRequest(
+            method="GET", schema="https", host="api.example.com", uri="/",
+            header_params={},
+        )
+        result = cred.process_auth_request_sync(req, http_client)
+        self.assertIs(result, req)
+        self.assertEqual(result.header_params["X-Security-Token"], "token123")
+        http_client.executor.submit.assert_not_called()
+
+    def test_process_auth_request_uses_executor(self):
+        cred = Credentials(ak="ak", sk="sk")
+        http_client = MagicMock()
+        req = SdkRequest(method="GET", schema="https", host="api.example.com", uri="/", header_params={})
+        future = cred.process_auth_request(req, http_client)
+        self.assertIs(future, http_client.executor.submit.return_value)
+        http_client.executor.submit.assert_called_once_with(cred.sign_request, req)
+
     def test_with_derived_predicate(self):
         cred = Credentials(ak="ak", sk="sk")
         pred = lambda req: True
@@ -345,5 +375,210 @@ class TestCredentialsBase(unittest.TestCase):
         self.assertEqual(cred.id_token_file, "/path/to/token")
 
 
+class TestProjectIdResolution(unittest.TestCase):
+    """测试 BasicCredentials.process_auth_params 的项目 ID 查询与缓存"""
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, "cache.json")
+        BasicCredentials._CACHE.clear()
+        self.addCleanup(BasicCredentials._CACHE.clear)
+        patcher = patch.object(
+            _auth_internal_mod.IamHelper, "get_keystone_list_projects_request",
+            side_effect=lambda *args, **kwargs: SdkRequest(method="GET", schema="https", host="iam.example.com",
+                                                           uri="/v3/projects", header_params={}))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _http_client(self, delay=0.0):
+        http_client = MagicMock()
+
+        def do_request_sync(request):
+            time.sleep(delay)
+            response = MagicMock()
+            response.content = json.dumps({"projects": [{"id": "project-1"}]})
+            return response
+
+        http_client.do_request_sync.side_effect = do_request_sync
+        return http_client
+
+    def test_concurrent_lookup_is_single_flight(self):
+        http_client = self._http_client(delay=0.05)
+        creds = [BasicCredentials("ak", "sk") for _ in range(6)]
+        threads = [threading.Thread(target=c.process_auth_params, args=(http_client, "cn-north-4")) for c in creds]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(http_client.do_request_sync.call_count, 1)
+        self.assertEqual({c.project_id for c in creds}, {"project-1"})
+
+    def test_persistent_cache_skips_iam(self):
+        http_client = self._http_client()
+        BasicCredentials("ak", "sk").with_project_id_cache(self.path).process_auth_params(http_client, "cn-north-4")
+        self.assertEqual(http_client.do_request_sync.call_count, 1)
+
+        # 模拟新进程：进程内缓存为空，从文件读取
+        BasicCredentials._CACHE.clear()
+        cred = BasicCredentials("ak", "sk").with_project_id_cache(self.path)
+        cred.process_auth_params(http_client, "cn-north-4")
+        self.assertEqual(cred.project_id, "project-1")
+        self.assertEqual(http_client.do_request_sync.call_count, 1)
+
+    def test_persistent_cache_write_failure_is_logged(self):
+        http_client = self._http_client()
+        blocker = os.path.join(self._dir.name, "file")
+        open(blocker, "w").close()
+        cred = BasicCredentials("ak", "sk").with_project_id_cache(os.path.join(blocker, "cache.json"))
+        cred.process_auth_params(http_client, "cn-north-4")
+        self.assertEqual(cred.project_id, "project-1")
+        http_client.logger.warning.assert_called_once()
+
+
+class _FakeAccessor:
+    """计数的 StsAccessor 替身，每次返回有效期 ttl 秒的新凭证"""
+
+    def __init__(self, ttl=3600, delay=0.0, fail=False):
+        self.ttl = ttl
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.event = threading.Event()
+
+    def get_credential(self, **kwargs):
+        self.calls += 1
+        time.sleep(self.delay)
+        self.event.set()
+        if self.fail:
+            raise RuntimeError("sts unavailable")
+        credential = MagicMock()
+        credential.access = "ak%d" % self.calls
+        credential.secret = "sk%d" % self.calls
+        credential.security_token = "token%d" % self.calls
+        credential.expire_at = _now() + self.ttl
+        return credential
+
+
+def _now():
+    return sys.modules["mzapi.utlis.huaweicloudauth.utils.time_utils"].get_timestamp_utc()
+
+
+class TestStsRefresh(unittest.TestCase):
+    """测试 STS 临时凭证 single-flight 刷新"""
+
+    def _credentials(self, accessor, expire_in):
+        cred = Credentials()
+        cred.sts_accessor = accessor
+        cred._expire_at = _now() + expire_in
+        return cred
+
+    def test_concurrent_blocking_refresh_is_single_flight(self):
+        accessor = _FakeAccessor(delay=0.1)
+        cred = self._credentials(accessor, -10)
+        threads = [threading.Thread(target=cred.process_sts, args=(None,)) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(accessor.calls, 1)
+        self.assertEqual(cred.ak, "ak1")
+        self.assertEqual(cred.security_token, "token1")
+        self.assertEqual(cred.sts_refresh_stats()["refreshes"], 1)
+
+    def test_refresh_within_lead_runs_in_background(self):
+        accessor = _FakeAccessor(delay=0.1)
+        cred = self._credentials(accessor, 20 * 60).with_ak("old-ak").with_sk("old-sk")
+        start = time.monotonic()
+        for _ in range(5):
+            cred.process_sts(None)
+        self.assertLess(time.monotonic() - start, 0.1)
+        self.assertEqual(cred.ak, "old-ak")
+        self.assertTrue(accessor.event.wait(1))
+        with cred._sts_lock:
+            pass
+        self.assertEqual(accessor.calls, 1)
+        self.assertEqual(cred.ak, "ak1")
+        stats = cred.sts_refresh_stats()
+        self.assertEqual(stats["background_refreshes"], 1)
+        self.assertGreater(stats["last_latency"], 0)
+
+    def test_no_refresh_outside_lead(self):
+        accessor = _FakeAccessor()
+        cred = self._credentials(accessor, 20 * 60).with_sts_refresh_lead(10 * 60)
+        cred.process_sts(None)
+        self.assertEqual(accessor.calls, 0)
+
+    def test_background_failure_keeps_old_credential(self):
+        accessor = _FakeAccessor(fail=True)
+        cred = self._credentials(accessor, 20 * 60).with_ak("old-ak").with_sk("old-sk")
+        http_client = MagicMock()
+        cred.process_sts(http_client)
+        self.assertTrue(accessor.event.wait(1))
+        with cred._sts_lock:
+            pass
+        self.assertEqual(cred.ak, "old-ak")
+        self.assertEqual(cred.sts_refresh_stats()["failures"], 1)
+        http_client.logger.warning.assert_called_once()
+
+    def test_blocking_failure_raises(self):
+        cred = self._credentials(_FakeAccessor(fail=True), -10)
+        with self.assertRaises(RuntimeError):
+            cred.process_sts(None)
+        self.assertEqual(cred.sts_refresh_stats()["failures"], 1)
+
+    def test_process_sts_async(self):
+        accessor = _FakeAccessor(delay=0.05)
+        cred = self._credentials(accessor, -10)
+
+        async def run():
+            await asyncio.gather(*(cred.process_sts_async(None) for _ in range(5)))
+
+        asyncio.run(run())
+        self.assertEqual(accessor.calls, 1)
+        self.assertEqual(cred.sk, "sk1")
+
+    def test_sign_request_uses_one_snapshot(self):
+        cred = self._credentials(_FakeAccessor(), -10)
+        cred.process_sts(None)
+        seen = []
+
+        class _RefreshingSigner(_MockSigner):
+            def sign(self, request):
+                # 签名过程中另一线程完成了 STS 刷新
+                cred._refresh_sts(None)
+                seen.append((self.credentials.ak, self.credentials.sk))
+                return request
+
+        req = SdkRequest(method="GET", schema="https", host="api.example.com", uri="/", header_params={})
+        with patch.dict(Credentials._SIGNER_CASE, {k: _RefreshingSigner for k in Credentials._SIGNER_CASE}):
+            result = cred.sign_request(req)
+        self.assertEqual(seen, [("ak1", "sk1")])
+        self.assertEqual(result.header_params["X-Security-Token"], "token1")
+        self.assertEqual((cred.ak, cred.sk, cred.security_token), ("ak2", "sk2", "token2"))
+
+    def test_refresh_with_empty_key_keeps_old_credential(self):
+        accessor = _FakeAccessor()
+        cred = self._credentials(accessor, -10)
+        cred.process_sts(None)
+        get_credential = accessor.get_credential
+
+        def empty_access(**kwargs):
+            credential = get_credential(**kwargs)
+            credential.access = ""
+            return credential
+
+        accessor.get_credential = empty_access
+        with self.assertRaises(ValueError):
+            cred._refresh_sts(None)
+        self.assertEqual((cred.ak, cred.sk, cred.security_token), ("ak1", "sk1", "token1"))
+
+    def test_refresh_lead_validation(self):
+        with self.assertRaises(ValueError):
+            Credentials(ak="ak", sk="sk").with_sts_refresh_lead(-1)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,151 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-test-hwc-endpoint-selector-2026-qxx"
+
+"""
+huaweicloudauth.http.endpoint_selector 模块单元测试
+
+覆盖场景：
+- 无样本节点优先探测，之后选择 EWMA 延迟最低的节点
+- 错误率抬高节点得分
+- 连接失败后的冷却期与指数延长，全部冷却时选择最早恢复的节点
+- exclude / healthy_only
+- 延迟分位数与样本数门槛
+"""
+
+import importlib.util
+import os
+import unittest
+from unittest import mock
+
+_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), os.pardir, "mzapi"))
+
+_spec = importlib.util.spec_from_file_location(
+    "mzapi_hwc_endpoint_selector", os.path.join(_ROOT, "core", "huaweicloudauth", "http", "endpoint_selector.py"))
+_selector_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_selector_mod)
+
+EndpointSelector = _selector_mod.EndpointSelector
+
+
+class _Clock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+class TestEndpointSelector(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = _Clock()
+        patcher = mock.patch.object(_selector_mod, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_single_endpoint(self):
+        selector = EndpointSelector(1)
+        self.assertEqual(selector.select(), 0)
+        self.assertIsNone(selector.select(exclude=[0]))
+
+    def test_probe_then_fastest(self):
+        selector = EndpointSelector(3)
+        self.assertEqual(selector.select(), 0)
+        selector.record(0, 0.2)
+        self.assertEqual(selector.select(), 1)
+        selector.record(1, 0.05)
+        self.assertEqual(selector.select(), 2)
+        selector.record(2, 0.1)
+        self.assertEqual(selector.select(), 1)
+
+    def test_ewma_tracks_degradation(self):
+        selector = EndpointSelector(2, alpha=0.5)
+        selector.record(0, 0.05)
+        selector.record(1, 0.1)
+        self.assertEqual(selector.select(), 0)
+        for _ in range(3):
+            selector.record(0, 0.5)
+        self.assertEqual(selector.select(), 1)
+        self.assertAlmostEqual(selector.stats()[0]["latency"], 0.44375)
+
+    def test_errors_raise_score(self):
+        selector = EndpointSelector(2)
+        selector.record(0, 0.05)
+        selector.record(1, 0.08)
+        for _ in range(3):
+            selector.record(0, 0.05, ok=False)
+        self.assertEqual(selector.select(), 1)
+        self.assertGreater(selector.stats()[0]["error_rate"], 0.4)
+
+    def test_failure_cooldown(self):
+        selector = EndpointSelector(2, failure_cooldown=10)
+        selector.record(0, 0.01)
+        selector.record(1, 0.5)
+        selector.record_failure(0)
+        self.assertEqual(selector.select(), 1)
+        self.assertFalse(selector.stats()[0]["healthy"])
+        self.clock.now += 10
+        self.assertEqual(selector.select(), 0)
+
+        # 连续失败冷却期翻倍
+        selector.record_failure(0)
+        self.clock.now += 10
+        self.assertEqual(selector.select(), 1)
+        self.clock.now += 10
+        self.assertEqual(selector.select(), 0)
+
+        # 成功后失败计数清零
+        selector.record(0, 0.01)
+        selector.record_failure(0)
+        self.clock.now += 10
+        self.assertEqual(selector.select(), 0)
+
+    def test_all_down_picks_earliest_recovery(self):
+        selector = EndpointSelector(2, failure_cooldown=10)
+        selector.record_failure(0)
+        selector.record_failure(0)
+        selector.record_failure(1)
+        self.assertEqual(selector.select(), 1)
+        self.assertIsNone(selector.select(healthy_only=True))
+        self.assertIsNone(selector.select(exclude=[1], healthy_only=True))
+        self.assertEqual(selector.select(exclude=[1]), 0)
+
+    def test_percentile(self):
+        selector = EndpointSelector(2)
+        for i in range(_selector_mod.MIN_PERCENTILE_SAMPLES - 1):
+            selector.record(i % 2, 0.01 * (i + 1))
+        self.assertIsNone(selector.percentile(95))
+        selector.record(0, 0.2)
+        self.assertAlmostEqual(selector.percentile(95), 0.2)
+        self.assertAlmostEqual(selector.percentile(50), 0.11)
+
+    def test_stats(self):
+        selector = EndpointSelector(2)
+        selector.record(0, 0.1)
+        selector.record_failure(1)
+        stats = selector.stats()
+        self.assertEqual(stats[0], {"latency": 0.1, "error_rate": 0.0, "requests": 1, "healthy": True})
+        self.assertEqual(stats[1]["requests"], 1)
+        self.assertIsNone(stats[1]["latency"])
+        self.assertFalse(stats[1]["healthy"])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            EndpointSelector(0)
+        with self.assertRaises(ValueError):
+            EndpointSelector(2, alpha=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,258 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-test-hwc-http-client-2026-qxx"
+
+"""
+huaweicloudauth.http.http_client 模块单元测试
+
+覆盖场景：
+- 线程池注入与自建线程池的生命周期
+- async_do_request 协程发送（httpx.MockTransport），事件循环关闭时释放连接池
+- 请求体转换与异常映射
+"""
+
+import asyncio
+import importlib.util
+import io
+import logging
+import os
+import socket
+import sys
+import types
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), os.pardir, "mzapi"))
+_HW_ROOT = os.path.join(_ROOT, "utlis", "huaweicloudauth")
+
+
+def _make_pkg(name, path):
+    if name in sys.modules:
+        return sys.modules[name]
+    m = types.ModuleType(name)
+    m.__path__ = [path]
+    m.__package__ = name
+    m.__loader__ = None
+    sys.modules[name] = m
+    return m
+
+
+def _load(name, filepath, pkg_name=None):
+    spec = importlib.util.spec_from_file_location(name, filepath)
+    mod = importlib.util.module_from_spec(spec)
+    if pkg_name:
+        mod.__package__ = pkg_name
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+_make_pkg("mzapi", _ROOT)
+_make_pkg("mzapi.utlis", os.path.join(_ROOT, "utlis"))
+_make_pkg("mzapi.utlis.huaweicloudauth", _HW_ROOT)
+_make_pkg("mzapi.utlis.huaweicloudauth.signer", os.path.join(_HW_ROOT, "signer"))
+_make_pkg("mzapi.utlis.huaweicloudauth.utils", os.path.join(_HW_ROOT, "utils"))
+_make_pkg("mzapi.utlis.huaweicloudauth.exceptions", os.path.join(_HW_ROOT, "exceptions"))
+_make_pkg("mzapi.utlis.huaweicloudauth.http", os.path.join(_HW_ROOT, "http"))
+
+for _name, _path in (
+        ("signer.algorithm", ("signer", "algorithm.py")),
+        ("utils.six_utils", ("utils", "six_utils.py")),
+        ("exceptions.exceptions", ("exceptions", "exceptions.py")),
+        ("exceptions.exception_handler", ("exceptions", "exception_handler.py")),
+        ("sdk_request", ("sdk_request.py",)),
+        ("http.http_config", ("http", "http_config.py")),
+        ("http.future_session", ("http", "future_session.py")),
+):
+    _full = "mzapi.utlis.huaweicloudauth." + _name
+    _load(_full, os.path.join(_HW_ROOT, *_path), pkg_name=_full.rsplit(".", 1)[0])
+
+_hc_mod = _load(
+    "mzapi.utlis.huaweicloudauth.http.http_client",
+    os.path.join(_HW_ROOT, "http", "http_client.py"),
+    pkg_name="mzapi.utlis.huaweicloudauth.http",
+)
+
+HttpClient = _hc_mod.HttpClient
+HttpConfig = sys.modules["mzapi.utlis.huaweicloudauth.http.http_config"].HttpConfig
+SdkRequest = sys.modules["mzapi.utlis.huaweicloudauth.sdk_request"].SdkRequest
+exceptions = sys.modules["mzapi.utlis.huaweicloudauth.exceptions.exceptions"]
+DefaultExceptionHandler = sys.modules[
+    "mzapi.utlis.huaweicloudauth.exceptions.exception_handler"].DefaultExceptionHandler
+
+_LOGGER = logging.getLogger("test-hwc-http-client")
+
+
+def _client(handler=None, **config):
+    client = HttpClient(HttpConfig(**config), None, DefaultExceptionHandler(), _LOGGER)
+    if handler is not None:
+        client._new_async_client = lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def _request(body=None, method="POST"):
+    return SdkRequest(method=method, schema="https", host="ocr.cn-north-4.myhuaweicloud.com",
+                      resource_path="/v2/p/ocr/general-text", uri="/v2/p/ocr/general-text", query_params=[],
+                      header_params={"Content-Type": "application/json"}, body=body)
+
+
+class TestHttpClientExecutor(unittest.TestCase):
+    """测试线程池配置"""
+
+    def test_default_executor_size(self):
+        client = _client(executor_max_workers=3)
+        self.assertEqual(client.executor._max_workers, 3)
+        client.close()
+        self.assertTrue(client.executor._shutdown)
+
+    def test_injected_executor_shared_and_not_closed(self):
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            first = _client(executor=executor)
+            second = _client(executor=executor)
+            self.assertIs(first.executor, executor)
+            self.assertIs(second.executor, executor)
+            first.close()
+            self.assertEqual(executor.submit(lambda: 1).result(), 1)
+        finally:
+            executor.shutdown()
+
+
+class TestHttpClientAsync(unittest.TestCase):
+    """测试 async_do_request"""
+
+    def test_sends_signed_request(self):
+        seen = {}
+
+        def handler(request):
+            seen["method"] = request.method
+            seen["url"] = str(request.url)
+            seen["body"] = request.content
+            seen["content_type"] = request.headers["Content-Type"]
+            return httpx.Response(200, json={"result": "ok"})
+
+        client = _client(handler)
+
+        async def run():
+            try:
+                return await client.async_do_request(_request('{"url": "x"}'))
+            finally:
+                await client.aclose()
+
+        response = asyncio.run(run())
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"result": "ok"})
+        self.assertEqual(seen["method"], "POST")
+        self.assertEqual(seen["url"], "https://ocr.cn-north-4.myhuaweicloud.com/v2/p/ocr/general-text")
+        self.assertEqual(seen["body"], b'{"url": "x"}')
+        self.assertEqual(seen["content_type"], "application/json")
+
+    def test_reuses_client_per_loop(self):
+        client = _client(lambda request: httpx.Response(200))
+
+        async def run():
+            await client.async_do_request(_request())
+            first = client._get_async_client()
+            await client.async_do_request(_request())
+            self.assertIs(client._get_async_client(), first)
+            await client.aclose()
+
+        asyncio.run(run())
+
+    def test_event_loops_not_retained(self):
+        import gc
+        import weakref
+
+        client = _client(lambda request: httpx.Response(200))
+        loops = weakref.WeakSet()
+        async_clients = []
+
+        async def run():
+            loops.add(asyncio.get_running_loop())
+            await client.async_do_request(_request())
+            async_clients.append(client._get_async_client())
+
+        # 不调用 aclose()，由 asyncio.run() 关闭连接池
+        for _ in range(5):
+            asyncio.run(run())
+        gc.collect()
+        self.assertEqual(len(loops), 0)
+        self.assertEqual(len(client._async_clients), 0)
+        self.assertEqual(len(set(map(id, async_clients))), 5)
+        self.assertTrue(all(c.is_closed for c in async_clients))
+
+    def test_many_in_flight(self):
+        async def handler(request):
+            await asyncio.sleep(0.01)
+            return httpx.Response(200)
+
+        client = _client(handler)
+
+        async def run():
+            responses = await asyncio.gather(*(client.async_do_request(_request()) for _ in range(200)))
+            await client.aclose()
+            return responses
+
+        self.assertEqual(len(asyncio.run(run())), 200)
+
+    def test_error_status_raises_client_exception(self):
+        client = _client(lambda request: httpx.Response(
+            400, headers={"X-Request-Id": "rid"}, json={"error_code": "OCR.0001", "error_msg": "bad image"}))
+        with self.assertRaises(exceptions.ClientRequestException) as ctx:
+            asyncio.run(client.async_do_request(_request()))
+        self.assertEqual(ctx.exception.error_code, "OCR.0001")
+        self.assertEqual(ctx.exception.request_id, "rid")
+
+    def test_dns_failure_maps_to_host_unreachable(self):
+        def handler(request):
+            try:
+                raise socket.gaierror(-2, "Name or service not known")
+            except socket.gaierror as e:
+                raise httpx.ConnectError(str(e), request=request) from e
+
+        with self.assertRaises(exceptions.HostUnreachableException):
+            asyncio.run(_client(handler).async_do_request(_request()))
+
+    def test_timeout_maps_to_call_timeout(self):
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        with self.assertRaises(exceptions.CallTimeoutException):
+            asyncio.run(_client(handler).async_do_request(_request()))
+
+    def test_file_body_streamed_with_length(self):
+        seen = {}
+
+        def handler(request):
+            seen["length"] = request.headers.get("Content-Length")
+            seen["body"] = request.read()
+            return httpx.Response(200)
+
+        body = io.BytesIO(b"x" * 200000)
+        asyncio.run(_client(handler).async_do_request(_request(body)))
+        self.assertEqual(seen["length"], "200000")
+        self.assertEqual(seen["body"], b"x" * 200000)
+
+    def test_form_body_urlencoded(self):
+        self.assertEqual(HttpClient._async_content({"a": "1", "b": ["x", "y"]}, {}), "a=1&b=x&b=y")
+        self.assertEqual(HttpClient._async_content([("a", "1")], {}), "a=1")
+
+    def test_ignore_ssl_verification(self):
+        ctx = _client(ignore_ssl_verification=True)._ssl_context()
+        self.assertFalse(ctx.check_hostname)
+
+
+if __name__ == "__main__":
+    unittest.main()
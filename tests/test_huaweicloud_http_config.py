@@ -124,6 +124,18 @@ class TestHttpConfigDefaults(unittest.TestCase):
         cfg = HttpConfig()
         self.assertIsNone(cfg.user_agent)
 
+    def test_default_executor_settings(self):
+        cfg = HttpConfig()
+        self.assertIsNone(cfg.executor)
+        self.assertEqual(cfg.executor_max_workers, 8)
+        self.assertEqual(cfg.async_pool_maxsize, 256)
+
+    def test_default_hedge_settings(self):
+        cfg = HttpConfig()
+        self.assertFalse(cfg.hedge_requests)
+        self.assertEqual(cfg.hedge_min_delay, 0.05)
+        self.assertEqual(cfg.hedge_paths, ("/ocr/",))
+
     def test_get_default_config(self):
         cfg = HttpConfig.get_default_config()
         self.assertIsInstance(cfg, HttpConfig)
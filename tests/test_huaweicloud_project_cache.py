@@ -0,0 +1,108 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-test-hwc-project-cache-2026-qxx"
+
+"""
+huaweicloudauth.auth.project_cache 模块单元测试
+
+覆盖场景：
+- 写入后读取、按 (principal, 区域) 区分
+- TTL 过期、写入时清理过期条目
+- 文件不存在 / 内容损坏时视为空缓存
+- 文件中不出现 AK，文件权限 0600
+- from_env 解析环境变量
+"""
+
+import importlib.util
+import json
+import os
+import stat
+import tempfile
+import unittest
+from unittest.mock import patch
+
+_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), os.pardir, "mzapi"))
+
+_spec = importlib.util.spec_from_file_location(
+    "mzapi_hwc_project_cache", os.path.join(_ROOT, "core", "huaweicloudauth", "auth", "project_cache.py"))
+_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_mod)
+
+ProjectIdCache = _mod.ProjectIdCache
+
+
+class TestProjectIdCache(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._dir.name, "sub", "cache.json")
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def test_put_and_get(self):
+        cache = ProjectIdCache(self.path)
+        self.assertIsNone(cache.get("ak", "cn-north-4"))
+        cache.put("ak", "cn-north-4", "p1")
+        cache.put("ak", "cn-east-3", "p2")
+        reopened = ProjectIdCache(self.path)
+        self.assertEqual(reopened.get("ak", "cn-north-4"), "p1")
+        self.assertEqual(reopened.get("ak", "cn-east-3"), "p2")
+        self.assertIsNone(reopened.get("other-ak", "cn-north-4"))
+
+    def test_file_does_not_contain_ak_and_is_private(self):
+        ProjectIdCache(self.path).put("SECRET-AK", "cn-north-4", "p1")
+        with open(self.path) as f:
+            self.assertNotIn("SECRET-AK", f.read())
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ["cache.json"])
+
+    def test_ttl_expiry(self):
+        cache = ProjectIdCache(self.path, ttl=10)
+        with patch.object(_mod.time, "time", return_value=1000.0):
+            cache.put("ak", "r1", "p1")
+        with patch.object(_mod.time, "time", return_value=1005.0):
+            self.assertEqual(cache.get("ak", "r1"), "p1")
+            cache.put("ak", "r2", "p2")
+        with patch.object(_mod.time, "time", return_value=1011.0):
+            self.assertIsNone(cache.get("ak", "r1"))
+            cache.put("ak", "r3", "p3")
+        with open(self.path) as f:
+            self.assertEqual(len(json.load(f)), 2)
+
+    def test_corrupt_file_is_ignored(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w") as f:
+            f.write("{not json")
+        cache = ProjectIdCache(self.path)
+        self.assertIsNone(cache.get("ak", "r1"))
+        cache.put("ak", "r1", "p1")
+        self.assertEqual(cache.get("ak", "r1"), "p1")
+
+    def test_invalid_ttl(self):
+        with self.assertRaises(ValueError):
+            ProjectIdCache(self.path, ttl=0)
+
+    def test_from_env(self):
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertIsNone(ProjectIdCache.from_env())
+        with patch.dict(os.environ, {_mod.PROJECT_ID_CACHE_ENV_NAME: "false"}):
+            self.assertIsNone(ProjectIdCache.from_env())
+        with patch.dict(os.environ, {_mod.PROJECT_ID_CACHE_ENV_NAME: "true"}):
+            self.assertEqual(ProjectIdCache.from_env().path, os.path.expanduser(_mod.DEFAULT_CACHE_PATH))
+        with patch.dict(os.environ, {_mod.PROJECT_ID_CACHE_ENV_NAME: self.path}):
+            self.assertEqual(ProjectIdCache.from_env().path, self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
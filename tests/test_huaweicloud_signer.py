@@ -0,0 +1,198 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-test-hwc-signer-2026-qxx"
+
+"""
+huaweicloudauth.signer 签名器与 hkdf 模块单元测试
+
+覆盖场景：
+- DerivedKeyCache 命中/未命中计数、UTC 零点过期、LRU 淘汰
+- DerivationAKSKSigner 通过进程级缓存获取派生密钥
+- P256SHA256Signer / SM2SM3Signer 复用派生签名密钥
+"""
+
+import importlib.util
+import os
+import sys
+import types
+import unittest
+from unittest import mock
+
+# =====================================================================
+# 模块加载：避免触发 mzapi/__init__.py 中缺失的模块
+# =====================================================================
+
+_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), os.pardir, "mzapi"))
+_HW_ROOT = os.path.join(_ROOT, "utlis", "huaweicloudauth")
+
+
+def _make_pkg(name, path):
+    if name in sys.modules:
+        return sys.modules[name]
+    m = types.ModuleType(name)
+    m.__path__ = [path]
+    m.__package__ = name
+    m.__loader__ = None
+    sys.modules[name] = m
+    return m
+
+
+def _load(name, filepath, pkg_name=None):
+    spec = importlib.util.spec_from_file_location(name, filepath)
+    mod = importlib.util.module_from_spec(spec)
+    if pkg_name:
+        mod.__package__ = pkg_name
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+# 注册包层次
+_make_pkg("mzapi", _ROOT)
+_make_pkg("mzapi.utlis", os.path.join(_ROOT, "utlis"))
+_make_pkg("mzapi.utlis.huaweicloudauth", _HW_ROOT)
+_make_pkg("mzapi.utlis.huaweicloudauth.exceptions", os.path.join(_HW_ROOT, "exceptions"))
+_make_pkg("mzapi.utlis.huaweicloudauth.signer", os.path.join(_HW_ROOT, "signer"))
+_make_pkg("mzapi.utlis.huaweicloudauth.utils", os.path.join(_HW_ROOT, "utils"))
+
+_load(
+    "mzapi.utlis.huaweicloudauth.utils.six_utils",
+    os.path.join(_HW_ROOT, "utils", "six_utils.py"),
+    pkg_name="mzapi.utlis.huaweicloudauth.utils",
+)
+_load(
+    "mzapi.utlis.huaweicloudauth.exceptions.exceptions",
+    os.path.join(_HW_ROOT, "exceptions", "exceptions.py"),
+    pkg_name="mzapi.utlis.huaweicloudauth.exceptions",
+)
+_load(
+    "mzapi.utlis.huaweicloudauth.signer.algorithm",
+    os.path.join(_HW_ROOT, "signer", "algorithm.py"),
+    pkg_name="mzapi.utlis.huaweicloudauth.signer",
+)
+_req_mod = _load(
+    "mzapi.utlis.huaweicloudauth.sdk_request",
+    os.path.join(_HW_ROOT, "sdk_request.py"),
+    pkg_name="mzapi.utlis.huaweicloudauth",
+)
+_hkdf_mod = _load(
+    "mzapi.utlis.huaweicloudauth.signer.hkdf",
+    os.path.join(_HW_ROOT, "signer", "hkdf.py"),
+    pkg_name="mzapi.utlis.huaweicloudauth.signer",
+)
+_load(
+    "mzapi.utlis.huaweicloudauth.signer.utils",
+    os.path.join(_HW_ROOT, "signer", "utils.py"),
+    pkg_name="mzapi.utlis.huaweicloudauth.signer",
+)
+_signer_mod = _load(
+    "mzapi.utlis.huaweicloudauth.signer.signer",
+    os.path.join(_HW_ROOT, "signer", "signer.py"),
+    pkg_name="mzapi.utlis.huaweicloudauth.signer",
+)
+
+SdkRequest = _req_mod.SdkRequest
+DerivedKeyCache = _hkdf_mod.DerivedKeyCache
+DerivationAKSKSigner = _signer_mod.DerivationAKSKSigner
+P256SHA256Signer = _signer_mod.P256SHA256Signer
+SM2SM3Signer = _signer_mod.SM2SM3Signer
+
+_INFO = "20260506/cn-north-4/ocr"
+
+
+class _Cred:
+    def __init__(self, ak, sk):
+        self.ak = ak
+        self.sk = sk
+
+
+def _new_request():
+    return SdkRequest(method="POST", schema="https", host="ocr.cn-north-4.myhuaweicloud.com",
+                      resource_path="/v2/project/ocr/general-text", query_params=[],
+                      header_params={"Content-Type": "application/json"}, body='{"url": "x"}')
+
+
+class TestDerivedKeyCache(unittest.TestCase):
+    """测试 DerivedKeyCache"""
+
+    def test_hit_and_miss_counters(self):
+        cache = DerivedKeyCache()
+        k1 = cache.get("ak", "sk", _INFO)
+        k2 = cache.get("ak", "sk", _INFO)
+        self.assertEqual(k1, k2)
+        self.assertEqual(k1, _hkdf_mod.get_der_key_sha256("ak", "sk", _INFO))
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 1, "size": 1})
+
+    def test_expires_at_utc_midnight(self):
+        cache = DerivedKeyCache()
+        day = 20000 * 86400
+        with mock.patch.object(_hkdf_mod.time, "time", return_value=day + 86399):
+            cache.get("ak", "sk", _INFO)
+            cache.get("ak", "sk", _INFO)
+        with mock.patch.object(_hkdf_mod.time, "time", return_value=day + 86400):
+            cache.get("ak", "sk", _INFO)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 2)
+
+    def test_lru_bounded(self):
+        cache = DerivedKeyCache(max_size=2)
+        for region in ("r1", "r2", "r1", "r3"):
+            cache.get("ak", "sk", "20260506/%s/ocr" % region)
+        self.assertEqual(cache.stats()["size"], 2)
+        cache.get("ak", "sk", "20260506/r1/ocr")
+        self.assertEqual(cache.hits, 2)
+
+    def test_missing_ak_not_cached(self):
+        cache = DerivedKeyCache()
+        self.assertIsNone(cache.get("", "sk", _INFO))
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_invalid_max_size(self):
+        with self.assertRaises(ValueError):
+            DerivedKeyCache(max_size=0)
+
+
+class TestDerivationAKSKSigner(unittest.TestCase):
+    """测试 DerivationAKSKSigner 使用进程级缓存"""
+
+    def test_sign_uses_shared_cache(self):
+        cache = _hkdf_mod.get_derived_key_cache()
+        cache.clear()
+        for _ in range(3):
+            req = DerivationAKSKSigner(_Cred("ak", "sk")).sign(_new_request(), "ocr", "cn-north-4")
+            self.assertTrue(req.header_params["Authorization"].startswith("V11-HMAC-SHA256 "))
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 2)
+
+
+class TestSigningKeyCache(unittest.TestCase):
+    """测试 P256SHA256Signer / SM2SM3Signer 签名密钥缓存"""
+
+    def test_p256_signing_key_reused(self):
+        s1 = P256SHA256Signer(_Cred("ak-p256", "sk"))
+        s2 = P256SHA256Signer(_Cred("ak-p256", "sk"))
+        self.assertIs(s1.get_signing_key(), s2.get_signing_key())
+
+    def test_algorithms_do_not_share_keys(self):
+        p256 = P256SHA256Signer(_Cred("ak-shared", "sk")).get_signing_key()
+        sm2 = SM2SM3Signer(_Cred("ak-shared", "sk")).get_signing_key()
+        self.assertIsNot(p256, sm2)
+        self.assertIsInstance(sm2, _signer_mod.SM2SigningKey)
+
+    def test_sm2_sign_request(self):
+        req = SM2SM3Signer(_Cred("ak-sm2", "sk")).sign(_new_request())
+        self.assertTrue(req.header_params["Authorization"].startswith("SDK-SM2-SM3 "))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,151 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-test-hwc-signer-utils-2026-qxx"
+
+"""
+huaweicloudauth.signer.utils 模块单元测试
+
+覆盖场景：
+- 基点预计算表乘法与通用倍点-加法结果一致
+- P256SigningKey / SM2SigningKey 签名与验签
+- CryptographyP256SigningKey 与纯 Python 实现互相验签
+"""
+
+import importlib.util
+import os
+import sys
+import types
+import unittest
+
+# =====================================================================
+# 模块加载：避免触发 mzapi/__init__.py 中缺失的模块
+# =====================================================================
+
+_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), os.pardir, "mzapi"))
+_HW_ROOT = os.path.join(_ROOT, "utlis", "huaweicloudauth")
+
+
+def _make_pkg(name, path):
+    if name in sys.modules:
+        return sys.modules[name]
+    m = types.ModuleType(name)
+    m.__path__ = [path]
+    m.__package__ = name
+    m.__loader__ = None
+    sys.modules[name] = m
+    return m
+
+
+def _load(name, filepath, pkg_name=None):
+    spec = importlib.util.spec_from_file_location(name, filepath)
+    mod = importlib.util.module_from_spec(spec)
+    if pkg_name:
+        mod.__package__ = pkg_name
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+# 注册包层次
+_make_pkg("mzapi", _ROOT)
+_make_pkg("mzapi.utlis", os.path.join(_ROOT, "utlis"))
+_make_pkg("mzapi.utlis.huaweicloudauth", _HW_ROOT)
+_make_pkg("mzapi.utlis.huaweicloudauth.exceptions", os.path.join(_HW_ROOT, "exceptions"))
+_make_pkg("mzapi.utlis.huaweicloudauth.signer", os.path.join(_HW_ROOT, "signer"))
+_make_pkg("mzapi.utlis.huaweicloudauth.utils", os.path.join(_HW_ROOT, "utils"))
+
+_load(
+    "mzapi.utlis.huaweicloudauth.utils.six_utils",
+    os.path.join(_HW_ROOT, "utils", "six_utils.py"),
+    pkg_name="mzapi.utlis.huaweicloudauth.utils",
+)
+_load(
+    "mzapi.utlis.huaweicloudauth.exceptions.exceptions",
+    os.path.join(_HW_ROOT, "exceptions", "exceptions.py"),
+    pkg_name="mzapi.utlis.huaweicloudauth.exceptions",
+)
+_utils_mod = _load(
+    "mzapi.utlis.huaweicloudauth.signer.utils",
+    os.path.join(_HW_ROOT, "signer", "utils.py"),
+    pkg_name="mzapi.utlis.huaweicloudauth.signer",
+)
+
+P256SigningKey = _utils_mod.P256SigningKey
+SM2SigningKey = _utils_mod.SM2SigningKey
+CryptographyP256SigningKey = _utils_mod.CryptographyP256SigningKey
+new_p256_signing_key = _utils_mod.new_p256_signing_key
+
+_PRIVATE_KEY = 0x3f49f6d4a3c55f3874c9b3e3d2103f504aff607beb40b7995899b8a7e764c6f0
+
+
+def _generic_multiply(cls, k, p):
+    """不经过预计算表的倍点-加法"""
+    result = None
+    for bit in bin(k)[2:]:
+        result = cls._jacobian_double(result)
+        if bit == "1":
+            result = cls._jacobian_add_affine(result, p)
+    return cls._from_jacobian(result)
+
+
+class TestBaseTable(unittest.TestCase):
+    """测试基点预计算表"""
+
+    def test_p256_base_multiply_matches_generic(self):
+        for k in (1, 2, 15, 16, 17, _PRIVATE_KEY, P256SigningKey.PARAM_n - 1):
+            self.assertEqual(P256SigningKey._base_multiply(k),
+                             _generic_multiply(P256SigningKey, k, P256SigningKey.PARAM_G))
+
+    def test_sm2_base_multiply_matches_generic(self):
+        for k in (1, 3, 255, _PRIVATE_KEY, SM2SigningKey.PARAM_n - 1):
+            self.assertEqual(SM2SigningKey._base_multiply(k),
+                             _generic_multiply(SM2SigningKey, k, SM2SigningKey.PARAM_G))
+
+    def test_tables_are_per_curve(self):
+        self.assertIsNot(P256SigningKey._get_base_table(), SM2SigningKey._get_base_table())
+        self.assertEqual(P256SigningKey._get_base_table()[0][1], P256SigningKey.PARAM_G)
+        self.assertEqual(SM2SigningKey._get_base_table()[0][1], SM2SigningKey.PARAM_G)
+
+    def test_public_key_on_curve(self):
+        x, y = P256SigningKey(_PRIVATE_KEY)._public_key
+        p = P256SigningKey.PARAM_p
+        self.assertEqual(y * y % p, (x * x * x + P256SigningKey.PARAM_a * x + P256SigningKey.PARAM_b) % p)
+
+
+class TestSigningKeys(unittest.TestCase):
+    """测试签名与验签"""
+
+    def test_p256_sign_verify(self):
+        key = P256SigningKey(_PRIVATE_KEY)
+        sig = key.sign(b"string-to-sign")
+        self.assertTrue(key.verify(sig, b"string-to-sign"))
+        self.assertFalse(key.verify(sig, b"tampered"))
+
+    def test_sm2_sign_verify(self):
+        key = SM2SigningKey(_PRIVATE_KEY)
+        sig = key.sign(b"string-to-sign")
+        self.assertTrue(key.verify(sig, b"string-to-sign"))
+        self.assertFalse(key.verify(sig, b"tampered"))
+
+    @unittest.skipUnless(_utils_mod.HAS_CRYPTOGRAPHY_EC, "cryptography 不可用")
+    def test_cryptography_interop(self):
+        native = CryptographyP256SigningKey(_PRIVATE_KEY)
+        pure = P256SigningKey(_PRIVATE_KEY)
+        self.assertTrue(pure.verify(native.sign(b"data"), b"data"))
+        self.assertTrue(native.verify(pure.sign(b"data"), b"data"))
+        self.assertFalse(native.verify(pure.sign(b"data"), b"other"))
+        self.assertIsInstance(new_p256_signing_key(_PRIVATE_KEY), CryptographyP256SigningKey)
+
+
+if __name__ == "__main__":
+    unittest.main()
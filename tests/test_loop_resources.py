@@ -0,0 +1,133 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-test-loop-resources-2026-qxx"
+
+"""
+loop_resources 模块单元测试
+
+覆盖场景：
+- 同一事件循环返回同一个资源容器，不同事件循环互不共享
+- asyncio.run() 关闭事件循环前关闭资源并移除缓存项，事件循环不被保留
+- pop() 取出资源后不再重复关闭
+- 未经 shutdown_asyncgens() 关闭的事件循环在下次访问时被丢弃
+"""
+
+import asyncio
+import gc
+import importlib.util
+import os
+import unittest
+import weakref
+
+_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), os.pardir, "mzapi"))
+
+_spec = importlib.util.spec_from_file_location("mzapi_loop_resources", os.path.join(_ROOT, "core", "loop_resources.py"))
+_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_mod)
+
+LoopResources = _mod.LoopResources
+
+
+class _Resource(object):
+    """持有事件循环强引用的资源，模拟 aiohttp.ClientSession / httpx.AsyncClient"""
+
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.closed = 0
+
+    async def close(self):
+        self.closed += 1
+
+
+class TestLoopResources(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = LoopResources(lambda resource: resource.close())
+
+    def _use(self, key="k"):
+        return self.registry.get().setdefault(key, _Resource())
+
+    def test_shared_within_loop(self):
+        async def run():
+            self.assertIs(self.registry.get(), self.registry.get())
+            return self._use(), self._use()
+
+        first, second = asyncio.run(run())
+        self.assertIs(first, second)
+        self.assertIsNot(asyncio.run(run())[0], first)
+
+    def test_closed_on_loop_shutdown(self):
+        loops = weakref.WeakSet()
+
+        async def run():
+            loops.add(asyncio.get_running_loop())
+            self._use()
+
+        for _ in range(5):
+            asyncio.run(run())
+        gc.collect()
+        self.assertEqual(len(loops), 0)
+        self.assertEqual(len(self.registry), 0)
+
+    def test_resource_closed_once(self):
+        async def run():
+            return self._use()
+
+        resource = asyncio.run(run())
+        self.assertEqual(resource.closed, 1)
+
+    def test_pop(self):
+        async def run():
+            resource = self._use()
+            resources = self.registry.pop()
+            self.assertEqual(list(resources.values()), [resource])
+            self.assertIsNone(self.registry.pop())
+            for item in resources.values():
+                await item.close()
+            return resource
+
+        resource = asyncio.run(run())
+        self.assertEqual(resource.closed, 1)
+        self.assertEqual(len(self.registry), 0)
+
+    def test_manually_closed_loop_pruned(self):
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(self._coro_use())
+        loop.close()
+        self.assertEqual(len(self.registry), 1)
+        ref = weakref.ref(loop)
+        del loop
+
+        async def other():
+            self.registry.get()
+            self.registry.pop()
+
+        asyncio.run(other())
+        gc.collect()
+        self.assertIsNone(ref())
+        self.assertEqual(len(self.registry), 0)
+
+    async def _coro_use(self):
+        self._use()
+
+    def test_clear(self):
+        async def run():
+            self._use()
+            self.assertEqual(len(self.registry.clear()), 1)
+            self.assertEqual(len(self.registry), 0)
+
+        asyncio.run(run())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-test-rate-limit-2026-qxx"
+
+"""
+rate_limit 模块单元测试
+
+覆盖场景：
+- 未收到限流响应时不限速
+- 限流后按实测发送速率乘性减速，冷却期内只减速一次
+- retry-after 期间不发放令牌，并发调用方按预约时间依次放行
+- 成功响应线性恢复速率，不超过 max_rate
+- 注册表按 (服务商, 账号, 接口) 共享限速器
+"""
+
+import asyncio
+import importlib.util
+import os
+import unittest
+from unittest import mock
+
+_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), os.pardir, "mzapi"))
+
+_spec = importlib.util.spec_from_file_location("mzapi_rate_limit", os.path.join(_ROOT, "core", "rate_limit.py"))
+_rate_limit_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_rate_limit_mod)
+
+AdaptiveRateLimiter = _rate_limit_mod.AdaptiveRateLimiter
+get_rate_limiter = _rate_limit_mod.get_rate_limiter
+rate_limiter_stats = _rate_limit_mod.rate_limiter_stats
+clear_rate_limiters = _rate_limit_mod.clear_rate_limiters
+
+
+class _Clock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class TestAdaptiveRateLimiter(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = _Clock()
+        patcher = mock.patch.object(_rate_limit_mod, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _send(self, limiter, count, interval):
+        waits = []
+        for _ in range(count):
+            waits.append(limiter.acquire())
+            self.clock.now += interval
+        return waits
+
+    def test_unthrottled_does_not_wait(self):
+        limiter = AdaptiveRateLimiter()
+        self.assertEqual(self._send(limiter, 100, 0.001), [0.0] * 100)
+        self.assertFalse(limiter.enabled)
+        self.assertIsNone(limiter.rate)
+
+    def test_throttle_halves_measured_rate(self):
+        limiter = AdaptiveRateLimiter()
+        # 20 请求/秒
+        self._send(limiter, 40, 0.05)
+        limiter.on_throttle()
+        self.assertTrue(limiter.enabled)
+        self.assertAlmostEqual(limiter.rate, 10.0, delta=1.0)
+
+        # 冷却期内的其他限流响应不再减速
+        rate = limiter.rate
+        limiter.on_throttle()
+        limiter.on_throttle()
+        self.assertEqual(limiter.rate, rate)
+        self.assertEqual(limiter.stats()["decreases"], 1)
+        self.assertEqual(limiter.stats()["throttles"], 3)
+
+        self.clock.now += 1.0
+        limiter.on_throttle()
+        self.assertAlmostEqual(limiter.rate, rate / 2, delta=0.01)
+
+    def test_rate_never_below_min_rate(self):
+        limiter = AdaptiveRateLimiter(min_rate=2.0)
+        for _ in range(10):
+            limiter.on_throttle()
+            self.clock.now += 1.0
+        self.assertEqual(limiter.rate, 2.0)
+
+    def test_reservations_are_spaced(self):
+        limiter = AdaptiveRateLimiter(min_rate=4.0)
+        limiter.on_throttle()
+        self.assertEqual(limiter.rate, 4.0)
+        # 不推进时钟，模拟并发调用方同时取令牌
+        waits = [limiter._reserve() for _ in range(4)]
+        self.assertEqual(waits, [0.25, 0.5, 0.75, 1.0])
+
+    def test_retry_after_blocks_tokens(self):
+        limiter = AdaptiveRateLimiter(min_rate=4.0)
+        limiter.on_throttle(retry_after=2.0)
+        wait = limiter.acquire()
+        self.assertAlmostEqual(wait, 2.25)
+        self.assertEqual(limiter.stats()["delayed"], 1)
+
+    def test_retry_after_capped(self):
+        limiter = AdaptiveRateLimiter(min_rate=1.0)
+        limiter.on_throttle(retry_after=3600)
+        self.assertLessEqual(limiter.acquire(), _rate_limit_mod.MAX_WAIT)
+
+    def test_success_recovers_linearly(self):
+        limiter = AdaptiveRateLimiter(min_rate=1.0, max_rate=3.0, increase_rate=0.5)
+        limiter.on_throttle()
+        self.assertEqual(limiter.rate, 1.0)
+        self.clock.now += 2.0
+        limiter.on_success()
+        self.assertAlmostEqual(limiter.rate, 2.0)
+        self.clock.now += 10.0
+        limiter.on_success()
+        self.assertEqual(limiter.rate, 3.0)
+
+    def test_success_before_throttle_is_noop(self):
+        limiter = AdaptiveRateLimiter()
+        limiter.on_success()
+        self.assertFalse(limiter.enabled)
+
+    def test_acquire_async(self):
+        limiter = AdaptiveRateLimiter(min_rate=2.0)
+        limiter.on_throttle()
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        with mock.patch.object(_rate_limit_mod.asyncio, "sleep", fake_sleep):
+            wait = asyncio.run(limiter.acquire_async())
+        self.assertEqual(sleeps, [wait])
+        self.assertAlmostEqual(wait, 0.5)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            AdaptiveRateLimiter(min_rate=0)
+        with self.assertRaises(ValueError):
+            AdaptiveRateLimiter(decrease_factor=1.0)
+
+
+class TestRegistry(unittest.TestCase):
+
+    def setUp(self):
+        clear_rate_limiters()
+        self.addCleanup(clear_rate_limiters)
+
+    def test_shared_by_key(self):
+        limiter = get_rate_limiter("aliyun", "AK1", "RecognizeGeneral")
+        self.assertIs(get_rate_limiter("aliyun", "AK1", "RecognizeGeneral"), limiter)
+        self.assertIsNot(get_rate_limiter("aliyun", "AK2", "RecognizeGeneral"), limiter)
+        self.assertIsNot(get_rate_limiter("tencent", "AK1", "RecognizeGeneral"), limiter)
+        self.assertIs(get_rate_limiter("huaweicloud", None, "GET /v1"), get_rate_limiter("huaweicloud", "", "GET /v1"))
+
+    def test_stats(self):
+        get_rate_limiter("tencent", "AK1", "GeneralBasicOCR").on_throttle()
+        stats = rate_limiter_stats()
+        self.assertEqual(stats[("tencent", "AK1", "GeneralBasicOCR")]["throttles"], 1)
+        self.assertTrue(stats[("tencent", "AK1", "GeneralBasicOCR")]["enabled"])
+
+
+if __name__ == "__main__":
+    unittest.main()
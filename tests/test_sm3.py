@@ -0,0 +1,110 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-test-sm3-2026-qxx"
+
+"""
+sm3 模块单元测试
+
+覆盖场景：
+- GB/T 32905-2016 标准测试向量
+- 纯 Python 实现与 OpenSSL 实现结果一致
+- 跨分组边界的增量 update()
+- copy() 与 digest() 后继续 update()
+- 作为 hmac digestmod 使用
+"""
+
+import hashlib
+import hmac
+import importlib.util
+import os
+import unittest
+
+_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), os.pardir, "mzapi"))
+
+_spec = importlib.util.spec_from_file_location("mzapi_sm3", os.path.join(_ROOT, "core", "sm3.py"))
+_sm3_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_sm3_mod)
+
+SM3Hash = _sm3_mod.SM3Hash
+new_sm3_hash = _sm3_mod.new_sm3_hash
+sm3_digest = _sm3_mod.sm3_digest
+
+_ABC_DIGEST = "66c7f0f462eeedd9d1f2d46bdc10e4e24167c4875cf2f7a2297da02b8f4ba8e0"
+_ABCD_DIGEST = "debe9ff92275b8a138604889c18e5a4d6fdb70e5387e5765293dcba39c0c5732"
+
+
+class TestSM3Vectors(unittest.TestCase):
+    """测试标准测试向量"""
+
+    def test_abc(self):
+        self.assertEqual(SM3Hash(b"abc").hexdigest(), _ABC_DIGEST)
+
+    def test_abcd_x16(self):
+        self.assertEqual(SM3Hash(b"abcd" * 16).hexdigest(), _ABCD_DIGEST)
+
+    def test_empty(self):
+        self.assertEqual(
+            SM3Hash().hexdigest(),
+            "1ab21d8355cfa17f8e61194831e81a8f22bec8c728fefb747ed035eb5082aa2b",
+        )
+
+    def test_new_sm3_hash(self):
+        self.assertEqual(new_sm3_hash(b"abc").hexdigest(), _ABC_DIGEST)
+        self.assertEqual(sm3_digest(b"abc").hex(), _ABC_DIGEST)
+
+    @unittest.skipUnless(_sm3_mod.OPENSSL_SM3_AVAILABLE, "OpenSSL 不支持 sm3")
+    def test_pure_matches_openssl(self):
+        for n in (1, 55, 56, 63, 64, 65, 119, 120, 128, 1000, 4099):
+            data = os.urandom(n)
+            self.assertEqual(SM3Hash(data).digest(), hashlib.new("sm3", data).digest(), n)
+
+
+class TestSM3Incremental(unittest.TestCase):
+    """测试增量接口"""
+
+    def test_chunked_update_matches_oneshot(self):
+        data = bytes(range(256)) * 5
+        expected = SM3Hash(data).digest()
+        for chunk in (1, 7, 63, 64, 65, 200):
+            h = SM3Hash()
+            for i in range(0, len(data), chunk):
+                h.update(data[i:i + chunk])
+            self.assertEqual(h.digest(), expected, chunk)
+
+    def test_accepts_memoryview_and_bytearray(self):
+        h = SM3Hash()
+        h.update(bytearray(b"ab"))
+        h.update(memoryview(b"c"))
+        self.assertEqual(h.hexdigest(), _ABC_DIGEST)
+
+    def test_digest_does_not_finalize(self):
+        h = SM3Hash(b"ab")
+        h.digest()
+        h.update(b"c")
+        self.assertEqual(h.hexdigest(), _ABC_DIGEST)
+
+    def test_copy_is_independent(self):
+        h = SM3Hash(b"ab")
+        c = h.copy()
+        c.update(b"c")
+        self.assertEqual(c.hexdigest(), _ABC_DIGEST)
+        self.assertEqual(h.hexdigest(), SM3Hash(b"ab").hexdigest())
+
+    def test_hmac_pure_matches_default(self):
+        key = b"k" * 80
+        expected = hmac.new(key, b"message", new_sm3_hash).hexdigest()
+        self.assertEqual(hmac.new(key, b"message", SM3Hash).hexdigest(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
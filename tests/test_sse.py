@@ -0,0 +1,116 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-test-sse-2026-qxx"
+
+"""
+sse 模块单元测试
+
+覆盖场景：
+- 字段解析：data 多行合并、event / id / retry、注释行、无冒号行
+- LF / CRLF / CR 行结束符，含跨分块的 CRLF
+- 逐字节输入与整体输入结果一致，多字节 UTF-8 字符跨分块
+- flush() 取出未以空行结束的事件
+- 同步与异步迭代
+"""
+
+import asyncio
+import importlib.util
+import os
+import unittest
+
+_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), os.pardir, "mzapi"))
+
+_spec = importlib.util.spec_from_file_location("mzapi_sse", os.path.join(_ROOT, "core", "sse.py"))
+_sse_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_sse_mod)
+
+SSEDecoder = _sse_mod.SSEDecoder
+iter_sse = _sse_mod.iter_sse
+aiter_sse = _sse_mod.aiter_sse
+
+STREAM = (
+    b": keep-alive\n"
+    b"event: delta\n"
+    b"id: 7\n"
+    b"retry: 3000\n"
+    b"data: {\"a\": 1}\n"
+    b"data:second\n"
+    b"\n"
+    b"\n"
+    b"data: \xe4\xbd\xa0\xe5\xa5\xbd\r\n"
+    b"\r\n"
+    b"data:  two spaces\r"
+    b"\r"
+    b"retry: soon\n"
+    b"field-without-colon\n"
+    b"data\n"
+    b"\n"
+)
+
+EXPECTED = [
+    {"event": "delta", "id": "7", "retry": 3000, "data": "{\"a\": 1}\nsecond"},
+    {"data": "你好"},
+    {"data": " two spaces"},
+    {"data": ""},
+]
+
+
+class TestSSEDecoder(unittest.TestCase):
+
+    def _decode(self, chunks):
+        decoder = SSEDecoder()
+        events = []
+        for chunk in chunks:
+            events.extend(decoder.feed(chunk))
+        events.extend(decoder.flush())
+        return events
+
+    def test_whole_stream(self):
+        self.assertEqual(self._decode([STREAM]), EXPECTED)
+
+    def test_byte_by_byte(self):
+        self.assertEqual(self._decode([STREAM[i:i + 1] for i in range(len(STREAM))]), EXPECTED)
+
+    def test_crlf_split_across_chunks(self):
+        decoder = SSEDecoder()
+        self.assertEqual(decoder.feed(b"data: a\r"), [])
+        self.assertEqual(decoder.feed(b"\n\r"), [])
+        self.assertEqual(decoder.feed(b"\n"), [{"data": "a"}])
+
+    def test_flush_unterminated_event(self):
+        decoder = SSEDecoder()
+        self.assertEqual(decoder.feed(b"data: a\ndata: b"), [])
+        self.assertEqual(decoder.flush(), [{"data": "a\nb"}])
+        self.assertEqual(decoder.flush(), [])
+        self.assertEqual(decoder.feed(b"data: c\r"), [])
+        self.assertEqual(decoder.flush(), [{"data": "c"}])
+
+    def test_memoryview_input(self):
+        self.assertEqual(self._decode([memoryview(STREAM)]), EXPECTED)
+
+    def test_iter_and_aiter(self):
+        chunks = [STREAM[i:i + 5] for i in range(0, len(STREAM), 5)]
+        self.assertEqual(list(iter_sse(chunks)), EXPECTED)
+
+        async def source():
+            for chunk in chunks:
+                yield chunk
+
+        async def collect():
+            return [e async for e in aiter_sse(source())]
+
+        self.assertEqual(asyncio.run(collect()), EXPECTED)
+
+
+if __name__ == "__main__":
+    unittest.main()
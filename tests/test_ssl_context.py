@@ -0,0 +1,179 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-test-ssl-context-2026-qxx"
+
+"""
+ssl_context 模块单元测试
+
+覆盖场景：
+- 相同配置复用同一 SSLContext，不同配置各自创建
+- 关闭校验、最低 TLS 版本
+- SSLContextAdapter 连接池参数
+- 通过本地自签名 TLS 服务端到端请求
+"""
+
+import datetime
+import importlib
+import ipaddress
+import os
+import ssl
+import sys
+import tempfile
+import threading
+import types
+import unittest
+import warnings
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import requests
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), os.pardir, "mzapi"))
+
+if "mzapi" not in sys.modules:
+    _pkg = types.ModuleType("mzapi")
+    _pkg.__path__ = [_ROOT]
+    sys.modules["mzapi"] = _pkg
+
+_ssl_mod = importlib.import_module("mzapi.core.ssl_context")
+
+get_ssl_context = _ssl_mod.get_ssl_context
+ssl_context_stats = _ssl_mod.ssl_context_stats
+clear_ssl_contexts = _ssl_mod.clear_ssl_contexts
+SSLContextAdapter = _ssl_mod.SSLContextAdapter
+
+
+def _write_self_signed(directory):
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (x509.CertificateBuilder()
+            .subject_name(name).issuer_name(name)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - datetime.timedelta(days=1))
+            .not_valid_after(now + datetime.timedelta(days=1))
+            .add_extension(x509.SubjectAlternativeName([
+                x509.DNSName("localhost"), x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), critical=False)
+            .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+            .sign(key, hashes.SHA256()))
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as f:
+        f.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                  serialization.NoEncryption()))
+    return cert_path, key_path
+
+
+class TestSSLContextRegistry(unittest.TestCase):
+    """测试 SSLContext 注册表"""
+
+    def test_same_key_reuses_context(self):
+        first = get_ssl_context()
+        reused = ssl_context_stats()["reused"]
+        self.assertIs(get_ssl_context(), first)
+        self.assertIs(get_ssl_context(verify=True, tls_min_version=None), first)
+        self.assertEqual(ssl_context_stats()["reused"], reused + 2)
+
+    def test_tls_version_normalized(self):
+        ctx = get_ssl_context(tls_min_version="TLSv1.2")
+        self.assertIs(get_ssl_context(tls_min_version=ssl.TLSVersion.TLSv1_2), ctx)
+        self.assertEqual(ctx.minimum_version, ssl.TLSVersion.TLSv1_2)
+        self.assertIsNot(get_ssl_context(tls_min_version="TLSv1.3"), ctx)
+
+    def test_unverified_context(self):
+        ctx = get_ssl_context(verify=False)
+        self.assertEqual(ctx.verify_mode, ssl.CERT_NONE)
+        self.assertFalse(ctx.check_hostname)
+        self.assertIs(get_ssl_context(ca="/ignored", verify=False), ctx)
+
+    def test_clear(self):
+        ctx = get_ssl_context(tls_min_version="TLSv1.3")
+        clear_ssl_contexts()
+        self.assertIsNot(get_ssl_context(tls_min_version="TLSv1.3"), ctx)
+
+
+class TestSSLContextAdapter(unittest.TestCase):
+    """测试 SSLContextAdapter 与本地 TLS 服务"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.cert_path, key_path = _write_self_signed(cls._tmp.name)
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self.send_response(200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"ok")
+
+            def log_message(self, *args):
+                pass
+
+        cls.server = HTTPServer(("127.0.0.1", 0), Handler)
+        server_ctx = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        server_ctx.load_cert_chain(cls.cert_path, key_path)
+        cls.server.socket = server_ctx.wrap_socket(cls.server.socket, server_side=True)
+        cls.url = "https://localhost:%d/" % cls.server.server_address[1]
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls._tmp.cleanup()
+
+    def _session(self, **kwargs):
+        session = requests.Session()
+        session.mount("https://", SSLContextAdapter(**kwargs))
+        self.addCleanup(session.close)
+        return session
+
+    def test_pool_kwargs_use_registry_context(self):
+        adapter = SSLContextAdapter(tls_min_version="TLSv1.2")
+        request = requests.Request("GET", self.url).prepare()
+        _, pool_kwargs = adapter.build_connection_pool_key_attributes(request, self.cert_path)
+        self.assertNotIn("ca_certs", pool_kwargs)
+        self.assertIs(pool_kwargs["ssl_context"], get_ssl_context(ca=self.cert_path, tls_min_version="TLSv1.2"))
+
+    def test_custom_ca(self):
+        session = self._session()
+        for _ in range(2):
+            self.assertEqual(session.get(self.url, verify=self.cert_path).text, "ok")
+        ctx = get_ssl_context(ca=self.cert_path)
+        self.assertEqual(ctx.verify_mode, ssl.CERT_REQUIRED)
+        self.assertTrue(ctx.check_hostname)
+
+    def test_default_bundle_rejects_self_signed(self):
+        with self.assertRaises(requests.exceptions.SSLError):
+            self._session().get(self.url)
+
+    def test_verify_disabled(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.assertEqual(self._session().get(self.url, verify=False).text, "ok")
+        # 共享的校验上下文未被改写
+        self.assertEqual(get_ssl_context().verify_mode, ssl.CERT_REQUIRED)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,18 +18,24 @@ tencentauth 模块单元测试
 覆盖场景：
 - Credential 凭证类（初始化校验、属性、get_credential_info）
 - Sign 签名类（HmacSHA1/SHA256、TC3-HMAC-SHA256）
+- TC3SigningKeyCache 签名密钥缓存（命中、跨日失效、容量淘汰）
 - TencentCloudSDKException 异常类
 - ClientProfile 配置（签名方法、语言校验）
 - HttpProfile 配置（默认值、自定义值）
 - EnvironmentVariableCredential 环境变量凭证
+- MultipartEncoder 流式 multipart 编码（格式、长度、文件对象、mmap 路径）
 """
 
 import binascii
 import hashlib
 import hmac
 import importlib.util
+import io
 import os
+import pathlib
 import sys
+import tempfile
+import threading
 import types
 import unittest
 import warnings
@@ -69,6 +75,7 @@ _make_pkg("mzapi.utlis", os.path.join(_ROOT, "utlis"))
 _make_pkg("mzapi.utlis.tencentauth", _TC_ROOT)
 _make_pkg("mzapi.utlis.tencentauth.exception", os.path.join(_TC_ROOT, "exception"))
 _make_pkg("mzapi.utlis.tencentauth.profile", os.path.join(_TC_ROOT, "profile"))
+_make_pkg("mzapi.utlis.tencentauth.http", os.path.join(_TC_ROOT, "http"))
 
 # 加载各模块
 _exc_mod = _load(
@@ -96,13 +103,28 @@ _cp_mod = _load(
     os.path.join(_TC_ROOT, "profile", "client_profile.py"),
     pkg_name="mzapi.utlis.tencentauth.profile",
 )
+_cb_mod = _load(
+    "mzapi.utlis.tencentauth.circuit_breaker",
+    os.path.join(_TC_ROOT, "circuit_breaker.py"),
+    pkg_name="mzapi.utlis.tencentauth",
+)
+_mp_mod = _load(
+    "mzapi.utlis.tencentauth.http.multipart",
+    os.path.join(_TC_ROOT, "http", "multipart.py"),
+    pkg_name="mzapi.utlis.tencentauth.http",
+)
 
 TencentCloudSDKException = _exc_mod.TencentCloudSDKException
 Sign = _sign_mod.Sign
+TC3SigningKeyCache = _sign_mod.TC3SigningKeyCache
 Credential = _cred_mod.Credential
 EnvironmentVariableCredential = _cred_mod.EnvironmentVariableCredential
 HttpProfile = _http_mod.HttpProfile
 ClientProfile = _cp_mod.ClientProfile
+RegionBreakerProfile = _cp_mod.RegionBreakerProfile
+CircuitBreaker = _cb_mod.CircuitBreaker
+SlidingWindow = _cb_mod.SlidingWindow
+MultipartEncoder = _mp_mod.MultipartEncoder
 
 NL = chr(10)  # newline，用于构建多行字符串
 
@@ -237,6 +259,50 @@ class TestSignTC3(unittest.TestCase):
         self.assertEqual(Sign.sign_tc3(sk, date, svc, s2s), expected)
 
 
+class TestTC3SigningKeyCache(unittest.TestCase):
+    """测试 TC3SigningKeyCache 签名密钥缓存"""
+
+    def test_cached_matches_uncached(self):
+        args = ("key", "2026-05-06", "ocr", "test_data")
+        self.assertEqual(Sign.sign_tc3(*args), Sign.sign_tc3(*args, use_cache=False))
+
+    def test_get_reuses_key_within_day(self):
+        cache = TC3SigningKeyCache()
+        k1 = cache.get("sk", "2026-05-06", "ocr")
+        k2 = cache.get("sk", "2026-05-06", "ocr")
+        self.assertIs(k1, k2)
+        self.assertEqual(k1, Sign.derive_tc3_signing_key("sk", "2026-05-06", "ocr"))
+        self.assertEqual(len(cache), 1)
+
+    def test_date_change_rederives(self):
+        cache = TC3SigningKeyCache()
+        k1 = cache.get("sk", "2026-05-06", "ocr")
+        k2 = cache.get("sk", "2026-05-07", "ocr")
+        self.assertNotEqual(k1, k2)
+        self.assertEqual(k2, Sign.derive_tc3_signing_key("sk", "2026-05-07", "ocr"))
+        self.assertEqual(len(cache), 1)
+
+    def test_bounded_lru_eviction(self):
+        cache = TC3SigningKeyCache(max_size=2)
+        cache.get("sk1", "2026-05-06", "ocr")
+        cache.get("sk2", "2026-05-06", "ocr")
+        cache.get("sk1", "2026-05-06", "ocr")
+        cache.get("sk3", "2026-05-06", "ocr")
+        self.assertEqual(len(cache), 2)
+        self.assertIn(("sk1", "ocr"), cache._entries)
+        self.assertNotIn(("sk2", "ocr"), cache._entries)
+
+    def test_invalid_max_size_raises(self):
+        with self.assertRaises(TencentCloudSDKException):
+            TC3SigningKeyCache(max_size=0)
+
+    def test_clear(self):
+        cache = TC3SigningKeyCache()
+        cache.get("sk", "2026-05-06", "ocr")
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
 # =========================================================================
 #  TencentCloudSDKException 测试
 # =========================================================================
@@ -345,6 +411,112 @@ class TestClientProfile(unittest.TestCase):
             self.assertIsNone(ClientProfile(request_client="has spaces!").request_client)
 
 
+# =========================================================================
+#  CircuitBreaker 测试
+# =========================================================================
+class TestCircuitBreaker(unittest.TestCase):
+    """测试按 endpoint 分片的地域熔断器"""
+
+    PRIMARY = "cvm.ap-shanghai.tencentcloudapi.com"
+    BACKUP = "cvm.ap-guangzhou.tencentcloudapi.com"
+
+    def _breaker(self, **kwargs):
+        return CircuitBreaker(RegionBreakerProfile(**kwargs))
+
+    def _fail(self, cb, n, endpoint=None):
+        endpoint = endpoint or self.PRIMARY
+        for _ in range(n):
+            ticket, _ = cb.before_requests(endpoint)
+            cb.after_requests(ticket, False, endpoint)
+
+    def test_consecutive_failures_open(self):
+        cb = self._breaker()
+        self._fail(cb, 4)
+        self.assertEqual(cb.state(self.PRIMARY), "closed")
+        self._fail(cb, 1)
+        self.assertEqual(cb.state(self.PRIMARY), "open")
+        _, need_break = cb.before_requests(self.PRIMARY)
+        self.assertTrue(need_break)
+
+    def test_endpoints_are_isolated(self):
+        cb = self._breaker()
+        self._fail(cb, 5)
+        self.assertEqual(cb.state(self.PRIMARY), "open")
+        self.assertEqual(cb.state("cvm.ap-beijing.tencentcloudapi.com"), "closed")
+
+    def test_backup_results_recorded_on_backup(self):
+        cb = self._breaker()
+        self._fail(cb, 5)
+        ticket, need_break = cb.before_requests(self.PRIMARY)
+        self.assertTrue(need_break)
+        cb.after_requests(ticket, False, self.BACKUP)
+        metrics = cb.metrics()
+        self.assertEqual(metrics[self.BACKUP]["failures"], 1)
+        self.assertEqual(metrics[self.PRIMARY]["total"], 0)
+        self.assertEqual(metrics[self.PRIMARY]["opened_count"], 1)
+
+    def test_failure_rate_threshold(self):
+        cb = self._breaker(max_fail_num=4, max_fail_percent=0.5)
+        for success in (True, False, True, False, True, False, False):
+            ticket, _ = cb.before_requests(self.PRIMARY)
+            cb.after_requests(ticket, success, self.PRIMARY)
+        self.assertEqual(cb.state(self.PRIMARY), "open")
+
+    def test_half_open_closes_after_successes(self):
+        cb = self._breaker(timeout=0, max_requests=2)
+        self._fail(cb, 5)
+        self.assertEqual(cb.state(self.PRIMARY), "half_open")
+        for _ in range(2):
+            ticket, need_break = cb.before_requests(self.PRIMARY)
+            self.assertFalse(need_break)
+            cb.after_requests(ticket, True, self.PRIMARY)
+        self.assertEqual(cb.state(self.PRIMARY), "closed")
+
+    def test_half_open_failure_reopens(self):
+        cb = self._breaker(timeout=0)
+        self._fail(cb, 5)
+        ticket, _ = cb.before_requests(self.PRIMARY)
+        cb.get(self.PRIMARY).breaker_setting.timeout = 60
+        cb.after_requests(ticket, False, self.PRIMARY)
+        self.assertEqual(cb.state(self.PRIMARY), "open")
+
+    def test_stale_generation_ignored(self):
+        cb = self._breaker()
+        ticket, _ = cb.before_requests(self.PRIMARY)
+        self._fail(cb, 5)
+        cb.after_requests(ticket, False, self.PRIMARY)
+        self.assertEqual(cb.metrics()[self.PRIMARY]["total"], 0)
+
+    def test_sliding_window_expires_buckets(self):
+        window = SlidingWindow(10, buckets=5)
+        window.add(False, 100.0)
+        window.add(True, 105.0)
+        self.assertEqual(window.totals(105.0), (1, 2))
+        self.assertEqual(window.totals(111.0), (0, 1))
+        self.assertEqual(window.totals(200.0), (0, 0))
+
+    def test_concurrent_updates_are_counted(self):
+        cb = self._breaker(max_fail_num=10 ** 6)
+
+        def worker():
+            for _ in range(500):
+                ticket, _ = cb.before_requests(self.PRIMARY)
+                cb.after_requests(ticket, True, self.PRIMARY)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        metrics = cb.metrics()[self.PRIMARY]
+        self.assertEqual(metrics["total"], 4000)
+        self.assertEqual(metrics["failure_rate"], 0.0)
+
+    def test_invalid_window_buckets(self):
+        with self.assertRaises(TencentCloudSDKException):
+            RegionBreakerProfile(window_buckets=0)
+
+
 # =========================================================================
 #  EnvironmentVariableCredential 测试
 # =========================================================================
@@ -379,5 +551,65 @@ class TestEnvironmentVariableCredential(unittest.TestCase):
 
 
 
+# =========================================================================
+#  MultipartEncoder 测试
+# =========================================================================
+class TestMultipartEncoder(unittest.TestCase):
+    """测试 MultipartEncoder 流式编码"""
+
+    _EXPECTED = (
+        b'--B\r\nContent-Disposition: form-data; name="Name"\r\n\r\na.png\r\n'
+        b'--B\r\nContent-Disposition: form-data; name="Image"; filename="Image"\r\n\r\n\x89PNG\r\n'
+        b'--B\r\nContent-Disposition: form-data; name="Conf"\r\nContent-Type: application/json\r\n'
+        b'\r\n{"a": 1}\r\n'
+        b'--B--\r\n'
+    )
+
+    def _encode(self, image):
+        return MultipartEncoder({"Name": "a.png", "Image": image, "Conf": {"a": 1}}, "B", ["Image"])
+
+    def test_bytes_body(self):
+        enc = self._encode(b"\x89PNG")
+        self.assertEqual(enc.to_bytes(), self._EXPECTED)
+        self.assertEqual(len(enc), len(self._EXPECTED))
+
+    def test_chunks_are_memoryviews(self):
+        image = b"\x89PNG"
+        chunks = list(self._encode(image))
+        self.assertTrue(all(isinstance(c, memoryview) for c in chunks))
+        self.assertTrue(any(c.obj is image for c in chunks))
+
+    def test_file_object_rewinds(self):
+        enc = self._encode(io.BytesIO(b"\x89PNG"))
+        self.assertEqual(enc.to_bytes(), self._EXPECTED)
+        self.assertEqual(enc.to_bytes(), self._EXPECTED)
+        self.assertEqual(len(enc), len(self._EXPECTED))
+
+    def test_path_is_mapped(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = pathlib.Path(d, "img.png")
+            path.write_bytes(b"\x89PNG")
+            enc = self._encode(path)
+            self.assertEqual(enc.to_bytes(), self._EXPECTED)
+            del enc
+
+    def test_sha256(self):
+        enc = self._encode(b"\x89PNG")
+        self.assertEqual(enc.sha256_hexdigest(), hashlib.sha256(self._EXPECTED).hexdigest())
+
+    def test_unseekable_file_raises(self):
+        class _Pipe(object):
+            def read(self, n=-1):
+                return b""
+
+        with self.assertRaises(TencentCloudSDKException):
+            self._encode(_Pipe())
+
+    def test_empty_params(self):
+        enc = MultipartEncoder({}, "B")
+        self.assertEqual(len(enc), 0)
+        self.assertEqual(enc.to_bytes(), b"")
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,205 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-test-txc-pre-conn-2026-qxx"
+
+"""
+tencentauth.http.pre_conn 模块单元测试
+
+覆盖场景：
+- warmup() 在后台预建连接，后续请求命中空闲连接
+- 池中没有空闲连接时新建连接并记为未命中
+- 空闲超时与被对端关闭的连接在取出前淘汰
+- 创建连接池后自动补足到 min_idle，空闲连接不超过 maxsize
+- 后台预建连接使用 connect_timeout 作为连接超时
+- 关闭连接池、停止 ConnWarmer
+"""
+
+import importlib.util
+import os
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import certifi
+import requests
+
+_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), os.pardir, "mzapi"))
+
+_spec = importlib.util.spec_from_file_location(
+    "mzapi_txc_pre_conn", os.path.join(_ROOT, "core", "tencentauth", "http", "pre_conn.py"))
+_pre_conn_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_pre_conn_mod)
+
+ConnWarmer = _pre_conn_mod.ConnWarmer
+PreConnAdapter = _pre_conn_mod.PreConnAdapter
+
+# 与 ProxyConnection 一致显式传入 verify，避免环境变量中的 CA 路径让请求落到另一个连接池
+_CA = certifi.where()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):
+        body = b'{"Response":{}}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.path == "/close":
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestPreConnAdapter(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.daemon_threads = True
+        cls.server.lock = threading.Lock()
+        cls.server.connections = 0
+        cls.url = "http://127.0.0.1:%d/" % cls.server.server_address[1]
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.warmer = ConnWarmer(sweep_interval=60)
+        patcher = mock.patch.object(_pre_conn_mod, "WARMER", self.warmer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.warmer.stop, 5)
+
+    def _session(self, **kwargs):
+        adapter = PreConnAdapter(**kwargs)
+        session = requests.Session()
+        session.verify = _CA
+        session.trust_env = False
+        session.mount("http://", adapter)
+        self.addCleanup(session.close)
+        return session, adapter
+
+    def _stats(self, adapter):
+        return next(iter(adapter.stats().values()))
+
+    def test_warmup_then_hit(self):
+        session, adapter = self._session(conn_pool_size=4, min_idle=0)
+        before = self.server.connections
+        self.assertEqual(adapter.warmup(self.url, 3, verify=_CA).result(timeout=5), 3)
+        self.assertEqual(self._stats(adapter)["idle"], 3)
+
+        for _ in range(5):
+            self.assertEqual(session.get(self.url).status_code, 200)
+        stats = self._stats(adapter)
+        self.assertEqual(stats["hits"], 5)
+        self.assertEqual(stats["misses"], 0)
+        self.assertEqual(stats["opened"], 3)
+        self.assertEqual(self.server.connections - before, 3)
+
+    def test_warmup_capped_at_pool_size(self):
+        _, adapter = self._session(conn_pool_size=2, min_idle=0)
+        self.assertEqual(adapter.warmup(self.url, 10, verify=_CA).result(timeout=5), 2)
+        self.assertEqual(adapter.warmup(self.url, 10, verify=_CA).result(timeout=5), 0)
+
+    def test_miss_opens_new_conn(self):
+        session, adapter = self._session(conn_pool_size=2, min_idle=0)
+        session.get(self.url)
+        session.get(self.url)
+        stats = self._stats(adapter)
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+
+    def test_min_idle_refilled_in_background(self):
+        session, adapter = self._session(conn_pool_size=3, min_idle=2)
+        session.get(self.url)
+        pool = adapter.get_connection_with_tls_context(requests.Request("GET", self.url).prepare(), _CA)
+        # 再次请求补足，等待后台完成
+        self.assertEqual(pool.warmup().result(timeout=5), 0)
+        self.assertGreaterEqual(self._stats(adapter)["idle"], 2)
+        self.assertLessEqual(self._stats(adapter)["idle"], 3)
+
+    def test_expired_conn_evicted(self):
+        session, adapter = self._session(conn_pool_size=2, min_idle=0, idle_ttl=0)
+        adapter.warmup(self.url, 1, verify=_CA).result(timeout=5)
+        session.get(self.url)
+        stats = self._stats(adapter)
+        self.assertEqual(stats["expired"], 1)
+        self.assertEqual((stats["hits"], stats["misses"]), (0, 1))
+
+    def test_closed_conn_not_reused(self):
+        session, adapter = self._session(conn_pool_size=2, min_idle=0)
+        session.get(self.url + "close")
+        before = self.server.connections
+        self.assertEqual(session.get(self.url).status_code, 200)
+        self.assertEqual(self.server.connections - before, 1)
+        self.assertEqual(self._stats(adapter)["hits"], 0)
+
+    def test_sweep_evicts_stale(self):
+        _, adapter = self._session(conn_pool_size=2, min_idle=0, idle_ttl=0)
+        adapter.warmup(self.url, 2, verify=_CA).result(timeout=5)
+        pool = adapter.get_connection_with_tls_context(requests.Request("GET", self.url).prepare(), _CA)
+        pool._evict_stale()
+        self.assertEqual(self._stats(adapter)["idle"], 0)
+        self.assertEqual(self._stats(adapter)["expired"], 2)
+
+    def test_close_unregisters(self):
+        session, adapter = self._session(conn_pool_size=2, min_idle=0)
+        session.get(self.url)
+        pool = adapter.get_connection_with_tls_context(requests.Request("GET", self.url).prepare(), _CA)
+        adapter.close()
+        self.assertNotIn(pool, list(self.warmer._pools))
+
+    def test_pre_opened_conn_uses_connect_timeout(self):
+        for kwargs, expected in (({}, _pre_conn_mod.DEFAULT_CONNECT_TIMEOUT), ({"connect_timeout": 0.5}, 0.5)):
+            _, adapter = self._session(conn_pool_size=2, min_idle=0, **kwargs)
+            pool = adapter.get_connection_with_tls_context(requests.Request("GET", self.url).prepare(), _CA)
+            timeouts = []
+            new_conn = pool._new_conn
+
+            def recording_new_conn():
+                conn = new_conn()
+                connect = conn.connect
+
+                def recording_connect():
+                    timeouts.append(conn.timeout)
+                    connect()
+
+                conn.connect = recording_connect
+                return conn
+
+            pool._new_conn = recording_new_conn
+            self.assertEqual(pool.warmup(2).result(timeout=5), 2)
+            self.assertEqual(timeouts, [expected, expected])
+
+    def test_stopped_warmer(self):
+        _, adapter = self._session(conn_pool_size=2, min_idle=0)
+        self.warmer.stop(5)
+        self.assertEqual(adapter.warmup(self.url, 2, verify=_CA).result(timeout=5), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,265 @@
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+# Copyright (C) 2026 祁筱欣
+#
+# ORIGINAL IMPLEMENTATION – DO NOT REMOVE OR ALTER THIS NOTICE
+# This file is part of MZAPI and is licensed under MPL 2.0.
+# Any modifications to this file must remain under MPL 2.0
+# when redistributed.
+
+# 内部项目标识（请勿修改）
+_MZAPI_ORIGIN = "mzapi-test-txc-retry-2026-qxx"
+
+"""
+tencentauth.retry / retry_async / retry_budget 模块单元测试
+
+覆盖场景：
+- RetryBudget 令牌消耗、成功归还与统计
+- full_jitter / decorrelated_jitter 的取值范围
+- StandardRetryer 重试后成功、预算耗尽与超过截止时间时停止重试、最后一次失败后不再等待
+- 异步 StandardRetryer 与同步版本行为一致
+- ClientProfile 将重试预算绑定到未指定 budget 的重试策略
+"""
+
+import asyncio
+import importlib.util
+import os
+import sys
+import types
+import unittest
+from unittest import mock
+
+_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), os.pardir, "mzapi"))
+_TC_ROOT = os.path.join(_ROOT, "utlis", "tencentauth")
+
+
+def _make_pkg(name, path):
+    """在 sys.modules 中注册一个包模块（已存在时沿用）"""
+    if name in sys.modules:
+        return sys.modules[name]
+    m = types.ModuleType(name)
+    m.__path__ = [path]
+    m.__package__ = name
+    sys.modules[name] = m
+    return m
+
+
+def _load(name, filepath, pkg_name=None):
+    """加载单个 .py 文件为模块，设置 __package__ 以支持相对导入"""
+    spec = importlib.util.spec_from_file_location(name, filepath)
+    mod = importlib.util.module_from_spec(spec)
+    if pkg_name:
+        mod.__package__ = pkg_name
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+_make_pkg("mzapi", _ROOT)
+_make_pkg("mzapi.utlis", os.path.join(_ROOT, "utlis"))
+_make_pkg("mzapi.utlis.tencentauth", _TC_ROOT)
+_make_pkg("mzapi.utlis.tencentauth.profile", os.path.join(_TC_ROOT, "profile"))
+_exc_pkg = _make_pkg("mzapi.utlis.tencentauth.exception", os.path.join(_TC_ROOT, "exception"))
+_exc_mod = sys.modules.get("mzapi.utlis.tencentauth.exception.tencent_cloud_sdk_exception") or _load(
+    "mzapi.utlis.tencentauth.exception.tencent_cloud_sdk_exception",
+    os.path.join(_TC_ROOT, "exception", "tencent_cloud_sdk_exception.py"),
+    "mzapi.utlis.tencentauth.exception",
+)
+_exc_pkg.TencentCloudSDKException = _exc_mod.TencentCloudSDKException
+TencentCloudSDKException = _exc_mod.TencentCloudSDKException
+
+_budget_mod = _load("mzapi.utlis.tencentauth.retry_budget", os.path.join(_TC_ROOT, "retry_budget.py"),
+                    "mzapi.utlis.tencentauth")
+_retry_mod = _load("mzapi.utlis.tencentauth.retry", os.path.join(_TC_ROOT, "retry.py"), "mzapi.utlis.tencentauth")
+_retry_async_mod = _load("mzapi.utlis.tencentauth.retry_async", os.path.join(_TC_ROOT, "retry_async.py"),
+                         "mzapi.utlis.tencentauth")
+_profile_mod = _load("mzapi.utlis.tencentauth.profile.client_profile",
+                     os.path.join(_TC_ROOT, "profile", "client_profile.py"), "mzapi.utlis.tencentauth.profile")
+
+RetryBudget = _budget_mod.RetryBudget
+StandardRetryer = _retry_mod.StandardRetryer
+AsyncStandardRetryer = _retry_async_mod.StandardRetryer
+ClientProfile = _profile_mod.ClientProfile
+
+
+class _Clock(object):
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _flaky(failures, code="ServerNetworkError"):
+    """前 failures 次调用抛出可重试的异常，之后返回 "ok" """
+    calls = []
+
+    def fn():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise TencentCloudSDKException(code, "boom")
+        return "ok"
+
+    return fn, calls
+
+
+class TestRetryBudget(unittest.TestCase):
+
+    def test_drain_and_refill(self):
+        budget = RetryBudget(capacity=10, retry_cost=5, success_credit=1)
+        self.assertTrue(budget.acquire())
+        self.assertTrue(budget.acquire())
+        self.assertFalse(budget.acquire())
+        for _ in range(20):
+            budget.on_success()
+        self.assertEqual(budget.tokens, 10)
+        stats = budget.stats()
+        self.assertEqual((stats["granted"], stats["denied"], stats["successes"]), (2, 1, 20))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            RetryBudget(capacity=0)
+        with self.assertRaises(ValueError):
+            RetryBudget(retry_cost=0)
+
+    def test_jitter_bounds(self):
+        for n in range(8):
+            self.assertTrue(0 <= _budget_mod.full_jitter(n, 1.0, 5.0) <= min(5.0, 2 ** n))
+        previous = 1.0
+        for _ in range(50):
+            previous = _budget_mod.decorrelated_jitter(previous, 1.0, 5.0)
+            self.assertTrue(1.0 <= previous <= 5.0)
+
+
+class TestStandardRetryer(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = _Clock()
+        patcher = mock.patch.object(_retry_mod, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_retry_then_success(self):
+        budget = RetryBudget()
+        retryer = StandardRetryer(max_attempts=3, budget=budget)
+        fn, calls = _flaky(2)
+        self.assertEqual(retryer.send_request(fn), "ok")
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(retryer.stats()["retries"], 2)
+        self.assertEqual(budget.stats()["granted"], 2)
+        self.assertEqual(budget.stats()["successes"], 1)
+        for n, sleep in enumerate(self.clock.sleeps):
+            self.assertTrue(0 <= sleep <= 2 ** n)
+
+    def test_no_sleep_after_last_attempt(self):
+        retryer = StandardRetryer(max_attempts=2)
+        fn, calls = _flaky(5)
+        with self.assertRaises(TencentCloudSDKException):
+            retryer.send_request(fn)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(len(self.clock.sleeps), 1)
+
+    def test_non_retryable_error_raised(self):
+        retryer = StandardRetryer()
+        fn, calls = _flaky(1, code="InvalidParameter")
+        with self.assertRaises(TencentCloudSDKException):
+            retryer.send_request(fn)
+        self.assertEqual(len(calls), 1)
+
+    def test_budget_exhausted(self):
+        budget = RetryBudget(capacity=5, retry_cost=5)
+        retryer = StandardRetryer(max_attempts=5, budget=budget)
+        fn, calls = _flaky(10)
+        with self.assertRaises(TencentCloudSDKException):
+            retryer.send_request(fn)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(retryer.stats()["budget_denied"], 1)
+        self.assertEqual(budget.stats()["denied"], 1)
+
+    def test_deadline(self):
+        retryer = StandardRetryer(max_attempts=10, jitter=None, deadline=3.5)
+        fn, calls = _flaky(10)
+        with self.assertRaises(TencentCloudSDKException):
+            retryer.send_request(fn)
+        # 等待 1 + 2 秒后，下一次 4 秒的等待会超过截止时间
+        self.assertEqual(self.clock.sleeps, [1, 2])
+        self.assertEqual(retryer.stats()["deadline_exceeded"], 1)
+
+    def test_max_delay(self):
+        retryer = StandardRetryer(max_attempts=6, jitter=None, max_delay=4)
+        fn, _ = _flaky(10)
+        with self.assertRaises(TencentCloudSDKException):
+            retryer.send_request(fn)
+        self.assertEqual(self.clock.sleeps, [1, 2, 4, 4, 4])
+
+    def test_backoff_override(self):
+        class FixedRetryer(StandardRetryer):
+            @staticmethod
+            def backoff(n):
+                return 0.1
+
+        fn, _ = _flaky(2)
+        self.assertEqual(FixedRetryer().send_request(fn), "ok")
+        self.assertEqual(self.clock.sleeps, [0.1, 0.1])
+
+    def test_invalid_jitter(self):
+        with self.assertRaises(ValueError):
+            StandardRetryer(jitter="equal")
+
+
+class TestAsyncStandardRetryer(unittest.TestCase):
+
+    def test_retry_then_success(self):
+        budget = RetryBudget(capacity=10, retry_cost=5)
+        retryer = AsyncStandardRetryer(max_attempts=4, budget=budget)
+        sync_fn, calls = _flaky(3)
+        sleeps = []
+
+        async def fn():
+            return sync_fn()
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        with mock.patch.object(_retry_async_mod.asyncio, "sleep", fake_sleep):
+            with self.assertRaises(TencentCloudSDKException):
+                asyncio.run(retryer.send_request(fn))
+        # 预算只够两次重试
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(len(sleeps), 2)
+        self.assertEqual(retryer.stats(), {"retries": 2, "budget_denied": 1, "deadline_exceeded": 0})
+
+
+class TestClientProfileRetryBudget(unittest.TestCase):
+
+    def test_profile_binds_budget(self):
+        retryer = StandardRetryer()
+        profile = ClientProfile(retryer=retryer)
+        self.assertIsInstance(profile.retry_budget, RetryBudget)
+        self.assertIs(retryer.budget, profile.retry_budget)
+
+    def test_shared_budget(self):
+        budget = RetryBudget()
+        sync_profile = ClientProfile(retryer=StandardRetryer(), retry_budget=budget)
+        async_profile = ClientProfile(retryer=AsyncStandardRetryer(), retry_budget=budget)
+        self.assertIs(sync_profile.retryer.budget, async_profile.retryer.budget)
+
+    def test_explicit_retryer_budget_kept(self):
+        own = RetryBudget()
+        profile = ClientProfile(retryer=StandardRetryer(budget=own))
+        self.assertIs(profile.retryer.budget, own)
+        self.assertIsNot(profile.retry_budget, own)
+
+    def test_without_retryer(self):
+        self.assertIsNone(ClientProfile().retryer)
+
+
+if __name__ == "__main__":
+    unittest.main()